@@ -0,0 +1,996 @@
+"""
+Generated by scripts/gen_keysyms.py. Do not edit.
+
+NAMES, VALUES and CODE_POINTS are parallel, in the order of
+clutter-keysyms.h, so the first name of a value is its canonical name.
+CODE_POINTS holds the Unicode character a keysym types, or 0 if none.
+"""
+
+# fmt: off
+NAMES = (
+    "KEY_VoidSymbol", "KEY_BackSpace", "KEY_Tab", "KEY_Linefeed", "KEY_Clear",
+    "KEY_Return", "KEY_Pause", "KEY_Scroll_Lock", "KEY_Sys_Req", "KEY_Escape",
+    "KEY_Delete", "KEY_Multi_key", "KEY_Codeinput", "KEY_SingleCandidate",
+    "KEY_MultipleCandidate", "KEY_PreviousCandidate", "KEY_Kanji", "KEY_Muhenkan",
+    "KEY_Henkan_Mode", "KEY_Henkan", "KEY_Romaji", "KEY_Hiragana", "KEY_Katakana",
+    "KEY_Hiragana_Katakana", "KEY_Zenkaku", "KEY_Hankaku", "KEY_Zenkaku_Hankaku",
+    "KEY_Touroku", "KEY_Massyo", "KEY_Kana_Lock", "KEY_Kana_Shift", "KEY_Eisu_Shift",
+    "KEY_Eisu_toggle", "KEY_Kanji_Bangou", "KEY_Zen_Koho", "KEY_Mae_Koho", "KEY_Home",
+    "KEY_Left", "KEY_Up", "KEY_Right", "KEY_Down", "KEY_Prior", "KEY_Page_Up",
+    "KEY_Next", "KEY_Page_Down", "KEY_End", "KEY_Begin", "KEY_Select", "KEY_Print",
+    "KEY_Execute", "KEY_Insert", "KEY_Undo", "KEY_Redo", "KEY_Menu", "KEY_Find",
+    "KEY_Cancel", "KEY_Help", "KEY_Break", "KEY_Mode_switch", "KEY_script_switch",
+    "KEY_Num_Lock", "KEY_KP_Space", "KEY_KP_Tab", "KEY_KP_Enter", "KEY_KP_F1",
+    "KEY_KP_F2", "KEY_KP_F3", "KEY_KP_F4", "KEY_KP_Home", "KEY_KP_Left", "KEY_KP_Up",
+    "KEY_KP_Right", "KEY_KP_Down", "KEY_KP_Prior", "KEY_KP_Page_Up", "KEY_KP_Next",
+    "KEY_KP_Page_Down", "KEY_KP_End", "KEY_KP_Begin", "KEY_KP_Insert", "KEY_KP_Delete",
+    "KEY_KP_Equal", "KEY_KP_Multiply", "KEY_KP_Add", "KEY_KP_Separator",
+    "KEY_KP_Subtract", "KEY_KP_Decimal", "KEY_KP_Divide", "KEY_KP_0", "KEY_KP_1",
+    "KEY_KP_2", "KEY_KP_3", "KEY_KP_4", "KEY_KP_5", "KEY_KP_6", "KEY_KP_7", "KEY_KP_8",
+    "KEY_KP_9", "KEY_F1", "KEY_F2", "KEY_F3", "KEY_F4", "KEY_F5", "KEY_F6", "KEY_F7",
+    "KEY_F8", "KEY_F9", "KEY_F10", "KEY_F11", "KEY_L1", "KEY_F12", "KEY_L2", "KEY_F13",
+    "KEY_L3", "KEY_F14", "KEY_L4", "KEY_F15", "KEY_L5", "KEY_F16", "KEY_L6", "KEY_F17",
+    "KEY_L7", "KEY_F18", "KEY_L8", "KEY_F19", "KEY_L9", "KEY_F20", "KEY_L10", "KEY_F21",
+    "KEY_R1", "KEY_F22", "KEY_R2", "KEY_F23", "KEY_R3", "KEY_F24", "KEY_R4", "KEY_F25",
+    "KEY_R5", "KEY_F26", "KEY_R6", "KEY_F27", "KEY_R7", "KEY_F28", "KEY_R8", "KEY_F29",
+    "KEY_R9", "KEY_F30", "KEY_R10", "KEY_F31", "KEY_R11", "KEY_F32", "KEY_R12",
+    "KEY_F33", "KEY_R13", "KEY_F34", "KEY_R14", "KEY_F35", "KEY_R15", "KEY_Shift_L",
+    "KEY_Shift_R", "KEY_Control_L", "KEY_Control_R", "KEY_Caps_Lock", "KEY_Shift_Lock",
+    "KEY_Meta_L", "KEY_Meta_R", "KEY_Alt_L", "KEY_Alt_R", "KEY_Super_L", "KEY_Super_R",
+    "KEY_Hyper_L", "KEY_Hyper_R", "KEY_ISO_Lock", "KEY_ISO_Level2_Latch",
+    "KEY_ISO_Level3_Shift", "KEY_ISO_Level3_Latch", "KEY_ISO_Level3_Lock",
+    "KEY_ISO_Level5_Shift", "KEY_ISO_Level5_Latch", "KEY_ISO_Level5_Lock",
+    "KEY_ISO_Group_Shift", "KEY_ISO_Group_Latch", "KEY_ISO_Group_Lock",
+    "KEY_ISO_Next_Group", "KEY_ISO_Next_Group_Lock", "KEY_ISO_Prev_Group",
+    "KEY_ISO_Prev_Group_Lock", "KEY_ISO_First_Group", "KEY_ISO_First_Group_Lock",
+    "KEY_ISO_Last_Group", "KEY_ISO_Last_Group_Lock", "KEY_ISO_Left_Tab",
+    "KEY_ISO_Move_Line_Up", "KEY_ISO_Move_Line_Down", "KEY_ISO_Partial_Line_Up",
+    "KEY_ISO_Partial_Line_Down", "KEY_ISO_Partial_Space_Left",
+    "KEY_ISO_Partial_Space_Right", "KEY_ISO_Set_Margin_Left",
+    "KEY_ISO_Set_Margin_Right", "KEY_ISO_Release_Margin_Left",
+    "KEY_ISO_Release_Margin_Right", "KEY_ISO_Release_Both_Margins",
+    "KEY_ISO_Fast_Cursor_Left", "KEY_ISO_Fast_Cursor_Right", "KEY_ISO_Fast_Cursor_Up",
+    "KEY_ISO_Fast_Cursor_Down", "KEY_ISO_Continuous_Underline",
+    "KEY_ISO_Discontinuous_Underline", "KEY_ISO_Emphasize", "KEY_ISO_Center_Object",
+    "KEY_ISO_Enter", "KEY_dead_grave", "KEY_dead_acute", "KEY_dead_circumflex",
+    "KEY_dead_tilde", "KEY_dead_perispomeni", "KEY_dead_macron", "KEY_dead_breve",
+    "KEY_dead_abovedot", "KEY_dead_diaeresis", "KEY_dead_abovering",
+    "KEY_dead_doubleacute", "KEY_dead_caron", "KEY_dead_cedilla", "KEY_dead_ogonek",
+    "KEY_dead_iota", "KEY_dead_voiced_sound", "KEY_dead_semivoiced_sound",
+    "KEY_dead_belowdot", "KEY_dead_hook", "KEY_dead_horn", "KEY_dead_stroke",
+    "KEY_dead_abovecomma", "KEY_dead_psili", "KEY_dead_abovereversedcomma",
+    "KEY_dead_dasia", "KEY_dead_doublegrave", "KEY_dead_belowring",
+    "KEY_dead_belowmacron", "KEY_dead_belowcircumflex", "KEY_dead_belowtilde",
+    "KEY_dead_belowbreve", "KEY_dead_belowdiaeresis", "KEY_dead_invertedbreve",
+    "KEY_dead_belowcomma", "KEY_dead_currency", "KEY_dead_lowline",
+    "KEY_dead_aboveverticalline", "KEY_dead_belowverticalline",
+    "KEY_dead_longsolidusoverlay", "KEY_dead_a", "KEY_dead_A", "KEY_dead_e",
+    "KEY_dead_E", "KEY_dead_i", "KEY_dead_I", "KEY_dead_o", "KEY_dead_O", "KEY_dead_u",
+    "KEY_dead_U", "KEY_dead_small_schwa", "KEY_dead_capital_schwa", "KEY_dead_greek",
+    "KEY_First_Virtual_Screen", "KEY_Prev_Virtual_Screen", "KEY_Next_Virtual_Screen",
+    "KEY_Last_Virtual_Screen", "KEY_Terminate_Server", "KEY_AccessX_Enable",
+    "KEY_AccessX_Feedback_Enable", "KEY_RepeatKeys_Enable", "KEY_SlowKeys_Enable",
+    "KEY_BounceKeys_Enable", "KEY_StickyKeys_Enable", "KEY_MouseKeys_Enable",
+    "KEY_MouseKeys_Accel_Enable", "KEY_Overlay1_Enable", "KEY_Overlay2_Enable",
+    "KEY_AudibleBell_Enable", "KEY_Pointer_Left", "KEY_Pointer_Right", "KEY_Pointer_Up",
+    "KEY_Pointer_Down", "KEY_Pointer_UpLeft", "KEY_Pointer_UpRight",
+    "KEY_Pointer_DownLeft", "KEY_Pointer_DownRight", "KEY_Pointer_Button_Dflt",
+    "KEY_Pointer_Button1", "KEY_Pointer_Button2", "KEY_Pointer_Button3",
+    "KEY_Pointer_Button4", "KEY_Pointer_Button5", "KEY_Pointer_DblClick_Dflt",
+    "KEY_Pointer_DblClick1", "KEY_Pointer_DblClick2", "KEY_Pointer_DblClick3",
+    "KEY_Pointer_DblClick4", "KEY_Pointer_DblClick5", "KEY_Pointer_Drag_Dflt",
+    "KEY_Pointer_Drag1", "KEY_Pointer_Drag2", "KEY_Pointer_Drag3", "KEY_Pointer_Drag4",
+    "KEY_Pointer_Drag5", "KEY_Pointer_EnableKeys", "KEY_Pointer_Accelerate",
+    "KEY_Pointer_DfltBtnNext", "KEY_Pointer_DfltBtnPrev", "KEY_ch", "KEY_Ch", "KEY_CH",
+    "KEY_c_h", "KEY_C_h", "KEY_C_H", "KEY_3270_Duplicate", "KEY_3270_FieldMark",
+    "KEY_3270_Right2", "KEY_3270_Left2", "KEY_3270_BackTab", "KEY_3270_EraseEOF",
+    "KEY_3270_EraseInput", "KEY_3270_Reset", "KEY_3270_Quit", "KEY_3270_PA1",
+    "KEY_3270_PA2", "KEY_3270_PA3", "KEY_3270_Test", "KEY_3270_Attn",
+    "KEY_3270_CursorBlink", "KEY_3270_AltCursor", "KEY_3270_KeyClick", "KEY_3270_Jump",
+    "KEY_3270_Ident", "KEY_3270_Rule", "KEY_3270_Copy", "KEY_3270_Play",
+    "KEY_3270_Setup", "KEY_3270_Record", "KEY_3270_ChangeScreen", "KEY_3270_DeleteWord",
+    "KEY_3270_ExSelect", "KEY_3270_CursorSelect", "KEY_3270_PrintScreen",
+    "KEY_3270_Enter", "KEY_space", "KEY_exclam", "KEY_quotedbl", "KEY_numbersign",
+    "KEY_dollar", "KEY_percent", "KEY_ampersand", "KEY_apostrophe", "KEY_quoteright",
+    "KEY_parenleft", "KEY_parenright", "KEY_asterisk", "KEY_plus", "KEY_comma",
+    "KEY_minus", "KEY_period", "KEY_slash", "KEY_0", "KEY_1", "KEY_2", "KEY_3", "KEY_4",
+    "KEY_5", "KEY_6", "KEY_7", "KEY_8", "KEY_9", "KEY_colon", "KEY_semicolon",
+    "KEY_less", "KEY_equal", "KEY_greater", "KEY_question", "KEY_at", "KEY_A", "KEY_B",
+    "KEY_C", "KEY_D", "KEY_E", "KEY_F", "KEY_G", "KEY_H", "KEY_I", "KEY_J", "KEY_K",
+    "KEY_L", "KEY_M", "KEY_N", "KEY_O", "KEY_P", "KEY_Q", "KEY_R", "KEY_S", "KEY_T",
+    "KEY_U", "KEY_V", "KEY_W", "KEY_X", "KEY_Y", "KEY_Z", "KEY_bracketleft",
+    "KEY_backslash", "KEY_bracketright", "KEY_asciicircum", "KEY_underscore",
+    "KEY_grave", "KEY_quoteleft", "KEY_a", "KEY_b", "KEY_c", "KEY_d", "KEY_e", "KEY_f",
+    "KEY_g", "KEY_h", "KEY_i", "KEY_j", "KEY_k", "KEY_l", "KEY_m", "KEY_n", "KEY_o",
+    "KEY_p", "KEY_q", "KEY_r", "KEY_s", "KEY_t", "KEY_u", "KEY_v", "KEY_w", "KEY_x",
+    "KEY_y", "KEY_z", "KEY_braceleft", "KEY_bar", "KEY_braceright", "KEY_asciitilde",
+    "KEY_nobreakspace", "KEY_exclamdown", "KEY_cent", "KEY_sterling", "KEY_currency",
+    "KEY_yen", "KEY_brokenbar", "KEY_section", "KEY_diaeresis", "KEY_copyright",
+    "KEY_ordfeminine", "KEY_guillemotleft", "KEY_notsign", "KEY_hyphen",
+    "KEY_registered", "KEY_macron", "KEY_degree", "KEY_plusminus", "KEY_twosuperior",
+    "KEY_threesuperior", "KEY_acute", "KEY_mu", "KEY_paragraph", "KEY_periodcentered",
+    "KEY_cedilla", "KEY_onesuperior", "KEY_masculine", "KEY_guillemotright",
+    "KEY_onequarter", "KEY_onehalf", "KEY_threequarters", "KEY_questiondown",
+    "KEY_Agrave", "KEY_Aacute", "KEY_Acircumflex", "KEY_Atilde", "KEY_Adiaeresis",
+    "KEY_Aring", "KEY_AE", "KEY_Ccedilla", "KEY_Egrave", "KEY_Eacute",
+    "KEY_Ecircumflex", "KEY_Ediaeresis", "KEY_Igrave", "KEY_Iacute", "KEY_Icircumflex",
+    "KEY_Idiaeresis", "KEY_ETH", "KEY_Eth", "KEY_Ntilde", "KEY_Ograve", "KEY_Oacute",
+    "KEY_Ocircumflex", "KEY_Otilde", "KEY_Odiaeresis", "KEY_multiply", "KEY_Oslash",
+    "KEY_Ooblique", "KEY_Ugrave", "KEY_Uacute", "KEY_Ucircumflex", "KEY_Udiaeresis",
+    "KEY_Yacute", "KEY_THORN", "KEY_Thorn", "KEY_ssharp", "KEY_agrave", "KEY_aacute",
+    "KEY_acircumflex", "KEY_atilde", "KEY_adiaeresis", "KEY_aring", "KEY_ae",
+    "KEY_ccedilla", "KEY_egrave", "KEY_eacute", "KEY_ecircumflex", "KEY_ediaeresis",
+    "KEY_igrave", "KEY_iacute", "KEY_icircumflex", "KEY_idiaeresis", "KEY_eth",
+    "KEY_ntilde", "KEY_ograve", "KEY_oacute", "KEY_ocircumflex", "KEY_otilde",
+    "KEY_odiaeresis", "KEY_division", "KEY_oslash", "KEY_ooblique", "KEY_ugrave",
+    "KEY_uacute", "KEY_ucircumflex", "KEY_udiaeresis", "KEY_yacute", "KEY_thorn",
+    "KEY_ydiaeresis", "KEY_Aogonek", "KEY_breve", "KEY_Lstroke", "KEY_Lcaron",
+    "KEY_Sacute", "KEY_Scaron", "KEY_Scedilla", "KEY_Tcaron", "KEY_Zacute",
+    "KEY_Zcaron", "KEY_Zabovedot", "KEY_aogonek", "KEY_ogonek", "KEY_lstroke",
+    "KEY_lcaron", "KEY_sacute", "KEY_caron", "KEY_scaron", "KEY_scedilla", "KEY_tcaron",
+    "KEY_zacute", "KEY_doubleacute", "KEY_zcaron", "KEY_zabovedot", "KEY_Racute",
+    "KEY_Abreve", "KEY_Lacute", "KEY_Cacute", "KEY_Ccaron", "KEY_Eogonek", "KEY_Ecaron",
+    "KEY_Dcaron", "KEY_Dstroke", "KEY_Nacute", "KEY_Ncaron", "KEY_Odoubleacute",
+    "KEY_Rcaron", "KEY_Uring", "KEY_Udoubleacute", "KEY_Tcedilla", "KEY_racute",
+    "KEY_abreve", "KEY_lacute", "KEY_cacute", "KEY_ccaron", "KEY_eogonek", "KEY_ecaron",
+    "KEY_dcaron", "KEY_dstroke", "KEY_nacute", "KEY_ncaron", "KEY_odoubleacute",
+    "KEY_rcaron", "KEY_uring", "KEY_udoubleacute", "KEY_tcedilla", "KEY_abovedot",
+    "KEY_Hstroke", "KEY_Hcircumflex", "KEY_Iabovedot", "KEY_Gbreve", "KEY_Jcircumflex",
+    "KEY_hstroke", "KEY_hcircumflex", "KEY_idotless", "KEY_gbreve", "KEY_jcircumflex",
+    "KEY_Cabovedot", "KEY_Ccircumflex", "KEY_Gabovedot", "KEY_Gcircumflex",
+    "KEY_Ubreve", "KEY_Scircumflex", "KEY_cabovedot", "KEY_ccircumflex",
+    "KEY_gabovedot", "KEY_gcircumflex", "KEY_ubreve", "KEY_scircumflex", "KEY_kra",
+    "KEY_kappa", "KEY_Rcedilla", "KEY_Itilde", "KEY_Lcedilla", "KEY_Emacron",
+    "KEY_Gcedilla", "KEY_Tslash", "KEY_rcedilla", "KEY_itilde", "KEY_lcedilla",
+    "KEY_emacron", "KEY_gcedilla", "KEY_tslash", "KEY_ENG", "KEY_eng", "KEY_Amacron",
+    "KEY_Iogonek", "KEY_Eabovedot", "KEY_Imacron", "KEY_Ncedilla", "KEY_Omacron",
+    "KEY_Kcedilla", "KEY_Uogonek", "KEY_Utilde", "KEY_Umacron", "KEY_amacron",
+    "KEY_iogonek", "KEY_eabovedot", "KEY_imacron", "KEY_ncedilla", "KEY_omacron",
+    "KEY_kcedilla", "KEY_uogonek", "KEY_utilde", "KEY_umacron", "KEY_Wcircumflex",
+    "KEY_wcircumflex", "KEY_Ycircumflex", "KEY_ycircumflex", "KEY_Babovedot",
+    "KEY_babovedot", "KEY_Dabovedot", "KEY_dabovedot", "KEY_Fabovedot", "KEY_fabovedot",
+    "KEY_Mabovedot", "KEY_mabovedot", "KEY_Pabovedot", "KEY_pabovedot", "KEY_Sabovedot",
+    "KEY_sabovedot", "KEY_Tabovedot", "KEY_tabovedot", "KEY_Wgrave", "KEY_wgrave",
+    "KEY_Wacute", "KEY_wacute", "KEY_Wdiaeresis", "KEY_wdiaeresis", "KEY_Ygrave",
+    "KEY_ygrave", "KEY_OE", "KEY_oe", "KEY_Ydiaeresis", "KEY_overline",
+    "KEY_kana_fullstop", "KEY_kana_openingbracket", "KEY_kana_closingbracket",
+    "KEY_kana_comma", "KEY_kana_conjunctive", "KEY_kana_middledot", "KEY_kana_WO",
+    "KEY_kana_a", "KEY_kana_i", "KEY_kana_u", "KEY_kana_e", "KEY_kana_o", "KEY_kana_ya",
+    "KEY_kana_yu", "KEY_kana_yo", "KEY_kana_tsu", "KEY_kana_tu", "KEY_prolongedsound",
+    "KEY_kana_A", "KEY_kana_I", "KEY_kana_U", "KEY_kana_E", "KEY_kana_O", "KEY_kana_KA",
+    "KEY_kana_KI", "KEY_kana_KU", "KEY_kana_KE", "KEY_kana_KO", "KEY_kana_SA",
+    "KEY_kana_SHI", "KEY_kana_SU", "KEY_kana_SE", "KEY_kana_SO", "KEY_kana_TA",
+    "KEY_kana_CHI", "KEY_kana_TI", "KEY_kana_TSU", "KEY_kana_TU", "KEY_kana_TE",
+    "KEY_kana_TO", "KEY_kana_NA", "KEY_kana_NI", "KEY_kana_NU", "KEY_kana_NE",
+    "KEY_kana_NO", "KEY_kana_HA", "KEY_kana_HI", "KEY_kana_FU", "KEY_kana_HU",
+    "KEY_kana_HE", "KEY_kana_HO", "KEY_kana_MA", "KEY_kana_MI", "KEY_kana_MU",
+    "KEY_kana_ME", "KEY_kana_MO", "KEY_kana_YA", "KEY_kana_YU", "KEY_kana_YO",
+    "KEY_kana_RA", "KEY_kana_RI", "KEY_kana_RU", "KEY_kana_RE", "KEY_kana_RO",
+    "KEY_kana_WA", "KEY_kana_N", "KEY_voicedsound", "KEY_semivoicedsound",
+    "KEY_kana_switch", "KEY_Farsi_0", "KEY_Farsi_1", "KEY_Farsi_2", "KEY_Farsi_3",
+    "KEY_Farsi_4", "KEY_Farsi_5", "KEY_Farsi_6", "KEY_Farsi_7", "KEY_Farsi_8",
+    "KEY_Farsi_9", "KEY_Arabic_percent", "KEY_Arabic_superscript_alef",
+    "KEY_Arabic_tteh", "KEY_Arabic_peh", "KEY_Arabic_tcheh", "KEY_Arabic_ddal",
+    "KEY_Arabic_rreh", "KEY_Arabic_comma", "KEY_Arabic_fullstop", "KEY_Arabic_0",
+    "KEY_Arabic_1", "KEY_Arabic_2", "KEY_Arabic_3", "KEY_Arabic_4", "KEY_Arabic_5",
+    "KEY_Arabic_6", "KEY_Arabic_7", "KEY_Arabic_8", "KEY_Arabic_9",
+    "KEY_Arabic_semicolon", "KEY_Arabic_question_mark", "KEY_Arabic_hamza",
+    "KEY_Arabic_maddaonalef", "KEY_Arabic_hamzaonalef", "KEY_Arabic_hamzaonwaw",
+    "KEY_Arabic_hamzaunderalef", "KEY_Arabic_hamzaonyeh", "KEY_Arabic_alef",
+    "KEY_Arabic_beh", "KEY_Arabic_tehmarbuta", "KEY_Arabic_teh", "KEY_Arabic_theh",
+    "KEY_Arabic_jeem", "KEY_Arabic_hah", "KEY_Arabic_khah", "KEY_Arabic_dal",
+    "KEY_Arabic_thal", "KEY_Arabic_ra", "KEY_Arabic_zain", "KEY_Arabic_seen",
+    "KEY_Arabic_sheen", "KEY_Arabic_sad", "KEY_Arabic_dad", "KEY_Arabic_tah",
+    "KEY_Arabic_zah", "KEY_Arabic_ain", "KEY_Arabic_ghain", "KEY_Arabic_tatweel",
+    "KEY_Arabic_feh", "KEY_Arabic_qaf", "KEY_Arabic_kaf", "KEY_Arabic_lam",
+    "KEY_Arabic_meem", "KEY_Arabic_noon", "KEY_Arabic_ha", "KEY_Arabic_heh",
+    "KEY_Arabic_waw", "KEY_Arabic_alefmaksura", "KEY_Arabic_yeh", "KEY_Arabic_fathatan",
+    "KEY_Arabic_dammatan", "KEY_Arabic_kasratan", "KEY_Arabic_fatha",
+    "KEY_Arabic_damma", "KEY_Arabic_kasra", "KEY_Arabic_shadda", "KEY_Arabic_sukun",
+    "KEY_Arabic_madda_above", "KEY_Arabic_hamza_above", "KEY_Arabic_hamza_below",
+    "KEY_Arabic_jeh", "KEY_Arabic_veh", "KEY_Arabic_keheh", "KEY_Arabic_gaf",
+    "KEY_Arabic_noon_ghunna", "KEY_Arabic_heh_doachashmee", "KEY_Farsi_yeh",
+    "KEY_Arabic_farsi_yeh", "KEY_Arabic_yeh_baree", "KEY_Arabic_heh_goal",
+    "KEY_Arabic_switch", "KEY_Cyrillic_GHE_bar", "KEY_Cyrillic_ghe_bar",
+    "KEY_Cyrillic_ZHE_descender", "KEY_Cyrillic_zhe_descender",
+    "KEY_Cyrillic_KA_descender", "KEY_Cyrillic_ka_descender",
+    "KEY_Cyrillic_KA_vertstroke", "KEY_Cyrillic_ka_vertstroke",
+    "KEY_Cyrillic_EN_descender", "KEY_Cyrillic_en_descender", "KEY_Cyrillic_U_straight",
+    "KEY_Cyrillic_u_straight", "KEY_Cyrillic_U_straight_bar",
+    "KEY_Cyrillic_u_straight_bar", "KEY_Cyrillic_HA_descender",
+    "KEY_Cyrillic_ha_descender", "KEY_Cyrillic_CHE_descender",
+    "KEY_Cyrillic_che_descender", "KEY_Cyrillic_CHE_vertstroke",
+    "KEY_Cyrillic_che_vertstroke", "KEY_Cyrillic_SHHA", "KEY_Cyrillic_shha",
+    "KEY_Cyrillic_SCHWA", "KEY_Cyrillic_schwa", "KEY_Cyrillic_I_macron",
+    "KEY_Cyrillic_i_macron", "KEY_Cyrillic_O_bar", "KEY_Cyrillic_o_bar",
+    "KEY_Cyrillic_U_macron", "KEY_Cyrillic_u_macron", "KEY_Serbian_dje",
+    "KEY_Macedonia_gje", "KEY_Cyrillic_io", "KEY_Ukrainian_ie", "KEY_Ukranian_je",
+    "KEY_Macedonia_dse", "KEY_Ukrainian_i", "KEY_Ukranian_i", "KEY_Ukrainian_yi",
+    "KEY_Ukranian_yi", "KEY_Cyrillic_je", "KEY_Serbian_je", "KEY_Cyrillic_lje",
+    "KEY_Serbian_lje", "KEY_Cyrillic_nje", "KEY_Serbian_nje", "KEY_Serbian_tshe",
+    "KEY_Macedonia_kje", "KEY_Ukrainian_ghe_with_upturn", "KEY_Byelorussian_shortu",
+    "KEY_Cyrillic_dzhe", "KEY_Serbian_dze", "KEY_numerosign", "KEY_Serbian_DJE",
+    "KEY_Macedonia_GJE", "KEY_Cyrillic_IO", "KEY_Ukrainian_IE", "KEY_Ukranian_JE",
+    "KEY_Macedonia_DSE", "KEY_Ukrainian_I", "KEY_Ukranian_I", "KEY_Ukrainian_YI",
+    "KEY_Ukranian_YI", "KEY_Cyrillic_JE", "KEY_Serbian_JE", "KEY_Cyrillic_LJE",
+    "KEY_Serbian_LJE", "KEY_Cyrillic_NJE", "KEY_Serbian_NJE", "KEY_Serbian_TSHE",
+    "KEY_Macedonia_KJE", "KEY_Ukrainian_GHE_WITH_UPTURN", "KEY_Byelorussian_SHORTU",
+    "KEY_Cyrillic_DZHE", "KEY_Serbian_DZE", "KEY_Cyrillic_yu", "KEY_Cyrillic_a",
+    "KEY_Cyrillic_be", "KEY_Cyrillic_tse", "KEY_Cyrillic_de", "KEY_Cyrillic_ie",
+    "KEY_Cyrillic_ef", "KEY_Cyrillic_ghe", "KEY_Cyrillic_ha", "KEY_Cyrillic_i",
+    "KEY_Cyrillic_shorti", "KEY_Cyrillic_ka", "KEY_Cyrillic_el", "KEY_Cyrillic_em",
+    "KEY_Cyrillic_en", "KEY_Cyrillic_o", "KEY_Cyrillic_pe", "KEY_Cyrillic_ya",
+    "KEY_Cyrillic_er", "KEY_Cyrillic_es", "KEY_Cyrillic_te", "KEY_Cyrillic_u",
+    "KEY_Cyrillic_zhe", "KEY_Cyrillic_ve", "KEY_Cyrillic_softsign", "KEY_Cyrillic_yeru",
+    "KEY_Cyrillic_ze", "KEY_Cyrillic_sha", "KEY_Cyrillic_e", "KEY_Cyrillic_shcha",
+    "KEY_Cyrillic_che", "KEY_Cyrillic_hardsign", "KEY_Cyrillic_YU", "KEY_Cyrillic_A",
+    "KEY_Cyrillic_BE", "KEY_Cyrillic_TSE", "KEY_Cyrillic_DE", "KEY_Cyrillic_IE",
+    "KEY_Cyrillic_EF", "KEY_Cyrillic_GHE", "KEY_Cyrillic_HA", "KEY_Cyrillic_I",
+    "KEY_Cyrillic_SHORTI", "KEY_Cyrillic_KA", "KEY_Cyrillic_EL", "KEY_Cyrillic_EM",
+    "KEY_Cyrillic_EN", "KEY_Cyrillic_O", "KEY_Cyrillic_PE", "KEY_Cyrillic_YA",
+    "KEY_Cyrillic_ER", "KEY_Cyrillic_ES", "KEY_Cyrillic_TE", "KEY_Cyrillic_U",
+    "KEY_Cyrillic_ZHE", "KEY_Cyrillic_VE", "KEY_Cyrillic_SOFTSIGN", "KEY_Cyrillic_YERU",
+    "KEY_Cyrillic_ZE", "KEY_Cyrillic_SHA", "KEY_Cyrillic_E", "KEY_Cyrillic_SHCHA",
+    "KEY_Cyrillic_CHE", "KEY_Cyrillic_HARDSIGN", "KEY_Greek_ALPHAaccent",
+    "KEY_Greek_EPSILONaccent", "KEY_Greek_ETAaccent", "KEY_Greek_IOTAaccent",
+    "KEY_Greek_IOTAdieresis", "KEY_Greek_IOTAdiaeresis", "KEY_Greek_OMICRONaccent",
+    "KEY_Greek_UPSILONaccent", "KEY_Greek_UPSILONdieresis", "KEY_Greek_OMEGAaccent",
+    "KEY_Greek_accentdieresis", "KEY_Greek_horizbar", "KEY_Greek_alphaaccent",
+    "KEY_Greek_epsilonaccent", "KEY_Greek_etaaccent", "KEY_Greek_iotaaccent",
+    "KEY_Greek_iotadieresis", "KEY_Greek_iotaaccentdieresis", "KEY_Greek_omicronaccent",
+    "KEY_Greek_upsilonaccent", "KEY_Greek_upsilondieresis",
+    "KEY_Greek_upsilonaccentdieresis", "KEY_Greek_omegaaccent", "KEY_Greek_ALPHA",
+    "KEY_Greek_BETA", "KEY_Greek_GAMMA", "KEY_Greek_DELTA", "KEY_Greek_EPSILON",
+    "KEY_Greek_ZETA", "KEY_Greek_ETA", "KEY_Greek_THETA", "KEY_Greek_IOTA",
+    "KEY_Greek_KAPPA", "KEY_Greek_LAMDA", "KEY_Greek_LAMBDA", "KEY_Greek_MU",
+    "KEY_Greek_NU", "KEY_Greek_XI", "KEY_Greek_OMICRON", "KEY_Greek_PI",
+    "KEY_Greek_RHO", "KEY_Greek_SIGMA", "KEY_Greek_TAU", "KEY_Greek_UPSILON",
+    "KEY_Greek_PHI", "KEY_Greek_CHI", "KEY_Greek_PSI", "KEY_Greek_OMEGA",
+    "KEY_Greek_alpha", "KEY_Greek_beta", "KEY_Greek_gamma", "KEY_Greek_delta",
+    "KEY_Greek_epsilon", "KEY_Greek_zeta", "KEY_Greek_eta", "KEY_Greek_theta",
+    "KEY_Greek_iota", "KEY_Greek_kappa", "KEY_Greek_lamda", "KEY_Greek_lambda",
+    "KEY_Greek_mu", "KEY_Greek_nu", "KEY_Greek_xi", "KEY_Greek_omicron", "KEY_Greek_pi",
+    "KEY_Greek_rho", "KEY_Greek_sigma", "KEY_Greek_finalsmallsigma", "KEY_Greek_tau",
+    "KEY_Greek_upsilon", "KEY_Greek_phi", "KEY_Greek_chi", "KEY_Greek_psi",
+    "KEY_Greek_omega", "KEY_Greek_switch", "KEY_leftradical", "KEY_topleftradical",
+    "KEY_horizconnector", "KEY_topintegral", "KEY_botintegral", "KEY_vertconnector",
+    "KEY_topleftsqbracket", "KEY_botleftsqbracket", "KEY_toprightsqbracket",
+    "KEY_botrightsqbracket", "KEY_topleftparens", "KEY_botleftparens",
+    "KEY_toprightparens", "KEY_botrightparens", "KEY_leftmiddlecurlybrace",
+    "KEY_rightmiddlecurlybrace", "KEY_topleftsummation", "KEY_botleftsummation",
+    "KEY_topvertsummationconnector", "KEY_botvertsummationconnector",
+    "KEY_toprightsummation", "KEY_botrightsummation", "KEY_rightmiddlesummation",
+    "KEY_lessthanequal", "KEY_notequal", "KEY_greaterthanequal", "KEY_integral",
+    "KEY_therefore", "KEY_variation", "KEY_infinity", "KEY_nabla", "KEY_approximate",
+    "KEY_similarequal", "KEY_ifonlyif", "KEY_implies", "KEY_identical", "KEY_radical",
+    "KEY_includedin", "KEY_includes", "KEY_intersection", "KEY_union", "KEY_logicaland",
+    "KEY_logicalor", "KEY_partialderivative", "KEY_function", "KEY_leftarrow",
+    "KEY_uparrow", "KEY_rightarrow", "KEY_downarrow", "KEY_blank", "KEY_soliddiamond",
+    "KEY_checkerboard", "KEY_ht", "KEY_ff", "KEY_cr", "KEY_lf", "KEY_nl", "KEY_vt",
+    "KEY_lowrightcorner", "KEY_uprightcorner", "KEY_upleftcorner", "KEY_lowleftcorner",
+    "KEY_crossinglines", "KEY_horizlinescan1", "KEY_horizlinescan3",
+    "KEY_horizlinescan5", "KEY_horizlinescan7", "KEY_horizlinescan9", "KEY_leftt",
+    "KEY_rightt", "KEY_bott", "KEY_topt", "KEY_vertbar", "KEY_emspace", "KEY_enspace",
+    "KEY_em3space", "KEY_em4space", "KEY_digitspace", "KEY_punctspace", "KEY_thinspace",
+    "KEY_hairspace", "KEY_emdash", "KEY_endash", "KEY_signifblank", "KEY_ellipsis",
+    "KEY_doubbaselinedot", "KEY_onethird", "KEY_twothirds", "KEY_onefifth",
+    "KEY_twofifths", "KEY_threefifths", "KEY_fourfifths", "KEY_onesixth",
+    "KEY_fivesixths", "KEY_careof", "KEY_figdash", "KEY_leftanglebracket",
+    "KEY_decimalpoint", "KEY_rightanglebracket", "KEY_marker", "KEY_oneeighth",
+    "KEY_threeeighths", "KEY_fiveeighths", "KEY_seveneighths", "KEY_trademark",
+    "KEY_signaturemark", "KEY_trademarkincircle", "KEY_leftopentriangle",
+    "KEY_rightopentriangle", "KEY_emopencircle", "KEY_emopenrectangle",
+    "KEY_leftsinglequotemark", "KEY_rightsinglequotemark", "KEY_leftdoublequotemark",
+    "KEY_rightdoublequotemark", "KEY_prescription", "KEY_permille", "KEY_minutes",
+    "KEY_seconds", "KEY_latincross", "KEY_hexagram", "KEY_filledrectbullet",
+    "KEY_filledlefttribullet", "KEY_filledrighttribullet", "KEY_emfilledcircle",
+    "KEY_emfilledrect", "KEY_enopencircbullet", "KEY_enopensquarebullet",
+    "KEY_openrectbullet", "KEY_opentribulletup", "KEY_opentribulletdown",
+    "KEY_openstar", "KEY_enfilledcircbullet", "KEY_enfilledsqbullet",
+    "KEY_filledtribulletup", "KEY_filledtribulletdown", "KEY_leftpointer",
+    "KEY_rightpointer", "KEY_club", "KEY_diamond", "KEY_heart", "KEY_maltesecross",
+    "KEY_dagger", "KEY_doubledagger", "KEY_checkmark", "KEY_ballotcross",
+    "KEY_musicalsharp", "KEY_musicalflat", "KEY_malesymbol", "KEY_femalesymbol",
+    "KEY_telephone", "KEY_telephonerecorder", "KEY_phonographcopyright", "KEY_caret",
+    "KEY_singlelowquotemark", "KEY_doublelowquotemark", "KEY_cursor", "KEY_leftcaret",
+    "KEY_rightcaret", "KEY_downcaret", "KEY_upcaret", "KEY_overbar", "KEY_downtack",
+    "KEY_upshoe", "KEY_downstile", "KEY_underbar", "KEY_jot", "KEY_quad", "KEY_uptack",
+    "KEY_circle", "KEY_upstile", "KEY_downshoe", "KEY_rightshoe", "KEY_leftshoe",
+    "KEY_lefttack", "KEY_righttack", "KEY_hebrew_doublelowline", "KEY_hebrew_aleph",
+    "KEY_hebrew_bet", "KEY_hebrew_beth", "KEY_hebrew_gimel", "KEY_hebrew_gimmel",
+    "KEY_hebrew_dalet", "KEY_hebrew_daleth", "KEY_hebrew_he", "KEY_hebrew_waw",
+    "KEY_hebrew_zain", "KEY_hebrew_zayin", "KEY_hebrew_chet", "KEY_hebrew_het",
+    "KEY_hebrew_tet", "KEY_hebrew_teth", "KEY_hebrew_yod", "KEY_hebrew_finalkaph",
+    "KEY_hebrew_kaph", "KEY_hebrew_lamed", "KEY_hebrew_finalmem", "KEY_hebrew_mem",
+    "KEY_hebrew_finalnun", "KEY_hebrew_nun", "KEY_hebrew_samech", "KEY_hebrew_samekh",
+    "KEY_hebrew_ayin", "KEY_hebrew_finalpe", "KEY_hebrew_pe", "KEY_hebrew_finalzade",
+    "KEY_hebrew_finalzadi", "KEY_hebrew_zade", "KEY_hebrew_zadi", "KEY_hebrew_qoph",
+    "KEY_hebrew_kuf", "KEY_hebrew_resh", "KEY_hebrew_shin", "KEY_hebrew_taw",
+    "KEY_hebrew_taf", "KEY_Hebrew_switch", "KEY_Thai_kokai", "KEY_Thai_khokhai",
+    "KEY_Thai_khokhuat", "KEY_Thai_khokhwai", "KEY_Thai_khokhon", "KEY_Thai_khorakhang",
+    "KEY_Thai_ngongu", "KEY_Thai_chochan", "KEY_Thai_choching", "KEY_Thai_chochang",
+    "KEY_Thai_soso", "KEY_Thai_chochoe", "KEY_Thai_yoying", "KEY_Thai_dochada",
+    "KEY_Thai_topatak", "KEY_Thai_thothan", "KEY_Thai_thonangmontho",
+    "KEY_Thai_thophuthao", "KEY_Thai_nonen", "KEY_Thai_dodek", "KEY_Thai_totao",
+    "KEY_Thai_thothung", "KEY_Thai_thothahan", "KEY_Thai_thothong", "KEY_Thai_nonu",
+    "KEY_Thai_bobaimai", "KEY_Thai_popla", "KEY_Thai_phophung", "KEY_Thai_fofa",
+    "KEY_Thai_phophan", "KEY_Thai_fofan", "KEY_Thai_phosamphao", "KEY_Thai_moma",
+    "KEY_Thai_yoyak", "KEY_Thai_rorua", "KEY_Thai_ru", "KEY_Thai_loling", "KEY_Thai_lu",
+    "KEY_Thai_wowaen", "KEY_Thai_sosala", "KEY_Thai_sorusi", "KEY_Thai_sosua",
+    "KEY_Thai_hohip", "KEY_Thai_lochula", "KEY_Thai_oang", "KEY_Thai_honokhuk",
+    "KEY_Thai_paiyannoi", "KEY_Thai_saraa", "KEY_Thai_maihanakat", "KEY_Thai_saraaa",
+    "KEY_Thai_saraam", "KEY_Thai_sarai", "KEY_Thai_saraii", "KEY_Thai_saraue",
+    "KEY_Thai_sarauee", "KEY_Thai_sarau", "KEY_Thai_sarauu", "KEY_Thai_phinthu",
+    "KEY_Thai_maihanakat_maitho", "KEY_Thai_baht", "KEY_Thai_sarae", "KEY_Thai_saraae",
+    "KEY_Thai_sarao", "KEY_Thai_saraaimaimuan", "KEY_Thai_saraaimaimalai",
+    "KEY_Thai_lakkhangyao", "KEY_Thai_maiyamok", "KEY_Thai_maitaikhu", "KEY_Thai_maiek",
+    "KEY_Thai_maitho", "KEY_Thai_maitri", "KEY_Thai_maichattawa",
+    "KEY_Thai_thanthakhat", "KEY_Thai_nikhahit", "KEY_Thai_leksun", "KEY_Thai_leknung",
+    "KEY_Thai_leksong", "KEY_Thai_leksam", "KEY_Thai_leksi", "KEY_Thai_lekha",
+    "KEY_Thai_lekhok", "KEY_Thai_lekchet", "KEY_Thai_lekpaet", "KEY_Thai_lekkao",
+    "KEY_Hangul", "KEY_Hangul_Start", "KEY_Hangul_End", "KEY_Hangul_Hanja",
+    "KEY_Hangul_Jamo", "KEY_Hangul_Romaja", "KEY_Hangul_Codeinput", "KEY_Hangul_Jeonja",
+    "KEY_Hangul_Banja", "KEY_Hangul_PreHanja", "KEY_Hangul_PostHanja",
+    "KEY_Hangul_SingleCandidate", "KEY_Hangul_MultipleCandidate",
+    "KEY_Hangul_PreviousCandidate", "KEY_Hangul_Special", "KEY_Hangul_switch",
+    "KEY_Hangul_Kiyeog", "KEY_Hangul_SsangKiyeog", "KEY_Hangul_KiyeogSios",
+    "KEY_Hangul_Nieun", "KEY_Hangul_NieunJieuj", "KEY_Hangul_NieunHieuh",
+    "KEY_Hangul_Dikeud", "KEY_Hangul_SsangDikeud", "KEY_Hangul_Rieul",
+    "KEY_Hangul_RieulKiyeog", "KEY_Hangul_RieulMieum", "KEY_Hangul_RieulPieub",
+    "KEY_Hangul_RieulSios", "KEY_Hangul_RieulTieut", "KEY_Hangul_RieulPhieuf",
+    "KEY_Hangul_RieulHieuh", "KEY_Hangul_Mieum", "KEY_Hangul_Pieub",
+    "KEY_Hangul_SsangPieub", "KEY_Hangul_PieubSios", "KEY_Hangul_Sios",
+    "KEY_Hangul_SsangSios", "KEY_Hangul_Ieung", "KEY_Hangul_Jieuj",
+    "KEY_Hangul_SsangJieuj", "KEY_Hangul_Cieuc", "KEY_Hangul_Khieuq",
+    "KEY_Hangul_Tieut", "KEY_Hangul_Phieuf", "KEY_Hangul_Hieuh", "KEY_Hangul_A",
+    "KEY_Hangul_AE", "KEY_Hangul_YA", "KEY_Hangul_YAE", "KEY_Hangul_EO", "KEY_Hangul_E",
+    "KEY_Hangul_YEO", "KEY_Hangul_YE", "KEY_Hangul_O", "KEY_Hangul_WA",
+    "KEY_Hangul_WAE", "KEY_Hangul_OE", "KEY_Hangul_YO", "KEY_Hangul_U",
+    "KEY_Hangul_WEO", "KEY_Hangul_WE", "KEY_Hangul_WI", "KEY_Hangul_YU",
+    "KEY_Hangul_EU", "KEY_Hangul_YI", "KEY_Hangul_I", "KEY_Hangul_J_Kiyeog",
+    "KEY_Hangul_J_SsangKiyeog", "KEY_Hangul_J_KiyeogSios", "KEY_Hangul_J_Nieun",
+    "KEY_Hangul_J_NieunJieuj", "KEY_Hangul_J_NieunHieuh", "KEY_Hangul_J_Dikeud",
+    "KEY_Hangul_J_Rieul", "KEY_Hangul_J_RieulKiyeog", "KEY_Hangul_J_RieulMieum",
+    "KEY_Hangul_J_RieulPieub", "KEY_Hangul_J_RieulSios", "KEY_Hangul_J_RieulTieut",
+    "KEY_Hangul_J_RieulPhieuf", "KEY_Hangul_J_RieulHieuh", "KEY_Hangul_J_Mieum",
+    "KEY_Hangul_J_Pieub", "KEY_Hangul_J_PieubSios", "KEY_Hangul_J_Sios",
+    "KEY_Hangul_J_SsangSios", "KEY_Hangul_J_Ieung", "KEY_Hangul_J_Jieuj",
+    "KEY_Hangul_J_Cieuc", "KEY_Hangul_J_Khieuq", "KEY_Hangul_J_Tieut",
+    "KEY_Hangul_J_Phieuf", "KEY_Hangul_J_Hieuh", "KEY_Hangul_RieulYeorinHieuh",
+    "KEY_Hangul_SunkyeongeumMieum", "KEY_Hangul_SunkyeongeumPieub",
+    "KEY_Hangul_PanSios", "KEY_Hangul_KkogjiDalrinIeung",
+    "KEY_Hangul_SunkyeongeumPhieuf", "KEY_Hangul_YeorinHieuh", "KEY_Hangul_AraeA",
+    "KEY_Hangul_AraeAE", "KEY_Hangul_J_PanSios", "KEY_Hangul_J_KkogjiDalrinIeung",
+    "KEY_Hangul_J_YeorinHieuh", "KEY_Korean_Won", "KEY_Armenian_ligature_ew",
+    "KEY_Armenian_full_stop", "KEY_Armenian_verjaket", "KEY_Armenian_separation_mark",
+    "KEY_Armenian_but", "KEY_Armenian_hyphen", "KEY_Armenian_yentamna",
+    "KEY_Armenian_exclam", "KEY_Armenian_amanak", "KEY_Armenian_accent",
+    "KEY_Armenian_shesht", "KEY_Armenian_question", "KEY_Armenian_paruyk",
+    "KEY_Armenian_AYB", "KEY_Armenian_ayb", "KEY_Armenian_BEN", "KEY_Armenian_ben",
+    "KEY_Armenian_GIM", "KEY_Armenian_gim", "KEY_Armenian_DA", "KEY_Armenian_da",
+    "KEY_Armenian_YECH", "KEY_Armenian_yech", "KEY_Armenian_ZA", "KEY_Armenian_za",
+    "KEY_Armenian_E", "KEY_Armenian_e", "KEY_Armenian_AT", "KEY_Armenian_at",
+    "KEY_Armenian_TO", "KEY_Armenian_to", "KEY_Armenian_ZHE", "KEY_Armenian_zhe",
+    "KEY_Armenian_INI", "KEY_Armenian_ini", "KEY_Armenian_LYUN", "KEY_Armenian_lyun",
+    "KEY_Armenian_KHE", "KEY_Armenian_khe", "KEY_Armenian_TSA", "KEY_Armenian_tsa",
+    "KEY_Armenian_KEN", "KEY_Armenian_ken", "KEY_Armenian_HO", "KEY_Armenian_ho",
+    "KEY_Armenian_DZA", "KEY_Armenian_dza", "KEY_Armenian_GHAT", "KEY_Armenian_ghat",
+    "KEY_Armenian_TCHE", "KEY_Armenian_tche", "KEY_Armenian_MEN", "KEY_Armenian_men",
+    "KEY_Armenian_HI", "KEY_Armenian_hi", "KEY_Armenian_NU", "KEY_Armenian_nu",
+    "KEY_Armenian_SHA", "KEY_Armenian_sha", "KEY_Armenian_VO", "KEY_Armenian_vo",
+    "KEY_Armenian_CHA", "KEY_Armenian_cha", "KEY_Armenian_PE", "KEY_Armenian_pe",
+    "KEY_Armenian_JE", "KEY_Armenian_je", "KEY_Armenian_RA", "KEY_Armenian_ra",
+    "KEY_Armenian_SE", "KEY_Armenian_se", "KEY_Armenian_VEV", "KEY_Armenian_vev",
+    "KEY_Armenian_TYUN", "KEY_Armenian_tyun", "KEY_Armenian_RE", "KEY_Armenian_re",
+    "KEY_Armenian_TSO", "KEY_Armenian_tso", "KEY_Armenian_VYUN", "KEY_Armenian_vyun",
+    "KEY_Armenian_PYUR", "KEY_Armenian_pyur", "KEY_Armenian_KE", "KEY_Armenian_ke",
+    "KEY_Armenian_O", "KEY_Armenian_o", "KEY_Armenian_FE", "KEY_Armenian_fe",
+    "KEY_Armenian_apostrophe", "KEY_Georgian_an", "KEY_Georgian_ban",
+    "KEY_Georgian_gan", "KEY_Georgian_don", "KEY_Georgian_en", "KEY_Georgian_vin",
+    "KEY_Georgian_zen", "KEY_Georgian_tan", "KEY_Georgian_in", "KEY_Georgian_kan",
+    "KEY_Georgian_las", "KEY_Georgian_man", "KEY_Georgian_nar", "KEY_Georgian_on",
+    "KEY_Georgian_par", "KEY_Georgian_zhar", "KEY_Georgian_rae", "KEY_Georgian_san",
+    "KEY_Georgian_tar", "KEY_Georgian_un", "KEY_Georgian_phar", "KEY_Georgian_khar",
+    "KEY_Georgian_ghan", "KEY_Georgian_qar", "KEY_Georgian_shin", "KEY_Georgian_chin",
+    "KEY_Georgian_can", "KEY_Georgian_jil", "KEY_Georgian_cil", "KEY_Georgian_char",
+    "KEY_Georgian_xan", "KEY_Georgian_jhan", "KEY_Georgian_hae", "KEY_Georgian_he",
+    "KEY_Georgian_hie", "KEY_Georgian_we", "KEY_Georgian_har", "KEY_Georgian_hoe",
+    "KEY_Georgian_fi", "KEY_Xabovedot", "KEY_Ibreve", "KEY_Zstroke", "KEY_Gcaron",
+    "KEY_Ocaron", "KEY_Obarred", "KEY_xabovedot", "KEY_ibreve", "KEY_zstroke",
+    "KEY_gcaron", "KEY_ocaron", "KEY_obarred", "KEY_SCHWA", "KEY_schwa", "KEY_EZH",
+    "KEY_ezh", "KEY_Lbelowdot", "KEY_lbelowdot", "KEY_Abelowdot", "KEY_abelowdot",
+    "KEY_Ahook", "KEY_ahook", "KEY_Acircumflexacute", "KEY_acircumflexacute",
+    "KEY_Acircumflexgrave", "KEY_acircumflexgrave", "KEY_Acircumflexhook",
+    "KEY_acircumflexhook", "KEY_Acircumflextilde", "KEY_acircumflextilde",
+    "KEY_Acircumflexbelowdot", "KEY_acircumflexbelowdot", "KEY_Abreveacute",
+    "KEY_abreveacute", "KEY_Abrevegrave", "KEY_abrevegrave", "KEY_Abrevehook",
+    "KEY_abrevehook", "KEY_Abrevetilde", "KEY_abrevetilde", "KEY_Abrevebelowdot",
+    "KEY_abrevebelowdot", "KEY_Ebelowdot", "KEY_ebelowdot", "KEY_Ehook", "KEY_ehook",
+    "KEY_Etilde", "KEY_etilde", "KEY_Ecircumflexacute", "KEY_ecircumflexacute",
+    "KEY_Ecircumflexgrave", "KEY_ecircumflexgrave", "KEY_Ecircumflexhook",
+    "KEY_ecircumflexhook", "KEY_Ecircumflextilde", "KEY_ecircumflextilde",
+    "KEY_Ecircumflexbelowdot", "KEY_ecircumflexbelowdot", "KEY_Ihook", "KEY_ihook",
+    "KEY_Ibelowdot", "KEY_ibelowdot", "KEY_Obelowdot", "KEY_obelowdot", "KEY_Ohook",
+    "KEY_ohook", "KEY_Ocircumflexacute", "KEY_ocircumflexacute", "KEY_Ocircumflexgrave",
+    "KEY_ocircumflexgrave", "KEY_Ocircumflexhook", "KEY_ocircumflexhook",
+    "KEY_Ocircumflextilde", "KEY_ocircumflextilde", "KEY_Ocircumflexbelowdot",
+    "KEY_ocircumflexbelowdot", "KEY_Ohornacute", "KEY_ohornacute", "KEY_Ohorngrave",
+    "KEY_ohorngrave", "KEY_Ohornhook", "KEY_ohornhook", "KEY_Ohorntilde",
+    "KEY_ohorntilde", "KEY_Ohornbelowdot", "KEY_ohornbelowdot", "KEY_Ubelowdot",
+    "KEY_ubelowdot", "KEY_Uhook", "KEY_uhook", "KEY_Uhornacute", "KEY_uhornacute",
+    "KEY_Uhorngrave", "KEY_uhorngrave", "KEY_Uhornhook", "KEY_uhornhook",
+    "KEY_Uhorntilde", "KEY_uhorntilde", "KEY_Uhornbelowdot", "KEY_uhornbelowdot",
+    "KEY_Ybelowdot", "KEY_ybelowdot", "KEY_Yhook", "KEY_yhook", "KEY_Ytilde",
+    "KEY_ytilde", "KEY_Ohorn", "KEY_ohorn", "KEY_Uhorn", "KEY_uhorn", "KEY_EcuSign",
+    "KEY_ColonSign", "KEY_CruzeiroSign", "KEY_FFrancSign", "KEY_LiraSign",
+    "KEY_MillSign", "KEY_NairaSign", "KEY_PesetaSign", "KEY_RupeeSign", "KEY_WonSign",
+    "KEY_NewSheqelSign", "KEY_DongSign", "KEY_EuroSign", "KEY_zerosuperior",
+    "KEY_foursuperior", "KEY_fivesuperior", "KEY_sixsuperior", "KEY_sevensuperior",
+    "KEY_eightsuperior", "KEY_ninesuperior", "KEY_zerosubscript", "KEY_onesubscript",
+    "KEY_twosubscript", "KEY_threesubscript", "KEY_foursubscript", "KEY_fivesubscript",
+    "KEY_sixsubscript", "KEY_sevensubscript", "KEY_eightsubscript", "KEY_ninesubscript",
+    "KEY_partdifferential", "KEY_emptyset", "KEY_elementof", "KEY_notelementof",
+    "KEY_containsas", "KEY_squareroot", "KEY_cuberoot", "KEY_fourthroot",
+    "KEY_dintegral", "KEY_tintegral", "KEY_because", "KEY_approxeq", "KEY_notapproxeq",
+    "KEY_notidentical", "KEY_stricteq", "KEY_braille_dot_1", "KEY_braille_dot_2",
+    "KEY_braille_dot_3", "KEY_braille_dot_4", "KEY_braille_dot_5", "KEY_braille_dot_6",
+    "KEY_braille_dot_7", "KEY_braille_dot_8", "KEY_braille_dot_9", "KEY_braille_dot_10",
+    "KEY_braille_blank", "KEY_braille_dots_1", "KEY_braille_dots_2",
+    "KEY_braille_dots_12", "KEY_braille_dots_3", "KEY_braille_dots_13",
+    "KEY_braille_dots_23", "KEY_braille_dots_123", "KEY_braille_dots_4",
+    "KEY_braille_dots_14", "KEY_braille_dots_24", "KEY_braille_dots_124",
+    "KEY_braille_dots_34", "KEY_braille_dots_134", "KEY_braille_dots_234",
+    "KEY_braille_dots_1234", "KEY_braille_dots_5", "KEY_braille_dots_15",
+    "KEY_braille_dots_25", "KEY_braille_dots_125", "KEY_braille_dots_35",
+    "KEY_braille_dots_135", "KEY_braille_dots_235", "KEY_braille_dots_1235",
+    "KEY_braille_dots_45", "KEY_braille_dots_145", "KEY_braille_dots_245",
+    "KEY_braille_dots_1245", "KEY_braille_dots_345", "KEY_braille_dots_1345",
+    "KEY_braille_dots_2345", "KEY_braille_dots_12345", "KEY_braille_dots_6",
+    "KEY_braille_dots_16", "KEY_braille_dots_26", "KEY_braille_dots_126",
+    "KEY_braille_dots_36", "KEY_braille_dots_136", "KEY_braille_dots_236",
+    "KEY_braille_dots_1236", "KEY_braille_dots_46", "KEY_braille_dots_146",
+    "KEY_braille_dots_246", "KEY_braille_dots_1246", "KEY_braille_dots_346",
+    "KEY_braille_dots_1346", "KEY_braille_dots_2346", "KEY_braille_dots_12346",
+    "KEY_braille_dots_56", "KEY_braille_dots_156", "KEY_braille_dots_256",
+    "KEY_braille_dots_1256", "KEY_braille_dots_356", "KEY_braille_dots_1356",
+    "KEY_braille_dots_2356", "KEY_braille_dots_12356", "KEY_braille_dots_456",
+    "KEY_braille_dots_1456", "KEY_braille_dots_2456", "KEY_braille_dots_12456",
+    "KEY_braille_dots_3456", "KEY_braille_dots_13456", "KEY_braille_dots_23456",
+    "KEY_braille_dots_123456", "KEY_braille_dots_7", "KEY_braille_dots_17",
+    "KEY_braille_dots_27", "KEY_braille_dots_127", "KEY_braille_dots_37",
+    "KEY_braille_dots_137", "KEY_braille_dots_237", "KEY_braille_dots_1237",
+    "KEY_braille_dots_47", "KEY_braille_dots_147", "KEY_braille_dots_247",
+    "KEY_braille_dots_1247", "KEY_braille_dots_347", "KEY_braille_dots_1347",
+    "KEY_braille_dots_2347", "KEY_braille_dots_12347", "KEY_braille_dots_57",
+    "KEY_braille_dots_157", "KEY_braille_dots_257", "KEY_braille_dots_1257",
+    "KEY_braille_dots_357", "KEY_braille_dots_1357", "KEY_braille_dots_2357",
+    "KEY_braille_dots_12357", "KEY_braille_dots_457", "KEY_braille_dots_1457",
+    "KEY_braille_dots_2457", "KEY_braille_dots_12457", "KEY_braille_dots_3457",
+    "KEY_braille_dots_13457", "KEY_braille_dots_23457", "KEY_braille_dots_123457",
+    "KEY_braille_dots_67", "KEY_braille_dots_167", "KEY_braille_dots_267",
+    "KEY_braille_dots_1267", "KEY_braille_dots_367", "KEY_braille_dots_1367",
+    "KEY_braille_dots_2367", "KEY_braille_dots_12367", "KEY_braille_dots_467",
+    "KEY_braille_dots_1467", "KEY_braille_dots_2467", "KEY_braille_dots_12467",
+    "KEY_braille_dots_3467", "KEY_braille_dots_13467", "KEY_braille_dots_23467",
+    "KEY_braille_dots_123467", "KEY_braille_dots_567", "KEY_braille_dots_1567",
+    "KEY_braille_dots_2567", "KEY_braille_dots_12567", "KEY_braille_dots_3567",
+    "KEY_braille_dots_13567", "KEY_braille_dots_23567", "KEY_braille_dots_123567",
+    "KEY_braille_dots_4567", "KEY_braille_dots_14567", "KEY_braille_dots_24567",
+    "KEY_braille_dots_124567", "KEY_braille_dots_34567", "KEY_braille_dots_134567",
+    "KEY_braille_dots_234567", "KEY_braille_dots_1234567", "KEY_braille_dots_8",
+    "KEY_braille_dots_18", "KEY_braille_dots_28", "KEY_braille_dots_128",
+    "KEY_braille_dots_38", "KEY_braille_dots_138", "KEY_braille_dots_238",
+    "KEY_braille_dots_1238", "KEY_braille_dots_48", "KEY_braille_dots_148",
+    "KEY_braille_dots_248", "KEY_braille_dots_1248", "KEY_braille_dots_348",
+    "KEY_braille_dots_1348", "KEY_braille_dots_2348", "KEY_braille_dots_12348",
+    "KEY_braille_dots_58", "KEY_braille_dots_158", "KEY_braille_dots_258",
+    "KEY_braille_dots_1258", "KEY_braille_dots_358", "KEY_braille_dots_1358",
+    "KEY_braille_dots_2358", "KEY_braille_dots_12358", "KEY_braille_dots_458",
+    "KEY_braille_dots_1458", "KEY_braille_dots_2458", "KEY_braille_dots_12458",
+    "KEY_braille_dots_3458", "KEY_braille_dots_13458", "KEY_braille_dots_23458",
+    "KEY_braille_dots_123458", "KEY_braille_dots_68", "KEY_braille_dots_168",
+    "KEY_braille_dots_268", "KEY_braille_dots_1268", "KEY_braille_dots_368",
+    "KEY_braille_dots_1368", "KEY_braille_dots_2368", "KEY_braille_dots_12368",
+    "KEY_braille_dots_468", "KEY_braille_dots_1468", "KEY_braille_dots_2468",
+    "KEY_braille_dots_12468", "KEY_braille_dots_3468", "KEY_braille_dots_13468",
+    "KEY_braille_dots_23468", "KEY_braille_dots_123468", "KEY_braille_dots_568",
+    "KEY_braille_dots_1568", "KEY_braille_dots_2568", "KEY_braille_dots_12568",
+    "KEY_braille_dots_3568", "KEY_braille_dots_13568", "KEY_braille_dots_23568",
+    "KEY_braille_dots_123568", "KEY_braille_dots_4568", "KEY_braille_dots_14568",
+    "KEY_braille_dots_24568", "KEY_braille_dots_124568", "KEY_braille_dots_34568",
+    "KEY_braille_dots_134568", "KEY_braille_dots_234568", "KEY_braille_dots_1234568",
+    "KEY_braille_dots_78", "KEY_braille_dots_178", "KEY_braille_dots_278",
+    "KEY_braille_dots_1278", "KEY_braille_dots_378", "KEY_braille_dots_1378",
+    "KEY_braille_dots_2378", "KEY_braille_dots_12378", "KEY_braille_dots_478",
+    "KEY_braille_dots_1478", "KEY_braille_dots_2478", "KEY_braille_dots_12478",
+    "KEY_braille_dots_3478", "KEY_braille_dots_13478", "KEY_braille_dots_23478",
+    "KEY_braille_dots_123478", "KEY_braille_dots_578", "KEY_braille_dots_1578",
+    "KEY_braille_dots_2578", "KEY_braille_dots_12578", "KEY_braille_dots_3578",
+    "KEY_braille_dots_13578", "KEY_braille_dots_23578", "KEY_braille_dots_123578",
+    "KEY_braille_dots_4578", "KEY_braille_dots_14578", "KEY_braille_dots_24578",
+    "KEY_braille_dots_124578", "KEY_braille_dots_34578", "KEY_braille_dots_134578",
+    "KEY_braille_dots_234578", "KEY_braille_dots_1234578", "KEY_braille_dots_678",
+    "KEY_braille_dots_1678", "KEY_braille_dots_2678", "KEY_braille_dots_12678",
+    "KEY_braille_dots_3678", "KEY_braille_dots_13678", "KEY_braille_dots_23678",
+    "KEY_braille_dots_123678", "KEY_braille_dots_4678", "KEY_braille_dots_14678",
+    "KEY_braille_dots_24678", "KEY_braille_dots_124678", "KEY_braille_dots_34678",
+    "KEY_braille_dots_134678", "KEY_braille_dots_234678", "KEY_braille_dots_1234678",
+    "KEY_braille_dots_5678", "KEY_braille_dots_15678", "KEY_braille_dots_25678",
+    "KEY_braille_dots_125678", "KEY_braille_dots_35678", "KEY_braille_dots_135678",
+    "KEY_braille_dots_235678", "KEY_braille_dots_1235678", "KEY_braille_dots_45678",
+    "KEY_braille_dots_145678", "KEY_braille_dots_245678", "KEY_braille_dots_1245678",
+    "KEY_braille_dots_345678", "KEY_braille_dots_1345678", "KEY_braille_dots_2345678",
+    "KEY_braille_dots_12345678", "KEY_Sinh_ng", "KEY_Sinh_h2", "KEY_Sinh_a",
+    "KEY_Sinh_aa", "KEY_Sinh_ae", "KEY_Sinh_aee", "KEY_Sinh_i", "KEY_Sinh_ii",
+    "KEY_Sinh_u", "KEY_Sinh_uu", "KEY_Sinh_ri", "KEY_Sinh_rii", "KEY_Sinh_lu",
+    "KEY_Sinh_luu", "KEY_Sinh_e", "KEY_Sinh_ee", "KEY_Sinh_ai", "KEY_Sinh_o",
+    "KEY_Sinh_oo", "KEY_Sinh_au", "KEY_Sinh_ka", "KEY_Sinh_kha", "KEY_Sinh_ga",
+    "KEY_Sinh_gha", "KEY_Sinh_ng2", "KEY_Sinh_nga", "KEY_Sinh_ca", "KEY_Sinh_cha",
+    "KEY_Sinh_ja", "KEY_Sinh_jha", "KEY_Sinh_nya", "KEY_Sinh_jnya", "KEY_Sinh_nja",
+    "KEY_Sinh_tta", "KEY_Sinh_ttha", "KEY_Sinh_dda", "KEY_Sinh_ddha", "KEY_Sinh_nna",
+    "KEY_Sinh_ndda", "KEY_Sinh_tha", "KEY_Sinh_thha", "KEY_Sinh_dha", "KEY_Sinh_dhha",
+    "KEY_Sinh_na", "KEY_Sinh_ndha", "KEY_Sinh_pa", "KEY_Sinh_pha", "KEY_Sinh_ba",
+    "KEY_Sinh_bha", "KEY_Sinh_ma", "KEY_Sinh_mba", "KEY_Sinh_ya", "KEY_Sinh_ra",
+    "KEY_Sinh_la", "KEY_Sinh_va", "KEY_Sinh_sha", "KEY_Sinh_ssha", "KEY_Sinh_sa",
+    "KEY_Sinh_ha", "KEY_Sinh_lla", "KEY_Sinh_fa", "KEY_Sinh_al", "KEY_Sinh_aa2",
+    "KEY_Sinh_ae2", "KEY_Sinh_aee2", "KEY_Sinh_i2", "KEY_Sinh_ii2", "KEY_Sinh_u2",
+    "KEY_Sinh_uu2", "KEY_Sinh_ru2", "KEY_Sinh_e2", "KEY_Sinh_ee2", "KEY_Sinh_ai2",
+    "KEY_Sinh_o2", "KEY_Sinh_oo2", "KEY_Sinh_au2", "KEY_Sinh_lu2", "KEY_Sinh_ruu2",
+    "KEY_Sinh_luu2", "KEY_Sinh_kunddaliya", "KEY_ModeLock", "KEY_MonBrightnessUp",
+    "KEY_MonBrightnessDown", "KEY_KbdLightOnOff", "KEY_KbdBrightnessUp",
+    "KEY_KbdBrightnessDown", "KEY_Standby", "KEY_AudioLowerVolume", "KEY_AudioMute",
+    "KEY_AudioRaiseVolume", "KEY_AudioPlay", "KEY_AudioStop", "KEY_AudioPrev",
+    "KEY_AudioNext", "KEY_HomePage", "KEY_Mail", "KEY_Start", "KEY_Search",
+    "KEY_AudioRecord", "KEY_Calculator", "KEY_Memo", "KEY_ToDoList", "KEY_Calendar",
+    "KEY_PowerDown", "KEY_ContrastAdjust", "KEY_RockerUp", "KEY_RockerDown",
+    "KEY_RockerEnter", "KEY_Back", "KEY_Forward", "KEY_Stop", "KEY_Refresh",
+    "KEY_PowerOff", "KEY_WakeUp", "KEY_Eject", "KEY_ScreenSaver", "KEY_WWW",
+    "KEY_Sleep", "KEY_Favorites", "KEY_AudioPause", "KEY_AudioMedia", "KEY_MyComputer",
+    "KEY_VendorHome", "KEY_LightBulb", "KEY_Shop", "KEY_History", "KEY_OpenURL",
+    "KEY_AddFavorite", "KEY_HotLinks", "KEY_BrightnessAdjust", "KEY_Finance",
+    "KEY_Community", "KEY_AudioRewind", "KEY_BackForward", "KEY_Launch0", "KEY_Launch1",
+    "KEY_Launch2", "KEY_Launch3", "KEY_Launch4", "KEY_Launch5", "KEY_Launch6",
+    "KEY_Launch7", "KEY_Launch8", "KEY_Launch9", "KEY_LaunchA", "KEY_LaunchB",
+    "KEY_LaunchC", "KEY_LaunchD", "KEY_LaunchE", "KEY_LaunchF", "KEY_ApplicationLeft",
+    "KEY_ApplicationRight", "KEY_Book", "KEY_CD", "KEY_WindowClear", "KEY_Close",
+    "KEY_Copy", "KEY_Cut", "KEY_Display", "KEY_DOS", "KEY_Documents", "KEY_Excel",
+    "KEY_Explorer", "KEY_Game", "KEY_Go", "KEY_iTouch", "KEY_LogOff", "KEY_Market",
+    "KEY_Meeting", "KEY_MenuKB", "KEY_MenuPB", "KEY_MySites", "KEY_New", "KEY_News",
+    "KEY_OfficeHome", "KEY_Open", "KEY_Option", "KEY_Paste", "KEY_Phone", "KEY_Reply",
+    "KEY_Reload", "KEY_RotateWindows", "KEY_RotationPB", "KEY_RotationKB", "KEY_Save",
+    "KEY_ScrollUp", "KEY_ScrollDown", "KEY_ScrollClick", "KEY_Send", "KEY_Spell",
+    "KEY_SplitScreen", "KEY_Support", "KEY_TaskPane", "KEY_Terminal", "KEY_Tools",
+    "KEY_Travel", "KEY_UserPB", "KEY_User1KB", "KEY_User2KB", "KEY_Video",
+    "KEY_WheelButton", "KEY_Word", "KEY_Xfer", "KEY_ZoomIn", "KEY_ZoomOut", "KEY_Away",
+    "KEY_Messenger", "KEY_WebCam", "KEY_MailForward", "KEY_Pictures", "KEY_Music",
+    "KEY_Battery", "KEY_Bluetooth", "KEY_WLAN", "KEY_UWB", "KEY_AudioForward",
+    "KEY_AudioRepeat", "KEY_AudioRandomPlay", "KEY_Subtitle", "KEY_AudioCycleTrack",
+    "KEY_CycleAngle", "KEY_FrameBack", "KEY_FrameForward", "KEY_Time",
+    "KEY_SelectButton", "KEY_View", "KEY_TopMenu", "KEY_Red", "KEY_Green", "KEY_Yellow",
+    "KEY_Blue", "KEY_Suspend", "KEY_Hibernate", "KEY_TouchpadToggle", "KEY_TouchpadOn",
+    "KEY_TouchpadOff", "KEY_AudioMicMute", "KEY_Switch_VT_1", "KEY_Switch_VT_2",
+    "KEY_Switch_VT_3", "KEY_Switch_VT_4", "KEY_Switch_VT_5", "KEY_Switch_VT_6",
+    "KEY_Switch_VT_7", "KEY_Switch_VT_8", "KEY_Switch_VT_9", "KEY_Switch_VT_10",
+    "KEY_Switch_VT_11", "KEY_Switch_VT_12", "KEY_Ungrab", "KEY_ClearGrab",
+    "KEY_Next_VMode", "KEY_Prev_VMode", "KEY_LogWindowTree", "KEY_LogGrabInfo",
+)
+VALUES = (
+    0xFFFFFF, 0xFF08, 0xFF09, 0xFF0A, 0xFF0B, 0xFF0D, 0xFF13, 0xFF14, 0xFF15, 0xFF1B,
+    0xFFFF, 0xFF20, 0xFF37, 0xFF3C, 0xFF3D, 0xFF3E, 0xFF21, 0xFF22, 0xFF23, 0xFF23,
+    0xFF24, 0xFF25, 0xFF26, 0xFF27, 0xFF28, 0xFF29, 0xFF2A, 0xFF2B, 0xFF2C, 0xFF2D,
+    0xFF2E, 0xFF2F, 0xFF30, 0xFF37, 0xFF3D, 0xFF3E, 0xFF50, 0xFF51, 0xFF52, 0xFF53,
+    0xFF54, 0xFF55, 0xFF55, 0xFF56, 0xFF56, 0xFF57, 0xFF58, 0xFF60, 0xFF61, 0xFF62,
+    0xFF63, 0xFF65, 0xFF66, 0xFF67, 0xFF68, 0xFF69, 0xFF6A, 0xFF6B, 0xFF7E, 0xFF7E,
+    0xFF7F, 0xFF80, 0xFF89, 0xFF8D, 0xFF91, 0xFF92, 0xFF93, 0xFF94, 0xFF95, 0xFF96,
+    0xFF97, 0xFF98, 0xFF99, 0xFF9A, 0xFF9A, 0xFF9B, 0xFF9B, 0xFF9C, 0xFF9D, 0xFF9E,
+    0xFF9F, 0xFFBD, 0xFFAA, 0xFFAB, 0xFFAC, 0xFFAD, 0xFFAE, 0xFFAF, 0xFFB0, 0xFFB1,
+    0xFFB2, 0xFFB3, 0xFFB4, 0xFFB5, 0xFFB6, 0xFFB7, 0xFFB8, 0xFFB9, 0xFFBE, 0xFFBF,
+    0xFFC0, 0xFFC1, 0xFFC2, 0xFFC3, 0xFFC4, 0xFFC5, 0xFFC6, 0xFFC7, 0xFFC8, 0xFFC8,
+    0xFFC9, 0xFFC9, 0xFFCA, 0xFFCA, 0xFFCB, 0xFFCB, 0xFFCC, 0xFFCC, 0xFFCD, 0xFFCD,
+    0xFFCE, 0xFFCE, 0xFFCF, 0xFFCF, 0xFFD0, 0xFFD0, 0xFFD1, 0xFFD1, 0xFFD2, 0xFFD2,
+    0xFFD3, 0xFFD3, 0xFFD4, 0xFFD4, 0xFFD5, 0xFFD5, 0xFFD6, 0xFFD6, 0xFFD7, 0xFFD7,
+    0xFFD8, 0xFFD8, 0xFFD9, 0xFFD9, 0xFFDA, 0xFFDA, 0xFFDB, 0xFFDB, 0xFFDC, 0xFFDC,
+    0xFFDD, 0xFFDD, 0xFFDE, 0xFFDE, 0xFFDF, 0xFFDF, 0xFFE0, 0xFFE0, 0xFFE1, 0xFFE2,
+    0xFFE3, 0xFFE4, 0xFFE5, 0xFFE6, 0xFFE7, 0xFFE8, 0xFFE9, 0xFFEA, 0xFFEB, 0xFFEC,
+    0xFFED, 0xFFEE, 0xFE01, 0xFE02, 0xFE03, 0xFE04, 0xFE05, 0xFE11, 0xFE12, 0xFE13,
+    0xFF7E, 0xFE06, 0xFE07, 0xFE08, 0xFE09, 0xFE0A, 0xFE0B, 0xFE0C, 0xFE0D, 0xFE0E,
+    0xFE0F, 0xFE20, 0xFE21, 0xFE22, 0xFE23, 0xFE24, 0xFE25, 0xFE26, 0xFE27, 0xFE28,
+    0xFE29, 0xFE2A, 0xFE2B, 0xFE2C, 0xFE2D, 0xFE2E, 0xFE2F, 0xFE30, 0xFE31, 0xFE32,
+    0xFE33, 0xFE34, 0xFE50, 0xFE51, 0xFE52, 0xFE53, 0xFE53, 0xFE54, 0xFE55, 0xFE56,
+    0xFE57, 0xFE58, 0xFE59, 0xFE5A, 0xFE5B, 0xFE5C, 0xFE5D, 0xFE5E, 0xFE5F, 0xFE60,
+    0xFE61, 0xFE62, 0xFE63, 0xFE64, 0xFE64, 0xFE65, 0xFE65, 0xFE66, 0xFE67, 0xFE68,
+    0xFE69, 0xFE6A, 0xFE6B, 0xFE6C, 0xFE6D, 0xFE6E, 0xFE6F, 0xFE90, 0xFE91, 0xFE92,
+    0xFE93, 0xFE80, 0xFE81, 0xFE82, 0xFE83, 0xFE84, 0xFE85, 0xFE86, 0xFE87, 0xFE88,
+    0xFE89, 0xFE8A, 0xFE8B, 0xFE8C, 0xFED0, 0xFED1, 0xFED2, 0xFED4, 0xFED5, 0xFE70,
+    0xFE71, 0xFE72, 0xFE73, 0xFE74, 0xFE75, 0xFE76, 0xFE77, 0xFE78, 0xFE79, 0xFE7A,
+    0xFEE0, 0xFEE1, 0xFEE2, 0xFEE3, 0xFEE4, 0xFEE5, 0xFEE6, 0xFEE7, 0xFEE8, 0xFEE9,
+    0xFEEA, 0xFEEB, 0xFEEC, 0xFEED, 0xFEEE, 0xFEEF, 0xFEF0, 0xFEF1, 0xFEF2, 0xFEF3,
+    0xFEF4, 0xFEF5, 0xFEF6, 0xFEF7, 0xFEF8, 0xFEFD, 0xFEF9, 0xFEFA, 0xFEFB, 0xFEFC,
+    0xFEA0, 0xFEA1, 0xFEA2, 0xFEA3, 0xFEA4, 0xFEA5, 0xFD01, 0xFD02, 0xFD03, 0xFD04,
+    0xFD05, 0xFD06, 0xFD07, 0xFD08, 0xFD09, 0xFD0A, 0xFD0B, 0xFD0C, 0xFD0D, 0xFD0E,
+    0xFD0F, 0xFD10, 0xFD11, 0xFD12, 0xFD13, 0xFD14, 0xFD15, 0xFD16, 0xFD17, 0xFD18,
+    0xFD19, 0xFD1A, 0xFD1B, 0xFD1C, 0xFD1D, 0xFD1E, 0x20, 0x21, 0x22, 0x23, 0x24, 0x25,
+    0x26, 0x27, 0x27, 0x28, 0x29, 0x2A, 0x2B, 0x2C, 0x2D, 0x2E, 0x2F, 0x30, 0x31, 0x32,
+    0x33, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39, 0x3A, 0x3B, 0x3C, 0x3D, 0x3E, 0x3F, 0x40,
+    0x41, 0x42, 0x43, 0x44, 0x45, 0x46, 0x47, 0x48, 0x49, 0x4A, 0x4B, 0x4C, 0x4D, 0x4E,
+    0x4F, 0x50, 0x51, 0x52, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59, 0x5A, 0x5B, 0x5C,
+    0x5D, 0x5E, 0x5F, 0x60, 0x60, 0x61, 0x62, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x69,
+    0x6A, 0x6B, 0x6C, 0x6D, 0x6E, 0x6F, 0x70, 0x71, 0x72, 0x73, 0x74, 0x75, 0x76, 0x77,
+    0x78, 0x79, 0x7A, 0x7B, 0x7C, 0x7D, 0x7E, 0xA0, 0xA1, 0xA2, 0xA3, 0xA4, 0xA5, 0xA6,
+    0xA7, 0xA8, 0xA9, 0xAA, 0xAB, 0xAC, 0xAD, 0xAE, 0xAF, 0xB0, 0xB1, 0xB2, 0xB3, 0xB4,
+    0xB5, 0xB6, 0xB7, 0xB8, 0xB9, 0xBA, 0xBB, 0xBC, 0xBD, 0xBE, 0xBF, 0xC0, 0xC1, 0xC2,
+    0xC3, 0xC4, 0xC5, 0xC6, 0xC7, 0xC8, 0xC9, 0xCA, 0xCB, 0xCC, 0xCD, 0xCE, 0xCF, 0xD0,
+    0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7, 0xD8, 0xD8, 0xD9, 0xDA, 0xDB, 0xDC,
+    0xDD, 0xDE, 0xDE, 0xDF, 0xE0, 0xE1, 0xE2, 0xE3, 0xE4, 0xE5, 0xE6, 0xE7, 0xE8, 0xE9,
+    0xEA, 0xEB, 0xEC, 0xED, 0xEE, 0xEF, 0xF0, 0xF1, 0xF2, 0xF3, 0xF4, 0xF5, 0xF6, 0xF7,
+    0xF8, 0xF8, 0xF9, 0xFA, 0xFB, 0xFC, 0xFD, 0xFE, 0xFF, 0x1A1, 0x1A2, 0x1A3, 0x1A5,
+    0x1A6, 0x1A9, 0x1AA, 0x1AB, 0x1AC, 0x1AE, 0x1AF, 0x1B1, 0x1B2, 0x1B3, 0x1B5, 0x1B6,
+    0x1B7, 0x1B9, 0x1BA, 0x1BB, 0x1BC, 0x1BD, 0x1BE, 0x1BF, 0x1C0, 0x1C3, 0x1C5, 0x1C6,
+    0x1C8, 0x1CA, 0x1CC, 0x1CF, 0x1D0, 0x1D1, 0x1D2, 0x1D5, 0x1D8, 0x1D9, 0x1DB, 0x1DE,
+    0x1E0, 0x1E3, 0x1E5, 0x1E6, 0x1E8, 0x1EA, 0x1EC, 0x1EF, 0x1F0, 0x1F1, 0x1F2, 0x1F5,
+    0x1F8, 0x1F9, 0x1FB, 0x1FE, 0x1FF, 0x2A1, 0x2A6, 0x2A9, 0x2AB, 0x2AC, 0x2B1, 0x2B6,
+    0x2B9, 0x2BB, 0x2BC, 0x2C5, 0x2C6, 0x2D5, 0x2D8, 0x2DD, 0x2DE, 0x2E5, 0x2E6, 0x2F5,
+    0x2F8, 0x2FD, 0x2FE, 0x3A2, 0x3A2, 0x3A3, 0x3A5, 0x3A6, 0x3AA, 0x3AB, 0x3AC, 0x3B3,
+    0x3B5, 0x3B6, 0x3BA, 0x3BB, 0x3BC, 0x3BD, 0x3BF, 0x3C0, 0x3C7, 0x3CC, 0x3CF, 0x3D1,
+    0x3D2, 0x3D3, 0x3D9, 0x3DD, 0x3DE, 0x3E0, 0x3E7, 0x3EC, 0x3EF, 0x3F1, 0x3F2, 0x3F3,
+    0x3F9, 0x3FD, 0x3FE, 0x1000174, 0x1000175, 0x1000176, 0x1000177, 0x1001E02,
+    0x1001E03, 0x1001E0A, 0x1001E0B, 0x1001E1E, 0x1001E1F, 0x1001E40, 0x1001E41,
+    0x1001E56, 0x1001E57, 0x1001E60, 0x1001E61, 0x1001E6A, 0x1001E6B, 0x1001E80,
+    0x1001E81, 0x1001E82, 0x1001E83, 0x1001E84, 0x1001E85, 0x1001EF2, 0x1001EF3, 0x13BC,
+    0x13BD, 0x13BE, 0x47E, 0x4A1, 0x4A2, 0x4A3, 0x4A4, 0x4A5, 0x4A5, 0x4A6, 0x4A7,
+    0x4A8, 0x4A9, 0x4AA, 0x4AB, 0x4AC, 0x4AD, 0x4AE, 0x4AF, 0x4AF, 0x4B0, 0x4B1, 0x4B2,
+    0x4B3, 0x4B4, 0x4B5, 0x4B6, 0x4B7, 0x4B8, 0x4B9, 0x4BA, 0x4BB, 0x4BC, 0x4BD, 0x4BE,
+    0x4BF, 0x4C0, 0x4C1, 0x4C1, 0x4C2, 0x4C2, 0x4C3, 0x4C4, 0x4C5, 0x4C6, 0x4C7, 0x4C8,
+    0x4C9, 0x4CA, 0x4CB, 0x4CC, 0x4CC, 0x4CD, 0x4CE, 0x4CF, 0x4D0, 0x4D1, 0x4D2, 0x4D3,
+    0x4D4, 0x4D5, 0x4D6, 0x4D7, 0x4D8, 0x4D9, 0x4DA, 0x4DB, 0x4DC, 0x4DD, 0x4DE, 0x4DF,
+    0xFF7E, 0x10006F0, 0x10006F1, 0x10006F2, 0x10006F3, 0x10006F4, 0x10006F5, 0x10006F6,
+    0x10006F7, 0x10006F8, 0x10006F9, 0x100066A, 0x1000670, 0x1000679, 0x100067E,
+    0x1000686, 0x1000688, 0x1000691, 0x5AC, 0x10006D4, 0x1000660, 0x1000661, 0x1000662,
+    0x1000663, 0x1000664, 0x1000665, 0x1000666, 0x1000667, 0x1000668, 0x1000669, 0x5BB,
+    0x5BF, 0x5C1, 0x5C2, 0x5C3, 0x5C4, 0x5C5, 0x5C6, 0x5C7, 0x5C8, 0x5C9, 0x5CA, 0x5CB,
+    0x5CC, 0x5CD, 0x5CE, 0x5CF, 0x5D0, 0x5D1, 0x5D2, 0x5D3, 0x5D4, 0x5D5, 0x5D6, 0x5D7,
+    0x5D8, 0x5D9, 0x5DA, 0x5E0, 0x5E1, 0x5E2, 0x5E3, 0x5E4, 0x5E5, 0x5E6, 0x5E7, 0x5E7,
+    0x5E8, 0x5E9, 0x5EA, 0x5EB, 0x5EC, 0x5ED, 0x5EE, 0x5EF, 0x5F0, 0x5F1, 0x5F2,
+    0x1000653, 0x1000654, 0x1000655, 0x1000698, 0x10006A4, 0x10006A9, 0x10006AF,
+    0x10006BA, 0x10006BE, 0x10006CC, 0x10006CC, 0x10006D2, 0x10006C1, 0xFF7E, 0x1000492,
+    0x1000493, 0x1000496, 0x1000497, 0x100049A, 0x100049B, 0x100049C, 0x100049D,
+    0x10004A2, 0x10004A3, 0x10004AE, 0x10004AF, 0x10004B0, 0x10004B1, 0x10004B2,
+    0x10004B3, 0x10004B6, 0x10004B7, 0x10004B8, 0x10004B9, 0x10004BA, 0x10004BB,
+    0x10004D8, 0x10004D9, 0x10004E2, 0x10004E3, 0x10004E8, 0x10004E9, 0x10004EE,
+    0x10004EF, 0x6A1, 0x6A2, 0x6A3, 0x6A4, 0x6A4, 0x6A5, 0x6A6, 0x6A6, 0x6A7, 0x6A7,
+    0x6A8, 0x6A8, 0x6A9, 0x6A9, 0x6AA, 0x6AA, 0x6AB, 0x6AC, 0x6AD, 0x6AE, 0x6AF, 0x6AF,
+    0x6B0, 0x6B1, 0x6B2, 0x6B3, 0x6B4, 0x6B4, 0x6B5, 0x6B6, 0x6B6, 0x6B7, 0x6B7, 0x6B8,
+    0x6B8, 0x6B9, 0x6B9, 0x6BA, 0x6BA, 0x6BB, 0x6BC, 0x6BD, 0x6BE, 0x6BF, 0x6BF, 0x6C0,
+    0x6C1, 0x6C2, 0x6C3, 0x6C4, 0x6C5, 0x6C6, 0x6C7, 0x6C8, 0x6C9, 0x6CA, 0x6CB, 0x6CC,
+    0x6CD, 0x6CE, 0x6CF, 0x6D0, 0x6D1, 0x6D2, 0x6D3, 0x6D4, 0x6D5, 0x6D6, 0x6D7, 0x6D8,
+    0x6D9, 0x6DA, 0x6DB, 0x6DC, 0x6DD, 0x6DE, 0x6DF, 0x6E0, 0x6E1, 0x6E2, 0x6E3, 0x6E4,
+    0x6E5, 0x6E6, 0x6E7, 0x6E8, 0x6E9, 0x6EA, 0x6EB, 0x6EC, 0x6ED, 0x6EE, 0x6EF, 0x6F0,
+    0x6F1, 0x6F2, 0x6F3, 0x6F4, 0x6F5, 0x6F6, 0x6F7, 0x6F8, 0x6F9, 0x6FA, 0x6FB, 0x6FC,
+    0x6FD, 0x6FE, 0x6FF, 0x7A1, 0x7A2, 0x7A3, 0x7A4, 0x7A5, 0x7A5, 0x7A7, 0x7A8, 0x7A9,
+    0x7AB, 0x7AE, 0x7AF, 0x7B1, 0x7B2, 0x7B3, 0x7B4, 0x7B5, 0x7B6, 0x7B7, 0x7B8, 0x7B9,
+    0x7BA, 0x7BB, 0x7C1, 0x7C2, 0x7C3, 0x7C4, 0x7C5, 0x7C6, 0x7C7, 0x7C8, 0x7C9, 0x7CA,
+    0x7CB, 0x7CB, 0x7CC, 0x7CD, 0x7CE, 0x7CF, 0x7D0, 0x7D1, 0x7D2, 0x7D4, 0x7D5, 0x7D6,
+    0x7D7, 0x7D8, 0x7D9, 0x7E1, 0x7E2, 0x7E3, 0x7E4, 0x7E5, 0x7E6, 0x7E7, 0x7E8, 0x7E9,
+    0x7EA, 0x7EB, 0x7EB, 0x7EC, 0x7ED, 0x7EE, 0x7EF, 0x7F0, 0x7F1, 0x7F2, 0x7F3, 0x7F4,
+    0x7F5, 0x7F6, 0x7F7, 0x7F8, 0x7F9, 0xFF7E, 0x8A1, 0x8A2, 0x8A3, 0x8A4, 0x8A5, 0x8A6,
+    0x8A7, 0x8A8, 0x8A9, 0x8AA, 0x8AB, 0x8AC, 0x8AD, 0x8AE, 0x8AF, 0x8B0, 0x8B1, 0x8B2,
+    0x8B3, 0x8B4, 0x8B5, 0x8B6, 0x8B7, 0x8BC, 0x8BD, 0x8BE, 0x8BF, 0x8C0, 0x8C1, 0x8C2,
+    0x8C5, 0x8C8, 0x8C9, 0x8CD, 0x8CE, 0x8CF, 0x8D6, 0x8DA, 0x8DB, 0x8DC, 0x8DD, 0x8DE,
+    0x8DF, 0x8EF, 0x8F6, 0x8FB, 0x8FC, 0x8FD, 0x8FE, 0x9DF, 0x9E0, 0x9E1, 0x9E2, 0x9E3,
+    0x9E4, 0x9E5, 0x9E8, 0x9E9, 0x9EA, 0x9EB, 0x9EC, 0x9ED, 0x9EE, 0x9EF, 0x9F0, 0x9F1,
+    0x9F2, 0x9F3, 0x9F4, 0x9F5, 0x9F6, 0x9F7, 0x9F8, 0xAA1, 0xAA2, 0xAA3, 0xAA4, 0xAA5,
+    0xAA6, 0xAA7, 0xAA8, 0xAA9, 0xAAA, 0xAAC, 0xAAE, 0xAAF, 0xAB0, 0xAB1, 0xAB2, 0xAB3,
+    0xAB4, 0xAB5, 0xAB6, 0xAB7, 0xAB8, 0xABB, 0xABC, 0xABD, 0xABE, 0xABF, 0xAC3, 0xAC4,
+    0xAC5, 0xAC6, 0xAC9, 0xACA, 0xACB, 0xACC, 0xACD, 0xACE, 0xACF, 0xAD0, 0xAD1, 0xAD2,
+    0xAD3, 0xAD4, 0xAD5, 0xAD6, 0xAD7, 0xAD9, 0xADA, 0xADB, 0xADC, 0xADD, 0xADE, 0xADF,
+    0xAE0, 0xAE1, 0xAE2, 0xAE3, 0xAE4, 0xAE5, 0xAE6, 0xAE7, 0xAE8, 0xAE9, 0xAEA, 0xAEB,
+    0xAEC, 0xAED, 0xAEE, 0xAF0, 0xAF1, 0xAF2, 0xAF3, 0xAF4, 0xAF5, 0xAF6, 0xAF7, 0xAF8,
+    0xAF9, 0xAFA, 0xAFB, 0xAFC, 0xAFD, 0xAFE, 0xAFF, 0xBA3, 0xBA6, 0xBA8, 0xBA9, 0xBC0,
+    0xBC2, 0xBC3, 0xBC4, 0xBC6, 0xBCA, 0xBCC, 0xBCE, 0xBCF, 0xBD3, 0xBD6, 0xBD8, 0xBDA,
+    0xBDC, 0xBFC, 0xCDF, 0xCE0, 0xCE1, 0xCE1, 0xCE2, 0xCE2, 0xCE3, 0xCE3, 0xCE4, 0xCE5,
+    0xCE6, 0xCE6, 0xCE7, 0xCE7, 0xCE8, 0xCE8, 0xCE9, 0xCEA, 0xCEB, 0xCEC, 0xCED, 0xCEE,
+    0xCEF, 0xCF0, 0xCF1, 0xCF1, 0xCF2, 0xCF3, 0xCF4, 0xCF5, 0xCF5, 0xCF6, 0xCF6, 0xCF7,
+    0xCF7, 0xCF8, 0xCF9, 0xCFA, 0xCFA, 0xFF7E, 0xDA1, 0xDA2, 0xDA3, 0xDA4, 0xDA5, 0xDA6,
+    0xDA7, 0xDA8, 0xDA9, 0xDAA, 0xDAB, 0xDAC, 0xDAD, 0xDAE, 0xDAF, 0xDB0, 0xDB1, 0xDB2,
+    0xDB3, 0xDB4, 0xDB5, 0xDB6, 0xDB7, 0xDB8, 0xDB9, 0xDBA, 0xDBB, 0xDBC, 0xDBD, 0xDBE,
+    0xDBF, 0xDC0, 0xDC1, 0xDC2, 0xDC3, 0xDC4, 0xDC5, 0xDC6, 0xDC7, 0xDC8, 0xDC9, 0xDCA,
+    0xDCB, 0xDCC, 0xDCD, 0xDCE, 0xDCF, 0xDD0, 0xDD1, 0xDD2, 0xDD3, 0xDD4, 0xDD5, 0xDD6,
+    0xDD7, 0xDD8, 0xDD9, 0xDDA, 0xDDE, 0xDDF, 0xDE0, 0xDE1, 0xDE2, 0xDE3, 0xDE4, 0xDE5,
+    0xDE6, 0xDE7, 0xDE8, 0xDE9, 0xDEA, 0xDEB, 0xDEC, 0xDED, 0xDF0, 0xDF1, 0xDF2, 0xDF3,
+    0xDF4, 0xDF5, 0xDF6, 0xDF7, 0xDF8, 0xDF9, 0xFF31, 0xFF32, 0xFF33, 0xFF34, 0xFF35,
+    0xFF36, 0xFF37, 0xFF38, 0xFF39, 0xFF3A, 0xFF3B, 0xFF3C, 0xFF3D, 0xFF3E, 0xFF3F,
+    0xFF7E, 0xEA1, 0xEA2, 0xEA3, 0xEA4, 0xEA5, 0xEA6, 0xEA7, 0xEA8, 0xEA9, 0xEAA, 0xEAB,
+    0xEAC, 0xEAD, 0xEAE, 0xEAF, 0xEB0, 0xEB1, 0xEB2, 0xEB3, 0xEB4, 0xEB5, 0xEB6, 0xEB7,
+    0xEB8, 0xEB9, 0xEBA, 0xEBB, 0xEBC, 0xEBD, 0xEBE, 0xEBF, 0xEC0, 0xEC1, 0xEC2, 0xEC3,
+    0xEC4, 0xEC5, 0xEC6, 0xEC7, 0xEC8, 0xEC9, 0xECA, 0xECB, 0xECC, 0xECD, 0xECE, 0xECF,
+    0xED0, 0xED1, 0xED2, 0xED3, 0xED4, 0xED5, 0xED6, 0xED7, 0xED8, 0xED9, 0xEDA, 0xEDB,
+    0xEDC, 0xEDD, 0xEDE, 0xEDF, 0xEE0, 0xEE1, 0xEE2, 0xEE3, 0xEE4, 0xEE5, 0xEE6, 0xEE7,
+    0xEE8, 0xEE9, 0xEEA, 0xEEB, 0xEEC, 0xEED, 0xEEE, 0xEEF, 0xEF0, 0xEF1, 0xEF2, 0xEF3,
+    0xEF4, 0xEF5, 0xEF6, 0xEF7, 0xEF8, 0xEF9, 0xEFA, 0xEFF, 0x1000587, 0x1000589,
+    0x1000589, 0x100055D, 0x100055D, 0x100058A, 0x100058A, 0x100055C, 0x100055C,
+    0x100055B, 0x100055B, 0x100055E, 0x100055E, 0x1000531, 0x1000561, 0x1000532,
+    0x1000562, 0x1000533, 0x1000563, 0x1000534, 0x1000564, 0x1000535, 0x1000565,
+    0x1000536, 0x1000566, 0x1000537, 0x1000567, 0x1000538, 0x1000568, 0x1000539,
+    0x1000569, 0x100053A, 0x100056A, 0x100053B, 0x100056B, 0x100053C, 0x100056C,
+    0x100053D, 0x100056D, 0x100053E, 0x100056E, 0x100053F, 0x100056F, 0x1000540,
+    0x1000570, 0x1000541, 0x1000571, 0x1000542, 0x1000572, 0x1000543, 0x1000573,
+    0x1000544, 0x1000574, 0x1000545, 0x1000575, 0x1000546, 0x1000576, 0x1000547,
+    0x1000577, 0x1000548, 0x1000578, 0x1000549, 0x1000579, 0x100054A, 0x100057A,
+    0x100054B, 0x100057B, 0x100054C, 0x100057C, 0x100054D, 0x100057D, 0x100054E,
+    0x100057E, 0x100054F, 0x100057F, 0x1000550, 0x1000580, 0x1000551, 0x1000581,
+    0x1000552, 0x1000582, 0x1000553, 0x1000583, 0x1000554, 0x1000584, 0x1000555,
+    0x1000585, 0x1000556, 0x1000586, 0x100055A, 0x10010D0, 0x10010D1, 0x10010D2,
+    0x10010D3, 0x10010D4, 0x10010D5, 0x10010D6, 0x10010D7, 0x10010D8, 0x10010D9,
+    0x10010DA, 0x10010DB, 0x10010DC, 0x10010DD, 0x10010DE, 0x10010DF, 0x10010E0,
+    0x10010E1, 0x10010E2, 0x10010E3, 0x10010E4, 0x10010E5, 0x10010E6, 0x10010E7,
+    0x10010E8, 0x10010E9, 0x10010EA, 0x10010EB, 0x10010EC, 0x10010ED, 0x10010EE,
+    0x10010EF, 0x10010F0, 0x10010F1, 0x10010F2, 0x10010F3, 0x10010F4, 0x10010F5,
+    0x10010F6, 0x1001E8A, 0x100012C, 0x10001B5, 0x10001E6, 0x10001D1, 0x100019F,
+    0x1001E8B, 0x100012D, 0x10001B6, 0x10001E7, 0x10001D2, 0x1000275, 0x100018F,
+    0x1000259, 0x10001B7, 0x1000292, 0x1001E36, 0x1001E37, 0x1001EA0, 0x1001EA1,
+    0x1001EA2, 0x1001EA3, 0x1001EA4, 0x1001EA5, 0x1001EA6, 0x1001EA7, 0x1001EA8,
+    0x1001EA9, 0x1001EAA, 0x1001EAB, 0x1001EAC, 0x1001EAD, 0x1001EAE, 0x1001EAF,
+    0x1001EB0, 0x1001EB1, 0x1001EB2, 0x1001EB3, 0x1001EB4, 0x1001EB5, 0x1001EB6,
+    0x1001EB7, 0x1001EB8, 0x1001EB9, 0x1001EBA, 0x1001EBB, 0x1001EBC, 0x1001EBD,
+    0x1001EBE, 0x1001EBF, 0x1001EC0, 0x1001EC1, 0x1001EC2, 0x1001EC3, 0x1001EC4,
+    0x1001EC5, 0x1001EC6, 0x1001EC7, 0x1001EC8, 0x1001EC9, 0x1001ECA, 0x1001ECB,
+    0x1001ECC, 0x1001ECD, 0x1001ECE, 0x1001ECF, 0x1001ED0, 0x1001ED1, 0x1001ED2,
+    0x1001ED3, 0x1001ED4, 0x1001ED5, 0x1001ED6, 0x1001ED7, 0x1001ED8, 0x1001ED9,
+    0x1001EDA, 0x1001EDB, 0x1001EDC, 0x1001EDD, 0x1001EDE, 0x1001EDF, 0x1001EE0,
+    0x1001EE1, 0x1001EE2, 0x1001EE3, 0x1001EE4, 0x1001EE5, 0x1001EE6, 0x1001EE7,
+    0x1001EE8, 0x1001EE9, 0x1001EEA, 0x1001EEB, 0x1001EEC, 0x1001EED, 0x1001EEE,
+    0x1001EEF, 0x1001EF0, 0x1001EF1, 0x1001EF4, 0x1001EF5, 0x1001EF6, 0x1001EF7,
+    0x1001EF8, 0x1001EF9, 0x10001A0, 0x10001A1, 0x10001AF, 0x10001B0, 0x10020A0,
+    0x10020A1, 0x10020A2, 0x10020A3, 0x10020A4, 0x10020A5, 0x10020A6, 0x10020A7,
+    0x10020A8, 0x10020A9, 0x10020AA, 0x10020AB, 0x20AC, 0x1002070, 0x1002074, 0x1002075,
+    0x1002076, 0x1002077, 0x1002078, 0x1002079, 0x1002080, 0x1002081, 0x1002082,
+    0x1002083, 0x1002084, 0x1002085, 0x1002086, 0x1002087, 0x1002088, 0x1002089,
+    0x1002202, 0x1002205, 0x1002208, 0x1002209, 0x100220B, 0x100221A, 0x100221B,
+    0x100221C, 0x100222C, 0x100222D, 0x1002235, 0x1002248, 0x1002247, 0x1002262,
+    0x1002263, 0xFFF1, 0xFFF2, 0xFFF3, 0xFFF4, 0xFFF5, 0xFFF6, 0xFFF7, 0xFFF8, 0xFFF9,
+    0xFFFA, 0x1002800, 0x1002801, 0x1002802, 0x1002803, 0x1002804, 0x1002805, 0x1002806,
+    0x1002807, 0x1002808, 0x1002809, 0x100280A, 0x100280B, 0x100280C, 0x100280D,
+    0x100280E, 0x100280F, 0x1002810, 0x1002811, 0x1002812, 0x1002813, 0x1002814,
+    0x1002815, 0x1002816, 0x1002817, 0x1002818, 0x1002819, 0x100281A, 0x100281B,
+    0x100281C, 0x100281D, 0x100281E, 0x100281F, 0x1002820, 0x1002821, 0x1002822,
+    0x1002823, 0x1002824, 0x1002825, 0x1002826, 0x1002827, 0x1002828, 0x1002829,
+    0x100282A, 0x100282B, 0x100282C, 0x100282D, 0x100282E, 0x100282F, 0x1002830,
+    0x1002831, 0x1002832, 0x1002833, 0x1002834, 0x1002835, 0x1002836, 0x1002837,
+    0x1002838, 0x1002839, 0x100283A, 0x100283B, 0x100283C, 0x100283D, 0x100283E,
+    0x100283F, 0x1002840, 0x1002841, 0x1002842, 0x1002843, 0x1002844, 0x1002845,
+    0x1002846, 0x1002847, 0x1002848, 0x1002849, 0x100284A, 0x100284B, 0x100284C,
+    0x100284D, 0x100284E, 0x100284F, 0x1002850, 0x1002851, 0x1002852, 0x1002853,
+    0x1002854, 0x1002855, 0x1002856, 0x1002857, 0x1002858, 0x1002859, 0x100285A,
+    0x100285B, 0x100285C, 0x100285D, 0x100285E, 0x100285F, 0x1002860, 0x1002861,
+    0x1002862, 0x1002863, 0x1002864, 0x1002865, 0x1002866, 0x1002867, 0x1002868,
+    0x1002869, 0x100286A, 0x100286B, 0x100286C, 0x100286D, 0x100286E, 0x100286F,
+    0x1002870, 0x1002871, 0x1002872, 0x1002873, 0x1002874, 0x1002875, 0x1002876,
+    0x1002877, 0x1002878, 0x1002879, 0x100287A, 0x100287B, 0x100287C, 0x100287D,
+    0x100287E, 0x100287F, 0x1002880, 0x1002881, 0x1002882, 0x1002883, 0x1002884,
+    0x1002885, 0x1002886, 0x1002887, 0x1002888, 0x1002889, 0x100288A, 0x100288B,
+    0x100288C, 0x100288D, 0x100288E, 0x100288F, 0x1002890, 0x1002891, 0x1002892,
+    0x1002893, 0x1002894, 0x1002895, 0x1002896, 0x1002897, 0x1002898, 0x1002899,
+    0x100289A, 0x100289B, 0x100289C, 0x100289D, 0x100289E, 0x100289F, 0x10028A0,
+    0x10028A1, 0x10028A2, 0x10028A3, 0x10028A4, 0x10028A5, 0x10028A6, 0x10028A7,
+    0x10028A8, 0x10028A9, 0x10028AA, 0x10028AB, 0x10028AC, 0x10028AD, 0x10028AE,
+    0x10028AF, 0x10028B0, 0x10028B1, 0x10028B2, 0x10028B3, 0x10028B4, 0x10028B5,
+    0x10028B6, 0x10028B7, 0x10028B8, 0x10028B9, 0x10028BA, 0x10028BB, 0x10028BC,
+    0x10028BD, 0x10028BE, 0x10028BF, 0x10028C0, 0x10028C1, 0x10028C2, 0x10028C3,
+    0x10028C4, 0x10028C5, 0x10028C6, 0x10028C7, 0x10028C8, 0x10028C9, 0x10028CA,
+    0x10028CB, 0x10028CC, 0x10028CD, 0x10028CE, 0x10028CF, 0x10028D0, 0x10028D1,
+    0x10028D2, 0x10028D3, 0x10028D4, 0x10028D5, 0x10028D6, 0x10028D7, 0x10028D8,
+    0x10028D9, 0x10028DA, 0x10028DB, 0x10028DC, 0x10028DD, 0x10028DE, 0x10028DF,
+    0x10028E0, 0x10028E1, 0x10028E2, 0x10028E3, 0x10028E4, 0x10028E5, 0x10028E6,
+    0x10028E7, 0x10028E8, 0x10028E9, 0x10028EA, 0x10028EB, 0x10028EC, 0x10028ED,
+    0x10028EE, 0x10028EF, 0x10028F0, 0x10028F1, 0x10028F2, 0x10028F3, 0x10028F4,
+    0x10028F5, 0x10028F6, 0x10028F7, 0x10028F8, 0x10028F9, 0x10028FA, 0x10028FB,
+    0x10028FC, 0x10028FD, 0x10028FE, 0x10028FF, 0x1000D82, 0x1000D83, 0x1000D85,
+    0x1000D86, 0x1000D87, 0x1000D88, 0x1000D89, 0x1000D8A, 0x1000D8B, 0x1000D8C,
+    0x1000D8D, 0x1000D8E, 0x1000D8F, 0x1000D90, 0x1000D91, 0x1000D92, 0x1000D93,
+    0x1000D94, 0x1000D95, 0x1000D96, 0x1000D9A, 0x1000D9B, 0x1000D9C, 0x1000D9D,
+    0x1000D9E, 0x1000D9F, 0x1000DA0, 0x1000DA1, 0x1000DA2, 0x1000DA3, 0x1000DA4,
+    0x1000DA5, 0x1000DA6, 0x1000DA7, 0x1000DA8, 0x1000DA9, 0x1000DAA, 0x1000DAB,
+    0x1000DAC, 0x1000DAD, 0x1000DAE, 0x1000DAF, 0x1000DB0, 0x1000DB1, 0x1000DB3,
+    0x1000DB4, 0x1000DB5, 0x1000DB6, 0x1000DB7, 0x1000DB8, 0x1000DB9, 0x1000DBA,
+    0x1000DBB, 0x1000DBD, 0x1000DC0, 0x1000DC1, 0x1000DC2, 0x1000DC3, 0x1000DC4,
+    0x1000DC5, 0x1000DC6, 0x1000DCA, 0x1000DCF, 0x1000DD0, 0x1000DD1, 0x1000DD2,
+    0x1000DD3, 0x1000DD4, 0x1000DD6, 0x1000DD8, 0x1000DD9, 0x1000DDA, 0x1000DDB,
+    0x1000DDC, 0x1000DDD, 0x1000DDE, 0x1000DDF, 0x1000DF2, 0x1000DF3, 0x1000DF4,
+    0x1008FF01, 0x1008FF02, 0x1008FF03, 0x1008FF04, 0x1008FF05, 0x1008FF06, 0x1008FF10,
+    0x1008FF11, 0x1008FF12, 0x1008FF13, 0x1008FF14, 0x1008FF15, 0x1008FF16, 0x1008FF17,
+    0x1008FF18, 0x1008FF19, 0x1008FF1A, 0x1008FF1B, 0x1008FF1C, 0x1008FF1D, 0x1008FF1E,
+    0x1008FF1F, 0x1008FF20, 0x1008FF21, 0x1008FF22, 0x1008FF23, 0x1008FF24, 0x1008FF25,
+    0x1008FF26, 0x1008FF27, 0x1008FF28, 0x1008FF29, 0x1008FF2A, 0x1008FF2B, 0x1008FF2C,
+    0x1008FF2D, 0x1008FF2E, 0x1008FF2F, 0x1008FF30, 0x1008FF31, 0x1008FF32, 0x1008FF33,
+    0x1008FF34, 0x1008FF35, 0x1008FF36, 0x1008FF37, 0x1008FF38, 0x1008FF39, 0x1008FF3A,
+    0x1008FF3B, 0x1008FF3C, 0x1008FF3D, 0x1008FF3E, 0x1008FF3F, 0x1008FF40, 0x1008FF41,
+    0x1008FF42, 0x1008FF43, 0x1008FF44, 0x1008FF45, 0x1008FF46, 0x1008FF47, 0x1008FF48,
+    0x1008FF49, 0x1008FF4A, 0x1008FF4B, 0x1008FF4C, 0x1008FF4D, 0x1008FF4E, 0x1008FF4F,
+    0x1008FF50, 0x1008FF51, 0x1008FF52, 0x1008FF53, 0x1008FF55, 0x1008FF56, 0x1008FF57,
+    0x1008FF58, 0x1008FF59, 0x1008FF5A, 0x1008FF5B, 0x1008FF5C, 0x1008FF5D, 0x1008FF5E,
+    0x1008FF5F, 0x1008FF60, 0x1008FF61, 0x1008FF62, 0x1008FF63, 0x1008FF65, 0x1008FF66,
+    0x1008FF67, 0x1008FF68, 0x1008FF69, 0x1008FF6A, 0x1008FF6B, 0x1008FF6C, 0x1008FF6D,
+    0x1008FF6E, 0x1008FF72, 0x1008FF73, 0x1008FF74, 0x1008FF75, 0x1008FF76, 0x1008FF77,
+    0x1008FF78, 0x1008FF79, 0x1008FF7A, 0x1008FF7B, 0x1008FF7C, 0x1008FF7D, 0x1008FF7E,
+    0x1008FF7F, 0x1008FF80, 0x1008FF81, 0x1008FF82, 0x1008FF84, 0x1008FF85, 0x1008FF86,
+    0x1008FF87, 0x1008FF88, 0x1008FF89, 0x1008FF8A, 0x1008FF8B, 0x1008FF8C, 0x1008FF8D,
+    0x1008FF8E, 0x1008FF8F, 0x1008FF90, 0x1008FF91, 0x1008FF92, 0x1008FF93, 0x1008FF94,
+    0x1008FF95, 0x1008FF96, 0x1008FF97, 0x1008FF98, 0x1008FF99, 0x1008FF9A, 0x1008FF9B,
+    0x1008FF9C, 0x1008FF9D, 0x1008FF9E, 0x1008FF9F, 0x1008FFA0, 0x1008FFA1, 0x1008FFA2,
+    0x1008FFA3, 0x1008FFA4, 0x1008FFA5, 0x1008FFA6, 0x1008FFA7, 0x1008FFA8, 0x1008FFA9,
+    0x1008FFB0, 0x1008FFB1, 0x1008FFB2, 0x1008FE01, 0x1008FE02, 0x1008FE03, 0x1008FE04,
+    0x1008FE05, 0x1008FE06, 0x1008FE07, 0x1008FE08, 0x1008FE09, 0x1008FE0A, 0x1008FE0B,
+    0x1008FE0C, 0x1008FE20, 0x1008FE21, 0x1008FE22, 0x1008FE23, 0x1008FE24, 0x1008FE25,
+)
+CODE_POINTS = (
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0,
+    0x28, 0x29, 0x2A, 0x2B, 0x2C, 0x2D, 0x2E, 0x2F, 0x30, 0x31, 0x32, 0x33, 0x34, 0x35,
+    0x36, 0x37, 0x38, 0x39, 0x3A, 0x3B, 0x3C, 0x3D, 0x3E, 0x3F, 0x40, 0x41, 0x42, 0x43,
+    0x44, 0x45, 0x46, 0x47, 0x48, 0x49, 0x4A, 0x4B, 0x4C, 0x4D, 0x4E, 0x4F, 0x50, 0x51,
+    0x52, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59, 0x5A, 0x5B, 0x5C, 0x5D, 0x5E, 0x5F,
+    0x60, 0, 0x61, 0x62, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x69, 0x6A, 0x6B, 0x6C,
+    0x6D, 0x6E, 0x6F, 0x70, 0x71, 0x72, 0x73, 0x74, 0x75, 0x76, 0x77, 0x78, 0x79, 0x7A,
+    0x7B, 0x7C, 0x7D, 0x7E, 0xA0, 0xA1, 0xA2, 0xA3, 0xA4, 0xA5, 0xA6, 0xA7, 0xA8, 0xA9,
+    0xAA, 0xAB, 0xAC, 0xAD, 0xAE, 0xAF, 0xB0, 0xB1, 0xB2, 0xB3, 0xB4, 0xB5, 0xB6, 0xB7,
+    0xB8, 0xB9, 0xBA, 0xBB, 0xBC, 0xBD, 0xBE, 0xBF, 0xC0, 0xC1, 0xC2, 0xC3, 0xC4, 0xC5,
+    0xC6, 0xC7, 0xC8, 0xC9, 0xCA, 0xCB, 0xCC, 0xCD, 0xCE, 0xCF, 0xD0, 0, 0xD1, 0xD2,
+    0xD3, 0xD4, 0xD5, 0xD6, 0xD7, 0xD8, 0xD8, 0xD9, 0xDA, 0xDB, 0xDC, 0xDD, 0xDE, 0,
+    0xDF, 0xE0, 0xE1, 0xE2, 0xE3, 0xE4, 0xE5, 0xE6, 0xE7, 0xE8, 0xE9, 0xEA, 0xEB, 0xEC,
+    0xED, 0xEE, 0xEF, 0xF0, 0xF1, 0xF2, 0xF3, 0xF4, 0xF5, 0xF6, 0xF7, 0xF8, 0xF8, 0xF9,
+    0xFA, 0xFB, 0xFC, 0xFD, 0xFE, 0xFF, 0x104, 0x2D8, 0x141, 0x13D, 0x15A, 0x160, 0x15E,
+    0x164, 0x179, 0x17D, 0x17B, 0x105, 0x2DB, 0x142, 0x13E, 0x15B, 0x2C7, 0x161, 0x15F,
+    0x165, 0x17A, 0x2DD, 0x17E, 0x17C, 0x154, 0x102, 0x139, 0x106, 0x10C, 0x118, 0x11A,
+    0x10E, 0x110, 0x143, 0x147, 0x150, 0x158, 0x16E, 0x170, 0x162, 0x155, 0x103, 0x13A,
+    0x107, 0x10D, 0x119, 0x11B, 0x10F, 0x111, 0x144, 0x148, 0x151, 0x159, 0x16F, 0x171,
+    0x163, 0x2D9, 0x126, 0x124, 0x130, 0x11E, 0x134, 0x127, 0x125, 0x131, 0x11F, 0x135,
+    0x10A, 0x108, 0x120, 0x11C, 0x16C, 0x15C, 0x10B, 0x109, 0x121, 0x11D, 0x16D, 0x15D,
+    0x138, 0, 0x156, 0x128, 0x13B, 0x112, 0x122, 0x166, 0x157, 0x129, 0x13C, 0x113,
+    0x123, 0x167, 0x14A, 0x14B, 0x100, 0x12E, 0x116, 0x12A, 0x145, 0x14C, 0x136, 0x172,
+    0x168, 0x16A, 0x101, 0x12F, 0x117, 0x12B, 0x146, 0x14D, 0x137, 0x173, 0x169, 0x16B,
+    0x174, 0x175, 0x176, 0x177, 0x1E02, 0x1E03, 0x1E0A, 0x1E0B, 0x1E1E, 0x1E1F, 0x1E40,
+    0x1E41, 0x1E56, 0x1E57, 0x1E60, 0x1E61, 0x1E6A, 0x1E6B, 0x1E80, 0x1E81, 0x1E82,
+    0x1E83, 0x1E84, 0x1E85, 0x1EF2, 0x1EF3, 0x152, 0x153, 0x178, 0x203E, 0x3002, 0x300C,
+    0x300D, 0x3001, 0x30FB, 0, 0x30F2, 0x30A1, 0x30A3, 0x30A5, 0x30A7, 0x30A9, 0x30E3,
+    0x30E5, 0x30E7, 0x30C3, 0, 0x30FC, 0x30A2, 0x30A4, 0x30A6, 0x30A8, 0x30AA, 0x30AB,
+    0x30AD, 0x30AF, 0x30B1, 0x30B3, 0x30B5, 0x30B7, 0x30B9, 0x30BB, 0x30BD, 0x30BF,
+    0x30C1, 0, 0x30C4, 0, 0x30C6, 0x30C8, 0x30CA, 0x30CB, 0x30CC, 0x30CD, 0x30CE,
+    0x30CF, 0x30D2, 0x30D5, 0, 0x30D8, 0x30DB, 0x30DE, 0x30DF, 0x30E0, 0x30E1, 0x30E2,
+    0x30E4, 0x30E6, 0x30E8, 0x30E9, 0x30EA, 0x30EB, 0x30EC, 0x30ED, 0x30EF, 0x30F3,
+    0x309B, 0x309C, 0, 0x6F0, 0x6F1, 0x6F2, 0x6F3, 0x6F4, 0x6F5, 0x6F6, 0x6F7, 0x6F8,
+    0x6F9, 0x66A, 0x670, 0x679, 0x67E, 0x686, 0x688, 0x691, 0x60C, 0x6D4, 0x660, 0x661,
+    0x662, 0x663, 0x664, 0x665, 0x666, 0x667, 0x668, 0x669, 0x61B, 0x61F, 0x621, 0x622,
+    0x623, 0x624, 0x625, 0x626, 0x627, 0x628, 0x629, 0x62A, 0x62B, 0x62C, 0x62D, 0x62E,
+    0x62F, 0x630, 0x631, 0x632, 0x633, 0x634, 0x635, 0x636, 0x637, 0x638, 0x639, 0x63A,
+    0x640, 0x641, 0x642, 0x643, 0x644, 0x645, 0x646, 0x647, 0, 0x648, 0x649, 0x64A,
+    0x64B, 0x64C, 0x64D, 0x64E, 0x64F, 0x650, 0x651, 0x652, 0x653, 0x654, 0x655, 0x698,
+    0x6A4, 0x6A9, 0x6AF, 0x6BA, 0x6BE, 0x6CC, 0x6CC, 0x6D2, 0x6C1, 0, 0x492, 0x493,
+    0x496, 0x497, 0x49A, 0x49B, 0x49C, 0x49D, 0x4A2, 0x4A3, 0x4AE, 0x4AF, 0x4B0, 0x4B1,
+    0x4B2, 0x4B3, 0x4B6, 0x4B7, 0x4B8, 0x4B9, 0x4BA, 0x4BB, 0x4D8, 0x4D9, 0x4E2, 0x4E3,
+    0x4E8, 0x4E9, 0x4EE, 0x4EF, 0x452, 0x453, 0x451, 0x454, 0, 0x455, 0x456, 0, 0x457,
+    0, 0x458, 0, 0x459, 0, 0x45A, 0, 0x45B, 0x45C, 0x491, 0x45E, 0x45F, 0, 0x2116,
+    0x402, 0x403, 0x401, 0x404, 0, 0x405, 0x406, 0, 0x407, 0, 0x408, 0, 0x409, 0, 0x40A,
+    0, 0x40B, 0x40C, 0x490, 0x40E, 0x40F, 0, 0x44E, 0x430, 0x431, 0x446, 0x434, 0x435,
+    0x444, 0x433, 0x445, 0x438, 0x439, 0x43A, 0x43B, 0x43C, 0x43D, 0x43E, 0x43F, 0x44F,
+    0x440, 0x441, 0x442, 0x443, 0x436, 0x432, 0x44C, 0x44B, 0x437, 0x448, 0x44D, 0x449,
+    0x447, 0x44A, 0x42E, 0x410, 0x411, 0x426, 0x414, 0x415, 0x424, 0x413, 0x425, 0x418,
+    0x419, 0x41A, 0x41B, 0x41C, 0x41D, 0x41E, 0x41F, 0x42F, 0x420, 0x421, 0x422, 0x423,
+    0x416, 0x412, 0x42C, 0x42B, 0x417, 0x428, 0x42D, 0x429, 0x427, 0x42A, 0x386, 0x388,
+    0x389, 0x38A, 0x3AA, 0, 0x38C, 0x38E, 0x3AB, 0x38F, 0x385, 0x2015, 0x3AC, 0x3AD,
+    0x3AE, 0x3AF, 0x3CA, 0x390, 0x3CC, 0x3CD, 0x3CB, 0x3B0, 0x3CE, 0x391, 0x392, 0x393,
+    0x394, 0x395, 0x396, 0x397, 0x398, 0x399, 0x39A, 0x39B, 0x39B, 0x39C, 0x39D, 0x39E,
+    0x39F, 0x3A0, 0x3A1, 0x3A3, 0x3A4, 0x3A5, 0x3A6, 0x3A7, 0x3A8, 0x3A9, 0x3B1, 0x3B2,
+    0x3B3, 0x3B4, 0x3B5, 0x3B6, 0x3B7, 0x3B8, 0x3B9, 0x3BA, 0x3BB, 0x3BB, 0x3BC, 0x3BD,
+    0x3BE, 0x3BF, 0x3C0, 0x3C1, 0x3C3, 0x3C2, 0x3C4, 0x3C5, 0x3C6, 0x3C7, 0x3C8, 0x3C9,
+    0, 0x23B7, 0, 0, 0x2320, 0x2321, 0, 0x23A1, 0x23A3, 0x23A4, 0x23A6, 0x239B, 0x239D,
+    0x239E, 0x23A0, 0x23A8, 0x23AC, 0, 0, 0, 0, 0, 0, 0, 0x2264, 0x2260, 0x2265, 0x222B,
+    0x2234, 0x221D, 0x221E, 0x2207, 0x223C, 0x2243, 0x21D4, 0x21D2, 0x2261, 0x221A,
+    0x2282, 0x2283, 0x2229, 0x222A, 0x2227, 0x2228, 0x2202, 0x192, 0x2190, 0x2191,
+    0x2192, 0x2193, 0, 0x25C6, 0x2592, 0x2409, 0x240C, 0x240D, 0x240A, 0x2424, 0x240B,
+    0x2518, 0x2510, 0x250C, 0x2514, 0x253C, 0x23BA, 0x23BB, 0x2500, 0x23BC, 0x23BD,
+    0x251C, 0x2524, 0x2534, 0x252C, 0x2502, 0x2003, 0x2002, 0x2004, 0x2005, 0x2007,
+    0x2008, 0x2009, 0x200A, 0x2014, 0x2013, 0, 0x2026, 0x2025, 0x2153, 0x2154, 0x2155,
+    0x2156, 0x2157, 0x2158, 0x2159, 0x215A, 0x2105, 0x2012, 0, 0, 0, 0, 0x215B, 0x215C,
+    0x215D, 0x215E, 0x2122, 0, 0, 0, 0, 0, 0, 0x2018, 0x2019, 0x201C, 0x201D, 0x211E,
+    0x2030, 0x2032, 0x2033, 0x271D, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0x2663, 0x2666, 0x2665, 0x2720, 0x2020, 0x2021, 0x2713, 0x2717, 0x266F, 0x266D,
+    0x2642, 0x2640, 0x260E, 0x2315, 0x2117, 0x2038, 0x201A, 0x201E, 0, 0, 0, 0, 0, 0,
+    0x22A4, 0, 0x230A, 0, 0x2218, 0x2395, 0x22A5, 0x25CB, 0x2308, 0, 0, 0, 0x22A3,
+    0x22A2, 0x2017, 0x5D0, 0x5D1, 0, 0x5D2, 0, 0x5D3, 0, 0x5D4, 0x5D5, 0x5D6, 0, 0x5D7,
+    0, 0x5D8, 0, 0x5D9, 0x5DA, 0x5DB, 0x5DC, 0x5DD, 0x5DE, 0x5DF, 0x5E0, 0x5E1, 0,
+    0x5E2, 0x5E3, 0x5E4, 0x5E5, 0, 0x5E6, 0, 0x5E7, 0, 0x5E8, 0x5E9, 0x5EA, 0, 0, 0xE01,
+    0xE02, 0xE03, 0xE04, 0xE05, 0xE06, 0xE07, 0xE08, 0xE09, 0xE0A, 0xE0B, 0xE0C, 0xE0D,
+    0xE0E, 0xE0F, 0xE10, 0xE11, 0xE12, 0xE13, 0xE14, 0xE15, 0xE16, 0xE17, 0xE18, 0xE19,
+    0xE1A, 0xE1B, 0xE1C, 0xE1D, 0xE1E, 0xE1F, 0xE20, 0xE21, 0xE22, 0xE23, 0xE24, 0xE25,
+    0xE26, 0xE27, 0xE28, 0xE29, 0xE2A, 0xE2B, 0xE2C, 0xE2D, 0xE2E, 0xE2F, 0xE30, 0xE31,
+    0xE32, 0xE33, 0xE34, 0xE35, 0xE36, 0xE37, 0xE38, 0xE39, 0xE3A, 0, 0xE3F, 0xE40,
+    0xE41, 0xE42, 0xE43, 0xE44, 0xE45, 0xE46, 0xE47, 0xE48, 0xE49, 0xE4A, 0xE4B, 0xE4C,
+    0xE4D, 0xE50, 0xE51, 0xE52, 0xE53, 0xE54, 0xE55, 0xE56, 0xE57, 0xE58, 0xE59, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0x3131, 0x3132, 0x3133, 0x3134, 0x3135,
+    0x3136, 0x3137, 0x3138, 0x3139, 0x313A, 0x313B, 0x313C, 0x313D, 0x313E, 0x313F,
+    0x3140, 0x3141, 0x3142, 0x3143, 0x3144, 0x3145, 0x3146, 0x3147, 0x3148, 0x3149,
+    0x314A, 0x314B, 0x314C, 0x314D, 0x314E, 0x314F, 0x3150, 0x3151, 0x3152, 0x3153,
+    0x3154, 0x3155, 0x3156, 0x3157, 0x3158, 0x3159, 0x315A, 0x315B, 0x315C, 0x315D,
+    0x315E, 0x315F, 0x3160, 0x3161, 0x3162, 0x3163, 0x11A8, 0x11A9, 0x11AA, 0x11AB,
+    0x11AC, 0x11AD, 0x11AE, 0x11AF, 0x11B0, 0x11B1, 0x11B2, 0x11B3, 0x11B4, 0x11B5,
+    0x11B6, 0x11B7, 0x11B8, 0x11B9, 0x11BA, 0x11BB, 0x11BC, 0x11BD, 0x11BE, 0x11BF,
+    0x11C0, 0x11C1, 0x11C2, 0x316D, 0x3171, 0x3178, 0x317F, 0x3181, 0x3184, 0x3186,
+    0x318D, 0x318E, 0x11EB, 0x11F0, 0x11F9, 0, 0x587, 0x589, 0x589, 0x55D, 0x55D, 0x58A,
+    0x58A, 0x55C, 0x55C, 0x55B, 0x55B, 0x55E, 0x55E, 0x531, 0x561, 0x532, 0x562, 0x533,
+    0x563, 0x534, 0x564, 0x535, 0x565, 0x536, 0x566, 0x537, 0x567, 0x538, 0x568, 0x539,
+    0x569, 0x53A, 0x56A, 0x53B, 0x56B, 0x53C, 0x56C, 0x53D, 0x56D, 0x53E, 0x56E, 0x53F,
+    0x56F, 0x540, 0x570, 0x541, 0x571, 0x542, 0x572, 0x543, 0x573, 0x544, 0x574, 0x545,
+    0x575, 0x546, 0x576, 0x547, 0x577, 0x548, 0x578, 0x549, 0x579, 0x54A, 0x57A, 0x54B,
+    0x57B, 0x54C, 0x57C, 0x54D, 0x57D, 0x54E, 0x57E, 0x54F, 0x57F, 0x550, 0x580, 0x551,
+    0x581, 0x552, 0x582, 0x553, 0x583, 0x554, 0x584, 0x555, 0x585, 0x556, 0x586, 0x55A,
+    0x10D0, 0x10D1, 0x10D2, 0x10D3, 0x10D4, 0x10D5, 0x10D6, 0x10D7, 0x10D8, 0x10D9,
+    0x10DA, 0x10DB, 0x10DC, 0x10DD, 0x10DE, 0x10DF, 0x10E0, 0x10E1, 0x10E2, 0x10E3,
+    0x10E4, 0x10E5, 0x10E6, 0x10E7, 0x10E8, 0x10E9, 0x10EA, 0x10EB, 0x10EC, 0x10ED,
+    0x10EE, 0x10EF, 0x10F0, 0x10F1, 0x10F2, 0x10F3, 0x10F4, 0x10F5, 0x10F6, 0x1E8A,
+    0x12C, 0x1B5, 0x1E6, 0x1D1, 0x19F, 0x1E8B, 0x12D, 0x1B6, 0x1E7, 0x1D2, 0x275, 0x18F,
+    0x259, 0x1B7, 0x292, 0x1E36, 0x1E37, 0x1EA0, 0x1EA1, 0x1EA2, 0x1EA3, 0x1EA4, 0x1EA5,
+    0x1EA6, 0x1EA7, 0x1EA8, 0x1EA9, 0x1EAA, 0x1EAB, 0x1EAC, 0x1EAD, 0x1EAE, 0x1EAF,
+    0x1EB0, 0x1EB1, 0x1EB2, 0x1EB3, 0x1EB4, 0x1EB5, 0x1EB6, 0x1EB7, 0x1EB8, 0x1EB9,
+    0x1EBA, 0x1EBB, 0x1EBC, 0x1EBD, 0x1EBE, 0x1EBF, 0x1EC0, 0x1EC1, 0x1EC2, 0x1EC3,
+    0x1EC4, 0x1EC5, 0x1EC6, 0x1EC7, 0x1EC8, 0x1EC9, 0x1ECA, 0x1ECB, 0x1ECC, 0x1ECD,
+    0x1ECE, 0x1ECF, 0x1ED0, 0x1ED1, 0x1ED2, 0x1ED3, 0x1ED4, 0x1ED5, 0x1ED6, 0x1ED7,
+    0x1ED8, 0x1ED9, 0x1EDA, 0x1EDB, 0x1EDC, 0x1EDD, 0x1EDE, 0x1EDF, 0x1EE0, 0x1EE1,
+    0x1EE2, 0x1EE3, 0x1EE4, 0x1EE5, 0x1EE6, 0x1EE7, 0x1EE8, 0x1EE9, 0x1EEA, 0x1EEB,
+    0x1EEC, 0x1EED, 0x1EEE, 0x1EEF, 0x1EF0, 0x1EF1, 0x1EF4, 0x1EF5, 0x1EF6, 0x1EF7,
+    0x1EF8, 0x1EF9, 0x1A0, 0x1A1, 0x1AF, 0x1B0, 0x20A0, 0x20A1, 0x20A2, 0x20A3, 0x20A4,
+    0x20A5, 0x20A6, 0x20A7, 0x20A8, 0x20A9, 0x20AA, 0x20AB, 0x20AC, 0x2070, 0x2074,
+    0x2075, 0x2076, 0x2077, 0x2078, 0x2079, 0x2080, 0x2081, 0x2082, 0x2083, 0x2084,
+    0x2085, 0x2086, 0x2087, 0x2088, 0x2089, 0x2202, 0x2205, 0x2208, 0x2209, 0x220B,
+    0x221A, 0x221B, 0x221C, 0x222C, 0x222D, 0x2235, 0x2248, 0x2247, 0x2262, 0x2263, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0x2800, 0x2801, 0x2802, 0x2803, 0x2804, 0x2805, 0x2806,
+    0x2807, 0x2808, 0x2809, 0x280A, 0x280B, 0x280C, 0x280D, 0x280E, 0x280F, 0x2810,
+    0x2811, 0x2812, 0x2813, 0x2814, 0x2815, 0x2816, 0x2817, 0x2818, 0x2819, 0x281A,
+    0x281B, 0x281C, 0x281D, 0x281E, 0x281F, 0x2820, 0x2821, 0x2822, 0x2823, 0x2824,
+    0x2825, 0x2826, 0x2827, 0x2828, 0x2829, 0x282A, 0x282B, 0x282C, 0x282D, 0x282E,
+    0x282F, 0x2830, 0x2831, 0x2832, 0x2833, 0x2834, 0x2835, 0x2836, 0x2837, 0x2838,
+    0x2839, 0x283A, 0x283B, 0x283C, 0x283D, 0x283E, 0x283F, 0x2840, 0x2841, 0x2842,
+    0x2843, 0x2844, 0x2845, 0x2846, 0x2847, 0x2848, 0x2849, 0x284A, 0x284B, 0x284C,
+    0x284D, 0x284E, 0x284F, 0x2850, 0x2851, 0x2852, 0x2853, 0x2854, 0x2855, 0x2856,
+    0x2857, 0x2858, 0x2859, 0x285A, 0x285B, 0x285C, 0x285D, 0x285E, 0x285F, 0x2860,
+    0x2861, 0x2862, 0x2863, 0x2864, 0x2865, 0x2866, 0x2867, 0x2868, 0x2869, 0x286A,
+    0x286B, 0x286C, 0x286D, 0x286E, 0x286F, 0x2870, 0x2871, 0x2872, 0x2873, 0x2874,
+    0x2875, 0x2876, 0x2877, 0x2878, 0x2879, 0x287A, 0x287B, 0x287C, 0x287D, 0x287E,
+    0x287F, 0x2880, 0x2881, 0x2882, 0x2883, 0x2884, 0x2885, 0x2886, 0x2887, 0x2888,
+    0x2889, 0x288A, 0x288B, 0x288C, 0x288D, 0x288E, 0x288F, 0x2890, 0x2891, 0x2892,
+    0x2893, 0x2894, 0x2895, 0x2896, 0x2897, 0x2898, 0x2899, 0x289A, 0x289B, 0x289C,
+    0x289D, 0x289E, 0x289F, 0x28A0, 0x28A1, 0x28A2, 0x28A3, 0x28A4, 0x28A5, 0x28A6,
+    0x28A7, 0x28A8, 0x28A9, 0x28AA, 0x28AB, 0x28AC, 0x28AD, 0x28AE, 0x28AF, 0x28B0,
+    0x28B1, 0x28B2, 0x28B3, 0x28B4, 0x28B5, 0x28B6, 0x28B7, 0x28B8, 0x28B9, 0x28BA,
+    0x28BB, 0x28BC, 0x28BD, 0x28BE, 0x28BF, 0x28C0, 0x28C1, 0x28C2, 0x28C3, 0x28C4,
+    0x28C5, 0x28C6, 0x28C7, 0x28C8, 0x28C9, 0x28CA, 0x28CB, 0x28CC, 0x28CD, 0x28CE,
+    0x28CF, 0x28D0, 0x28D1, 0x28D2, 0x28D3, 0x28D4, 0x28D5, 0x28D6, 0x28D7, 0x28D8,
+    0x28D9, 0x28DA, 0x28DB, 0x28DC, 0x28DD, 0x28DE, 0x28DF, 0x28E0, 0x28E1, 0x28E2,
+    0x28E3, 0x28E4, 0x28E5, 0x28E6, 0x28E7, 0x28E8, 0x28E9, 0x28EA, 0x28EB, 0x28EC,
+    0x28ED, 0x28EE, 0x28EF, 0x28F0, 0x28F1, 0x28F2, 0x28F3, 0x28F4, 0x28F5, 0x28F6,
+    0x28F7, 0x28F8, 0x28F9, 0x28FA, 0x28FB, 0x28FC, 0x28FD, 0x28FE, 0x28FF, 0xD82,
+    0xD83, 0xD85, 0xD86, 0xD87, 0xD88, 0xD89, 0xD8A, 0xD8B, 0xD8C, 0xD8D, 0xD8E, 0xD8F,
+    0xD90, 0xD91, 0xD92, 0xD93, 0xD94, 0xD95, 0xD96, 0xD9A, 0xD9B, 0xD9C, 0xD9D, 0xD9E,
+    0xD9F, 0xDA0, 0xDA1, 0xDA2, 0xDA3, 0xDA4, 0xDA5, 0xDA6, 0xDA7, 0xDA8, 0xDA9, 0xDAA,
+    0xDAB, 0xDAC, 0xDAD, 0xDAE, 0xDAF, 0xDB0, 0xDB1, 0xDB3, 0xDB4, 0xDB5, 0xDB6, 0xDB7,
+    0xDB8, 0xDB9, 0xDBA, 0xDBB, 0xDBD, 0xDC0, 0xDC1, 0xDC2, 0xDC3, 0xDC4, 0xDC5, 0xDC6,
+    0xDCA, 0xDCF, 0xDD0, 0xDD1, 0xDD2, 0xDD3, 0xDD4, 0xDD6, 0xDD8, 0xDD9, 0xDDA, 0xDDB,
+    0xDDC, 0xDDD, 0xDDE, 0xDDF, 0xDF2, 0xDF3, 0xDF4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+)
+# fmt: on
@@ -0,0 +1,463 @@
+"""
+The in-shell runner shared by the keyboard, pointer and mixed input APIs.
+
+Events are packed into a flat array('i') with EVENT_SIZE integers per event,
+(type, a, b, delay_ms), as returned by the events' pack_event() methods. The
+array is sent as base64 and viewed as an Int32Array in the shell. Both ends
+run on the same machine, so they agree on byte order.
+
+Button delays come before the button, and all other delays come after the
+event.
+"""
+
+import base64
+import time
+import uuid
+from array import array
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional
+
+from ._utils import reusable_device_expr
+from .evaluator import BatchEvaluator, Evaluator, EvaluatorJavaScriptError
+
+EVENT_SIZE = 4
+
+# Sequences longer than either of these limits are split into chunks,
+# which are streamed into the shell while earlier chunks run.
+MAX_CHUNK_EVENTS = 4096
+MAX_CHUNK_MS = 30000
+
+# Pointer coordinates and scroll amounts are sent as fixed-point numbers
+# with this scale.
+FIXED_POINT = 256
+
+# Event types, with the meaning of their (a, b) arguments.
+EVENT_KEYVAL = 0  # (keyval, pressed)
+EVENT_KEY = 1  # (hardware key code, pressed)
+EVENT_MOVE = 2  # (fixed-point x, fixed-point y)
+EVENT_BUTTON = 3  # (button, pressed)
+EVENT_SCROLL = 4  # (fixed-point dx, fixed-point dy), in wheel clicks
+EVENT_SMOOTH_SCROLL = 5  # (fixed-point dx, fixed-point dy)
+
+TIMELINE_JS = (
+    """
+const Clutter = imports.gi.Clutter;
+const GLib = imports.gi.GLib;
+
+let keyboardDevice = null;
+let pointerDevice = null;
+const keyboard = () => keyboardDevice || (keyboardDevice = """
+    + reusable_device_expr("KEYBOARD_DEVICE")
+    + """);
+const pointer = () => pointerDevice || (pointerDevice = """
+    + reusable_device_expr("POINTER_DEVICE")
+    + """);
+
+const EVENT_SIZE = """
+    + str(EVENT_SIZE)
+    + """;
+const FIXED_POINT = """
+    + str(FIXED_POINT)
+    + """;
+const KEYVAL = """
+    + str(EVENT_KEYVAL)
+    + """;
+const KEY = """
+    + str(EVENT_KEY)
+    + """;
+const MOVE = """
+    + str(EVENT_MOVE)
+    + """;
+const BUTTON = """
+    + str(EVENT_BUTTON)
+    + """;
+const SCROLL = """
+    + str(EVENT_SCROLL)
+    + """;
+const SMOOTH_SCROLL = """
+    + str(EVENT_SMOOTH_SCROLL)
+    + """;
+
+const decodeEvents = (packed) => {
+    const bytes = GLib.base64_decode(packed);
+    const end = bytes.byteOffset + bytes.byteLength;
+    return new Int32Array(bytes.buffer.slice(bytes.byteOffset, end));
+};
+
+// Dispatch the event at index i, moving the pointer by an offset of (dx, dy).
+const dispatch = (events, i, dx, dy) => {
+    const type = events[i];
+    const a = events[i + 1];
+    const b = events[i + 2];
+    const keyState = b ? Clutter.KeyState.PRESSED : Clutter.KeyState.RELEASED;
+    if (type === KEYVAL) {
+        keyboard().notify_keyval(0, a, keyState);
+    } else if (type === KEY) {
+        keyboard().notify_key(0, a, keyState);
+    } else if (type === MOVE) {
+        pointer().notify_absolute_motion(0, a / FIXED_POINT + dx, b / FIXED_POINT + dy);
+    } else if (type === BUTTON) {
+        pointer().notify_button(
+            0,
+            a,
+            b ? Clutter.ButtonState.PRESSED : Clutter.ButtonState.RELEASED,
+        );
+    } else if (type === SMOOTH_SCROLL) {
+        pointer().notify_scroll_continuous(
+            0,
+            a / FIXED_POINT,
+            b / FIXED_POINT,
+            Clutter.ScrollSource.WHEEL,
+            Clutter.ScrollFinishFlags.NONE,
+        );
+    } else if (type === SCROLL) {
+        const D = Clutter.ScrollDirection;
+        const source = Clutter.ScrollSource.WHEEL;
+        for (let j = 0; j < Math.abs(b / FIXED_POINT); j++) {
+            pointer().notify_discrete_scroll(0, b > 0 ? D.DOWN : D.UP, source);
+        }
+        for (let j = 0; j < Math.abs(a / FIXED_POINT); j++) {
+            pointer().notify_discrete_scroll(0, a > 0 ? D.RIGHT : D.LEFT, source);
+        }
+    }
+};
+
+// For some reason, some click events don't work if they are directly after
+// a mouse movement, so clicks have a delay before them.
+const delayBefore = (events, i) => (events[i] === BUTTON ? events[i + 3] : 0);
+const delayAfter = (events, i) => (events[i] === BUTTON ? 0 : events[i + 3]);
+
+// Wait until dueMs milliseconds after the monotonic time start, so that
+// delays are measured against a fixed schedule and errors don't add up.
+const waitUntil = (start, dueMs) => {
+    const waitMs = dueMs - (GLib.get_monotonic_time() - start) / 1000;
+    if (waitMs < 1) {
+        return Promise.resolve();
+    }
+    return new Promise((resolve) => {
+        GLib.timeout_add(GLib.PRIORITY_DEFAULT, Math.round(waitMs), () => {
+            resolve();
+            return GLib.SOURCE_REMOVE;
+        });
+    });
+};
+
+// Both runners take decoded events and optional {dx, dy, speed}, where
+// delays are divided by speed. runTimeline() also takes a monotonic start
+// time and the offset dueMs of the first event from it, to continue an
+// earlier schedule, and onDispatch and cancelled callbacks.
+const runEvents = (events, opts = {}) => {
+    for (let i = 0; i < events.length; i += EVENT_SIZE) {
+        dispatch(events, i, opts.dx || 0, opts.dy || 0);
+    }
+};
+
+const runTimeline = async (events, opts = {}) => {
+    const dx = opts.dx || 0;
+    const dy = opts.dy || 0;
+    const speed = opts.speed || 1;
+    const start = opts.start || GLib.get_monotonic_time();
+    let dueMs = opts.dueMs || 0;
+    for (let i = 0; i < events.length; i += EVENT_SIZE) {
+        if (opts.cancelled && opts.cancelled()) {
+            return;
+        }
+        if (delayBefore(events, i)) {
+            dueMs += delayBefore(events, i) / speed;
+            await waitUntil(start, dueMs);
+        }
+        dispatch(events, i, dx, dy);
+        if (opts.onDispatch) {
+            opts.onDispatch();
+        }
+        if (delayAfter(events, i)) {
+            dueMs += delayAfter(events, i) / speed;
+            await waitUntil(start, dueMs);
+        }
+    }
+};
+"""
+)
+
+
+def pack_events(events: Iterable[Any]) -> array:
+    """
+    Pack events which have a pack_event() method into a flat array.
+    """
+    packed = array("i")
+    for evt in events:
+        packed.extend(evt.pack_event())
+    return packed
+
+
+def encode_packed(packed: array) -> str:
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+def to_fixed_point(value: float) -> int:
+    return round(value * FIXED_POINT)
+
+
+def timeline_duration_ms(packed: array) -> int:
+    """
+    Get the total delay of a packed sequence of events.
+    """
+    return sum(packed[EVENT_SIZE - 1 :: EVENT_SIZE])
+
+
+@dataclass
+class ScheduleChunk:
+    start: int  # the index of the chunk's first event.
+    packed: array
+    start_ms: int  # the time of the chunk's first event in the schedule.
+    duration_ms: int  # the total delay of the chunk's events.
+
+    @property
+    def count(self) -> int:
+        return len(self.packed) // EVENT_SIZE
+
+
+def plan_schedule(
+    packed: array,
+    max_chunk_events: int = MAX_CHUNK_EVENTS,
+    max_chunk_ms: int = MAX_CHUNK_MS,
+) -> List[ScheduleChunk]:
+    """
+    Split a packed sequence of events into chunks of at most max_chunk_events
+    events and (unless a single event is longer) max_chunk_ms of delays.
+
+    Every event's delay counts towards the schedule, including the delays
+    before buttons.
+    """
+    chunks = []
+    chunk_start = 0
+    start_ms = 0
+    duration = 0
+    count = len(packed) // EVENT_SIZE
+    for i in range(count):
+        delay = packed[i * EVENT_SIZE + EVENT_SIZE - 1]
+        size = i - chunk_start
+        if size and (size >= max_chunk_events or duration + delay > max_chunk_ms):
+            chunks.append(
+                ScheduleChunk(
+                    start=chunk_start,
+                    packed=packed[chunk_start * EVENT_SIZE : i * EVENT_SIZE],
+                    start_ms=start_ms,
+                    duration_ms=duration,
+                )
+            )
+            chunk_start = i
+            start_ms += duration
+            duration = 0
+        duration += delay
+    chunks.append(
+        ScheduleChunk(
+            start=chunk_start,
+            packed=packed[chunk_start * EVENT_SIZE :],
+            start_ms=start_ms,
+            duration_ms=duration,
+        )
+    )
+    return chunks
+
+
+def run_timeline(
+    e: Evaluator,
+    packed: array,
+    progress: Optional[Callable[[int, int], None]] = None,
+    **kwargs,
+) -> Any:
+    """
+    Run a packed sequence of events in the shell.
+
+    Sequences without delays are run synchronously in a single call.
+    Otherwise, the call waits for the whole sequence, and its timeout is
+    extended by the total delay.
+
+    Sequences which plan_schedule() splits into several chunks are instead
+    streamed: each chunk is queued in the shell while the previous one
+    runs, so no single request is huge and no single call has to wait for
+    the whole sequence.
+
+    :param progress: called with (events done, total events) as the
+                     sequence runs.
+    """
+    count = len(packed) // EVENT_SIZE
+    chunks = plan_schedule(packed)
+    if len(chunks) > 1 and not isinstance(e, BatchEvaluator):
+        return _stream_timeline(e, chunks, count, progress, **kwargs)
+    duration = timeline_duration_ms(packed)
+    data = encode_packed(packed)
+    if not duration:
+        result = e.call_function(
+            TIMELINE_JS + "runEvents(decodeEvents(events));", events=data, **kwargs
+        )
+    else:
+        result = e.with_timeout(e.timeout_ms + duration).call_async_function(
+            TIMELINE_JS + "await runTimeline(decodeEvents(events));",
+            events=data,
+            **kwargs,
+        )
+    if progress is not None:
+        progress(count, count)
+    return result
+
+
+def _stream_timeline(
+    e: Evaluator,
+    chunks: List[ScheduleChunk],
+    count: int,
+    progress: Optional[Callable[[int, int], None]],
+    idle_timeout_ms: int = 10000,
+    **kwargs,
+):
+    session_id = f"q{uuid.uuid4().hex}"
+
+    def push(chunk: ScheduleChunk, script: str):
+        status = e.call_function(
+            script,
+            session_id=session_id,
+            events=encode_packed(chunk.packed),
+            start_ms=chunk.start_ms,
+            last=chunk is chunks[-1],
+            idle_timeout_ms=idle_timeout_ms,
+            **kwargs,
+        )
+        check(status)
+
+    def check(status: dict):
+        if status["error"]:
+            raise EvaluatorJavaScriptError(status["error"])
+        if progress is not None:
+            progress(status["done"], count)
+
+    try:
+        push(chunks[0], _START_QUEUE_SCRIPT)
+        started = time.monotonic()
+        for prev, chunk in zip(chunks, chunks[1:]):
+            # Queue each chunk once the one before it starts running.
+            wait = started + prev.start_ms / 1000 - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            push(chunk, _PUSH_QUEUE_SCRIPT)
+        end = started + (chunks[-1].start_ms + chunks[-1].duration_ms) / 1000
+        remaining_ms = max(0, int((end - time.monotonic()) * 1000))
+        check(
+            e.with_timeout(e.timeout_ms + remaining_ms).call_async_function(
+                _WAIT_QUEUE_SCRIPT, session_id=session_id, **kwargs
+            )
+        )
+    except BaseException:
+        try:
+            e.call_function(_CANCEL_QUEUE_SCRIPT, session_id=session_id)
+        except EvaluatorJavaScriptError:
+            pass
+        raise
+
+
+_QUEUE_JS = """
+if (!global._gnomeHacksInputQueues) {
+    global._gnomeHacksInputQueues = {};
+}
+const queues = global._gnomeHacksInputQueues;
+const status = (q) => ({done: q.done, finished: q.finished, error: q.error});
+"""
+
+_START_QUEUE_SCRIPT = TIMELINE_JS + _QUEUE_JS + """
+const q = {
+    chunks: [{events: decodeEvents(events), startMs: start_ms}],
+    closed: last,
+    cancelled: false,
+    done: 0,
+    finished: false,
+    error: null,
+    wake: null,
+    waiters: [],
+};
+queues[session_id] = q;
+
+const nextChunk = () => new Promise((resolve) => {
+    const timeout = GLib.timeout_add(GLib.PRIORITY_DEFAULT, idle_timeout_ms, () => {
+        q.wake = null;
+        resolve(false);
+        return GLib.SOURCE_REMOVE;
+    });
+    q.wake = () => {
+        GLib.source_remove(timeout);
+        q.wake = null;
+        resolve(true);
+    };
+});
+
+(async () => {
+    const opts = {
+        start: GLib.get_monotonic_time(),
+        onDispatch: () => q.done++,
+        cancelled: () => q.cancelled,
+    };
+    try {
+        while (!q.cancelled) {
+            if (!q.chunks.length) {
+                if (q.closed) {
+                    break;
+                }
+                if (!await nextChunk()) {
+                    throw new Error('no input queued for ' + idle_timeout_ms + ' ms');
+                }
+                continue;
+            }
+            const chunk = q.chunks.shift();
+            await runTimeline(chunk.events, Object.assign({dueMs: chunk.startMs}, opts));
+        }
+    } catch (e) {
+        q.error = String(e);
+    }
+    q.finished = true;
+    q.waiters.forEach((resolve) => resolve());
+
+    // Forget the queue if nobody waits for it.
+    GLib.timeout_add(GLib.PRIORITY_DEFAULT, idle_timeout_ms, () => {
+        if (queues[session_id] === q) {
+            delete queues[session_id];
+        }
+        return GLib.SOURCE_REMOVE;
+    });
+})();
+return status(q);
+"""
+
+_PUSH_QUEUE_SCRIPT = TIMELINE_JS + _QUEUE_JS + """
+const q = queues[session_id];
+if (!q) {
+    throw new Error('unknown input queue: ' + session_id);
+}
+q.chunks.push({events: decodeEvents(events), startMs: start_ms});
+q.closed = last;
+if (q.wake) {
+    q.wake();
+}
+return status(q);
+"""
+
+_WAIT_QUEUE_SCRIPT = _QUEUE_JS + """
+const q = queues[session_id];
+if (!q) {
+    throw new Error('unknown input queue: ' + session_id);
+}
+if (!q.finished) {
+    await new Promise((resolve) => q.waiters.push(resolve));
+}
+delete queues[session_id];
+return status(q);
+"""
+
+_CANCEL_QUEUE_SCRIPT = _QUEUE_JS + """
+const q = queues[session_id];
+if (q) {
+    q.cancelled = true;
+    q.chunks = [];
+    if (q.wake) {
+        q.wake();
+    }
+}
+"""
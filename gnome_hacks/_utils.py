@@ -1,3 +1,15 @@
+import atexit
+import functools
+import os
+import shutil
+import sys
+import tempfile
+
+# Keyword arguments for @dataclass which add __slots__ on Python 3.10+, to
+# make large numbers of small objects cheaper to create and store.
+DATACLASS_SLOTS = dict(slots=True) if sys.version_info >= (3, 10) else {}
+
+
 def reusable_device_expr(dev_type: str) -> str:
     """
     Create a virtual input device and cache the result for the lifetime of the
@@ -28,3 +40,169 @@ def reusable_device_expr(dev_type: str) -> str:
     })()"""
     )
     return "".join([x.strip() for x in res.split("\n")])
+
+
+def window_index_expr() -> str:
+    """
+    Get an index of all windows by ID which is kept up to date by window
+    signals for the lifetime of the GNOME shell process.
+
+    The index has the following fields:
+     - windows: maps window IDs to entries of the form {window, version}.
+     - version: a counter bumped by every change, including removals.
+     - epoch: a random string that identifies this instance of the index.
+     - listeners: maps names to functions which are called with an event
+       {type, id, time} for every change. The type is one of 'created',
+       'destroyed', 'moved', 'resized', 'title' or 'focus'.
+
+    An entry's version is the value of the counter when the window was last
+    created, moved, resized or retitled.
+
+    The index also keeps a bounded change log:
+     - log: entries of the form {seq, id, kind} in order of seq, where seq is
+       the version the change produced and kind is 'added', 'changed' or
+       'removed'.
+     - logStart: the log holds every change with a seq above this version.
+       Older entries are dropped once the log grows past its limit.
+
+    :return: a JavaScript expression to get the index
+    """
+    res = """(function() {
+        const schema = 3;
+        const logLimit = 4096;
+        const old = global._gnomeHacksWindowIndex;
+        if (old && old.schema === schema) {
+            return old;
+        }
+        if (old) {
+            old.destroy();
+        }
+        const GLib = imports.gi.GLib;
+        const display = global.display;
+        const idx = {
+            schema: schema,
+            epoch: GLib.uuid_string_random(),
+            version: 0,
+            windows: {},
+            listeners: {},
+            log: [],
+            logStart: 0,
+        };
+        const record = (kind, id) => {
+            idx.log.push({seq: idx.version, id: id, kind: kind});
+            if (idx.log.length > logLimit) {
+                const dropped = idx.log.splice(0, logLimit / 2);
+                idx.logStart = dropped[dropped.length - 1].seq;
+            }
+        };
+        const emit = (type, id) => {
+            const evt = {type: type, id: id, time: GLib.get_real_time()};
+            Object.values(idx.listeners).forEach((l) => l(evt));
+        };
+        const untrack = (window) => {
+            const entry = idx.windows[window.get_id()];
+            if (!entry) {
+                return;
+            }
+            entry.signals.forEach((s) => window.disconnect(s));
+            delete idx.windows[window.get_id()];
+            idx.version++;
+            record('removed', window.get_id());
+            emit('destroyed', window.get_id());
+        };
+        const track = (window) => {
+            if (idx.windows[window.get_id()]) {
+                return;
+            }
+            const entry = {window: window, version: ++idx.version, signals: []};
+            const changed = (type) => {
+                entry.version = ++idx.version;
+                record('changed', window.get_id());
+                emit(type, window.get_id());
+            };
+            entry.signals.push(window.connect('position-changed', () => changed('moved')));
+            entry.signals.push(window.connect('size-changed', () => changed('resized')));
+            entry.signals.push(window.connect('notify::title', () => changed('title')));
+            entry.signals.push(window.connect('unmanaged', untrack));
+            idx.windows[window.get_id()] = entry;
+            record('added', window.get_id());
+        };
+        const displaySignals = [
+            display.connect('window-created', (_, w) => {
+                track(w);
+                emit('created', w.get_id());
+            }),
+            display.connect('notify::focus-window', () => {
+                const w = display.get_focus_window();
+                emit('focus', w ? w.get_id() : null);
+            }),
+        ];
+        idx.destroy = () => {
+            idx.listeners = {};
+            displaySignals.forEach((s) => display.disconnect(s));
+            Object.values(idx.windows).forEach((e) => untrack(e.window));
+        };
+        global.get_window_actors().forEach((a) => track(a.get_meta_window()));
+        global._gnomeHacksWindowIndex = idx;
+        return idx;
+    })()"""
+    return "".join([x.strip() for x in res.split("\n")])
+
+
+NOTIFY_PATH = "/org/gnome/GnomeHacks"
+NOTIFY_INTERFACE = "org.gnome.GnomeHacks"
+NOTIFY_SIGNAL = "Notify"
+
+
+def notify_expr() -> str:
+    """
+    Create a function which pushes a message from the shell to a D-Bus client
+    as a unicast NOTIFY_SIGNAL with arguments (key, payload).
+
+    :return: a JavaScript expression for a function (dest, key, payload) that
+             returns true if the signal was sent, or false if dest is empty or
+             the shell cannot emit signals.
+    """
+    res = (
+        """((dest, key, payload) => {
+        const Gio = imports.gi.Gio;
+        const GLib = imports.gi.GLib;
+        const conn = Gio.DBus.session;
+        if (!dest || !conn || typeof conn.emit_signal !== 'function') {
+            return false;
+        }
+        try {
+            conn.emit_signal(
+                dest,
+                '"""
+        + NOTIFY_PATH
+        + """',
+                '"""
+        + NOTIFY_INTERFACE
+        + """',
+                '"""
+        + NOTIFY_SIGNAL
+        + """',
+                new GLib.Variant('(ss)', [key, payload]),
+            );
+            return true;
+        } catch (e) {
+            return false;
+        }
+    })"""
+    )
+    return "".join([x.strip() for x in res.split("\n")])
+
+
+@functools.lru_cache(maxsize=None)
+def private_shm_dir() -> str:
+    """
+    Get a private directory for exchanging large buffers with the shell.
+
+    The directory lives on /dev/shm when possible, so files in it are backed
+    by memory, and it is removed when the process exits.
+    """
+    parent = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    path = tempfile.mkdtemp(prefix="gnome-hacks-", dir=parent)
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
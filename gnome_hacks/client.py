@@ -0,0 +1,125 @@
+"""
+A lightweight client for the gnome-hacks daemon (see daemon.py).
+
+This module does not import gi or any of the other gnome_hacks modules, so
+it starts quickly. From the command line, run a single command like
+
+    python -m gnome_hacks.client press_keys names='["H", "i", "Return"]'
+
+or pass `-` to read one command per line from stdin over a single
+connection:
+
+    printf 'move_pointer x=10 y=10\nmove_pointer x=20 y=20 click=true\n' | \
+        python -m gnome_hacks.client -
+
+Arguments are given as key=value, where values are parsed as JSON if
+possible and are otherwise treated as strings. Each result is printed as a
+line of JSON.
+"""
+
+import argparse
+import json
+import os
+import shlex
+import socket
+import sys
+from typing import Any, Dict, List, Tuple
+
+
+def default_socket_path() -> str:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "gnome-hacks.sock")
+    return f"/tmp/gnome-hacks-{os.getuid()}.sock"
+
+
+class Client:
+    """
+    A connection to a running gnome-hacks daemon.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or default_socket_path()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.connect(self.path)
+        self._file = self._sock.makefile("rwb")
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        self._file.close()
+        self._sock.close()
+
+    def call(self, method: str, **params) -> Any:
+        """
+        Call a daemon method and return its result.
+
+        :raises DaemonError: if the method failed inside the daemon.
+        """
+        request = json.dumps(dict(method=method, params=params))
+        self._file.write(request.encode("utf-8") + b"\n")
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("daemon closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise DaemonError(response["error"]["type"], response["error"]["message"])
+        return response["result"]
+
+
+class DaemonError(Exception):
+    """
+    An error raised by a method inside the daemon.
+    """
+
+    def __init__(self, type_name: str, msg: str):
+        super().__init__(f"{type_name}: {msg}")
+        self.type_name = type_name
+        self.message = msg
+
+
+def _parse_command(args: List[str]) -> Tuple[str, Dict[str, Any]]:
+    params = {}
+    for arg in args[1:]:
+        if "=" not in arg:
+            raise ValueError(f"expected key=value but got: {arg}")
+        key, value = arg.split("=", 1)
+        try:
+            params[key] = json.loads(value)
+        except ValueError:
+            params[key] = value
+    return args[0], params
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send commands to gnome-hacks.")
+    parser.add_argument("--socket", default=None, help="path of the daemon socket")
+    parser.add_argument("method", help="method to call, or - to read from stdin")
+    parser.add_argument("params", nargs="*", help="arguments as key=value")
+    args = parser.parse_args()
+
+    with Client(args.socket) as client:
+        if args.method == "-":
+            commands = (shlex.split(line) for line in sys.stdin)
+        else:
+            commands = [[args.method] + args.params]
+        status = 0
+        for command in commands:
+            if not command:
+                continue
+            method, params = _parse_command(command)
+            try:
+                print(json.dumps(client.call(method, **params)), flush=True)
+            except DaemonError as exc:
+                print(str(exc), file=sys.stderr, flush=True)
+                status = 1
+        sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+A long-lived process which holds a warm Evaluator and serves requests from
+gnome_hacks.client over a Unix socket.
+
+Run it with `python -m gnome_hacks.daemon`. Requests and responses are lines
+of JSON: a request is {"method": ..., "params": {...}}, and a response is
+either {"result": ...} or {"error": {"type": ..., "message": ...}}.
+"""
+
+import argparse
+import base64
+import json
+import os
+import socketserver
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Union
+
+from .client import default_socket_path
+from .evaluator import Evaluator
+from .input import simulate_input
+from .keyboard import KeyEvent, simulate_key_events, type_text
+from .keysyms import keyval_from_name
+from .monitors import list_monitors
+from .pointer import (
+    PointerButton,
+    PointerMove,
+    PointerScroll,
+    drag,
+    glide_pointer,
+    simulate_pointer_events,
+)
+from .screenshot import capture_screenshot
+from .windows import (
+    get_window_frame,
+    get_window_monitor_frame,
+    list_windows,
+    move_window,
+    windows_since,
+)
+
+
+def create_handlers(e: Evaluator) -> Dict[str, Callable[..., Any]]:
+    """
+    Create the methods exposed by the daemon. Every method takes and returns
+    JSON-compatible values.
+    """
+
+    def optional_rect(rect):
+        return None if rect is None else asdict(rect)
+
+    def key_events(events: List[Dict[str, Any]]):
+        simulate_key_events(e, *[KeyEvent(**x) for x in events])
+
+    def press_keys(names: Union[str, List[str]]):
+        if isinstance(names, str):
+            names = [names]
+        keyvals = [keyval_from_name("KEY_" + name) for name in names]
+        simulate_key_events(
+            e,
+            *[KeyEvent(pressed=p, keyval=k) for k in keyvals for p in [True, False]],
+        )
+
+    def parse_event(evt: Dict[str, Any]):
+        if "key" in evt:
+            return KeyEvent(**evt["key"])
+        if "move" in evt:
+            return PointerMove(**evt["move"])
+        if "scroll" in evt:
+            return PointerScroll(**evt["scroll"])
+        return PointerButton(**evt["button"])
+
+    def pointer_events(events: List[Dict[str, Any]]):
+        simulate_pointer_events(e, *[parse_event(x) for x in events])
+
+    def input_events(events: List[Dict[str, Any]]):
+        simulate_input(e, *[parse_event(x) for x in events])
+
+    def move_pointer(x: int, y: int, click: bool = False, button: int = 1):
+        events = [PointerMove(x, y)]
+        if click:
+            events += [PointerButton(True, button), PointerButton(False, button)]
+        simulate_pointer_events(e, *events)
+
+    def screenshot(**kwargs):
+        return base64.b64encode(capture_screenshot(e, **kwargs)).decode("ascii")
+
+    return {
+        "ping": lambda: "pong",
+        "eval": lambda script, **kwargs: e(script, **kwargs),
+        "call_async": lambda script, **kwargs: e.call_async(script, **kwargs),
+        "list_windows": lambda: [asdict(x) for x in list_windows(e)],
+        "get_window_frame": lambda id: optional_rect(get_window_frame(e, id)),
+        "get_window_monitor_frame": lambda id: optional_rect(
+            get_window_monitor_frame(e, id)
+        ),
+        "move_window": lambda id, x, y, user_op=False: move_window(
+            e, id, x, y, user_op
+        ),
+        "list_monitors": lambda: [asdict(x) for x in list_monitors(e)],
+        "windows_since": lambda token=None: asdict(windows_since(e, token)),
+        "key_events": key_events,
+        "press_keys": press_keys,
+        "type_text": lambda text, cps=None, us_shift=False: type_text(
+            e, text, cps, us_shift
+        ),
+        "pointer_events": pointer_events,
+        "input_events": input_events,
+        "move_pointer": move_pointer,
+        "glide_pointer": lambda end, **kwargs: glide_pointer(e, end, **kwargs),
+        "drag": lambda start, end, **kwargs: drag(e, start, end, **kwargs),
+        "screenshot": screenshot,
+    }
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                handler = self.server.handlers.get(request["method"])
+                if handler is None:
+                    raise ValueError(f"unknown method: {request['method']}")
+                response = dict(result=handler(**request.get("params", {})))
+            except Exception as exc:
+                response = dict(error=dict(type=type(exc).__name__, message=str(exc)))
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class Daemon(socketserver.ThreadingUnixStreamServer):
+    """
+    A server which handles each client connection on its own thread, using
+    a shared Evaluator.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: str, e: Evaluator):
+        if os.path.exists(path):
+            os.unlink(path)
+        super().__init__(path, _RequestHandler)
+        self.path = path
+        self.handlers = create_handlers(e)
+
+    def server_bind(self):
+        # Create the socket without access for other users, rather than
+        # restricting it after binding, when others could already connect.
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve gnome-hacks requests.")
+    parser.add_argument("--socket", default=default_socket_path())
+    parser.add_argument("--timeout-ms", type=int, default=10000)
+    args = parser.parse_args()
+
+    with Daemon(args.socket, Evaluator(timeout_ms=args.timeout_ms)) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
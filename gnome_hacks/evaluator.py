@@ -1,10 +1,17 @@
+import asyncio
+import contextlib
+import functools
+import hashlib
 import json
 import random
+import threading
 import time
-from typing import Any
+from typing import Any, Callable, Iterator, List, Optional, Tuple
 
 from gi.repository import Gio, GLib, GObject
 
+from ._utils import NOTIFY_INTERFACE, NOTIFY_PATH, NOTIFY_SIGNAL, notify_expr
+
 
 class Evaluator(GObject.Object):
     """
@@ -14,18 +21,7 @@ class Evaluator(GObject.Object):
     def __init__(self, timeout_ms: int = 10000, proxy: Any = None):
         super().__init__()
         self.timeout_ms = timeout_ms
-        self.proxy = (
-            proxy
-            if proxy is not None
-            else Gio.DBusProxy.new_for_bus_sync(
-                Gio.BusType.SESSION,
-                Gio.DBusProxyFlags.NONE,
-                None,
-                "org.gnome.Shell",
-                "/org/gnome/Shell",
-                "org.gnome.Shell",
-            )
-        )
+        self.proxy = proxy if proxy is not None else _shell_proxy()
 
     def with_timeout(self, timeout_ms: int) -> Any:
         return Evaluator(timeout_ms=timeout_ms, proxy=self.proxy)
@@ -46,63 +42,422 @@ class Evaluator(GObject.Object):
             Gio.DBusCallFlags.NO_AUTO_START,
             self.timeout_ms,
         ).unpack()
-        if not status:
-            raise EvaluatorJavaScriptError(result)
-        if raw:
-            return result
-        elif not result:
-            return None
-        return json.loads(result)
+        return _parse_result(status, result, raw)
 
     def call_async(self, script: str, poll_interval: int = 50, **kwargs) -> Any:
         """
         Evaluate code inside an async function and wait for the results.
+
+        The shell pushes the result back with a D-Bus signal as soon as the
+        function returns. On shells where this is not possible, the result is
+        polled for every poll_interval milliseconds instead.
         """
-        wait_name = f"_waitCtx{random.randrange(2**40)}"
-        wrapped_script = _add_variables(script, **kwargs)
-        code = (
-            "const _waitCtx = {status: 0};"
-            "global[_waitName] = _waitCtx;"
-            "(async function(){" + wrapped_script + "})().then((result)=>{"
-            "_waitCtx.result=(typeof result === 'undefined' ? null : result);"
-            "_waitCtx.status=1;}).catch((err)=>{"
-            "_waitCtx.error=''+err; _waitCtx.status=2;});"
-            """
-            // Cleanup global object if the call times out.
-            const GLib = imports.gi.GLib;
-            GLib.timeout_add(GLib.PRIORITY_DEFAULT, _waitTimeout, () => {
-                if (global[_waitName]) {
-                    delete global[_waitName];
-                }
-                return false;
-            });
-            """
-        )
+        wait_name = _wait_name()
         t1 = int(time.time() * 1000)
-        self(
-            code,
-            _waitName=wait_name,
-            _waitTimeout=self.timeout_ms + 1000,  # buffer time before cleanup
-        )
+        with _SignalWaiter(self.proxy, wait_name) as waiter:
+            pushed = self(
+                _async_script(
+                    script, wait_name, self.timeout_ms, waiter.destination, **kwargs
+                )
+            )
+            if pushed:
+                payload = waiter.wait(t1 + self.timeout_ms - int(time.time() * 1000))
+                if payload is not None:
+                    return _wait_ctx_result(json.loads(payload))
+                # The signal may have failed to send; check for a stored result.
+                out = self(_CHECK_SCRIPT, _waitName=wait_name)
+                if out is not None and out["status"]:
+                    return _wait_ctx_result(out)
+                raise EvaluatorPromiseTimeoutError("result was not received in time")
         while True:
             remaining_time = t1 + self.timeout_ms - int(time.time() * 1000)
             if remaining_time < 0:
                 break
-            check_code = """
-            const res = global[_waitName];
-            if (res.status) {
-                delete global[_waitName];
-            }
-            res;
-            """
-            out = self(check_code, _waitName=wait_name)
-            if out["status"] == 1:
-                return out["result"]
-            elif out["status"] == 2:
-                raise EvaluatorJavaScriptError(out["error"])
+            out = self(_CHECK_SCRIPT, _waitName=wait_name)
+            if out is not None and out["status"]:
+                return _wait_ctx_result(out)
             time.sleep(poll_interval / 1000)
         raise EvaluatorPromiseTimeoutError("result was not received in time")
 
+    def call_function(self, body: str, **kwargs) -> Any:
+        """
+        Call a JavaScript function inside the GNOME shell.
+
+        The function is installed in the shell the first time it is used and
+        is keyed by a hash of its source, so later calls only send a handle
+        and the arguments. It is reinstalled automatically if the shell has
+        restarted since.
+
+        :param body: the body of the function, which should use `return` to
+                     produce a result. It sees kwargs as local variables.
+        :param kwargs: arguments to the function. These must be JSON
+                       serializable.
+        """
+        handle = _function_handle(body, tuple(sorted(kwargs)), False)
+        try:
+            return self(_invoke_script(handle, kwargs))
+        except EvaluatorJavaScriptError as exc:
+            if _MISSING_FUNCTION not in exc.message:
+                raise
+        return self(
+            _install_script(handle, body, kwargs) + _invoke_script(handle, kwargs)
+        )
+
+    def call_async_function(self, body: str, poll_interval: int = 50, **kwargs) -> Any:
+        """
+        Like call_function(), but the function is async (i.e. may use await)
+        and is waited for like call_async().
+        """
+        handle = _function_handle(body, tuple(sorted(kwargs)), True)
+        invoke = "return await " + _invoke_script(handle, kwargs)
+        try:
+            return self.call_async(invoke, poll_interval=poll_interval)
+        except EvaluatorJavaScriptError as exc:
+            if _MISSING_FUNCTION not in exc.message:
+                raise
+        return self.call_async(
+            _install_script(handle, body, kwargs) + invoke, poll_interval=poll_interval
+        )
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator["BatchEvaluator"]:
+        """
+        Collect calls and run them all in a single Eval.
+
+        Inside the block, the yielded BatchEvaluator can be passed to the same
+        functions as an Evaluator. Calls return BatchResult placeholders which
+        are filled in when the block exits, each with its own result or
+        exception. If the block raises, none of the calls are run.
+        """
+        b = BatchEvaluator(self)
+        yield b
+        b.flush()
+
+    def listen(self, key: str) -> "_SignalWaiter":
+        """
+        Receive the notifications which scripts send for a key with the
+        function from notify_expr().
+
+        Scripts should send them to the returned waiter's destination. This
+        is None if the shell cannot send signals to this process, in which
+        case callers have to poll instead. The waiter should be closed when
+        no longer needed.
+        """
+        return _SignalWaiter(self.proxy, key)
+
+
+class AsyncEvaluator(GObject.Object):
+    """
+    An asyncio counterpart to Evaluator.
+
+    Calls are issued with the non-blocking D-Bus API, and their replies are
+    dispatched from a GLib main loop running on a background thread back onto
+    the calling asyncio loop. As a result, many scripts can be in flight at
+    once, e.g. using asyncio.gather().
+    """
+
+    def __init__(self, timeout_ms: int = 10000, proxy: Any = None):
+        super().__init__()
+        self.timeout_ms = timeout_ms
+        self.proxy = proxy if proxy is not None else _shell_proxy()
+
+    def with_timeout(self, timeout_ms: int) -> Any:
+        return AsyncEvaluator(timeout_ms=timeout_ms, proxy=self.proxy)
+
+    async def __call__(self, script: str, raw=False, **kwargs) -> Any:
+        """
+        Evaluate JavaScript code inside the GNOME shell.
+
+        See Evaluator.__call__ for details on the arguments.
+        """
+        wrapped_script = _add_variables(script, **kwargs)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def on_done(proxy, async_result, _user_data):
+            try:
+                value = proxy.call_finish(async_result).unpack()
+            except Exception as exc:
+                loop.call_soon_threadsafe(_set_future_exception, future, exc)
+            else:
+                loop.call_soon_threadsafe(_set_future_result, future, value)
+
+        def start():
+            self.proxy.call(
+                "Eval",
+                GLib.Variant.new_tuple(GLib.Variant.new_string(wrapped_script)),
+                Gio.DBusCallFlags.NO_AUTO_START,
+                self.timeout_ms,
+                None,
+                on_done,
+                None,
+            )
+
+        _glib_loop().invoke(start)
+        status, result = await future
+        return _parse_result(status, result, raw)
+
+    async def call_async(self, script: str, poll_interval: int = 50, **kwargs) -> Any:
+        """
+        Evaluate code inside an async function and wait for the results.
+
+        See Evaluator.call_async for details.
+        """
+        wait_name = _wait_name()
+        t1 = int(time.time() * 1000)
+        async with _AsyncSignalWaiter(self.proxy, wait_name) as waiter:
+            pushed = await self(
+                _async_script(
+                    script, wait_name, self.timeout_ms, waiter.destination, **kwargs
+                )
+            )
+            if pushed:
+                payload = await waiter.wait(
+                    t1 + self.timeout_ms - int(time.time() * 1000)
+                )
+                if payload is not None:
+                    return _wait_ctx_result(json.loads(payload))
+                out = await self(_CHECK_SCRIPT, _waitName=wait_name)
+                if out is not None and out["status"]:
+                    return _wait_ctx_result(out)
+                raise EvaluatorPromiseTimeoutError("result was not received in time")
+        while True:
+            remaining_time = t1 + self.timeout_ms - int(time.time() * 1000)
+            if remaining_time < 0:
+                break
+            out = await self(_CHECK_SCRIPT, _waitName=wait_name)
+            if out is not None and out["status"]:
+                return _wait_ctx_result(out)
+            await asyncio.sleep(poll_interval / 1000)
+        raise EvaluatorPromiseTimeoutError("result was not received in time")
+
+    async def call_function(self, body: str, **kwargs) -> Any:
+        """
+        Call an installed JavaScript function inside the GNOME shell.
+
+        See Evaluator.call_function for details.
+        """
+        handle = _function_handle(body, tuple(sorted(kwargs)), False)
+        try:
+            return await self(_invoke_script(handle, kwargs))
+        except EvaluatorJavaScriptError as exc:
+            if _MISSING_FUNCTION not in exc.message:
+                raise
+        return await self(
+            _install_script(handle, body, kwargs) + _invoke_script(handle, kwargs)
+        )
+
+    async def call_async_function(
+        self, body: str, poll_interval: int = 50, **kwargs
+    ) -> Any:
+        """
+        Call an installed async JavaScript function and wait for the results.
+
+        See Evaluator.call_async_function for details.
+        """
+        handle = _function_handle(body, tuple(sorted(kwargs)), True)
+        invoke = "return await " + _invoke_script(handle, kwargs)
+        try:
+            return await self.call_async(invoke, poll_interval=poll_interval)
+        except EvaluatorJavaScriptError as exc:
+            if _MISSING_FUNCTION not in exc.message:
+                raise
+        return await self.call_async(
+            _install_script(handle, body, kwargs) + invoke, poll_interval=poll_interval
+        )
+
+
+class BatchResult:
+    """
+    The result of a call made through a BatchEvaluator, which becomes
+    available once the batch has been run.
+    """
+
+    def __init__(self):
+        self._done = False
+        self._value = None
+        self._error = None
+        self._dependents = []
+
+    def done(self) -> bool:
+        return self._done
+
+    def result(self) -> Any:
+        """
+        Get the result of the call, raising its exception if it failed.
+        """
+        if not self._done:
+            raise RuntimeError("the batch containing this call has not been run")
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def map(self, fn: Callable[[Any], Any]) -> "BatchResult":
+        """
+        Create a BatchResult for fn() applied to this result.
+        """
+        res = BatchResult()
+        self._dependents.append((res, fn))
+        if self._done:
+            self._propagate()
+        return res
+
+    def _resolve(self, value: Any = None, error: Optional[Exception] = None):
+        self._done = True
+        self._value = value
+        self._error = error
+        self._propagate()
+
+    def _propagate(self):
+        dependents, self._dependents = self._dependents, []
+        for res, fn in dependents:
+            if self._error is not None:
+                res._resolve(error=self._error)
+                continue
+            try:
+                value = fn(self._value)
+            except Exception as exc:
+                res._resolve(error=exc)
+            else:
+                res._resolve(value)
+
+
+def map_result(value: Any, fn: Callable[[Any], Any]) -> Any:
+    """
+    Apply fn to the result of an evaluator call, deferring it if the call was
+    made inside a batch.
+    """
+    if isinstance(value, BatchResult):
+        return value.map(fn)
+    return fn(value)
+
+
+class _BatchCall:
+    def __init__(self, thunk: str, is_async: bool, timeout_ms: int, raw: bool):
+        self.thunk = thunk
+        self.is_async = is_async
+        self.timeout_ms = timeout_ms
+        self.raw = raw
+        self.install = None
+        self.result = BatchResult()
+
+
+class BatchEvaluator:
+    """
+    An evaluator which records calls so that Evaluator.batch() can run them
+    together. Every method returns a BatchResult.
+    """
+
+    def __init__(
+        self,
+        parent: Evaluator,
+        calls: Optional[List[_BatchCall]] = None,
+        timeout_ms: Optional[int] = None,
+    ):
+        self.parent = parent
+        self.timeout_ms = timeout_ms if timeout_ms is not None else parent.timeout_ms
+        self._calls = calls if calls is not None else []
+
+    def with_timeout(self, timeout_ms: int) -> Any:
+        return BatchEvaluator(self.parent, self._calls, timeout_ms=timeout_ms)
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator["BatchEvaluator"]:
+        yield self
+
+    def __call__(self, script: str, raw=False, **kwargs) -> BatchResult:
+        thunk = "() => eval(" + json.dumps(_add_variables(script, **kwargs)) + ")"
+        return self._add(_BatchCall(thunk, False, self.timeout_ms, raw))
+
+    def call_async(self, script: str, poll_interval: int = 50, **kwargs) -> BatchResult:
+        thunk = "async () => {" + _add_variables(script, **kwargs) + "\n}"
+        return self._add(_BatchCall(thunk, True, self.timeout_ms, False))
+
+    def call_function(self, body: str, **kwargs) -> BatchResult:
+        return self._add_function(body, False, kwargs)
+
+    def call_async_function(
+        self, body: str, poll_interval: int = 50, **kwargs
+    ) -> BatchResult:
+        return self._add_function(body, True, kwargs)
+
+    def flush(self):
+        """
+        Run all of the recorded calls and resolve their results.
+
+        This is called automatically at the end of an Evaluator.batch() block.
+        """
+        calls, self._calls[:] = list(self._calls), []
+        if not calls:
+            return
+        handles = {c.install[0]: c.install for c in calls if c.install is not None}
+        extra_ms = sum(max(0, c.timeout_ms - self.parent.timeout_ms) for c in calls)
+        e = self.parent.with_timeout(self.parent.timeout_ms + extra_ms)
+        try:
+            out = self._run(e, calls, handles, install=False)
+            if "missing" in out:
+                out = self._run(e, calls, handles, install=True)
+        except Exception as exc:
+            for c in calls:
+                c.result._resolve(error=exc)
+            return
+        for c, item in zip(calls, out["results"]):
+            if "error" in item:
+                c.result._resolve(error=EvaluatorJavaScriptError(item["error"]))
+            else:
+                c.result._resolve(item.get("ok"))
+
+    def _add_function(self, body: str, is_async: bool, kwargs: dict) -> BatchResult:
+        handle = _function_handle(body, tuple(sorted(kwargs)), is_async)
+        thunk = "() => _fns." + handle + "(" + json.dumps(kwargs) + ")"
+        call = _BatchCall(thunk, is_async, self.timeout_ms, False)
+        call.install = (handle, body, kwargs)
+        return self._add(call)
+
+    def _add(self, call: _BatchCall) -> BatchResult:
+        self._calls.append(call)
+        return call.result
+
+    @staticmethod
+    def _run(e: Evaluator, calls: List[_BatchCall], handles: dict, install: bool):
+        is_async = any(c.is_async for c in calls)
+        await_kw = "await " if is_async else ""
+        code = ""
+        if install:
+            code += "".join(_install_script(*args) for args in handles.values())
+        code += (
+            "const _fns = global._gnomeHacksFunctions || {};"
+            "const _missing = "
+            + json.dumps(sorted(handles))
+            + ".filter((h) => !_fns[h]);"
+            "if (_missing.length) {return {missing: _missing};}"
+            "const _raw = (v) => typeof v === 'undefined' ? '' : JSON.stringify(v);"
+            "const _results = [];"
+        )
+        for c in calls:
+            value = await_kw + "(" + c.thunk + ")()"
+            if c.raw:
+                value = "_raw(" + value + ")"
+            code += (
+                "try {_results.push({ok: " + value + "});}"
+                "catch (err) {_results.push({error: '' + err});}"
+            )
+        code += "return {results: _results};"
+        if is_async:
+            return e.call_async(code)
+        return e("(function() {" + code + "})()")
+
+
+def _shell_proxy() -> Gio.DBusProxy:
+    return Gio.DBusProxy.new_for_bus_sync(
+        Gio.BusType.SESSION,
+        Gio.DBusProxyFlags.NONE,
+        None,
+        "org.gnome.Shell",
+        "/org/gnome/Shell",
+        "org.gnome.Shell",
+    )
+
 
 def _add_variables(script: str, **kwargs):
     vars = ";".join(f"var {name}={json.dumps(value)}" for name, value in kwargs.items())
@@ -111,6 +466,364 @@ def _add_variables(script: str, **kwargs):
     return vars + script
 
 
+def _parse_result(status: bool, result: str, raw: bool) -> Any:
+    if not status:
+        raise EvaluatorJavaScriptError(result)
+    if raw:
+        return result
+    elif not result:
+        return None
+    return json.loads(result)
+
+
+def _wait_name() -> str:
+    return f"_waitCtx{random.randrange(2**40)}"
+
+
+def _async_script(
+    script: str, wait_name: str, timeout_ms: int, notify_dest: Optional[str], **kwargs
+) -> str:
+    """
+    Wrap a script in an async function whose outcome is stored in
+    global[wait_name] once it settles.
+
+    If notify_dest is set, the outcome is also pushed to that bus name with a
+    Notify signal keyed by wait_name, and the global is only kept if sending
+    the signal fails. The script evaluates to true if pushing is supported.
+    """
+    wrapped_script = _add_variables(script, **kwargs)
+    code = (
+        "const _waitCtx = {status: 0};"
+        "global[_waitName] = _waitCtx;"
+        "const _waitNotify = " + notify_expr() + ";"
+        "const _waitDone = () => {"
+        "if (_waitNotify(_notifyDest, _waitName, JSON.stringify(_waitCtx))) {"
+        "delete global[_waitName];}};"
+        "(async function(){" + wrapped_script + "})().then((result)=>{"
+        "_waitCtx.result=(typeof result === 'undefined' ? null : result);"
+        "_waitCtx.status=1; _waitDone();}).catch((err)=>{"
+        "_waitCtx.error=''+err; _waitCtx.status=2; _waitDone();});"
+        """
+        // Cleanup global object if the call times out.
+        const GLib = imports.gi.GLib;
+        GLib.timeout_add(GLib.PRIORITY_DEFAULT, _waitTimeout, () => {
+            if (global[_waitName]) {
+                delete global[_waitName];
+            }
+            return false;
+        });
+        const _waitConn = imports.gi.Gio.DBus.session;
+        !!_notifyDest && !!_waitConn && typeof _waitConn.emit_signal === 'function';
+        """
+    )
+    return _add_variables(
+        code,
+        _waitName=wait_name,
+        _waitTimeout=timeout_ms + 1000,  # buffer time before cleanup
+        _notifyDest=notify_dest,
+    )
+
+
+_CHECK_SCRIPT = """
+const res = global[_waitName] || null;
+if (res && res.status) {
+    delete global[_waitName];
+}
+res;
+"""
+
+
+_MISSING_FUNCTION = "GnomeHacksMissingFunction"
+
+
+@functools.lru_cache(maxsize=None)
+def _function_handle(body: str, arg_names: Tuple[str, ...], is_async: bool) -> str:
+    source = json.dumps([body, arg_names, is_async])
+    return ("a" if is_async else "f") + hashlib.sha1(
+        source.encode("utf-8")
+    ).hexdigest()[:20]
+
+
+def _install_script(handle: str, body: str, kwargs: dict) -> str:
+    """
+    Create a script that installs a function under global._gnomeHacksFunctions.
+    """
+    unpack = f"let {{{','.join(sorted(kwargs))}}} = _args;" if kwargs else ""
+    return (
+        "if (!global._gnomeHacksFunctions) {global._gnomeHacksFunctions = {};}"
+        f"global._gnomeHacksFunctions.{handle} = "
+        + ("async " if handle.startswith("a") else "")
+        + "function(_args) {"
+        + unpack
+        + body
+        + "\n};"
+    )
+
+
+def _invoke_script(handle: str, kwargs: dict) -> str:
+    """
+    Create a script that calls an installed function, or throws an error
+    containing _MISSING_FUNCTION if it is not installed.
+    """
+    return (
+        "(global._gnomeHacksFunctions && global._gnomeHacksFunctions."
+        + handle
+        + " || (() => {throw new Error('"
+        + _MISSING_FUNCTION
+        + "');})())("
+        + json.dumps(kwargs)
+        + ");"
+    )
+
+
+def _wait_ctx_result(out: dict) -> Any:
+    if out["status"] == 2:
+        raise EvaluatorJavaScriptError(out["error"])
+    return out["result"]
+
+
+def _notify_connection(proxy: Any) -> Optional[Tuple[Gio.DBusConnection, str]]:
+    """
+    Get the bus connection of a proxy along with the shell's unique bus name,
+    or None if signals from the shell cannot be received through the proxy.
+    """
+    if not isinstance(proxy, Gio.DBusProxy):
+        return None
+    sender = proxy.get_name_owner()
+    if sender is None:
+        return None
+    return proxy.get_connection(), sender
+
+
+class _SignalWaiter:
+    """
+    Receive Notify signals for a given key from the shell.
+
+    Signals are dispatched on a private main context which is only iterated
+    while waiting, so this works without a running GLib main loop.
+
+    Signals are only accepted from the shell instance that owns the shell's
+    bus name. If the shell restarts, owner_changes is incremented and the
+    waiter follows the new instance. State which scripts set up in the old
+    instance, such as requests to send notifications, is lost at that point.
+    """
+
+    def __init__(self, proxy: Any, key: str):
+        self.destination = None
+        self.owner_changes = 0
+        self.context = GLib.MainContext.new()
+        self._key = key
+        self._payloads = []
+        self._connection = None
+        self._subscription = None
+        self._owner_subscription = None
+        info = _notify_connection(proxy)
+        if info is None:
+            return
+        self._connection, sender = info
+        self.context.push_thread_default()
+        try:
+            self._subscribe(sender)
+            self._owner_subscription = self._connection.signal_subscribe(
+                "org.freedesktop.DBus",
+                "org.freedesktop.DBus",
+                "NameOwnerChanged",
+                "/org/freedesktop/DBus",
+                proxy.get_name(),
+                Gio.DBusSignalFlags.NONE,
+                self._on_owner_changed,
+            )
+        finally:
+            self.context.pop_thread_default()
+        self.destination = self._connection.get_unique_name()
+
+    def _subscribe(self, sender: str):
+        self._subscription = self._connection.signal_subscribe(
+            sender,
+            NOTIFY_INTERFACE,
+            NOTIFY_SIGNAL,
+            NOTIFY_PATH,
+            self._key,
+            Gio.DBusSignalFlags.NONE,
+            self._on_signal,
+        )
+
+    def __enter__(self) -> "_SignalWaiter":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        if self._subscription is not None:
+            self._connection.signal_unsubscribe(self._subscription)
+            self._subscription = None
+        if self._owner_subscription is not None:
+            self._connection.signal_unsubscribe(self._owner_subscription)
+            self._owner_subscription = None
+
+    def poll(self) -> Optional[str]:
+        """
+        Get the next payload without blocking, or None if there is none.
+        """
+        while not self._payloads and self.context.iteration(False):
+            pass
+        return self._payloads.pop(0) if self._payloads else None
+
+    def wait(self, timeout_ms: int) -> Optional[str]:
+        """
+        Wait for the next payload, or return None after timeout_ms.
+        """
+        deadline = time.monotonic() + timeout_ms / 1000
+        while not self._payloads:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0 or self._subscription is None:
+                return None
+            timeout = GLib.timeout_source_new(remaining_ms)
+            timeout.set_callback(lambda *_: False)
+            timeout.attach(self.context)
+            try:
+                self.context.iteration(True)
+            finally:
+                timeout.destroy()
+        return self._payloads.pop(0)
+
+    def _on_signal(self, _conn, _sender, _path, _iface, _signal, params, *_):
+        self._payloads.append(params.unpack()[1])
+
+    def _on_owner_changed(self, _conn, _sender, _path, _iface, _signal, params, *_):
+        if self._owner_subscription is None:
+            return
+        self.owner_changes += 1
+        if self._subscription is not None:
+            self._connection.signal_unsubscribe(self._subscription)
+            self._subscription = None
+        new_owner = params.unpack()[2]
+        if new_owner:
+            self.context.push_thread_default()
+            try:
+                self._subscribe(new_owner)
+            finally:
+                self.context.pop_thread_default()
+
+
+class _AsyncSignalWaiter:
+    """
+    An asyncio version of _SignalWaiter, which subscribes on the background
+    GLib loop used by AsyncEvaluator.
+    """
+
+    def __init__(self, proxy: Any, key: str):
+        self.destination = None
+        self._proxy = proxy
+        self._key = key
+        self._queue = None
+        self._connection = None
+        self._subscription = None
+
+    async def __aenter__(self) -> "_AsyncSignalWaiter":
+        info = _notify_connection(self._proxy)
+        if info is None:
+            return self
+        self._connection, sender = info
+        loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        subscribed = loop.create_future()
+
+        def on_signal(_conn, _sender, _path, _iface, _signal, params, *_):
+            loop.call_soon_threadsafe(self._queue.put_nowait, params.unpack()[1])
+
+        def subscribe():
+            subscription = self._connection.signal_subscribe(
+                sender,
+                NOTIFY_INTERFACE,
+                NOTIFY_SIGNAL,
+                NOTIFY_PATH,
+                self._key,
+                Gio.DBusSignalFlags.NONE,
+                on_signal,
+            )
+            loop.call_soon_threadsafe(_set_future_result, subscribed, subscription)
+
+        _glib_loop().invoke(subscribe)
+        self._subscription = await subscribed
+        self.destination = self._connection.get_unique_name()
+        return self
+
+    async def __aexit__(self, *_):
+        if self._subscription is not None:
+            self._connection.signal_unsubscribe(self._subscription)
+            self._subscription = None
+
+    async def wait(self, timeout_ms: int) -> Optional[str]:
+        """
+        Wait for the next payload, or return None after timeout_ms.
+        """
+        if self._queue is None:
+            return None
+        try:
+            return await asyncio.wait_for(self._queue.get(), max(timeout_ms, 0) / 1000)
+        except asyncio.TimeoutError:
+            return None
+
+
+class _GLibLoop:
+    """
+    A private GLib main context iterated on a daemon thread.
+    """
+
+    def __init__(self):
+        self.context = GLib.MainContext.new()
+        self._loop = GLib.MainLoop.new(self.context, False)
+        self._thread = threading.Thread(
+            target=self._run, name="gnome-hacks-glib", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        self.context.push_thread_default()
+        try:
+            self._loop.run()
+        finally:
+            self.context.pop_thread_default()
+
+    def invoke(self, fn: Callable[[], None]):
+        """
+        Run fn() on the loop thread, where it may start async GIO calls whose
+        callbacks will be dispatched on the same thread.
+        """
+
+        def callback(*_):
+            fn()
+            return False
+
+        source = GLib.idle_source_new()
+        source.set_callback(callback)
+        source.attach(self.context)
+
+
+_glib_loop_lock = threading.Lock()
+_glib_loop_instance: Optional[_GLibLoop] = None
+
+
+def _glib_loop() -> _GLibLoop:
+    global _glib_loop_instance
+    with _glib_loop_lock:
+        if _glib_loop_instance is None:
+            _glib_loop_instance = _GLibLoop()
+        return _glib_loop_instance
+
+
+def _set_future_result(future: asyncio.Future, value: Any):
+    if not future.done():
+        future.set_result(value)
+
+
+def _set_future_exception(future: asyncio.Future, exc: Exception):
+    if not future.done():
+        future.set_exception(exc)
+
+
 class EvaluatorJavaScriptError(Exception):
     """
     An error thrown when GNOME's JavaScript engine fails to execute a script.
@@ -0,0 +1,32 @@
+from typing import Callable, Optional, Union
+
+from ._timeline import pack_events, run_timeline
+from .evaluator import Evaluator
+from .keyboard import KeyEvent
+from .pointer import PointerEvent
+
+InputEvent = Union[KeyEvent, PointerEvent]
+
+
+def simulate_input(
+    e: Evaluator,
+    *events: InputEvent,
+    progress: Optional[Callable[[int, int], None]] = None,
+    **kwargs,
+):
+    """
+    Trigger a sequence of key and pointer events, in order, in one call.
+
+    Both virtual devices are reused across calls, and the events' delays are
+    scheduled by a single loop in the shell, so e.g. a Ctrl+click has no
+    gaps between the key and button events beyond the requested delays.
+
+    :param e: the script evaluator.
+    :param events: KeyEvent, PointerMove, PointerButton and PointerScroll
+                   objects.
+    :param progress: called with (events done, total events) as the
+                     sequence runs. Very long sequences are streamed to the
+                     shell in chunks, with progress reported per chunk.
+    :param kwargs: arguments to e.call_function() or e.call_async_function().
+    """
+    run_timeline(e, pack_events(events), progress=progress, **kwargs)
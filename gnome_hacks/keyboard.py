@@ -1,11 +1,36 @@
+import functools
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 
-from ._utils import reusable_device_expr
+from ._keysym_data import CODE_POINTS, VALUES
+from ._timeline import (
+    EVENT_KEY,
+    EVENT_KEYVAL,
+    TIMELINE_JS,
+    pack_events,
+    run_timeline,
+)
+from ._utils import DATACLASS_SLOTS
 from .evaluator import Evaluator
+from .keysyms import keyval_from_name
 
+# Characters which need Shift on a US keyboard layout.
+US_SHIFTED_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ" + '~!@#$%^&*()_+{}|:"<>?')
 
-@dataclass
+# Offset of the keyvals which directly encode a Unicode code point.
+_UNICODE_KEYVAL_OFFSET = 0x01000000
+
+_CONTROL_KEYSYMS = {
+    "\n": "KEY_Return",
+    "\r": "KEY_Return",
+    "\t": "KEY_Tab",
+    "\b": "KEY_BackSpace",
+    "\x1b": "KEY_Escape",
+    "\x7f": "KEY_Delete",
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class KeyEvent:
     pressed: bool
 
@@ -13,31 +38,190 @@ class KeyEvent:
     keyval: Optional[int] = None  # layout-agnostic key code, see keysyms.py.
     key: Optional[int] = None  # hardware key code
 
+    # How long to wait after the event, e.g. to hold a key down.
+    delay_ms: int = 0
+
+    def pack_event(self) -> Tuple[int, int, int, int]:
+        if self.keyval is not None and self.key is None:
+            return (EVENT_KEYVAL, self.keyval, int(self.pressed), int(self.delay_ms))
+        if self.key is not None and self.keyval is None:
+            return (EVENT_KEY, self.key, int(self.pressed), int(self.delay_ms))
+        raise ValueError(f"must specify exactly one of keyval or key, but got {self}")
+
+
+def simulate_key_events(
+    e: Evaluator,
+    *events: KeyEvent,
+    progress: Optional[Callable[[int, int], None]] = None,
+    **kwargs,
+):
+    """
+    Trigger a sequence of key events.
+
+    If any event has a delay, the shell schedules the events with GLib
+    timeouts against the time the sequence started, so delays don't add up
+    timer or D-Bus latency, and the call returns once the last delay ends.
+    Very long sequences are streamed to the shell in chunks as they run.
+    To mix key and pointer events, see simulate_input().
 
-def simulate_key_events(e: Evaluator, *events: KeyEvent, **kwargs):
-    code = (
-        """
-    const Clutter = imports.gi.Clutter;
-    const dev = """
-        + reusable_device_expr("KEYBOARD_DEVICE")
-        + """;
-    events.forEach((e) => {
-        const state = e.pressed ? Clutter.KeyState.PRESSED : Clutter.KeyState.RELEASED;
-        if (e.keyval != null) {
-            dev.notify_keyval(0, e.keyval, state);
-        } else {
-            dev.notify_key(0, e.key, state);
-        }
-    });
+    :param progress: called with (events done, total events) as the
+                     sequence runs.
     """
+    run_timeline(e, pack_events(events), progress=progress, **kwargs)
+
+
+def char_to_keyval(ch: str) -> int:
+    """
+    Get the keyval that types a character.
+
+    Characters are mapped to the keysym in keysyms.py which types them,
+    preferring legacy keysyms such as KEY_Cyrillic_zhe, which keyboard
+    layouts use, over keysyms in the Unicode range. Characters without any
+    keysym are mapped to the Unicode keyval range, which can't always be
+    typed, see type_text().
+
+    :raises ValueError: if the character is a control character that cannot
+                        be typed.
+    """
+    keyval = _char_keyval_index().get(ch)
+    if keyval is not None:
+        return keyval
+    cp = ord(ch)
+    if cp < 0x100:
+        raise ValueError(f"cannot type character {ch!r}")
+    return _UNICODE_KEYVAL_OFFSET + cp
+
+
+def type_text(
+    e: Evaluator, text: str, cps: Optional[float] = None, us_shift: bool = False
+) -> str:
+    """
+    Type a string of text.
+
+    The whole string is sent in one call. Only the characters whose keyvals
+    the shell cannot derive from their code points are sent as a table, and
+    the shell picks the key and level (e.g. Shift or AltGr) for each keyval
+    on the active layout.
+
+    On X11, characters which the active layout cannot produce are typed
+    through a spare key code that the shell maps on demand. On Wayland, the
+    shell's virtual keyboard drops keyvals which the active layout lacks.
+    Layouts rarely contain characters without a keysym name, so on Wayland
+    these are not typed but returned. Characters with a keysym name that the
+    active layout lacks, e.g. Cyrillic letters on a US layout, are still
+    dropped by the shell without notice, since the layout's contents are not
+    available to scripts.
+
+    :param e: the script evaluator.
+    :param text: the text to type. Newlines, tabs and backspaces are typed
+                 as Return, Tab and BackSpace.
+    :param cps: if specified, the typing speed in characters per second.
+                Otherwise, all keys are typed at once.
+    :param us_shift: if True, also hold Shift explicitly around characters
+                     that need it on a US layout, for applications that
+                     track the Shift key themselves.
+    :return: the characters which were not typed, in order, or an empty
+             string if all of them were.
+    """
+    overrides: Dict[str, int] = {}
+    unnamed = []
+    for ch in set(text):
+        keyval = char_to_keyval(ch)
+        if keyval != _default_keyval(ch):
+            overrides[ch] = keyval
+        if ch not in _char_keyval_index():
+            unnamed.append(ch)
+    kwargs = dict(
+        text=text,
+        overrides=overrides,
+        unnamed="".join(sorted(unnamed)),
+        shifted="".join(sorted(US_SHIFTED_CHARS & set(text))) if us_shift else "",
     )
-    for evt in events:
-        if sum(x is not None for x in [evt.key, evt.keyval]) != 1:
-            raise ValueError(
-                f"must specify exactly one of keyval or key, but got {evt}"
-            )
-    e(
-        code,
-        events=[dict(pressed=x.pressed, key=x.key, keyval=x.keyval) for x in events],
-        **kwargs,
+    if not cps:
+        return e.call_function(_TYPE_TEXT_PRELUDE + _TYPE_TEXT_SCRIPT, **kwargs)
+    interval_ms = 1000 / cps
+    return e.with_timeout(
+        e.timeout_ms + int(len(text) * interval_ms)
+    ).call_async_function(
+        _TYPE_TEXT_PRELUDE + _TYPE_TEXT_TIMED_SCRIPT, interval_ms=interval_ms, **kwargs
     )
+
+
+@functools.lru_cache(maxsize=None)
+def _char_keyval_index() -> Dict[str, int]:
+    index = {}
+    for keyval, cp in zip(VALUES, CODE_POINTS):
+        if not cp:
+            continue
+        # Prefer legacy keysyms, which layouts use, over Unicode keysyms.
+        old = index.get(chr(cp))
+        if old is None or (
+            old >= _UNICODE_KEYVAL_OFFSET and keyval < _UNICODE_KEYVAL_OFFSET
+        ):
+            index[chr(cp)] = keyval
+    index.update({ch: keyval_from_name(name) for ch, name in _CONTROL_KEYSYMS.items()})
+    return index
+
+
+def _default_keyval(ch: str) -> int:
+    # Keep this in sync with keyvalOf() in _TYPE_TEXT_PRELUDE.
+    cp = ord(ch)
+    return cp if cp < 0x100 else _UNICODE_KEYVAL_OFFSET + cp
+
+
+_TYPE_TEXT_PRELUDE = (
+    TIMELINE_JS
+    + """
+const dev = keyboard();
+const keyvalOf = (ch) => {
+    if (overrides.hasOwnProperty(ch)) {
+        return overrides[ch];
+    }
+    const cp = ch.codePointAt(0);
+    return cp < 0x100 ? cp : """
+    + str(_UNICODE_KEYVAL_OFFSET)
+    + """ + cp;
+};
+let shiftDown = false;
+const setShift = (down) => {
+    if (down !== shiftDown) {
+        const state = down ? Clutter.KeyState.PRESSED : Clutter.KeyState.RELEASED;
+        dev.notify_keyval(0, Clutter.KEY_Shift_L, state);
+        shiftDown = down;
+    }
+};
+// See type_text() for why these are skipped on Wayland.
+const skip = imports.gi.Meta.is_wayland_compositor() ? unnamed : '';
+const skipped = [];
+const typeChar = (ch) => {
+    if (skip.includes(ch)) {
+        skipped.push(ch);
+        return;
+    }
+    setShift(shifted.includes(ch));
+    const keyval = keyvalOf(ch);
+    dev.notify_keyval(0, keyval, Clutter.KeyState.PRESSED);
+    dev.notify_keyval(0, keyval, Clutter.KeyState.RELEASED);
+};
+const chars = Array.from(text);
+"""
+)
+
+_TYPE_TEXT_SCRIPT = """
+chars.forEach(typeChar);
+setShift(false);
+return skipped.join('');
+"""
+
+_TYPE_TEXT_TIMED_SCRIPT = """
+const start = GLib.get_monotonic_time();
+try {
+    for (let i = 0; i < chars.length; i++) {
+        await waitUntil(start, i * interval_ms);
+        typeChar(chars[i]);
+    }
+} finally {
+    setShift(false);
+}
+return skipped.join('');
+"""
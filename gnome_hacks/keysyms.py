@@ -1,2285 +1,60 @@
-import enum
+"""
+Symbolic key codes (keyvals) in GNOME.
 
+Adapted from this auto-generated file:
+https://github.com/GNOME/mutter/blob/e42196b00a96f2169f18861964328c61a4590d5f/clutter/clutter/clutter-keysyms.h
 
-class KeyVal(enum.IntEnum):
+The table is stored compactly in _keysym_data.py, and lookup tables are only
+built when first used. The KeyVal enum is kept for compatibility, but it is
+slow to create, so it is only built the first time it is accessed.
+"""
+
+import functools
+from typing import Dict, Tuple
+
+from ._keysym_data import NAMES, VALUES
+
+
+def keyval_from_name(name: str) -> int:
     """
-    A lookup table of all symbolic key codes in GNOME.
+    Get the keyval for a name like "KEY_Return".
 
-    Adapted from this auto-generated file:
-    https://github.com/GNOME/mutter/blob/e42196b00a96f2169f18861964328c61a4590d5f/clutter/clutter/clutter-keysyms.h
+    :raises KeyError: if there is no such keyval.
+    """
+    return _values_by_name()[name]
+
+
+def keyval_names(keyval: int) -> Tuple[str, ...]:
+    """
+    Get all names of a keyval, starting with its canonical name, or an empty
+    tuple if the keyval has no name.
     """
+    return _names_by_value().get(keyval, ())
+
+
+def __getattr__(name: str):
+    if name == "KeyVal":
+        return _key_val_enum()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=None)
+def _values_by_name() -> Dict[str, int]:
+    return dict(zip(NAMES, VALUES))
+
+
+@functools.lru_cache(maxsize=None)
+def _names_by_value() -> Dict[int, Tuple[str, ...]]:
+    result = {}
+    for name, value in zip(NAMES, VALUES):
+        result[value] = result.get(value, ()) + (name,)
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _key_val_enum() -> type:
+    import enum
 
-    KEY_VoidSymbol = 0xFFFFFF
-    KEY_BackSpace = 0xFF08
-    KEY_Tab = 0xFF09
-    KEY_Linefeed = 0xFF0A
-    KEY_Clear = 0xFF0B
-    KEY_Return = 0xFF0D
-    KEY_Pause = 0xFF13
-    KEY_Scroll_Lock = 0xFF14
-    KEY_Sys_Req = 0xFF15
-    KEY_Escape = 0xFF1B
-    KEY_Delete = 0xFFFF
-    KEY_Multi_key = 0xFF20
-    KEY_Codeinput = 0xFF37
-    KEY_SingleCandidate = 0xFF3C
-    KEY_MultipleCandidate = 0xFF3D
-    KEY_PreviousCandidate = 0xFF3E
-    KEY_Kanji = 0xFF21
-    KEY_Muhenkan = 0xFF22
-    KEY_Henkan_Mode = 0xFF23
-    KEY_Henkan = 0xFF23
-    KEY_Romaji = 0xFF24
-    KEY_Hiragana = 0xFF25
-    KEY_Katakana = 0xFF26
-    KEY_Hiragana_Katakana = 0xFF27
-    KEY_Zenkaku = 0xFF28
-    KEY_Hankaku = 0xFF29
-    KEY_Zenkaku_Hankaku = 0xFF2A
-    KEY_Touroku = 0xFF2B
-    KEY_Massyo = 0xFF2C
-    KEY_Kana_Lock = 0xFF2D
-    KEY_Kana_Shift = 0xFF2E
-    KEY_Eisu_Shift = 0xFF2F
-    KEY_Eisu_toggle = 0xFF30
-    KEY_Kanji_Bangou = 0xFF37
-    KEY_Zen_Koho = 0xFF3D
-    KEY_Mae_Koho = 0xFF3E
-    KEY_Home = 0xFF50
-    KEY_Left = 0xFF51
-    KEY_Up = 0xFF52
-    KEY_Right = 0xFF53
-    KEY_Down = 0xFF54
-    KEY_Prior = 0xFF55
-    KEY_Page_Up = 0xFF55
-    KEY_Next = 0xFF56
-    KEY_Page_Down = 0xFF56
-    KEY_End = 0xFF57
-    KEY_Begin = 0xFF58
-    KEY_Select = 0xFF60
-    KEY_Print = 0xFF61
-    KEY_Execute = 0xFF62
-    KEY_Insert = 0xFF63
-    KEY_Undo = 0xFF65
-    KEY_Redo = 0xFF66
-    KEY_Menu = 0xFF67
-    KEY_Find = 0xFF68
-    KEY_Cancel = 0xFF69
-    KEY_Help = 0xFF6A
-    KEY_Break = 0xFF6B
-    KEY_Mode_switch = 0xFF7E
-    KEY_script_switch = 0xFF7E
-    KEY_Num_Lock = 0xFF7F
-    KEY_KP_Space = 0xFF80
-    KEY_KP_Tab = 0xFF89
-    KEY_KP_Enter = 0xFF8D
-    KEY_KP_F1 = 0xFF91
-    KEY_KP_F2 = 0xFF92
-    KEY_KP_F3 = 0xFF93
-    KEY_KP_F4 = 0xFF94
-    KEY_KP_Home = 0xFF95
-    KEY_KP_Left = 0xFF96
-    KEY_KP_Up = 0xFF97
-    KEY_KP_Right = 0xFF98
-    KEY_KP_Down = 0xFF99
-    KEY_KP_Prior = 0xFF9A
-    KEY_KP_Page_Up = 0xFF9A
-    KEY_KP_Next = 0xFF9B
-    KEY_KP_Page_Down = 0xFF9B
-    KEY_KP_End = 0xFF9C
-    KEY_KP_Begin = 0xFF9D
-    KEY_KP_Insert = 0xFF9E
-    KEY_KP_Delete = 0xFF9F
-    KEY_KP_Equal = 0xFFBD
-    KEY_KP_Multiply = 0xFFAA
-    KEY_KP_Add = 0xFFAB
-    KEY_KP_Separator = 0xFFAC
-    KEY_KP_Subtract = 0xFFAD
-    KEY_KP_Decimal = 0xFFAE
-    KEY_KP_Divide = 0xFFAF
-    KEY_KP_0 = 0xFFB0
-    KEY_KP_1 = 0xFFB1
-    KEY_KP_2 = 0xFFB2
-    KEY_KP_3 = 0xFFB3
-    KEY_KP_4 = 0xFFB4
-    KEY_KP_5 = 0xFFB5
-    KEY_KP_6 = 0xFFB6
-    KEY_KP_7 = 0xFFB7
-    KEY_KP_8 = 0xFFB8
-    KEY_KP_9 = 0xFFB9
-    KEY_F1 = 0xFFBE
-    KEY_F2 = 0xFFBF
-    KEY_F3 = 0xFFC0
-    KEY_F4 = 0xFFC1
-    KEY_F5 = 0xFFC2
-    KEY_F6 = 0xFFC3
-    KEY_F7 = 0xFFC4
-    KEY_F8 = 0xFFC5
-    KEY_F9 = 0xFFC6
-    KEY_F10 = 0xFFC7
-    KEY_F11 = 0xFFC8
-    KEY_L1 = 0xFFC8
-    KEY_F12 = 0xFFC9
-    KEY_L2 = 0xFFC9
-    KEY_F13 = 0xFFCA
-    KEY_L3 = 0xFFCA
-    KEY_F14 = 0xFFCB
-    KEY_L4 = 0xFFCB
-    KEY_F15 = 0xFFCC
-    KEY_L5 = 0xFFCC
-    KEY_F16 = 0xFFCD
-    KEY_L6 = 0xFFCD
-    KEY_F17 = 0xFFCE
-    KEY_L7 = 0xFFCE
-    KEY_F18 = 0xFFCF
-    KEY_L8 = 0xFFCF
-    KEY_F19 = 0xFFD0
-    KEY_L9 = 0xFFD0
-    KEY_F20 = 0xFFD1
-    KEY_L10 = 0xFFD1
-    KEY_F21 = 0xFFD2
-    KEY_R1 = 0xFFD2
-    KEY_F22 = 0xFFD3
-    KEY_R2 = 0xFFD3
-    KEY_F23 = 0xFFD4
-    KEY_R3 = 0xFFD4
-    KEY_F24 = 0xFFD5
-    KEY_R4 = 0xFFD5
-    KEY_F25 = 0xFFD6
-    KEY_R5 = 0xFFD6
-    KEY_F26 = 0xFFD7
-    KEY_R6 = 0xFFD7
-    KEY_F27 = 0xFFD8
-    KEY_R7 = 0xFFD8
-    KEY_F28 = 0xFFD9
-    KEY_R8 = 0xFFD9
-    KEY_F29 = 0xFFDA
-    KEY_R9 = 0xFFDA
-    KEY_F30 = 0xFFDB
-    KEY_R10 = 0xFFDB
-    KEY_F31 = 0xFFDC
-    KEY_R11 = 0xFFDC
-    KEY_F32 = 0xFFDD
-    KEY_R12 = 0xFFDD
-    KEY_F33 = 0xFFDE
-    KEY_R13 = 0xFFDE
-    KEY_F34 = 0xFFDF
-    KEY_R14 = 0xFFDF
-    KEY_F35 = 0xFFE0
-    KEY_R15 = 0xFFE0
-    KEY_Shift_L = 0xFFE1
-    KEY_Shift_R = 0xFFE2
-    KEY_Control_L = 0xFFE3
-    KEY_Control_R = 0xFFE4
-    KEY_Caps_Lock = 0xFFE5
-    KEY_Shift_Lock = 0xFFE6
-    KEY_Meta_L = 0xFFE7
-    KEY_Meta_R = 0xFFE8
-    KEY_Alt_L = 0xFFE9
-    KEY_Alt_R = 0xFFEA
-    KEY_Super_L = 0xFFEB
-    KEY_Super_R = 0xFFEC
-    KEY_Hyper_L = 0xFFED
-    KEY_Hyper_R = 0xFFEE
-    KEY_ISO_Lock = 0xFE01
-    KEY_ISO_Level2_Latch = 0xFE02
-    KEY_ISO_Level3_Shift = 0xFE03
-    KEY_ISO_Level3_Latch = 0xFE04
-    KEY_ISO_Level3_Lock = 0xFE05
-    KEY_ISO_Level5_Shift = 0xFE11
-    KEY_ISO_Level5_Latch = 0xFE12
-    KEY_ISO_Level5_Lock = 0xFE13
-    KEY_ISO_Group_Shift = 0xFF7E
-    KEY_ISO_Group_Latch = 0xFE06
-    KEY_ISO_Group_Lock = 0xFE07
-    KEY_ISO_Next_Group = 0xFE08
-    KEY_ISO_Next_Group_Lock = 0xFE09
-    KEY_ISO_Prev_Group = 0xFE0A
-    KEY_ISO_Prev_Group_Lock = 0xFE0B
-    KEY_ISO_First_Group = 0xFE0C
-    KEY_ISO_First_Group_Lock = 0xFE0D
-    KEY_ISO_Last_Group = 0xFE0E
-    KEY_ISO_Last_Group_Lock = 0xFE0F
-    KEY_ISO_Left_Tab = 0xFE20
-    KEY_ISO_Move_Line_Up = 0xFE21
-    KEY_ISO_Move_Line_Down = 0xFE22
-    KEY_ISO_Partial_Line_Up = 0xFE23
-    KEY_ISO_Partial_Line_Down = 0xFE24
-    KEY_ISO_Partial_Space_Left = 0xFE25
-    KEY_ISO_Partial_Space_Right = 0xFE26
-    KEY_ISO_Set_Margin_Left = 0xFE27
-    KEY_ISO_Set_Margin_Right = 0xFE28
-    KEY_ISO_Release_Margin_Left = 0xFE29
-    KEY_ISO_Release_Margin_Right = 0xFE2A
-    KEY_ISO_Release_Both_Margins = 0xFE2B
-    KEY_ISO_Fast_Cursor_Left = 0xFE2C
-    KEY_ISO_Fast_Cursor_Right = 0xFE2D
-    KEY_ISO_Fast_Cursor_Up = 0xFE2E
-    KEY_ISO_Fast_Cursor_Down = 0xFE2F
-    KEY_ISO_Continuous_Underline = 0xFE30
-    KEY_ISO_Discontinuous_Underline = 0xFE31
-    KEY_ISO_Emphasize = 0xFE32
-    KEY_ISO_Center_Object = 0xFE33
-    KEY_ISO_Enter = 0xFE34
-    KEY_dead_grave = 0xFE50
-    KEY_dead_acute = 0xFE51
-    KEY_dead_circumflex = 0xFE52
-    KEY_dead_tilde = 0xFE53
-    KEY_dead_perispomeni = 0xFE53
-    KEY_dead_macron = 0xFE54
-    KEY_dead_breve = 0xFE55
-    KEY_dead_abovedot = 0xFE56
-    KEY_dead_diaeresis = 0xFE57
-    KEY_dead_abovering = 0xFE58
-    KEY_dead_doubleacute = 0xFE59
-    KEY_dead_caron = 0xFE5A
-    KEY_dead_cedilla = 0xFE5B
-    KEY_dead_ogonek = 0xFE5C
-    KEY_dead_iota = 0xFE5D
-    KEY_dead_voiced_sound = 0xFE5E
-    KEY_dead_semivoiced_sound = 0xFE5F
-    KEY_dead_belowdot = 0xFE60
-    KEY_dead_hook = 0xFE61
-    KEY_dead_horn = 0xFE62
-    KEY_dead_stroke = 0xFE63
-    KEY_dead_abovecomma = 0xFE64
-    KEY_dead_psili = 0xFE64
-    KEY_dead_abovereversedcomma = 0xFE65
-    KEY_dead_dasia = 0xFE65
-    KEY_dead_doublegrave = 0xFE66
-    KEY_dead_belowring = 0xFE67
-    KEY_dead_belowmacron = 0xFE68
-    KEY_dead_belowcircumflex = 0xFE69
-    KEY_dead_belowtilde = 0xFE6A
-    KEY_dead_belowbreve = 0xFE6B
-    KEY_dead_belowdiaeresis = 0xFE6C
-    KEY_dead_invertedbreve = 0xFE6D
-    KEY_dead_belowcomma = 0xFE6E
-    KEY_dead_currency = 0xFE6F
-    KEY_dead_lowline = 0xFE90
-    KEY_dead_aboveverticalline = 0xFE91
-    KEY_dead_belowverticalline = 0xFE92
-    KEY_dead_longsolidusoverlay = 0xFE93
-    KEY_dead_a = 0xFE80
-    KEY_dead_A = 0xFE81
-    KEY_dead_e = 0xFE82
-    KEY_dead_E = 0xFE83
-    KEY_dead_i = 0xFE84
-    KEY_dead_I = 0xFE85
-    KEY_dead_o = 0xFE86
-    KEY_dead_O = 0xFE87
-    KEY_dead_u = 0xFE88
-    KEY_dead_U = 0xFE89
-    KEY_dead_small_schwa = 0xFE8A
-    KEY_dead_capital_schwa = 0xFE8B
-    KEY_dead_greek = 0xFE8C
-    KEY_First_Virtual_Screen = 0xFED0
-    KEY_Prev_Virtual_Screen = 0xFED1
-    KEY_Next_Virtual_Screen = 0xFED2
-    KEY_Last_Virtual_Screen = 0xFED4
-    KEY_Terminate_Server = 0xFED5
-    KEY_AccessX_Enable = 0xFE70
-    KEY_AccessX_Feedback_Enable = 0xFE71
-    KEY_RepeatKeys_Enable = 0xFE72
-    KEY_SlowKeys_Enable = 0xFE73
-    KEY_BounceKeys_Enable = 0xFE74
-    KEY_StickyKeys_Enable = 0xFE75
-    KEY_MouseKeys_Enable = 0xFE76
-    KEY_MouseKeys_Accel_Enable = 0xFE77
-    KEY_Overlay1_Enable = 0xFE78
-    KEY_Overlay2_Enable = 0xFE79
-    KEY_AudibleBell_Enable = 0xFE7A
-    KEY_Pointer_Left = 0xFEE0
-    KEY_Pointer_Right = 0xFEE1
-    KEY_Pointer_Up = 0xFEE2
-    KEY_Pointer_Down = 0xFEE3
-    KEY_Pointer_UpLeft = 0xFEE4
-    KEY_Pointer_UpRight = 0xFEE5
-    KEY_Pointer_DownLeft = 0xFEE6
-    KEY_Pointer_DownRight = 0xFEE7
-    KEY_Pointer_Button_Dflt = 0xFEE8
-    KEY_Pointer_Button1 = 0xFEE9
-    KEY_Pointer_Button2 = 0xFEEA
-    KEY_Pointer_Button3 = 0xFEEB
-    KEY_Pointer_Button4 = 0xFEEC
-    KEY_Pointer_Button5 = 0xFEED
-    KEY_Pointer_DblClick_Dflt = 0xFEEE
-    KEY_Pointer_DblClick1 = 0xFEEF
-    KEY_Pointer_DblClick2 = 0xFEF0
-    KEY_Pointer_DblClick3 = 0xFEF1
-    KEY_Pointer_DblClick4 = 0xFEF2
-    KEY_Pointer_DblClick5 = 0xFEF3
-    KEY_Pointer_Drag_Dflt = 0xFEF4
-    KEY_Pointer_Drag1 = 0xFEF5
-    KEY_Pointer_Drag2 = 0xFEF6
-    KEY_Pointer_Drag3 = 0xFEF7
-    KEY_Pointer_Drag4 = 0xFEF8
-    KEY_Pointer_Drag5 = 0xFEFD
-    KEY_Pointer_EnableKeys = 0xFEF9
-    KEY_Pointer_Accelerate = 0xFEFA
-    KEY_Pointer_DfltBtnNext = 0xFEFB
-    KEY_Pointer_DfltBtnPrev = 0xFEFC
-    KEY_ch = 0xFEA0
-    KEY_Ch = 0xFEA1
-    KEY_CH = 0xFEA2
-    KEY_c_h = 0xFEA3
-    KEY_C_h = 0xFEA4
-    KEY_C_H = 0xFEA5
-    KEY_3270_Duplicate = 0xFD01
-    KEY_3270_FieldMark = 0xFD02
-    KEY_3270_Right2 = 0xFD03
-    KEY_3270_Left2 = 0xFD04
-    KEY_3270_BackTab = 0xFD05
-    KEY_3270_EraseEOF = 0xFD06
-    KEY_3270_EraseInput = 0xFD07
-    KEY_3270_Reset = 0xFD08
-    KEY_3270_Quit = 0xFD09
-    KEY_3270_PA1 = 0xFD0A
-    KEY_3270_PA2 = 0xFD0B
-    KEY_3270_PA3 = 0xFD0C
-    KEY_3270_Test = 0xFD0D
-    KEY_3270_Attn = 0xFD0E
-    KEY_3270_CursorBlink = 0xFD0F
-    KEY_3270_AltCursor = 0xFD10
-    KEY_3270_KeyClick = 0xFD11
-    KEY_3270_Jump = 0xFD12
-    KEY_3270_Ident = 0xFD13
-    KEY_3270_Rule = 0xFD14
-    KEY_3270_Copy = 0xFD15
-    KEY_3270_Play = 0xFD16
-    KEY_3270_Setup = 0xFD17
-    KEY_3270_Record = 0xFD18
-    KEY_3270_ChangeScreen = 0xFD19
-    KEY_3270_DeleteWord = 0xFD1A
-    KEY_3270_ExSelect = 0xFD1B
-    KEY_3270_CursorSelect = 0xFD1C
-    KEY_3270_PrintScreen = 0xFD1D
-    KEY_3270_Enter = 0xFD1E
-    KEY_space = 0x020
-    KEY_exclam = 0x021
-    KEY_quotedbl = 0x022
-    KEY_numbersign = 0x023
-    KEY_dollar = 0x024
-    KEY_percent = 0x025
-    KEY_ampersand = 0x026
-    KEY_apostrophe = 0x027
-    KEY_quoteright = 0x027
-    KEY_parenleft = 0x028
-    KEY_parenright = 0x029
-    KEY_asterisk = 0x02A
-    KEY_plus = 0x02B
-    KEY_comma = 0x02C
-    KEY_minus = 0x02D
-    KEY_period = 0x02E
-    KEY_slash = 0x02F
-    KEY_0 = 0x030
-    KEY_1 = 0x031
-    KEY_2 = 0x032
-    KEY_3 = 0x033
-    KEY_4 = 0x034
-    KEY_5 = 0x035
-    KEY_6 = 0x036
-    KEY_7 = 0x037
-    KEY_8 = 0x038
-    KEY_9 = 0x039
-    KEY_colon = 0x03A
-    KEY_semicolon = 0x03B
-    KEY_less = 0x03C
-    KEY_equal = 0x03D
-    KEY_greater = 0x03E
-    KEY_question = 0x03F
-    KEY_at = 0x040
-    KEY_A = 0x041
-    KEY_B = 0x042
-    KEY_C = 0x043
-    KEY_D = 0x044
-    KEY_E = 0x045
-    KEY_F = 0x046
-    KEY_G = 0x047
-    KEY_H = 0x048
-    KEY_I = 0x049
-    KEY_J = 0x04A
-    KEY_K = 0x04B
-    KEY_L = 0x04C
-    KEY_M = 0x04D
-    KEY_N = 0x04E
-    KEY_O = 0x04F
-    KEY_P = 0x050
-    KEY_Q = 0x051
-    KEY_R = 0x052
-    KEY_S = 0x053
-    KEY_T = 0x054
-    KEY_U = 0x055
-    KEY_V = 0x056
-    KEY_W = 0x057
-    KEY_X = 0x058
-    KEY_Y = 0x059
-    KEY_Z = 0x05A
-    KEY_bracketleft = 0x05B
-    KEY_backslash = 0x05C
-    KEY_bracketright = 0x05D
-    KEY_asciicircum = 0x05E
-    KEY_underscore = 0x05F
-    KEY_grave = 0x060
-    KEY_quoteleft = 0x060
-    KEY_a = 0x061
-    KEY_b = 0x062
-    KEY_c = 0x063
-    KEY_d = 0x064
-    KEY_e = 0x065
-    KEY_f = 0x066
-    KEY_g = 0x067
-    KEY_h = 0x068
-    KEY_i = 0x069
-    KEY_j = 0x06A
-    KEY_k = 0x06B
-    KEY_l = 0x06C
-    KEY_m = 0x06D
-    KEY_n = 0x06E
-    KEY_o = 0x06F
-    KEY_p = 0x070
-    KEY_q = 0x071
-    KEY_r = 0x072
-    KEY_s = 0x073
-    KEY_t = 0x074
-    KEY_u = 0x075
-    KEY_v = 0x076
-    KEY_w = 0x077
-    KEY_x = 0x078
-    KEY_y = 0x079
-    KEY_z = 0x07A
-    KEY_braceleft = 0x07B
-    KEY_bar = 0x07C
-    KEY_braceright = 0x07D
-    KEY_asciitilde = 0x07E
-    KEY_nobreakspace = 0x0A0
-    KEY_exclamdown = 0x0A1
-    KEY_cent = 0x0A2
-    KEY_sterling = 0x0A3
-    KEY_currency = 0x0A4
-    KEY_yen = 0x0A5
-    KEY_brokenbar = 0x0A6
-    KEY_section = 0x0A7
-    KEY_diaeresis = 0x0A8
-    KEY_copyright = 0x0A9
-    KEY_ordfeminine = 0x0AA
-    KEY_guillemotleft = 0x0AB
-    KEY_notsign = 0x0AC
-    KEY_hyphen = 0x0AD
-    KEY_registered = 0x0AE
-    KEY_macron = 0x0AF
-    KEY_degree = 0x0B0
-    KEY_plusminus = 0x0B1
-    KEY_twosuperior = 0x0B2
-    KEY_threesuperior = 0x0B3
-    KEY_acute = 0x0B4
-    KEY_mu = 0x0B5
-    KEY_paragraph = 0x0B6
-    KEY_periodcentered = 0x0B7
-    KEY_cedilla = 0x0B8
-    KEY_onesuperior = 0x0B9
-    KEY_masculine = 0x0BA
-    KEY_guillemotright = 0x0BB
-    KEY_onequarter = 0x0BC
-    KEY_onehalf = 0x0BD
-    KEY_threequarters = 0x0BE
-    KEY_questiondown = 0x0BF
-    KEY_Agrave = 0x0C0
-    KEY_Aacute = 0x0C1
-    KEY_Acircumflex = 0x0C2
-    KEY_Atilde = 0x0C3
-    KEY_Adiaeresis = 0x0C4
-    KEY_Aring = 0x0C5
-    KEY_AE = 0x0C6
-    KEY_Ccedilla = 0x0C7
-    KEY_Egrave = 0x0C8
-    KEY_Eacute = 0x0C9
-    KEY_Ecircumflex = 0x0CA
-    KEY_Ediaeresis = 0x0CB
-    KEY_Igrave = 0x0CC
-    KEY_Iacute = 0x0CD
-    KEY_Icircumflex = 0x0CE
-    KEY_Idiaeresis = 0x0CF
-    KEY_ETH = 0x0D0
-    KEY_Eth = 0x0D0
-    KEY_Ntilde = 0x0D1
-    KEY_Ograve = 0x0D2
-    KEY_Oacute = 0x0D3
-    KEY_Ocircumflex = 0x0D4
-    KEY_Otilde = 0x0D5
-    KEY_Odiaeresis = 0x0D6
-    KEY_multiply = 0x0D7
-    KEY_Oslash = 0x0D8
-    KEY_Ooblique = 0x0D8
-    KEY_Ugrave = 0x0D9
-    KEY_Uacute = 0x0DA
-    KEY_Ucircumflex = 0x0DB
-    KEY_Udiaeresis = 0x0DC
-    KEY_Yacute = 0x0DD
-    KEY_THORN = 0x0DE
-    KEY_Thorn = 0x0DE
-    KEY_ssharp = 0x0DF
-    KEY_agrave = 0x0E0
-    KEY_aacute = 0x0E1
-    KEY_acircumflex = 0x0E2
-    KEY_atilde = 0x0E3
-    KEY_adiaeresis = 0x0E4
-    KEY_aring = 0x0E5
-    KEY_ae = 0x0E6
-    KEY_ccedilla = 0x0E7
-    KEY_egrave = 0x0E8
-    KEY_eacute = 0x0E9
-    KEY_ecircumflex = 0x0EA
-    KEY_ediaeresis = 0x0EB
-    KEY_igrave = 0x0EC
-    KEY_iacute = 0x0ED
-    KEY_icircumflex = 0x0EE
-    KEY_idiaeresis = 0x0EF
-    KEY_eth = 0x0F0
-    KEY_ntilde = 0x0F1
-    KEY_ograve = 0x0F2
-    KEY_oacute = 0x0F3
-    KEY_ocircumflex = 0x0F4
-    KEY_otilde = 0x0F5
-    KEY_odiaeresis = 0x0F6
-    KEY_division = 0x0F7
-    KEY_oslash = 0x0F8
-    KEY_ooblique = 0x0F8
-    KEY_ugrave = 0x0F9
-    KEY_uacute = 0x0FA
-    KEY_ucircumflex = 0x0FB
-    KEY_udiaeresis = 0x0FC
-    KEY_yacute = 0x0FD
-    KEY_thorn = 0x0FE
-    KEY_ydiaeresis = 0x0FF
-    KEY_Aogonek = 0x1A1
-    KEY_breve = 0x1A2
-    KEY_Lstroke = 0x1A3
-    KEY_Lcaron = 0x1A5
-    KEY_Sacute = 0x1A6
-    KEY_Scaron = 0x1A9
-    KEY_Scedilla = 0x1AA
-    KEY_Tcaron = 0x1AB
-    KEY_Zacute = 0x1AC
-    KEY_Zcaron = 0x1AE
-    KEY_Zabovedot = 0x1AF
-    KEY_aogonek = 0x1B1
-    KEY_ogonek = 0x1B2
-    KEY_lstroke = 0x1B3
-    KEY_lcaron = 0x1B5
-    KEY_sacute = 0x1B6
-    KEY_caron = 0x1B7
-    KEY_scaron = 0x1B9
-    KEY_scedilla = 0x1BA
-    KEY_tcaron = 0x1BB
-    KEY_zacute = 0x1BC
-    KEY_doubleacute = 0x1BD
-    KEY_zcaron = 0x1BE
-    KEY_zabovedot = 0x1BF
-    KEY_Racute = 0x1C0
-    KEY_Abreve = 0x1C3
-    KEY_Lacute = 0x1C5
-    KEY_Cacute = 0x1C6
-    KEY_Ccaron = 0x1C8
-    KEY_Eogonek = 0x1CA
-    KEY_Ecaron = 0x1CC
-    KEY_Dcaron = 0x1CF
-    KEY_Dstroke = 0x1D0
-    KEY_Nacute = 0x1D1
-    KEY_Ncaron = 0x1D2
-    KEY_Odoubleacute = 0x1D5
-    KEY_Rcaron = 0x1D8
-    KEY_Uring = 0x1D9
-    KEY_Udoubleacute = 0x1DB
-    KEY_Tcedilla = 0x1DE
-    KEY_racute = 0x1E0
-    KEY_abreve = 0x1E3
-    KEY_lacute = 0x1E5
-    KEY_cacute = 0x1E6
-    KEY_ccaron = 0x1E8
-    KEY_eogonek = 0x1EA
-    KEY_ecaron = 0x1EC
-    KEY_dcaron = 0x1EF
-    KEY_dstroke = 0x1F0
-    KEY_nacute = 0x1F1
-    KEY_ncaron = 0x1F2
-    KEY_odoubleacute = 0x1F5
-    KEY_rcaron = 0x1F8
-    KEY_uring = 0x1F9
-    KEY_udoubleacute = 0x1FB
-    KEY_tcedilla = 0x1FE
-    KEY_abovedot = 0x1FF
-    KEY_Hstroke = 0x2A1
-    KEY_Hcircumflex = 0x2A6
-    KEY_Iabovedot = 0x2A9
-    KEY_Gbreve = 0x2AB
-    KEY_Jcircumflex = 0x2AC
-    KEY_hstroke = 0x2B1
-    KEY_hcircumflex = 0x2B6
-    KEY_idotless = 0x2B9
-    KEY_gbreve = 0x2BB
-    KEY_jcircumflex = 0x2BC
-    KEY_Cabovedot = 0x2C5
-    KEY_Ccircumflex = 0x2C6
-    KEY_Gabovedot = 0x2D5
-    KEY_Gcircumflex = 0x2D8
-    KEY_Ubreve = 0x2DD
-    KEY_Scircumflex = 0x2DE
-    KEY_cabovedot = 0x2E5
-    KEY_ccircumflex = 0x2E6
-    KEY_gabovedot = 0x2F5
-    KEY_gcircumflex = 0x2F8
-    KEY_ubreve = 0x2FD
-    KEY_scircumflex = 0x2FE
-    KEY_kra = 0x3A2
-    KEY_kappa = 0x3A2
-    KEY_Rcedilla = 0x3A3
-    KEY_Itilde = 0x3A5
-    KEY_Lcedilla = 0x3A6
-    KEY_Emacron = 0x3AA
-    KEY_Gcedilla = 0x3AB
-    KEY_Tslash = 0x3AC
-    KEY_rcedilla = 0x3B3
-    KEY_itilde = 0x3B5
-    KEY_lcedilla = 0x3B6
-    KEY_emacron = 0x3BA
-    KEY_gcedilla = 0x3BB
-    KEY_tslash = 0x3BC
-    KEY_ENG = 0x3BD
-    KEY_eng = 0x3BF
-    KEY_Amacron = 0x3C0
-    KEY_Iogonek = 0x3C7
-    KEY_Eabovedot = 0x3CC
-    KEY_Imacron = 0x3CF
-    KEY_Ncedilla = 0x3D1
-    KEY_Omacron = 0x3D2
-    KEY_Kcedilla = 0x3D3
-    KEY_Uogonek = 0x3D9
-    KEY_Utilde = 0x3DD
-    KEY_Umacron = 0x3DE
-    KEY_amacron = 0x3E0
-    KEY_iogonek = 0x3E7
-    KEY_eabovedot = 0x3EC
-    KEY_imacron = 0x3EF
-    KEY_ncedilla = 0x3F1
-    KEY_omacron = 0x3F2
-    KEY_kcedilla = 0x3F3
-    KEY_uogonek = 0x3F9
-    KEY_utilde = 0x3FD
-    KEY_umacron = 0x3FE
-    KEY_Wcircumflex = 0x1000174
-    KEY_wcircumflex = 0x1000175
-    KEY_Ycircumflex = 0x1000176
-    KEY_ycircumflex = 0x1000177
-    KEY_Babovedot = 0x1001E02
-    KEY_babovedot = 0x1001E03
-    KEY_Dabovedot = 0x1001E0A
-    KEY_dabovedot = 0x1001E0B
-    KEY_Fabovedot = 0x1001E1E
-    KEY_fabovedot = 0x1001E1F
-    KEY_Mabovedot = 0x1001E40
-    KEY_mabovedot = 0x1001E41
-    KEY_Pabovedot = 0x1001E56
-    KEY_pabovedot = 0x1001E57
-    KEY_Sabovedot = 0x1001E60
-    KEY_sabovedot = 0x1001E61
-    KEY_Tabovedot = 0x1001E6A
-    KEY_tabovedot = 0x1001E6B
-    KEY_Wgrave = 0x1001E80
-    KEY_wgrave = 0x1001E81
-    KEY_Wacute = 0x1001E82
-    KEY_wacute = 0x1001E83
-    KEY_Wdiaeresis = 0x1001E84
-    KEY_wdiaeresis = 0x1001E85
-    KEY_Ygrave = 0x1001EF2
-    KEY_ygrave = 0x1001EF3
-    KEY_OE = 0x13BC
-    KEY_oe = 0x13BD
-    KEY_Ydiaeresis = 0x13BE
-    KEY_overline = 0x47E
-    KEY_kana_fullstop = 0x4A1
-    KEY_kana_openingbracket = 0x4A2
-    KEY_kana_closingbracket = 0x4A3
-    KEY_kana_comma = 0x4A4
-    KEY_kana_conjunctive = 0x4A5
-    KEY_kana_middledot = 0x4A5
-    KEY_kana_WO = 0x4A6
-    KEY_kana_a = 0x4A7
-    KEY_kana_i = 0x4A8
-    KEY_kana_u = 0x4A9
-    KEY_kana_e = 0x4AA
-    KEY_kana_o = 0x4AB
-    KEY_kana_ya = 0x4AC
-    KEY_kana_yu = 0x4AD
-    KEY_kana_yo = 0x4AE
-    KEY_kana_tsu = 0x4AF
-    KEY_kana_tu = 0x4AF
-    KEY_prolongedsound = 0x4B0
-    KEY_kana_A = 0x4B1
-    KEY_kana_I = 0x4B2
-    KEY_kana_U = 0x4B3
-    KEY_kana_E = 0x4B4
-    KEY_kana_O = 0x4B5
-    KEY_kana_KA = 0x4B6
-    KEY_kana_KI = 0x4B7
-    KEY_kana_KU = 0x4B8
-    KEY_kana_KE = 0x4B9
-    KEY_kana_KO = 0x4BA
-    KEY_kana_SA = 0x4BB
-    KEY_kana_SHI = 0x4BC
-    KEY_kana_SU = 0x4BD
-    KEY_kana_SE = 0x4BE
-    KEY_kana_SO = 0x4BF
-    KEY_kana_TA = 0x4C0
-    KEY_kana_CHI = 0x4C1
-    KEY_kana_TI = 0x4C1
-    KEY_kana_TSU = 0x4C2
-    KEY_kana_TU = 0x4C2
-    KEY_kana_TE = 0x4C3
-    KEY_kana_TO = 0x4C4
-    KEY_kana_NA = 0x4C5
-    KEY_kana_NI = 0x4C6
-    KEY_kana_NU = 0x4C7
-    KEY_kana_NE = 0x4C8
-    KEY_kana_NO = 0x4C9
-    KEY_kana_HA = 0x4CA
-    KEY_kana_HI = 0x4CB
-    KEY_kana_FU = 0x4CC
-    KEY_kana_HU = 0x4CC
-    KEY_kana_HE = 0x4CD
-    KEY_kana_HO = 0x4CE
-    KEY_kana_MA = 0x4CF
-    KEY_kana_MI = 0x4D0
-    KEY_kana_MU = 0x4D1
-    KEY_kana_ME = 0x4D2
-    KEY_kana_MO = 0x4D3
-    KEY_kana_YA = 0x4D4
-    KEY_kana_YU = 0x4D5
-    KEY_kana_YO = 0x4D6
-    KEY_kana_RA = 0x4D7
-    KEY_kana_RI = 0x4D8
-    KEY_kana_RU = 0x4D9
-    KEY_kana_RE = 0x4DA
-    KEY_kana_RO = 0x4DB
-    KEY_kana_WA = 0x4DC
-    KEY_kana_N = 0x4DD
-    KEY_voicedsound = 0x4DE
-    KEY_semivoicedsound = 0x4DF
-    KEY_kana_switch = 0xFF7E
-    KEY_Farsi_0 = 0x10006F0
-    KEY_Farsi_1 = 0x10006F1
-    KEY_Farsi_2 = 0x10006F2
-    KEY_Farsi_3 = 0x10006F3
-    KEY_Farsi_4 = 0x10006F4
-    KEY_Farsi_5 = 0x10006F5
-    KEY_Farsi_6 = 0x10006F6
-    KEY_Farsi_7 = 0x10006F7
-    KEY_Farsi_8 = 0x10006F8
-    KEY_Farsi_9 = 0x10006F9
-    KEY_Arabic_percent = 0x100066A
-    KEY_Arabic_superscript_alef = 0x1000670
-    KEY_Arabic_tteh = 0x1000679
-    KEY_Arabic_peh = 0x100067E
-    KEY_Arabic_tcheh = 0x1000686
-    KEY_Arabic_ddal = 0x1000688
-    KEY_Arabic_rreh = 0x1000691
-    KEY_Arabic_comma = 0x5AC
-    KEY_Arabic_fullstop = 0x10006D4
-    KEY_Arabic_0 = 0x1000660
-    KEY_Arabic_1 = 0x1000661
-    KEY_Arabic_2 = 0x1000662
-    KEY_Arabic_3 = 0x1000663
-    KEY_Arabic_4 = 0x1000664
-    KEY_Arabic_5 = 0x1000665
-    KEY_Arabic_6 = 0x1000666
-    KEY_Arabic_7 = 0x1000667
-    KEY_Arabic_8 = 0x1000668
-    KEY_Arabic_9 = 0x1000669
-    KEY_Arabic_semicolon = 0x5BB
-    KEY_Arabic_question_mark = 0x5BF
-    KEY_Arabic_hamza = 0x5C1
-    KEY_Arabic_maddaonalef = 0x5C2
-    KEY_Arabic_hamzaonalef = 0x5C3
-    KEY_Arabic_hamzaonwaw = 0x5C4
-    KEY_Arabic_hamzaunderalef = 0x5C5
-    KEY_Arabic_hamzaonyeh = 0x5C6
-    KEY_Arabic_alef = 0x5C7
-    KEY_Arabic_beh = 0x5C8
-    KEY_Arabic_tehmarbuta = 0x5C9
-    KEY_Arabic_teh = 0x5CA
-    KEY_Arabic_theh = 0x5CB
-    KEY_Arabic_jeem = 0x5CC
-    KEY_Arabic_hah = 0x5CD
-    KEY_Arabic_khah = 0x5CE
-    KEY_Arabic_dal = 0x5CF
-    KEY_Arabic_thal = 0x5D0
-    KEY_Arabic_ra = 0x5D1
-    KEY_Arabic_zain = 0x5D2
-    KEY_Arabic_seen = 0x5D3
-    KEY_Arabic_sheen = 0x5D4
-    KEY_Arabic_sad = 0x5D5
-    KEY_Arabic_dad = 0x5D6
-    KEY_Arabic_tah = 0x5D7
-    KEY_Arabic_zah = 0x5D8
-    KEY_Arabic_ain = 0x5D9
-    KEY_Arabic_ghain = 0x5DA
-    KEY_Arabic_tatweel = 0x5E0
-    KEY_Arabic_feh = 0x5E1
-    KEY_Arabic_qaf = 0x5E2
-    KEY_Arabic_kaf = 0x5E3
-    KEY_Arabic_lam = 0x5E4
-    KEY_Arabic_meem = 0x5E5
-    KEY_Arabic_noon = 0x5E6
-    KEY_Arabic_ha = 0x5E7
-    KEY_Arabic_heh = 0x5E7
-    KEY_Arabic_waw = 0x5E8
-    KEY_Arabic_alefmaksura = 0x5E9
-    KEY_Arabic_yeh = 0x5EA
-    KEY_Arabic_fathatan = 0x5EB
-    KEY_Arabic_dammatan = 0x5EC
-    KEY_Arabic_kasratan = 0x5ED
-    KEY_Arabic_fatha = 0x5EE
-    KEY_Arabic_damma = 0x5EF
-    KEY_Arabic_kasra = 0x5F0
-    KEY_Arabic_shadda = 0x5F1
-    KEY_Arabic_sukun = 0x5F2
-    KEY_Arabic_madda_above = 0x1000653
-    KEY_Arabic_hamza_above = 0x1000654
-    KEY_Arabic_hamza_below = 0x1000655
-    KEY_Arabic_jeh = 0x1000698
-    KEY_Arabic_veh = 0x10006A4
-    KEY_Arabic_keheh = 0x10006A9
-    KEY_Arabic_gaf = 0x10006AF
-    KEY_Arabic_noon_ghunna = 0x10006BA
-    KEY_Arabic_heh_doachashmee = 0x10006BE
-    KEY_Farsi_yeh = 0x10006CC
-    KEY_Arabic_farsi_yeh = 0x10006CC
-    KEY_Arabic_yeh_baree = 0x10006D2
-    KEY_Arabic_heh_goal = 0x10006C1
-    KEY_Arabic_switch = 0xFF7E
-    KEY_Cyrillic_GHE_bar = 0x1000492
-    KEY_Cyrillic_ghe_bar = 0x1000493
-    KEY_Cyrillic_ZHE_descender = 0x1000496
-    KEY_Cyrillic_zhe_descender = 0x1000497
-    KEY_Cyrillic_KA_descender = 0x100049A
-    KEY_Cyrillic_ka_descender = 0x100049B
-    KEY_Cyrillic_KA_vertstroke = 0x100049C
-    KEY_Cyrillic_ka_vertstroke = 0x100049D
-    KEY_Cyrillic_EN_descender = 0x10004A2
-    KEY_Cyrillic_en_descender = 0x10004A3
-    KEY_Cyrillic_U_straight = 0x10004AE
-    KEY_Cyrillic_u_straight = 0x10004AF
-    KEY_Cyrillic_U_straight_bar = 0x10004B0
-    KEY_Cyrillic_u_straight_bar = 0x10004B1
-    KEY_Cyrillic_HA_descender = 0x10004B2
-    KEY_Cyrillic_ha_descender = 0x10004B3
-    KEY_Cyrillic_CHE_descender = 0x10004B6
-    KEY_Cyrillic_che_descender = 0x10004B7
-    KEY_Cyrillic_CHE_vertstroke = 0x10004B8
-    KEY_Cyrillic_che_vertstroke = 0x10004B9
-    KEY_Cyrillic_SHHA = 0x10004BA
-    KEY_Cyrillic_shha = 0x10004BB
-    KEY_Cyrillic_SCHWA = 0x10004D8
-    KEY_Cyrillic_schwa = 0x10004D9
-    KEY_Cyrillic_I_macron = 0x10004E2
-    KEY_Cyrillic_i_macron = 0x10004E3
-    KEY_Cyrillic_O_bar = 0x10004E8
-    KEY_Cyrillic_o_bar = 0x10004E9
-    KEY_Cyrillic_U_macron = 0x10004EE
-    KEY_Cyrillic_u_macron = 0x10004EF
-    KEY_Serbian_dje = 0x6A1
-    KEY_Macedonia_gje = 0x6A2
-    KEY_Cyrillic_io = 0x6A3
-    KEY_Ukrainian_ie = 0x6A4
-    KEY_Ukranian_je = 0x6A4
-    KEY_Macedonia_dse = 0x6A5
-    KEY_Ukrainian_i = 0x6A6
-    KEY_Ukranian_i = 0x6A6
-    KEY_Ukrainian_yi = 0x6A7
-    KEY_Ukranian_yi = 0x6A7
-    KEY_Cyrillic_je = 0x6A8
-    KEY_Serbian_je = 0x6A8
-    KEY_Cyrillic_lje = 0x6A9
-    KEY_Serbian_lje = 0x6A9
-    KEY_Cyrillic_nje = 0x6AA
-    KEY_Serbian_nje = 0x6AA
-    KEY_Serbian_tshe = 0x6AB
-    KEY_Macedonia_kje = 0x6AC
-    KEY_Ukrainian_ghe_with_upturn = 0x6AD
-    KEY_Byelorussian_shortu = 0x6AE
-    KEY_Cyrillic_dzhe = 0x6AF
-    KEY_Serbian_dze = 0x6AF
-    KEY_numerosign = 0x6B0
-    KEY_Serbian_DJE = 0x6B1
-    KEY_Macedonia_GJE = 0x6B2
-    KEY_Cyrillic_IO = 0x6B3
-    KEY_Ukrainian_IE = 0x6B4
-    KEY_Ukranian_JE = 0x6B4
-    KEY_Macedonia_DSE = 0x6B5
-    KEY_Ukrainian_I = 0x6B6
-    KEY_Ukranian_I = 0x6B6
-    KEY_Ukrainian_YI = 0x6B7
-    KEY_Ukranian_YI = 0x6B7
-    KEY_Cyrillic_JE = 0x6B8
-    KEY_Serbian_JE = 0x6B8
-    KEY_Cyrillic_LJE = 0x6B9
-    KEY_Serbian_LJE = 0x6B9
-    KEY_Cyrillic_NJE = 0x6BA
-    KEY_Serbian_NJE = 0x6BA
-    KEY_Serbian_TSHE = 0x6BB
-    KEY_Macedonia_KJE = 0x6BC
-    KEY_Ukrainian_GHE_WITH_UPTURN = 0x6BD
-    KEY_Byelorussian_SHORTU = 0x6BE
-    KEY_Cyrillic_DZHE = 0x6BF
-    KEY_Serbian_DZE = 0x6BF
-    KEY_Cyrillic_yu = 0x6C0
-    KEY_Cyrillic_a = 0x6C1
-    KEY_Cyrillic_be = 0x6C2
-    KEY_Cyrillic_tse = 0x6C3
-    KEY_Cyrillic_de = 0x6C4
-    KEY_Cyrillic_ie = 0x6C5
-    KEY_Cyrillic_ef = 0x6C6
-    KEY_Cyrillic_ghe = 0x6C7
-    KEY_Cyrillic_ha = 0x6C8
-    KEY_Cyrillic_i = 0x6C9
-    KEY_Cyrillic_shorti = 0x6CA
-    KEY_Cyrillic_ka = 0x6CB
-    KEY_Cyrillic_el = 0x6CC
-    KEY_Cyrillic_em = 0x6CD
-    KEY_Cyrillic_en = 0x6CE
-    KEY_Cyrillic_o = 0x6CF
-    KEY_Cyrillic_pe = 0x6D0
-    KEY_Cyrillic_ya = 0x6D1
-    KEY_Cyrillic_er = 0x6D2
-    KEY_Cyrillic_es = 0x6D3
-    KEY_Cyrillic_te = 0x6D4
-    KEY_Cyrillic_u = 0x6D5
-    KEY_Cyrillic_zhe = 0x6D6
-    KEY_Cyrillic_ve = 0x6D7
-    KEY_Cyrillic_softsign = 0x6D8
-    KEY_Cyrillic_yeru = 0x6D9
-    KEY_Cyrillic_ze = 0x6DA
-    KEY_Cyrillic_sha = 0x6DB
-    KEY_Cyrillic_e = 0x6DC
-    KEY_Cyrillic_shcha = 0x6DD
-    KEY_Cyrillic_che = 0x6DE
-    KEY_Cyrillic_hardsign = 0x6DF
-    KEY_Cyrillic_YU = 0x6E0
-    KEY_Cyrillic_A = 0x6E1
-    KEY_Cyrillic_BE = 0x6E2
-    KEY_Cyrillic_TSE = 0x6E3
-    KEY_Cyrillic_DE = 0x6E4
-    KEY_Cyrillic_IE = 0x6E5
-    KEY_Cyrillic_EF = 0x6E6
-    KEY_Cyrillic_GHE = 0x6E7
-    KEY_Cyrillic_HA = 0x6E8
-    KEY_Cyrillic_I = 0x6E9
-    KEY_Cyrillic_SHORTI = 0x6EA
-    KEY_Cyrillic_KA = 0x6EB
-    KEY_Cyrillic_EL = 0x6EC
-    KEY_Cyrillic_EM = 0x6ED
-    KEY_Cyrillic_EN = 0x6EE
-    KEY_Cyrillic_O = 0x6EF
-    KEY_Cyrillic_PE = 0x6F0
-    KEY_Cyrillic_YA = 0x6F1
-    KEY_Cyrillic_ER = 0x6F2
-    KEY_Cyrillic_ES = 0x6F3
-    KEY_Cyrillic_TE = 0x6F4
-    KEY_Cyrillic_U = 0x6F5
-    KEY_Cyrillic_ZHE = 0x6F6
-    KEY_Cyrillic_VE = 0x6F7
-    KEY_Cyrillic_SOFTSIGN = 0x6F8
-    KEY_Cyrillic_YERU = 0x6F9
-    KEY_Cyrillic_ZE = 0x6FA
-    KEY_Cyrillic_SHA = 0x6FB
-    KEY_Cyrillic_E = 0x6FC
-    KEY_Cyrillic_SHCHA = 0x6FD
-    KEY_Cyrillic_CHE = 0x6FE
-    KEY_Cyrillic_HARDSIGN = 0x6FF
-    KEY_Greek_ALPHAaccent = 0x7A1
-    KEY_Greek_EPSILONaccent = 0x7A2
-    KEY_Greek_ETAaccent = 0x7A3
-    KEY_Greek_IOTAaccent = 0x7A4
-    KEY_Greek_IOTAdieresis = 0x7A5
-    KEY_Greek_IOTAdiaeresis = 0x7A5
-    KEY_Greek_OMICRONaccent = 0x7A7
-    KEY_Greek_UPSILONaccent = 0x7A8
-    KEY_Greek_UPSILONdieresis = 0x7A9
-    KEY_Greek_OMEGAaccent = 0x7AB
-    KEY_Greek_accentdieresis = 0x7AE
-    KEY_Greek_horizbar = 0x7AF
-    KEY_Greek_alphaaccent = 0x7B1
-    KEY_Greek_epsilonaccent = 0x7B2
-    KEY_Greek_etaaccent = 0x7B3
-    KEY_Greek_iotaaccent = 0x7B4
-    KEY_Greek_iotadieresis = 0x7B5
-    KEY_Greek_iotaaccentdieresis = 0x7B6
-    KEY_Greek_omicronaccent = 0x7B7
-    KEY_Greek_upsilonaccent = 0x7B8
-    KEY_Greek_upsilondieresis = 0x7B9
-    KEY_Greek_upsilonaccentdieresis = 0x7BA
-    KEY_Greek_omegaaccent = 0x7BB
-    KEY_Greek_ALPHA = 0x7C1
-    KEY_Greek_BETA = 0x7C2
-    KEY_Greek_GAMMA = 0x7C3
-    KEY_Greek_DELTA = 0x7C4
-    KEY_Greek_EPSILON = 0x7C5
-    KEY_Greek_ZETA = 0x7C6
-    KEY_Greek_ETA = 0x7C7
-    KEY_Greek_THETA = 0x7C8
-    KEY_Greek_IOTA = 0x7C9
-    KEY_Greek_KAPPA = 0x7CA
-    KEY_Greek_LAMDA = 0x7CB
-    KEY_Greek_LAMBDA = 0x7CB
-    KEY_Greek_MU = 0x7CC
-    KEY_Greek_NU = 0x7CD
-    KEY_Greek_XI = 0x7CE
-    KEY_Greek_OMICRON = 0x7CF
-    KEY_Greek_PI = 0x7D0
-    KEY_Greek_RHO = 0x7D1
-    KEY_Greek_SIGMA = 0x7D2
-    KEY_Greek_TAU = 0x7D4
-    KEY_Greek_UPSILON = 0x7D5
-    KEY_Greek_PHI = 0x7D6
-    KEY_Greek_CHI = 0x7D7
-    KEY_Greek_PSI = 0x7D8
-    KEY_Greek_OMEGA = 0x7D9
-    KEY_Greek_alpha = 0x7E1
-    KEY_Greek_beta = 0x7E2
-    KEY_Greek_gamma = 0x7E3
-    KEY_Greek_delta = 0x7E4
-    KEY_Greek_epsilon = 0x7E5
-    KEY_Greek_zeta = 0x7E6
-    KEY_Greek_eta = 0x7E7
-    KEY_Greek_theta = 0x7E8
-    KEY_Greek_iota = 0x7E9
-    KEY_Greek_kappa = 0x7EA
-    KEY_Greek_lamda = 0x7EB
-    KEY_Greek_lambda = 0x7EB
-    KEY_Greek_mu = 0x7EC
-    KEY_Greek_nu = 0x7ED
-    KEY_Greek_xi = 0x7EE
-    KEY_Greek_omicron = 0x7EF
-    KEY_Greek_pi = 0x7F0
-    KEY_Greek_rho = 0x7F1
-    KEY_Greek_sigma = 0x7F2
-    KEY_Greek_finalsmallsigma = 0x7F3
-    KEY_Greek_tau = 0x7F4
-    KEY_Greek_upsilon = 0x7F5
-    KEY_Greek_phi = 0x7F6
-    KEY_Greek_chi = 0x7F7
-    KEY_Greek_psi = 0x7F8
-    KEY_Greek_omega = 0x7F9
-    KEY_Greek_switch = 0xFF7E
-    KEY_leftradical = 0x8A1
-    KEY_topleftradical = 0x8A2
-    KEY_horizconnector = 0x8A3
-    KEY_topintegral = 0x8A4
-    KEY_botintegral = 0x8A5
-    KEY_vertconnector = 0x8A6
-    KEY_topleftsqbracket = 0x8A7
-    KEY_botleftsqbracket = 0x8A8
-    KEY_toprightsqbracket = 0x8A9
-    KEY_botrightsqbracket = 0x8AA
-    KEY_topleftparens = 0x8AB
-    KEY_botleftparens = 0x8AC
-    KEY_toprightparens = 0x8AD
-    KEY_botrightparens = 0x8AE
-    KEY_leftmiddlecurlybrace = 0x8AF
-    KEY_rightmiddlecurlybrace = 0x8B0
-    KEY_topleftsummation = 0x8B1
-    KEY_botleftsummation = 0x8B2
-    KEY_topvertsummationconnector = 0x8B3
-    KEY_botvertsummationconnector = 0x8B4
-    KEY_toprightsummation = 0x8B5
-    KEY_botrightsummation = 0x8B6
-    KEY_rightmiddlesummation = 0x8B7
-    KEY_lessthanequal = 0x8BC
-    KEY_notequal = 0x8BD
-    KEY_greaterthanequal = 0x8BE
-    KEY_integral = 0x8BF
-    KEY_therefore = 0x8C0
-    KEY_variation = 0x8C1
-    KEY_infinity = 0x8C2
-    KEY_nabla = 0x8C5
-    KEY_approximate = 0x8C8
-    KEY_similarequal = 0x8C9
-    KEY_ifonlyif = 0x8CD
-    KEY_implies = 0x8CE
-    KEY_identical = 0x8CF
-    KEY_radical = 0x8D6
-    KEY_includedin = 0x8DA
-    KEY_includes = 0x8DB
-    KEY_intersection = 0x8DC
-    KEY_union = 0x8DD
-    KEY_logicaland = 0x8DE
-    KEY_logicalor = 0x8DF
-    KEY_partialderivative = 0x8EF
-    KEY_function = 0x8F6
-    KEY_leftarrow = 0x8FB
-    KEY_uparrow = 0x8FC
-    KEY_rightarrow = 0x8FD
-    KEY_downarrow = 0x8FE
-    KEY_blank = 0x9DF
-    KEY_soliddiamond = 0x9E0
-    KEY_checkerboard = 0x9E1
-    KEY_ht = 0x9E2
-    KEY_ff = 0x9E3
-    KEY_cr = 0x9E4
-    KEY_lf = 0x9E5
-    KEY_nl = 0x9E8
-    KEY_vt = 0x9E9
-    KEY_lowrightcorner = 0x9EA
-    KEY_uprightcorner = 0x9EB
-    KEY_upleftcorner = 0x9EC
-    KEY_lowleftcorner = 0x9ED
-    KEY_crossinglines = 0x9EE
-    KEY_horizlinescan1 = 0x9EF
-    KEY_horizlinescan3 = 0x9F0
-    KEY_horizlinescan5 = 0x9F1
-    KEY_horizlinescan7 = 0x9F2
-    KEY_horizlinescan9 = 0x9F3
-    KEY_leftt = 0x9F4
-    KEY_rightt = 0x9F5
-    KEY_bott = 0x9F6
-    KEY_topt = 0x9F7
-    KEY_vertbar = 0x9F8
-    KEY_emspace = 0xAA1
-    KEY_enspace = 0xAA2
-    KEY_em3space = 0xAA3
-    KEY_em4space = 0xAA4
-    KEY_digitspace = 0xAA5
-    KEY_punctspace = 0xAA6
-    KEY_thinspace = 0xAA7
-    KEY_hairspace = 0xAA8
-    KEY_emdash = 0xAA9
-    KEY_endash = 0xAAA
-    KEY_signifblank = 0xAAC
-    KEY_ellipsis = 0xAAE
-    KEY_doubbaselinedot = 0xAAF
-    KEY_onethird = 0xAB0
-    KEY_twothirds = 0xAB1
-    KEY_onefifth = 0xAB2
-    KEY_twofifths = 0xAB3
-    KEY_threefifths = 0xAB4
-    KEY_fourfifths = 0xAB5
-    KEY_onesixth = 0xAB6
-    KEY_fivesixths = 0xAB7
-    KEY_careof = 0xAB8
-    KEY_figdash = 0xABB
-    KEY_leftanglebracket = 0xABC
-    KEY_decimalpoint = 0xABD
-    KEY_rightanglebracket = 0xABE
-    KEY_marker = 0xABF
-    KEY_oneeighth = 0xAC3
-    KEY_threeeighths = 0xAC4
-    KEY_fiveeighths = 0xAC5
-    KEY_seveneighths = 0xAC6
-    KEY_trademark = 0xAC9
-    KEY_signaturemark = 0xACA
-    KEY_trademarkincircle = 0xACB
-    KEY_leftopentriangle = 0xACC
-    KEY_rightopentriangle = 0xACD
-    KEY_emopencircle = 0xACE
-    KEY_emopenrectangle = 0xACF
-    KEY_leftsinglequotemark = 0xAD0
-    KEY_rightsinglequotemark = 0xAD1
-    KEY_leftdoublequotemark = 0xAD2
-    KEY_rightdoublequotemark = 0xAD3
-    KEY_prescription = 0xAD4
-    KEY_permille = 0xAD5
-    KEY_minutes = 0xAD6
-    KEY_seconds = 0xAD7
-    KEY_latincross = 0xAD9
-    KEY_hexagram = 0xADA
-    KEY_filledrectbullet = 0xADB
-    KEY_filledlefttribullet = 0xADC
-    KEY_filledrighttribullet = 0xADD
-    KEY_emfilledcircle = 0xADE
-    KEY_emfilledrect = 0xADF
-    KEY_enopencircbullet = 0xAE0
-    KEY_enopensquarebullet = 0xAE1
-    KEY_openrectbullet = 0xAE2
-    KEY_opentribulletup = 0xAE3
-    KEY_opentribulletdown = 0xAE4
-    KEY_openstar = 0xAE5
-    KEY_enfilledcircbullet = 0xAE6
-    KEY_enfilledsqbullet = 0xAE7
-    KEY_filledtribulletup = 0xAE8
-    KEY_filledtribulletdown = 0xAE9
-    KEY_leftpointer = 0xAEA
-    KEY_rightpointer = 0xAEB
-    KEY_club = 0xAEC
-    KEY_diamond = 0xAED
-    KEY_heart = 0xAEE
-    KEY_maltesecross = 0xAF0
-    KEY_dagger = 0xAF1
-    KEY_doubledagger = 0xAF2
-    KEY_checkmark = 0xAF3
-    KEY_ballotcross = 0xAF4
-    KEY_musicalsharp = 0xAF5
-    KEY_musicalflat = 0xAF6
-    KEY_malesymbol = 0xAF7
-    KEY_femalesymbol = 0xAF8
-    KEY_telephone = 0xAF9
-    KEY_telephonerecorder = 0xAFA
-    KEY_phonographcopyright = 0xAFB
-    KEY_caret = 0xAFC
-    KEY_singlelowquotemark = 0xAFD
-    KEY_doublelowquotemark = 0xAFE
-    KEY_cursor = 0xAFF
-    KEY_leftcaret = 0xBA3
-    KEY_rightcaret = 0xBA6
-    KEY_downcaret = 0xBA8
-    KEY_upcaret = 0xBA9
-    KEY_overbar = 0xBC0
-    KEY_downtack = 0xBC2
-    KEY_upshoe = 0xBC3
-    KEY_downstile = 0xBC4
-    KEY_underbar = 0xBC6
-    KEY_jot = 0xBCA
-    KEY_quad = 0xBCC
-    KEY_uptack = 0xBCE
-    KEY_circle = 0xBCF
-    KEY_upstile = 0xBD3
-    KEY_downshoe = 0xBD6
-    KEY_rightshoe = 0xBD8
-    KEY_leftshoe = 0xBDA
-    KEY_lefttack = 0xBDC
-    KEY_righttack = 0xBFC
-    KEY_hebrew_doublelowline = 0xCDF
-    KEY_hebrew_aleph = 0xCE0
-    KEY_hebrew_bet = 0xCE1
-    KEY_hebrew_beth = 0xCE1
-    KEY_hebrew_gimel = 0xCE2
-    KEY_hebrew_gimmel = 0xCE2
-    KEY_hebrew_dalet = 0xCE3
-    KEY_hebrew_daleth = 0xCE3
-    KEY_hebrew_he = 0xCE4
-    KEY_hebrew_waw = 0xCE5
-    KEY_hebrew_zain = 0xCE6
-    KEY_hebrew_zayin = 0xCE6
-    KEY_hebrew_chet = 0xCE7
-    KEY_hebrew_het = 0xCE7
-    KEY_hebrew_tet = 0xCE8
-    KEY_hebrew_teth = 0xCE8
-    KEY_hebrew_yod = 0xCE9
-    KEY_hebrew_finalkaph = 0xCEA
-    KEY_hebrew_kaph = 0xCEB
-    KEY_hebrew_lamed = 0xCEC
-    KEY_hebrew_finalmem = 0xCED
-    KEY_hebrew_mem = 0xCEE
-    KEY_hebrew_finalnun = 0xCEF
-    KEY_hebrew_nun = 0xCF0
-    KEY_hebrew_samech = 0xCF1
-    KEY_hebrew_samekh = 0xCF1
-    KEY_hebrew_ayin = 0xCF2
-    KEY_hebrew_finalpe = 0xCF3
-    KEY_hebrew_pe = 0xCF4
-    KEY_hebrew_finalzade = 0xCF5
-    KEY_hebrew_finalzadi = 0xCF5
-    KEY_hebrew_zade = 0xCF6
-    KEY_hebrew_zadi = 0xCF6
-    KEY_hebrew_qoph = 0xCF7
-    KEY_hebrew_kuf = 0xCF7
-    KEY_hebrew_resh = 0xCF8
-    KEY_hebrew_shin = 0xCF9
-    KEY_hebrew_taw = 0xCFA
-    KEY_hebrew_taf = 0xCFA
-    KEY_Hebrew_switch = 0xFF7E
-    KEY_Thai_kokai = 0xDA1
-    KEY_Thai_khokhai = 0xDA2
-    KEY_Thai_khokhuat = 0xDA3
-    KEY_Thai_khokhwai = 0xDA4
-    KEY_Thai_khokhon = 0xDA5
-    KEY_Thai_khorakhang = 0xDA6
-    KEY_Thai_ngongu = 0xDA7
-    KEY_Thai_chochan = 0xDA8
-    KEY_Thai_choching = 0xDA9
-    KEY_Thai_chochang = 0xDAA
-    KEY_Thai_soso = 0xDAB
-    KEY_Thai_chochoe = 0xDAC
-    KEY_Thai_yoying = 0xDAD
-    KEY_Thai_dochada = 0xDAE
-    KEY_Thai_topatak = 0xDAF
-    KEY_Thai_thothan = 0xDB0
-    KEY_Thai_thonangmontho = 0xDB1
-    KEY_Thai_thophuthao = 0xDB2
-    KEY_Thai_nonen = 0xDB3
-    KEY_Thai_dodek = 0xDB4
-    KEY_Thai_totao = 0xDB5
-    KEY_Thai_thothung = 0xDB6
-    KEY_Thai_thothahan = 0xDB7
-    KEY_Thai_thothong = 0xDB8
-    KEY_Thai_nonu = 0xDB9
-    KEY_Thai_bobaimai = 0xDBA
-    KEY_Thai_popla = 0xDBB
-    KEY_Thai_phophung = 0xDBC
-    KEY_Thai_fofa = 0xDBD
-    KEY_Thai_phophan = 0xDBE
-    KEY_Thai_fofan = 0xDBF
-    KEY_Thai_phosamphao = 0xDC0
-    KEY_Thai_moma = 0xDC1
-    KEY_Thai_yoyak = 0xDC2
-    KEY_Thai_rorua = 0xDC3
-    KEY_Thai_ru = 0xDC4
-    KEY_Thai_loling = 0xDC5
-    KEY_Thai_lu = 0xDC6
-    KEY_Thai_wowaen = 0xDC7
-    KEY_Thai_sosala = 0xDC8
-    KEY_Thai_sorusi = 0xDC9
-    KEY_Thai_sosua = 0xDCA
-    KEY_Thai_hohip = 0xDCB
-    KEY_Thai_lochula = 0xDCC
-    KEY_Thai_oang = 0xDCD
-    KEY_Thai_honokhuk = 0xDCE
-    KEY_Thai_paiyannoi = 0xDCF
-    KEY_Thai_saraa = 0xDD0
-    KEY_Thai_maihanakat = 0xDD1
-    KEY_Thai_saraaa = 0xDD2
-    KEY_Thai_saraam = 0xDD3
-    KEY_Thai_sarai = 0xDD4
-    KEY_Thai_saraii = 0xDD5
-    KEY_Thai_saraue = 0xDD6
-    KEY_Thai_sarauee = 0xDD7
-    KEY_Thai_sarau = 0xDD8
-    KEY_Thai_sarauu = 0xDD9
-    KEY_Thai_phinthu = 0xDDA
-    KEY_Thai_maihanakat_maitho = 0xDDE
-    KEY_Thai_baht = 0xDDF
-    KEY_Thai_sarae = 0xDE0
-    KEY_Thai_saraae = 0xDE1
-    KEY_Thai_sarao = 0xDE2
-    KEY_Thai_saraaimaimuan = 0xDE3
-    KEY_Thai_saraaimaimalai = 0xDE4
-    KEY_Thai_lakkhangyao = 0xDE5
-    KEY_Thai_maiyamok = 0xDE6
-    KEY_Thai_maitaikhu = 0xDE7
-    KEY_Thai_maiek = 0xDE8
-    KEY_Thai_maitho = 0xDE9
-    KEY_Thai_maitri = 0xDEA
-    KEY_Thai_maichattawa = 0xDEB
-    KEY_Thai_thanthakhat = 0xDEC
-    KEY_Thai_nikhahit = 0xDED
-    KEY_Thai_leksun = 0xDF0
-    KEY_Thai_leknung = 0xDF1
-    KEY_Thai_leksong = 0xDF2
-    KEY_Thai_leksam = 0xDF3
-    KEY_Thai_leksi = 0xDF4
-    KEY_Thai_lekha = 0xDF5
-    KEY_Thai_lekhok = 0xDF6
-    KEY_Thai_lekchet = 0xDF7
-    KEY_Thai_lekpaet = 0xDF8
-    KEY_Thai_lekkao = 0xDF9
-    KEY_Hangul = 0xFF31
-    KEY_Hangul_Start = 0xFF32
-    KEY_Hangul_End = 0xFF33
-    KEY_Hangul_Hanja = 0xFF34
-    KEY_Hangul_Jamo = 0xFF35
-    KEY_Hangul_Romaja = 0xFF36
-    KEY_Hangul_Codeinput = 0xFF37
-    KEY_Hangul_Jeonja = 0xFF38
-    KEY_Hangul_Banja = 0xFF39
-    KEY_Hangul_PreHanja = 0xFF3A
-    KEY_Hangul_PostHanja = 0xFF3B
-    KEY_Hangul_SingleCandidate = 0xFF3C
-    KEY_Hangul_MultipleCandidate = 0xFF3D
-    KEY_Hangul_PreviousCandidate = 0xFF3E
-    KEY_Hangul_Special = 0xFF3F
-    KEY_Hangul_switch = 0xFF7E
-    KEY_Hangul_Kiyeog = 0xEA1
-    KEY_Hangul_SsangKiyeog = 0xEA2
-    KEY_Hangul_KiyeogSios = 0xEA3
-    KEY_Hangul_Nieun = 0xEA4
-    KEY_Hangul_NieunJieuj = 0xEA5
-    KEY_Hangul_NieunHieuh = 0xEA6
-    KEY_Hangul_Dikeud = 0xEA7
-    KEY_Hangul_SsangDikeud = 0xEA8
-    KEY_Hangul_Rieul = 0xEA9
-    KEY_Hangul_RieulKiyeog = 0xEAA
-    KEY_Hangul_RieulMieum = 0xEAB
-    KEY_Hangul_RieulPieub = 0xEAC
-    KEY_Hangul_RieulSios = 0xEAD
-    KEY_Hangul_RieulTieut = 0xEAE
-    KEY_Hangul_RieulPhieuf = 0xEAF
-    KEY_Hangul_RieulHieuh = 0xEB0
-    KEY_Hangul_Mieum = 0xEB1
-    KEY_Hangul_Pieub = 0xEB2
-    KEY_Hangul_SsangPieub = 0xEB3
-    KEY_Hangul_PieubSios = 0xEB4
-    KEY_Hangul_Sios = 0xEB5
-    KEY_Hangul_SsangSios = 0xEB6
-    KEY_Hangul_Ieung = 0xEB7
-    KEY_Hangul_Jieuj = 0xEB8
-    KEY_Hangul_SsangJieuj = 0xEB9
-    KEY_Hangul_Cieuc = 0xEBA
-    KEY_Hangul_Khieuq = 0xEBB
-    KEY_Hangul_Tieut = 0xEBC
-    KEY_Hangul_Phieuf = 0xEBD
-    KEY_Hangul_Hieuh = 0xEBE
-    KEY_Hangul_A = 0xEBF
-    KEY_Hangul_AE = 0xEC0
-    KEY_Hangul_YA = 0xEC1
-    KEY_Hangul_YAE = 0xEC2
-    KEY_Hangul_EO = 0xEC3
-    KEY_Hangul_E = 0xEC4
-    KEY_Hangul_YEO = 0xEC5
-    KEY_Hangul_YE = 0xEC6
-    KEY_Hangul_O = 0xEC7
-    KEY_Hangul_WA = 0xEC8
-    KEY_Hangul_WAE = 0xEC9
-    KEY_Hangul_OE = 0xECA
-    KEY_Hangul_YO = 0xECB
-    KEY_Hangul_U = 0xECC
-    KEY_Hangul_WEO = 0xECD
-    KEY_Hangul_WE = 0xECE
-    KEY_Hangul_WI = 0xECF
-    KEY_Hangul_YU = 0xED0
-    KEY_Hangul_EU = 0xED1
-    KEY_Hangul_YI = 0xED2
-    KEY_Hangul_I = 0xED3
-    KEY_Hangul_J_Kiyeog = 0xED4
-    KEY_Hangul_J_SsangKiyeog = 0xED5
-    KEY_Hangul_J_KiyeogSios = 0xED6
-    KEY_Hangul_J_Nieun = 0xED7
-    KEY_Hangul_J_NieunJieuj = 0xED8
-    KEY_Hangul_J_NieunHieuh = 0xED9
-    KEY_Hangul_J_Dikeud = 0xEDA
-    KEY_Hangul_J_Rieul = 0xEDB
-    KEY_Hangul_J_RieulKiyeog = 0xEDC
-    KEY_Hangul_J_RieulMieum = 0xEDD
-    KEY_Hangul_J_RieulPieub = 0xEDE
-    KEY_Hangul_J_RieulSios = 0xEDF
-    KEY_Hangul_J_RieulTieut = 0xEE0
-    KEY_Hangul_J_RieulPhieuf = 0xEE1
-    KEY_Hangul_J_RieulHieuh = 0xEE2
-    KEY_Hangul_J_Mieum = 0xEE3
-    KEY_Hangul_J_Pieub = 0xEE4
-    KEY_Hangul_J_PieubSios = 0xEE5
-    KEY_Hangul_J_Sios = 0xEE6
-    KEY_Hangul_J_SsangSios = 0xEE7
-    KEY_Hangul_J_Ieung = 0xEE8
-    KEY_Hangul_J_Jieuj = 0xEE9
-    KEY_Hangul_J_Cieuc = 0xEEA
-    KEY_Hangul_J_Khieuq = 0xEEB
-    KEY_Hangul_J_Tieut = 0xEEC
-    KEY_Hangul_J_Phieuf = 0xEED
-    KEY_Hangul_J_Hieuh = 0xEEE
-    KEY_Hangul_RieulYeorinHieuh = 0xEEF
-    KEY_Hangul_SunkyeongeumMieum = 0xEF0
-    KEY_Hangul_SunkyeongeumPieub = 0xEF1
-    KEY_Hangul_PanSios = 0xEF2
-    KEY_Hangul_KkogjiDalrinIeung = 0xEF3
-    KEY_Hangul_SunkyeongeumPhieuf = 0xEF4
-    KEY_Hangul_YeorinHieuh = 0xEF5
-    KEY_Hangul_AraeA = 0xEF6
-    KEY_Hangul_AraeAE = 0xEF7
-    KEY_Hangul_J_PanSios = 0xEF8
-    KEY_Hangul_J_KkogjiDalrinIeung = 0xEF9
-    KEY_Hangul_J_YeorinHieuh = 0xEFA
-    KEY_Korean_Won = 0xEFF
-    KEY_Armenian_ligature_ew = 0x1000587
-    KEY_Armenian_full_stop = 0x1000589
-    KEY_Armenian_verjaket = 0x1000589
-    KEY_Armenian_separation_mark = 0x100055D
-    KEY_Armenian_but = 0x100055D
-    KEY_Armenian_hyphen = 0x100058A
-    KEY_Armenian_yentamna = 0x100058A
-    KEY_Armenian_exclam = 0x100055C
-    KEY_Armenian_amanak = 0x100055C
-    KEY_Armenian_accent = 0x100055B
-    KEY_Armenian_shesht = 0x100055B
-    KEY_Armenian_question = 0x100055E
-    KEY_Armenian_paruyk = 0x100055E
-    KEY_Armenian_AYB = 0x1000531
-    KEY_Armenian_ayb = 0x1000561
-    KEY_Armenian_BEN = 0x1000532
-    KEY_Armenian_ben = 0x1000562
-    KEY_Armenian_GIM = 0x1000533
-    KEY_Armenian_gim = 0x1000563
-    KEY_Armenian_DA = 0x1000534
-    KEY_Armenian_da = 0x1000564
-    KEY_Armenian_YECH = 0x1000535
-    KEY_Armenian_yech = 0x1000565
-    KEY_Armenian_ZA = 0x1000536
-    KEY_Armenian_za = 0x1000566
-    KEY_Armenian_E = 0x1000537
-    KEY_Armenian_e = 0x1000567
-    KEY_Armenian_AT = 0x1000538
-    KEY_Armenian_at = 0x1000568
-    KEY_Armenian_TO = 0x1000539
-    KEY_Armenian_to = 0x1000569
-    KEY_Armenian_ZHE = 0x100053A
-    KEY_Armenian_zhe = 0x100056A
-    KEY_Armenian_INI = 0x100053B
-    KEY_Armenian_ini = 0x100056B
-    KEY_Armenian_LYUN = 0x100053C
-    KEY_Armenian_lyun = 0x100056C
-    KEY_Armenian_KHE = 0x100053D
-    KEY_Armenian_khe = 0x100056D
-    KEY_Armenian_TSA = 0x100053E
-    KEY_Armenian_tsa = 0x100056E
-    KEY_Armenian_KEN = 0x100053F
-    KEY_Armenian_ken = 0x100056F
-    KEY_Armenian_HO = 0x1000540
-    KEY_Armenian_ho = 0x1000570
-    KEY_Armenian_DZA = 0x1000541
-    KEY_Armenian_dza = 0x1000571
-    KEY_Armenian_GHAT = 0x1000542
-    KEY_Armenian_ghat = 0x1000572
-    KEY_Armenian_TCHE = 0x1000543
-    KEY_Armenian_tche = 0x1000573
-    KEY_Armenian_MEN = 0x1000544
-    KEY_Armenian_men = 0x1000574
-    KEY_Armenian_HI = 0x1000545
-    KEY_Armenian_hi = 0x1000575
-    KEY_Armenian_NU = 0x1000546
-    KEY_Armenian_nu = 0x1000576
-    KEY_Armenian_SHA = 0x1000547
-    KEY_Armenian_sha = 0x1000577
-    KEY_Armenian_VO = 0x1000548
-    KEY_Armenian_vo = 0x1000578
-    KEY_Armenian_CHA = 0x1000549
-    KEY_Armenian_cha = 0x1000579
-    KEY_Armenian_PE = 0x100054A
-    KEY_Armenian_pe = 0x100057A
-    KEY_Armenian_JE = 0x100054B
-    KEY_Armenian_je = 0x100057B
-    KEY_Armenian_RA = 0x100054C
-    KEY_Armenian_ra = 0x100057C
-    KEY_Armenian_SE = 0x100054D
-    KEY_Armenian_se = 0x100057D
-    KEY_Armenian_VEV = 0x100054E
-    KEY_Armenian_vev = 0x100057E
-    KEY_Armenian_TYUN = 0x100054F
-    KEY_Armenian_tyun = 0x100057F
-    KEY_Armenian_RE = 0x1000550
-    KEY_Armenian_re = 0x1000580
-    KEY_Armenian_TSO = 0x1000551
-    KEY_Armenian_tso = 0x1000581
-    KEY_Armenian_VYUN = 0x1000552
-    KEY_Armenian_vyun = 0x1000582
-    KEY_Armenian_PYUR = 0x1000553
-    KEY_Armenian_pyur = 0x1000583
-    KEY_Armenian_KE = 0x1000554
-    KEY_Armenian_ke = 0x1000584
-    KEY_Armenian_O = 0x1000555
-    KEY_Armenian_o = 0x1000585
-    KEY_Armenian_FE = 0x1000556
-    KEY_Armenian_fe = 0x1000586
-    KEY_Armenian_apostrophe = 0x100055A
-    KEY_Georgian_an = 0x10010D0
-    KEY_Georgian_ban = 0x10010D1
-    KEY_Georgian_gan = 0x10010D2
-    KEY_Georgian_don = 0x10010D3
-    KEY_Georgian_en = 0x10010D4
-    KEY_Georgian_vin = 0x10010D5
-    KEY_Georgian_zen = 0x10010D6
-    KEY_Georgian_tan = 0x10010D7
-    KEY_Georgian_in = 0x10010D8
-    KEY_Georgian_kan = 0x10010D9
-    KEY_Georgian_las = 0x10010DA
-    KEY_Georgian_man = 0x10010DB
-    KEY_Georgian_nar = 0x10010DC
-    KEY_Georgian_on = 0x10010DD
-    KEY_Georgian_par = 0x10010DE
-    KEY_Georgian_zhar = 0x10010DF
-    KEY_Georgian_rae = 0x10010E0
-    KEY_Georgian_san = 0x10010E1
-    KEY_Georgian_tar = 0x10010E2
-    KEY_Georgian_un = 0x10010E3
-    KEY_Georgian_phar = 0x10010E4
-    KEY_Georgian_khar = 0x10010E5
-    KEY_Georgian_ghan = 0x10010E6
-    KEY_Georgian_qar = 0x10010E7
-    KEY_Georgian_shin = 0x10010E8
-    KEY_Georgian_chin = 0x10010E9
-    KEY_Georgian_can = 0x10010EA
-    KEY_Georgian_jil = 0x10010EB
-    KEY_Georgian_cil = 0x10010EC
-    KEY_Georgian_char = 0x10010ED
-    KEY_Georgian_xan = 0x10010EE
-    KEY_Georgian_jhan = 0x10010EF
-    KEY_Georgian_hae = 0x10010F0
-    KEY_Georgian_he = 0x10010F1
-    KEY_Georgian_hie = 0x10010F2
-    KEY_Georgian_we = 0x10010F3
-    KEY_Georgian_har = 0x10010F4
-    KEY_Georgian_hoe = 0x10010F5
-    KEY_Georgian_fi = 0x10010F6
-    KEY_Xabovedot = 0x1001E8A
-    KEY_Ibreve = 0x100012C
-    KEY_Zstroke = 0x10001B5
-    KEY_Gcaron = 0x10001E6
-    KEY_Ocaron = 0x10001D1
-    KEY_Obarred = 0x100019F
-    KEY_xabovedot = 0x1001E8B
-    KEY_ibreve = 0x100012D
-    KEY_zstroke = 0x10001B6
-    KEY_gcaron = 0x10001E7
-    KEY_ocaron = 0x10001D2
-    KEY_obarred = 0x1000275
-    KEY_SCHWA = 0x100018F
-    KEY_schwa = 0x1000259
-    KEY_EZH = 0x10001B7
-    KEY_ezh = 0x1000292
-    KEY_Lbelowdot = 0x1001E36
-    KEY_lbelowdot = 0x1001E37
-    KEY_Abelowdot = 0x1001EA0
-    KEY_abelowdot = 0x1001EA1
-    KEY_Ahook = 0x1001EA2
-    KEY_ahook = 0x1001EA3
-    KEY_Acircumflexacute = 0x1001EA4
-    KEY_acircumflexacute = 0x1001EA5
-    KEY_Acircumflexgrave = 0x1001EA6
-    KEY_acircumflexgrave = 0x1001EA7
-    KEY_Acircumflexhook = 0x1001EA8
-    KEY_acircumflexhook = 0x1001EA9
-    KEY_Acircumflextilde = 0x1001EAA
-    KEY_acircumflextilde = 0x1001EAB
-    KEY_Acircumflexbelowdot = 0x1001EAC
-    KEY_acircumflexbelowdot = 0x1001EAD
-    KEY_Abreveacute = 0x1001EAE
-    KEY_abreveacute = 0x1001EAF
-    KEY_Abrevegrave = 0x1001EB0
-    KEY_abrevegrave = 0x1001EB1
-    KEY_Abrevehook = 0x1001EB2
-    KEY_abrevehook = 0x1001EB3
-    KEY_Abrevetilde = 0x1001EB4
-    KEY_abrevetilde = 0x1001EB5
-    KEY_Abrevebelowdot = 0x1001EB6
-    KEY_abrevebelowdot = 0x1001EB7
-    KEY_Ebelowdot = 0x1001EB8
-    KEY_ebelowdot = 0x1001EB9
-    KEY_Ehook = 0x1001EBA
-    KEY_ehook = 0x1001EBB
-    KEY_Etilde = 0x1001EBC
-    KEY_etilde = 0x1001EBD
-    KEY_Ecircumflexacute = 0x1001EBE
-    KEY_ecircumflexacute = 0x1001EBF
-    KEY_Ecircumflexgrave = 0x1001EC0
-    KEY_ecircumflexgrave = 0x1001EC1
-    KEY_Ecircumflexhook = 0x1001EC2
-    KEY_ecircumflexhook = 0x1001EC3
-    KEY_Ecircumflextilde = 0x1001EC4
-    KEY_ecircumflextilde = 0x1001EC5
-    KEY_Ecircumflexbelowdot = 0x1001EC6
-    KEY_ecircumflexbelowdot = 0x1001EC7
-    KEY_Ihook = 0x1001EC8
-    KEY_ihook = 0x1001EC9
-    KEY_Ibelowdot = 0x1001ECA
-    KEY_ibelowdot = 0x1001ECB
-    KEY_Obelowdot = 0x1001ECC
-    KEY_obelowdot = 0x1001ECD
-    KEY_Ohook = 0x1001ECE
-    KEY_ohook = 0x1001ECF
-    KEY_Ocircumflexacute = 0x1001ED0
-    KEY_ocircumflexacute = 0x1001ED1
-    KEY_Ocircumflexgrave = 0x1001ED2
-    KEY_ocircumflexgrave = 0x1001ED3
-    KEY_Ocircumflexhook = 0x1001ED4
-    KEY_ocircumflexhook = 0x1001ED5
-    KEY_Ocircumflextilde = 0x1001ED6
-    KEY_ocircumflextilde = 0x1001ED7
-    KEY_Ocircumflexbelowdot = 0x1001ED8
-    KEY_ocircumflexbelowdot = 0x1001ED9
-    KEY_Ohornacute = 0x1001EDA
-    KEY_ohornacute = 0x1001EDB
-    KEY_Ohorngrave = 0x1001EDC
-    KEY_ohorngrave = 0x1001EDD
-    KEY_Ohornhook = 0x1001EDE
-    KEY_ohornhook = 0x1001EDF
-    KEY_Ohorntilde = 0x1001EE0
-    KEY_ohorntilde = 0x1001EE1
-    KEY_Ohornbelowdot = 0x1001EE2
-    KEY_ohornbelowdot = 0x1001EE3
-    KEY_Ubelowdot = 0x1001EE4
-    KEY_ubelowdot = 0x1001EE5
-    KEY_Uhook = 0x1001EE6
-    KEY_uhook = 0x1001EE7
-    KEY_Uhornacute = 0x1001EE8
-    KEY_uhornacute = 0x1001EE9
-    KEY_Uhorngrave = 0x1001EEA
-    KEY_uhorngrave = 0x1001EEB
-    KEY_Uhornhook = 0x1001EEC
-    KEY_uhornhook = 0x1001EED
-    KEY_Uhorntilde = 0x1001EEE
-    KEY_uhorntilde = 0x1001EEF
-    KEY_Uhornbelowdot = 0x1001EF0
-    KEY_uhornbelowdot = 0x1001EF1
-    KEY_Ybelowdot = 0x1001EF4
-    KEY_ybelowdot = 0x1001EF5
-    KEY_Yhook = 0x1001EF6
-    KEY_yhook = 0x1001EF7
-    KEY_Ytilde = 0x1001EF8
-    KEY_ytilde = 0x1001EF9
-    KEY_Ohorn = 0x10001A0
-    KEY_ohorn = 0x10001A1
-    KEY_Uhorn = 0x10001AF
-    KEY_uhorn = 0x10001B0
-    KEY_EcuSign = 0x10020A0
-    KEY_ColonSign = 0x10020A1
-    KEY_CruzeiroSign = 0x10020A2
-    KEY_FFrancSign = 0x10020A3
-    KEY_LiraSign = 0x10020A4
-    KEY_MillSign = 0x10020A5
-    KEY_NairaSign = 0x10020A6
-    KEY_PesetaSign = 0x10020A7
-    KEY_RupeeSign = 0x10020A8
-    KEY_WonSign = 0x10020A9
-    KEY_NewSheqelSign = 0x10020AA
-    KEY_DongSign = 0x10020AB
-    KEY_EuroSign = 0x20AC
-    KEY_zerosuperior = 0x1002070
-    KEY_foursuperior = 0x1002074
-    KEY_fivesuperior = 0x1002075
-    KEY_sixsuperior = 0x1002076
-    KEY_sevensuperior = 0x1002077
-    KEY_eightsuperior = 0x1002078
-    KEY_ninesuperior = 0x1002079
-    KEY_zerosubscript = 0x1002080
-    KEY_onesubscript = 0x1002081
-    KEY_twosubscript = 0x1002082
-    KEY_threesubscript = 0x1002083
-    KEY_foursubscript = 0x1002084
-    KEY_fivesubscript = 0x1002085
-    KEY_sixsubscript = 0x1002086
-    KEY_sevensubscript = 0x1002087
-    KEY_eightsubscript = 0x1002088
-    KEY_ninesubscript = 0x1002089
-    KEY_partdifferential = 0x1002202
-    KEY_emptyset = 0x1002205
-    KEY_elementof = 0x1002208
-    KEY_notelementof = 0x1002209
-    KEY_containsas = 0x100220B
-    KEY_squareroot = 0x100221A
-    KEY_cuberoot = 0x100221B
-    KEY_fourthroot = 0x100221C
-    KEY_dintegral = 0x100222C
-    KEY_tintegral = 0x100222D
-    KEY_because = 0x1002235
-    KEY_approxeq = 0x1002248
-    KEY_notapproxeq = 0x1002247
-    KEY_notidentical = 0x1002262
-    KEY_stricteq = 0x1002263
-    KEY_braille_dot_1 = 0xFFF1
-    KEY_braille_dot_2 = 0xFFF2
-    KEY_braille_dot_3 = 0xFFF3
-    KEY_braille_dot_4 = 0xFFF4
-    KEY_braille_dot_5 = 0xFFF5
-    KEY_braille_dot_6 = 0xFFF6
-    KEY_braille_dot_7 = 0xFFF7
-    KEY_braille_dot_8 = 0xFFF8
-    KEY_braille_dot_9 = 0xFFF9
-    KEY_braille_dot_10 = 0xFFFA
-    KEY_braille_blank = 0x1002800
-    KEY_braille_dots_1 = 0x1002801
-    KEY_braille_dots_2 = 0x1002802
-    KEY_braille_dots_12 = 0x1002803
-    KEY_braille_dots_3 = 0x1002804
-    KEY_braille_dots_13 = 0x1002805
-    KEY_braille_dots_23 = 0x1002806
-    KEY_braille_dots_123 = 0x1002807
-    KEY_braille_dots_4 = 0x1002808
-    KEY_braille_dots_14 = 0x1002809
-    KEY_braille_dots_24 = 0x100280A
-    KEY_braille_dots_124 = 0x100280B
-    KEY_braille_dots_34 = 0x100280C
-    KEY_braille_dots_134 = 0x100280D
-    KEY_braille_dots_234 = 0x100280E
-    KEY_braille_dots_1234 = 0x100280F
-    KEY_braille_dots_5 = 0x1002810
-    KEY_braille_dots_15 = 0x1002811
-    KEY_braille_dots_25 = 0x1002812
-    KEY_braille_dots_125 = 0x1002813
-    KEY_braille_dots_35 = 0x1002814
-    KEY_braille_dots_135 = 0x1002815
-    KEY_braille_dots_235 = 0x1002816
-    KEY_braille_dots_1235 = 0x1002817
-    KEY_braille_dots_45 = 0x1002818
-    KEY_braille_dots_145 = 0x1002819
-    KEY_braille_dots_245 = 0x100281A
-    KEY_braille_dots_1245 = 0x100281B
-    KEY_braille_dots_345 = 0x100281C
-    KEY_braille_dots_1345 = 0x100281D
-    KEY_braille_dots_2345 = 0x100281E
-    KEY_braille_dots_12345 = 0x100281F
-    KEY_braille_dots_6 = 0x1002820
-    KEY_braille_dots_16 = 0x1002821
-    KEY_braille_dots_26 = 0x1002822
-    KEY_braille_dots_126 = 0x1002823
-    KEY_braille_dots_36 = 0x1002824
-    KEY_braille_dots_136 = 0x1002825
-    KEY_braille_dots_236 = 0x1002826
-    KEY_braille_dots_1236 = 0x1002827
-    KEY_braille_dots_46 = 0x1002828
-    KEY_braille_dots_146 = 0x1002829
-    KEY_braille_dots_246 = 0x100282A
-    KEY_braille_dots_1246 = 0x100282B
-    KEY_braille_dots_346 = 0x100282C
-    KEY_braille_dots_1346 = 0x100282D
-    KEY_braille_dots_2346 = 0x100282E
-    KEY_braille_dots_12346 = 0x100282F
-    KEY_braille_dots_56 = 0x1002830
-    KEY_braille_dots_156 = 0x1002831
-    KEY_braille_dots_256 = 0x1002832
-    KEY_braille_dots_1256 = 0x1002833
-    KEY_braille_dots_356 = 0x1002834
-    KEY_braille_dots_1356 = 0x1002835
-    KEY_braille_dots_2356 = 0x1002836
-    KEY_braille_dots_12356 = 0x1002837
-    KEY_braille_dots_456 = 0x1002838
-    KEY_braille_dots_1456 = 0x1002839
-    KEY_braille_dots_2456 = 0x100283A
-    KEY_braille_dots_12456 = 0x100283B
-    KEY_braille_dots_3456 = 0x100283C
-    KEY_braille_dots_13456 = 0x100283D
-    KEY_braille_dots_23456 = 0x100283E
-    KEY_braille_dots_123456 = 0x100283F
-    KEY_braille_dots_7 = 0x1002840
-    KEY_braille_dots_17 = 0x1002841
-    KEY_braille_dots_27 = 0x1002842
-    KEY_braille_dots_127 = 0x1002843
-    KEY_braille_dots_37 = 0x1002844
-    KEY_braille_dots_137 = 0x1002845
-    KEY_braille_dots_237 = 0x1002846
-    KEY_braille_dots_1237 = 0x1002847
-    KEY_braille_dots_47 = 0x1002848
-    KEY_braille_dots_147 = 0x1002849
-    KEY_braille_dots_247 = 0x100284A
-    KEY_braille_dots_1247 = 0x100284B
-    KEY_braille_dots_347 = 0x100284C
-    KEY_braille_dots_1347 = 0x100284D
-    KEY_braille_dots_2347 = 0x100284E
-    KEY_braille_dots_12347 = 0x100284F
-    KEY_braille_dots_57 = 0x1002850
-    KEY_braille_dots_157 = 0x1002851
-    KEY_braille_dots_257 = 0x1002852
-    KEY_braille_dots_1257 = 0x1002853
-    KEY_braille_dots_357 = 0x1002854
-    KEY_braille_dots_1357 = 0x1002855
-    KEY_braille_dots_2357 = 0x1002856
-    KEY_braille_dots_12357 = 0x1002857
-    KEY_braille_dots_457 = 0x1002858
-    KEY_braille_dots_1457 = 0x1002859
-    KEY_braille_dots_2457 = 0x100285A
-    KEY_braille_dots_12457 = 0x100285B
-    KEY_braille_dots_3457 = 0x100285C
-    KEY_braille_dots_13457 = 0x100285D
-    KEY_braille_dots_23457 = 0x100285E
-    KEY_braille_dots_123457 = 0x100285F
-    KEY_braille_dots_67 = 0x1002860
-    KEY_braille_dots_167 = 0x1002861
-    KEY_braille_dots_267 = 0x1002862
-    KEY_braille_dots_1267 = 0x1002863
-    KEY_braille_dots_367 = 0x1002864
-    KEY_braille_dots_1367 = 0x1002865
-    KEY_braille_dots_2367 = 0x1002866
-    KEY_braille_dots_12367 = 0x1002867
-    KEY_braille_dots_467 = 0x1002868
-    KEY_braille_dots_1467 = 0x1002869
-    KEY_braille_dots_2467 = 0x100286A
-    KEY_braille_dots_12467 = 0x100286B
-    KEY_braille_dots_3467 = 0x100286C
-    KEY_braille_dots_13467 = 0x100286D
-    KEY_braille_dots_23467 = 0x100286E
-    KEY_braille_dots_123467 = 0x100286F
-    KEY_braille_dots_567 = 0x1002870
-    KEY_braille_dots_1567 = 0x1002871
-    KEY_braille_dots_2567 = 0x1002872
-    KEY_braille_dots_12567 = 0x1002873
-    KEY_braille_dots_3567 = 0x1002874
-    KEY_braille_dots_13567 = 0x1002875
-    KEY_braille_dots_23567 = 0x1002876
-    KEY_braille_dots_123567 = 0x1002877
-    KEY_braille_dots_4567 = 0x1002878
-    KEY_braille_dots_14567 = 0x1002879
-    KEY_braille_dots_24567 = 0x100287A
-    KEY_braille_dots_124567 = 0x100287B
-    KEY_braille_dots_34567 = 0x100287C
-    KEY_braille_dots_134567 = 0x100287D
-    KEY_braille_dots_234567 = 0x100287E
-    KEY_braille_dots_1234567 = 0x100287F
-    KEY_braille_dots_8 = 0x1002880
-    KEY_braille_dots_18 = 0x1002881
-    KEY_braille_dots_28 = 0x1002882
-    KEY_braille_dots_128 = 0x1002883
-    KEY_braille_dots_38 = 0x1002884
-    KEY_braille_dots_138 = 0x1002885
-    KEY_braille_dots_238 = 0x1002886
-    KEY_braille_dots_1238 = 0x1002887
-    KEY_braille_dots_48 = 0x1002888
-    KEY_braille_dots_148 = 0x1002889
-    KEY_braille_dots_248 = 0x100288A
-    KEY_braille_dots_1248 = 0x100288B
-    KEY_braille_dots_348 = 0x100288C
-    KEY_braille_dots_1348 = 0x100288D
-    KEY_braille_dots_2348 = 0x100288E
-    KEY_braille_dots_12348 = 0x100288F
-    KEY_braille_dots_58 = 0x1002890
-    KEY_braille_dots_158 = 0x1002891
-    KEY_braille_dots_258 = 0x1002892
-    KEY_braille_dots_1258 = 0x1002893
-    KEY_braille_dots_358 = 0x1002894
-    KEY_braille_dots_1358 = 0x1002895
-    KEY_braille_dots_2358 = 0x1002896
-    KEY_braille_dots_12358 = 0x1002897
-    KEY_braille_dots_458 = 0x1002898
-    KEY_braille_dots_1458 = 0x1002899
-    KEY_braille_dots_2458 = 0x100289A
-    KEY_braille_dots_12458 = 0x100289B
-    KEY_braille_dots_3458 = 0x100289C
-    KEY_braille_dots_13458 = 0x100289D
-    KEY_braille_dots_23458 = 0x100289E
-    KEY_braille_dots_123458 = 0x100289F
-    KEY_braille_dots_68 = 0x10028A0
-    KEY_braille_dots_168 = 0x10028A1
-    KEY_braille_dots_268 = 0x10028A2
-    KEY_braille_dots_1268 = 0x10028A3
-    KEY_braille_dots_368 = 0x10028A4
-    KEY_braille_dots_1368 = 0x10028A5
-    KEY_braille_dots_2368 = 0x10028A6
-    KEY_braille_dots_12368 = 0x10028A7
-    KEY_braille_dots_468 = 0x10028A8
-    KEY_braille_dots_1468 = 0x10028A9
-    KEY_braille_dots_2468 = 0x10028AA
-    KEY_braille_dots_12468 = 0x10028AB
-    KEY_braille_dots_3468 = 0x10028AC
-    KEY_braille_dots_13468 = 0x10028AD
-    KEY_braille_dots_23468 = 0x10028AE
-    KEY_braille_dots_123468 = 0x10028AF
-    KEY_braille_dots_568 = 0x10028B0
-    KEY_braille_dots_1568 = 0x10028B1
-    KEY_braille_dots_2568 = 0x10028B2
-    KEY_braille_dots_12568 = 0x10028B3
-    KEY_braille_dots_3568 = 0x10028B4
-    KEY_braille_dots_13568 = 0x10028B5
-    KEY_braille_dots_23568 = 0x10028B6
-    KEY_braille_dots_123568 = 0x10028B7
-    KEY_braille_dots_4568 = 0x10028B8
-    KEY_braille_dots_14568 = 0x10028B9
-    KEY_braille_dots_24568 = 0x10028BA
-    KEY_braille_dots_124568 = 0x10028BB
-    KEY_braille_dots_34568 = 0x10028BC
-    KEY_braille_dots_134568 = 0x10028BD
-    KEY_braille_dots_234568 = 0x10028BE
-    KEY_braille_dots_1234568 = 0x10028BF
-    KEY_braille_dots_78 = 0x10028C0
-    KEY_braille_dots_178 = 0x10028C1
-    KEY_braille_dots_278 = 0x10028C2
-    KEY_braille_dots_1278 = 0x10028C3
-    KEY_braille_dots_378 = 0x10028C4
-    KEY_braille_dots_1378 = 0x10028C5
-    KEY_braille_dots_2378 = 0x10028C6
-    KEY_braille_dots_12378 = 0x10028C7
-    KEY_braille_dots_478 = 0x10028C8
-    KEY_braille_dots_1478 = 0x10028C9
-    KEY_braille_dots_2478 = 0x10028CA
-    KEY_braille_dots_12478 = 0x10028CB
-    KEY_braille_dots_3478 = 0x10028CC
-    KEY_braille_dots_13478 = 0x10028CD
-    KEY_braille_dots_23478 = 0x10028CE
-    KEY_braille_dots_123478 = 0x10028CF
-    KEY_braille_dots_578 = 0x10028D0
-    KEY_braille_dots_1578 = 0x10028D1
-    KEY_braille_dots_2578 = 0x10028D2
-    KEY_braille_dots_12578 = 0x10028D3
-    KEY_braille_dots_3578 = 0x10028D4
-    KEY_braille_dots_13578 = 0x10028D5
-    KEY_braille_dots_23578 = 0x10028D6
-    KEY_braille_dots_123578 = 0x10028D7
-    KEY_braille_dots_4578 = 0x10028D8
-    KEY_braille_dots_14578 = 0x10028D9
-    KEY_braille_dots_24578 = 0x10028DA
-    KEY_braille_dots_124578 = 0x10028DB
-    KEY_braille_dots_34578 = 0x10028DC
-    KEY_braille_dots_134578 = 0x10028DD
-    KEY_braille_dots_234578 = 0x10028DE
-    KEY_braille_dots_1234578 = 0x10028DF
-    KEY_braille_dots_678 = 0x10028E0
-    KEY_braille_dots_1678 = 0x10028E1
-    KEY_braille_dots_2678 = 0x10028E2
-    KEY_braille_dots_12678 = 0x10028E3
-    KEY_braille_dots_3678 = 0x10028E4
-    KEY_braille_dots_13678 = 0x10028E5
-    KEY_braille_dots_23678 = 0x10028E6
-    KEY_braille_dots_123678 = 0x10028E7
-    KEY_braille_dots_4678 = 0x10028E8
-    KEY_braille_dots_14678 = 0x10028E9
-    KEY_braille_dots_24678 = 0x10028EA
-    KEY_braille_dots_124678 = 0x10028EB
-    KEY_braille_dots_34678 = 0x10028EC
-    KEY_braille_dots_134678 = 0x10028ED
-    KEY_braille_dots_234678 = 0x10028EE
-    KEY_braille_dots_1234678 = 0x10028EF
-    KEY_braille_dots_5678 = 0x10028F0
-    KEY_braille_dots_15678 = 0x10028F1
-    KEY_braille_dots_25678 = 0x10028F2
-    KEY_braille_dots_125678 = 0x10028F3
-    KEY_braille_dots_35678 = 0x10028F4
-    KEY_braille_dots_135678 = 0x10028F5
-    KEY_braille_dots_235678 = 0x10028F6
-    KEY_braille_dots_1235678 = 0x10028F7
-    KEY_braille_dots_45678 = 0x10028F8
-    KEY_braille_dots_145678 = 0x10028F9
-    KEY_braille_dots_245678 = 0x10028FA
-    KEY_braille_dots_1245678 = 0x10028FB
-    KEY_braille_dots_345678 = 0x10028FC
-    KEY_braille_dots_1345678 = 0x10028FD
-    KEY_braille_dots_2345678 = 0x10028FE
-    KEY_braille_dots_12345678 = 0x10028FF
-    KEY_Sinh_ng = 0x1000D82
-    KEY_Sinh_h2 = 0x1000D83
-    KEY_Sinh_a = 0x1000D85
-    KEY_Sinh_aa = 0x1000D86
-    KEY_Sinh_ae = 0x1000D87
-    KEY_Sinh_aee = 0x1000D88
-    KEY_Sinh_i = 0x1000D89
-    KEY_Sinh_ii = 0x1000D8A
-    KEY_Sinh_u = 0x1000D8B
-    KEY_Sinh_uu = 0x1000D8C
-    KEY_Sinh_ri = 0x1000D8D
-    KEY_Sinh_rii = 0x1000D8E
-    KEY_Sinh_lu = 0x1000D8F
-    KEY_Sinh_luu = 0x1000D90
-    KEY_Sinh_e = 0x1000D91
-    KEY_Sinh_ee = 0x1000D92
-    KEY_Sinh_ai = 0x1000D93
-    KEY_Sinh_o = 0x1000D94
-    KEY_Sinh_oo = 0x1000D95
-    KEY_Sinh_au = 0x1000D96
-    KEY_Sinh_ka = 0x1000D9A
-    KEY_Sinh_kha = 0x1000D9B
-    KEY_Sinh_ga = 0x1000D9C
-    KEY_Sinh_gha = 0x1000D9D
-    KEY_Sinh_ng2 = 0x1000D9E
-    KEY_Sinh_nga = 0x1000D9F
-    KEY_Sinh_ca = 0x1000DA0
-    KEY_Sinh_cha = 0x1000DA1
-    KEY_Sinh_ja = 0x1000DA2
-    KEY_Sinh_jha = 0x1000DA3
-    KEY_Sinh_nya = 0x1000DA4
-    KEY_Sinh_jnya = 0x1000DA5
-    KEY_Sinh_nja = 0x1000DA6
-    KEY_Sinh_tta = 0x1000DA7
-    KEY_Sinh_ttha = 0x1000DA8
-    KEY_Sinh_dda = 0x1000DA9
-    KEY_Sinh_ddha = 0x1000DAA
-    KEY_Sinh_nna = 0x1000DAB
-    KEY_Sinh_ndda = 0x1000DAC
-    KEY_Sinh_tha = 0x1000DAD
-    KEY_Sinh_thha = 0x1000DAE
-    KEY_Sinh_dha = 0x1000DAF
-    KEY_Sinh_dhha = 0x1000DB0
-    KEY_Sinh_na = 0x1000DB1
-    KEY_Sinh_ndha = 0x1000DB3
-    KEY_Sinh_pa = 0x1000DB4
-    KEY_Sinh_pha = 0x1000DB5
-    KEY_Sinh_ba = 0x1000DB6
-    KEY_Sinh_bha = 0x1000DB7
-    KEY_Sinh_ma = 0x1000DB8
-    KEY_Sinh_mba = 0x1000DB9
-    KEY_Sinh_ya = 0x1000DBA
-    KEY_Sinh_ra = 0x1000DBB
-    KEY_Sinh_la = 0x1000DBD
-    KEY_Sinh_va = 0x1000DC0
-    KEY_Sinh_sha = 0x1000DC1
-    KEY_Sinh_ssha = 0x1000DC2
-    KEY_Sinh_sa = 0x1000DC3
-    KEY_Sinh_ha = 0x1000DC4
-    KEY_Sinh_lla = 0x1000DC5
-    KEY_Sinh_fa = 0x1000DC6
-    KEY_Sinh_al = 0x1000DCA
-    KEY_Sinh_aa2 = 0x1000DCF
-    KEY_Sinh_ae2 = 0x1000DD0
-    KEY_Sinh_aee2 = 0x1000DD1
-    KEY_Sinh_i2 = 0x1000DD2
-    KEY_Sinh_ii2 = 0x1000DD3
-    KEY_Sinh_u2 = 0x1000DD4
-    KEY_Sinh_uu2 = 0x1000DD6
-    KEY_Sinh_ru2 = 0x1000DD8
-    KEY_Sinh_e2 = 0x1000DD9
-    KEY_Sinh_ee2 = 0x1000DDA
-    KEY_Sinh_ai2 = 0x1000DDB
-    KEY_Sinh_o2 = 0x1000DDC
-    KEY_Sinh_oo2 = 0x1000DDD
-    KEY_Sinh_au2 = 0x1000DDE
-    KEY_Sinh_lu2 = 0x1000DDF
-    KEY_Sinh_ruu2 = 0x1000DF2
-    KEY_Sinh_luu2 = 0x1000DF3
-    KEY_Sinh_kunddaliya = 0x1000DF4
-    KEY_ModeLock = 0x1008FF01
-    KEY_MonBrightnessUp = 0x1008FF02
-    KEY_MonBrightnessDown = 0x1008FF03
-    KEY_KbdLightOnOff = 0x1008FF04
-    KEY_KbdBrightnessUp = 0x1008FF05
-    KEY_KbdBrightnessDown = 0x1008FF06
-    KEY_Standby = 0x1008FF10
-    KEY_AudioLowerVolume = 0x1008FF11
-    KEY_AudioMute = 0x1008FF12
-    KEY_AudioRaiseVolume = 0x1008FF13
-    KEY_AudioPlay = 0x1008FF14
-    KEY_AudioStop = 0x1008FF15
-    KEY_AudioPrev = 0x1008FF16
-    KEY_AudioNext = 0x1008FF17
-    KEY_HomePage = 0x1008FF18
-    KEY_Mail = 0x1008FF19
-    KEY_Start = 0x1008FF1A
-    KEY_Search = 0x1008FF1B
-    KEY_AudioRecord = 0x1008FF1C
-    KEY_Calculator = 0x1008FF1D
-    KEY_Memo = 0x1008FF1E
-    KEY_ToDoList = 0x1008FF1F
-    KEY_Calendar = 0x1008FF20
-    KEY_PowerDown = 0x1008FF21
-    KEY_ContrastAdjust = 0x1008FF22
-    KEY_RockerUp = 0x1008FF23
-    KEY_RockerDown = 0x1008FF24
-    KEY_RockerEnter = 0x1008FF25
-    KEY_Back = 0x1008FF26
-    KEY_Forward = 0x1008FF27
-    KEY_Stop = 0x1008FF28
-    KEY_Refresh = 0x1008FF29
-    KEY_PowerOff = 0x1008FF2A
-    KEY_WakeUp = 0x1008FF2B
-    KEY_Eject = 0x1008FF2C
-    KEY_ScreenSaver = 0x1008FF2D
-    KEY_WWW = 0x1008FF2E
-    KEY_Sleep = 0x1008FF2F
-    KEY_Favorites = 0x1008FF30
-    KEY_AudioPause = 0x1008FF31
-    KEY_AudioMedia = 0x1008FF32
-    KEY_MyComputer = 0x1008FF33
-    KEY_VendorHome = 0x1008FF34
-    KEY_LightBulb = 0x1008FF35
-    KEY_Shop = 0x1008FF36
-    KEY_History = 0x1008FF37
-    KEY_OpenURL = 0x1008FF38
-    KEY_AddFavorite = 0x1008FF39
-    KEY_HotLinks = 0x1008FF3A
-    KEY_BrightnessAdjust = 0x1008FF3B
-    KEY_Finance = 0x1008FF3C
-    KEY_Community = 0x1008FF3D
-    KEY_AudioRewind = 0x1008FF3E
-    KEY_BackForward = 0x1008FF3F
-    KEY_Launch0 = 0x1008FF40
-    KEY_Launch1 = 0x1008FF41
-    KEY_Launch2 = 0x1008FF42
-    KEY_Launch3 = 0x1008FF43
-    KEY_Launch4 = 0x1008FF44
-    KEY_Launch5 = 0x1008FF45
-    KEY_Launch6 = 0x1008FF46
-    KEY_Launch7 = 0x1008FF47
-    KEY_Launch8 = 0x1008FF48
-    KEY_Launch9 = 0x1008FF49
-    KEY_LaunchA = 0x1008FF4A
-    KEY_LaunchB = 0x1008FF4B
-    KEY_LaunchC = 0x1008FF4C
-    KEY_LaunchD = 0x1008FF4D
-    KEY_LaunchE = 0x1008FF4E
-    KEY_LaunchF = 0x1008FF4F
-    KEY_ApplicationLeft = 0x1008FF50
-    KEY_ApplicationRight = 0x1008FF51
-    KEY_Book = 0x1008FF52
-    KEY_CD = 0x1008FF53
-    KEY_WindowClear = 0x1008FF55
-    KEY_Close = 0x1008FF56
-    KEY_Copy = 0x1008FF57
-    KEY_Cut = 0x1008FF58
-    KEY_Display = 0x1008FF59
-    KEY_DOS = 0x1008FF5A
-    KEY_Documents = 0x1008FF5B
-    KEY_Excel = 0x1008FF5C
-    KEY_Explorer = 0x1008FF5D
-    KEY_Game = 0x1008FF5E
-    KEY_Go = 0x1008FF5F
-    KEY_iTouch = 0x1008FF60
-    KEY_LogOff = 0x1008FF61
-    KEY_Market = 0x1008FF62
-    KEY_Meeting = 0x1008FF63
-    KEY_MenuKB = 0x1008FF65
-    KEY_MenuPB = 0x1008FF66
-    KEY_MySites = 0x1008FF67
-    KEY_New = 0x1008FF68
-    KEY_News = 0x1008FF69
-    KEY_OfficeHome = 0x1008FF6A
-    KEY_Open = 0x1008FF6B
-    KEY_Option = 0x1008FF6C
-    KEY_Paste = 0x1008FF6D
-    KEY_Phone = 0x1008FF6E
-    KEY_Reply = 0x1008FF72
-    KEY_Reload = 0x1008FF73
-    KEY_RotateWindows = 0x1008FF74
-    KEY_RotationPB = 0x1008FF75
-    KEY_RotationKB = 0x1008FF76
-    KEY_Save = 0x1008FF77
-    KEY_ScrollUp = 0x1008FF78
-    KEY_ScrollDown = 0x1008FF79
-    KEY_ScrollClick = 0x1008FF7A
-    KEY_Send = 0x1008FF7B
-    KEY_Spell = 0x1008FF7C
-    KEY_SplitScreen = 0x1008FF7D
-    KEY_Support = 0x1008FF7E
-    KEY_TaskPane = 0x1008FF7F
-    KEY_Terminal = 0x1008FF80
-    KEY_Tools = 0x1008FF81
-    KEY_Travel = 0x1008FF82
-    KEY_UserPB = 0x1008FF84
-    KEY_User1KB = 0x1008FF85
-    KEY_User2KB = 0x1008FF86
-    KEY_Video = 0x1008FF87
-    KEY_WheelButton = 0x1008FF88
-    KEY_Word = 0x1008FF89
-    KEY_Xfer = 0x1008FF8A
-    KEY_ZoomIn = 0x1008FF8B
-    KEY_ZoomOut = 0x1008FF8C
-    KEY_Away = 0x1008FF8D
-    KEY_Messenger = 0x1008FF8E
-    KEY_WebCam = 0x1008FF8F
-    KEY_MailForward = 0x1008FF90
-    KEY_Pictures = 0x1008FF91
-    KEY_Music = 0x1008FF92
-    KEY_Battery = 0x1008FF93
-    KEY_Bluetooth = 0x1008FF94
-    KEY_WLAN = 0x1008FF95
-    KEY_UWB = 0x1008FF96
-    KEY_AudioForward = 0x1008FF97
-    KEY_AudioRepeat = 0x1008FF98
-    KEY_AudioRandomPlay = 0x1008FF99
-    KEY_Subtitle = 0x1008FF9A
-    KEY_AudioCycleTrack = 0x1008FF9B
-    KEY_CycleAngle = 0x1008FF9C
-    KEY_FrameBack = 0x1008FF9D
-    KEY_FrameForward = 0x1008FF9E
-    KEY_Time = 0x1008FF9F
-    KEY_SelectButton = 0x1008FFA0
-    KEY_View = 0x1008FFA1
-    KEY_TopMenu = 0x1008FFA2
-    KEY_Red = 0x1008FFA3
-    KEY_Green = 0x1008FFA4
-    KEY_Yellow = 0x1008FFA5
-    KEY_Blue = 0x1008FFA6
-    KEY_Suspend = 0x1008FFA7
-    KEY_Hibernate = 0x1008FFA8
-    KEY_TouchpadToggle = 0x1008FFA9
-    KEY_TouchpadOn = 0x1008FFB0
-    KEY_TouchpadOff = 0x1008FFB1
-    KEY_AudioMicMute = 0x1008FFB2
-    KEY_Switch_VT_1 = 0x1008FE01
-    KEY_Switch_VT_2 = 0x1008FE02
-    KEY_Switch_VT_3 = 0x1008FE03
-    KEY_Switch_VT_4 = 0x1008FE04
-    KEY_Switch_VT_5 = 0x1008FE05
-    KEY_Switch_VT_6 = 0x1008FE06
-    KEY_Switch_VT_7 = 0x1008FE07
-    KEY_Switch_VT_8 = 0x1008FE08
-    KEY_Switch_VT_9 = 0x1008FE09
-    KEY_Switch_VT_10 = 0x1008FE0A
-    KEY_Switch_VT_11 = 0x1008FE0B
-    KEY_Switch_VT_12 = 0x1008FE0C
-    KEY_Ungrab = 0x1008FE20
-    KEY_ClearGrab = 0x1008FE21
-    KEY_Next_VMode = 0x1008FE22
-    KEY_Prev_VMode = 0x1008FE23
-    KEY_LogWindowTree = 0x1008FE24
-    KEY_LogGrabInfo = 0x1008FE25
+    KeyVal = enum.IntEnum("KeyVal", list(zip(NAMES, VALUES)), module=__name__)
+    KeyVal.__doc__ = "A lookup table of all symbolic key codes in GNOME."
+    return KeyVal
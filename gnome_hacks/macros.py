@@ -0,0 +1,175 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Tuple, Union
+
+from ._timeline import (
+    EVENT_SIZE,
+    TIMELINE_JS,
+    encode_packed,
+    pack_events,
+    timeline_duration_ms,
+)
+from .evaluator import Evaluator, EvaluatorJavaScriptError
+from .input import InputEvent
+
+# The most events the shell keeps across all macros. Beyond this, the least
+# recently used macros are evicted, and are uploaded again when next used.
+MAX_CACHED_EVENTS = 1000000
+
+_MISSING_MACRO = "GnomeHacksMissingMacro"
+
+
+@dataclass
+class Macro:
+    """
+    A sequence of input events which can be replayed by handle.
+
+    The handle is a hash of the events, so uploading the same sequence twice
+    gives the same macro.
+    """
+
+    handle: str
+    events: str  # the packed events, in base64.
+    count: int  # the number of events.
+    duration_ms: int  # the total delay of the events at normal speed.
+
+
+def create_macro(*events: InputEvent) -> Macro:
+    """
+    Create a macro without uploading it. It is uploaded when first replayed.
+    """
+    packed = pack_events(events)
+    data = encode_packed(packed)
+    return Macro(
+        handle="m" + hashlib.sha1(data.encode("ascii")).hexdigest()[:20],
+        events=data,
+        count=len(packed) // EVENT_SIZE,
+        duration_ms=timeline_duration_ms(packed),
+    )
+
+
+def upload_macro(e: Evaluator, *events: InputEvent) -> Macro:
+    """
+    Upload a sequence of key and pointer events into the shell.
+
+    :param e: the script evaluator.
+    :param events: KeyEvent, PointerMove, PointerButton and PointerScroll
+                   objects, as accepted by simulate_input().
+    :return: a macro which can be passed to replay_macro().
+    """
+    macro = create_macro(*events)
+    e.call_function(
+        TIMELINE_JS + _STORE_JS + "store(handle, decodeEvents(events));",
+        handle=macro.handle,
+        events=macro.events,
+        max_events=MAX_CACHED_EVENTS,
+    )
+    return macro
+
+
+def replay_macro(
+    e: Evaluator,
+    macro: Macro,
+    offset: Tuple[Union[int, float], Union[int, float]] = (0, 0),
+    speed: float = 1.0,
+):
+    """
+    Replay an uploaded macro.
+
+    Only the handle and replay options are sent. If the shell no longer has
+    the macro, e.g. because it restarted or evicted the macro, the events
+    are uploaded again as part of the same call.
+
+    :param e: the script evaluator.
+    :param macro: the macro to replay.
+    :param offset: an (x, y) offset added to every pointer motion.
+    :param speed: a factor by which to speed up the macro's delays.
+    """
+    if speed <= 0:
+        raise ValueError(f"speed must be positive, got {speed}")
+    duration = int(macro.duration_ms / speed)
+    kwargs = dict(
+        handle=macro.handle,
+        opts=dict(dx=offset[0], dy=offset[1], speed=speed),
+        max_events=MAX_CACHED_EVENTS,
+    )
+    if duration:
+        script = _REPLAY_JS + "await runTimeline(lookup(handle, events), opts);"
+        call = e.with_timeout(e.timeout_ms + duration).call_async_function
+    else:
+        script = _REPLAY_JS + "runEvents(lookup(handle, events), opts);"
+        call = e.call_function
+    try:
+        call(script, events=None, **kwargs)
+        return
+    except EvaluatorJavaScriptError as exc:
+        if _MISSING_MACRO not in exc.message:
+            raise
+    call(script, events=macro.events, **kwargs)
+
+
+def forget_macro(e: Evaluator, macro: Macro):
+    """
+    Remove a macro from the shell's cache.
+    """
+    e.call_function(_FORGET_JS, handle=macro.handle)
+
+
+_STORE_JS = """
+if (!global._gnomeHacksMacros) {
+    global._gnomeHacksMacros = {entries: new Map(), size: 0};
+}
+const macros = global._gnomeHacksMacros;
+
+// Map iterates in insertion order, so re-inserting a macro on every use
+// keeps the least recently used macros first.
+const store = (handle, events) => {
+    if (macros.entries.has(handle)) {
+        macros.size -= macros.entries.get(handle).length / EVENT_SIZE;
+        macros.entries.delete(handle);
+    }
+    macros.entries.set(handle, events);
+    macros.size += events.length / EVENT_SIZE;
+    for (const [oldHandle, oldEvents] of macros.entries) {
+        if (macros.size <= max_events || oldHandle === handle) {
+            break;
+        }
+        macros.entries.delete(oldHandle);
+        macros.size -= oldEvents.length / EVENT_SIZE;
+    }
+};
+"""
+
+_REPLAY_JS = (
+    TIMELINE_JS
+    + _STORE_JS
+    + """
+const lookup = (handle, events) => {
+    if (events) {
+        const decoded = decodeEvents(events);
+        store(handle, decoded);
+        return decoded;
+    }
+    const cached = macros.entries.get(handle);
+    if (!cached) {
+        throw new Error('"""
+    + _MISSING_MACRO
+    + """: ' + handle);
+    }
+    store(handle, cached);
+    return cached;
+};
+"""
+)
+
+_FORGET_JS = (
+    """
+const macros = global._gnomeHacksMacros;
+if (macros && macros.entries.has(handle)) {
+    macros.size -= macros.entries.get(handle).length / """
+    + str(EVENT_SIZE)
+    + """;
+    macros.entries.delete(handle);
+}
+"""
+)
@@ -0,0 +1,191 @@
+import time
+import uuid
+from dataclasses import dataclass
+from typing import List, Optional
+
+from ._utils import notify_expr
+from .evaluator import Evaluator, EvaluatorJavaScriptError, map_result
+from .windows import Rect
+
+
+@dataclass
+class MonitorInfo:
+    index: int
+    geometry: Rect
+    scale: float
+    primary: bool
+
+    # The part of the monitor not covered by panels or docks, on the active
+    # workspace.
+    work_area: Rect
+
+    def contains(self, x: int, y: int) -> bool:
+        g = self.geometry
+        return g.x <= x < g.x + g.width and g.y <= y < g.y + g.height
+
+
+def list_monitors(e: Evaluator) -> List[MonitorInfo]:
+    """
+    Get the layout of all monitors in one call.
+    """
+    return map_result(
+        e.call_function(_LIST_SCRIPT, key=None, notify_dest=None), _parse_monitors
+    )
+
+
+class MonitorCache:
+    """
+    A local cache of the monitor layout.
+
+    Each fetch asks the shell to send this process a D-Bus signal the next
+    time the monitors, the work areas or the active workspace change, so the
+    cache is only refetched after a change and lookups are otherwise answered
+    locally. The cache is also invalidated if the shell restarts. On shells
+    that cannot emit signals, the layout is refetched when it is older than
+    fallback_max_age_ms.
+    """
+
+    def __init__(self, e: Evaluator, fallback_max_age_ms: int = 1000):
+        self.e = e
+        self.fallback_max_age_ms = fallback_max_age_ms
+        self.key = f"m{uuid.uuid4().hex}"
+        self.fetched_at: Optional[float] = None
+        self._monitors: Optional[List[MonitorInfo]] = None
+        self._waiter = e.listen(self.key)
+        self._owner_changes = 0
+
+    def __enter__(self) -> "MonitorCache":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        """
+        Stop listening for changes in the shell.
+        """
+        self._waiter.close()
+        try:
+            self.e.call_function(_UNWATCH_SCRIPT, key=self.key)
+        except EvaluatorJavaScriptError:
+            pass
+
+    def invalidate(self):
+        """
+        Force the next lookup to refetch the layout.
+        """
+        self._monitors = None
+
+    def is_valid(self) -> bool:
+        """
+        Check if the cached layout is up to date, without blocking.
+        """
+        if self._monitors is None:
+            return False
+        if self._waiter.destination is None:
+            age_ms = (time.monotonic() - self.fetched_at) * 1000
+            return age_ms <= self.fallback_max_age_ms
+        changed = False
+        while self._waiter.poll() is not None:
+            changed = True
+        # The shell restarted, so its watch for this cache is gone.
+        changed = changed or self._waiter.owner_changes != self._owner_changes
+        if changed:
+            self._monitors = None
+        return not changed
+
+    def monitors(self) -> List[MonitorInfo]:
+        """
+        Get all monitors, fetching them first if the cache is invalid.
+        """
+        if not self.is_valid():
+            self._owner_changes = self._waiter.owner_changes
+            self._monitors = _parse_monitors(
+                self.e.call_function(
+                    _LIST_SCRIPT, key=self.key, notify_dest=self._waiter.destination
+                )
+            )
+            self.fetched_at = time.monotonic()
+        return list(self._monitors)
+
+    def primary(self) -> Optional[MonitorInfo]:
+        return next((m for m in self.monitors() if m.primary), None)
+
+    def monitor_at(self, x: int, y: int) -> Optional[MonitorInfo]:
+        """
+        Get the monitor containing a point in global coordinates.
+        """
+        return next((m for m in self.monitors() if m.contains(x, y)), None)
+
+
+def _parse_monitors(result: List[dict]) -> List[MonitorInfo]:
+    return [
+        MonitorInfo(
+            index=m["index"],
+            geometry=Rect(**m["geometry"]),
+            scale=m["scale"],
+            primary=m["primary"],
+            work_area=Rect(**m["work_area"]),
+        )
+        for m in result
+    ]
+
+
+_LIST_SCRIPT = (
+    """
+const Meta = imports.gi.Meta;
+const display = global.display;
+const workspaceManager = global.workspace_manager;
+if (notify_dest) {
+    if (!global._gnomeHacksMonitorWatches) {
+        global._gnomeHacksMonitorWatches = {};
+    }
+    const watches = global._gnomeHacksMonitorWatches;
+    if (!watches[key]) {
+        const notify = """
+    + notify_expr()
+    + """;
+        const manager = global.backend && global.backend.get_monitor_manager
+            ? global.backend.get_monitor_manager()
+            : Meta.MonitorManager.get();
+        const signals = [
+            [manager, manager.connect('monitors-changed', () => fire())],
+            [display, display.connect('workareas-changed', () => fire())],
+            [workspaceManager, workspaceManager.connect(
+                'active-workspace-changed', () => fire())],
+        ];
+        const disarm = () => {
+            signals.forEach(([obj, id]) => obj.disconnect(id));
+            delete watches[key];
+        };
+        const fire = () => {
+            disarm();
+            notify(notify_dest, key, '');
+        };
+        watches[key] = {disarm: disarm};
+    }
+}
+
+const rect = (r) => ({x: r.x, y: r.y, width: r.width, height: r.height});
+const workspace = workspaceManager.get_active_workspace();
+const primary = display.get_primary_monitor();
+const result = [];
+for (let i = 0; i < display.get_n_monitors(); i++) {
+    result.push({
+        index: i,
+        geometry: rect(display.get_monitor_geometry(i)),
+        scale: display.get_monitor_scale(i),
+        primary: i === primary,
+        work_area: rect(workspace.get_work_area_for_monitor(i)),
+    });
+}
+return result;
+"""
+)
+
+_UNWATCH_SCRIPT = """
+const watch = (global._gnomeHacksMonitorWatches || {})[key];
+if (watch) {
+    watch.disarm();
+}
+"""
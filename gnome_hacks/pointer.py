@@ -1,11 +1,27 @@
+import random
 from dataclasses import dataclass
-from typing import Any, Dict, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 
-from ._utils import reusable_device_expr
+from ._timeline import (
+    EVENT_BUTTON,
+    EVENT_MOVE,
+    EVENT_SCROLL,
+    EVENT_SMOOTH_SCROLL,
+    TIMELINE_JS,
+    pack_events,
+    run_timeline,
+    to_fixed_point,
+)
+from ._utils import DATACLASS_SLOTS
 from .evaluator import Evaluator
 
+Point = Tuple[Union[int, float], Union[int, float]]
 
-@dataclass
+# Shapes of the paths generated by glide_pointer() and drag().
+PATH_KINDS = ("linear", "bezier", "human")
+
+
+@dataclass(**DATACLASS_SLOTS)
 class PointerMove:
     x: Union[int, float]
     y: Union[int, float]
@@ -14,8 +30,16 @@ class PointerMove:
     def encode_pointer_event(self) -> Dict[str, Any]:
         return dict(move=dict(x=self.x, y=self.y, delay_ms=self.delay_ms))
 
+    def pack_event(self) -> Tuple[int, int, int, int]:
+        return (
+            EVENT_MOVE,
+            to_fixed_point(self.x),
+            to_fixed_point(self.y),
+            int(self.delay_ms),
+        )
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PointerButton:
     pressed: bool
     button: int = 1
@@ -28,50 +52,253 @@ class PointerButton:
             )
         )
 
+    def pack_event(self) -> Tuple[int, int, int, int]:
+        return (EVENT_BUTTON, self.button, int(self.pressed), int(self.delay_ms))
 
-def simulate_pointer_events(e: Evaluator, *events: Union[PointerMove, PointerButton]):
-    code = (
-        """
-    const Clutter = imports.gi.Clutter;
-    const GLib = imports.gi.GLib;
 
-    const dev = """
-        + reusable_device_expr("POINTER_DEVICE")
-        + """;
+@dataclass(**DATACLASS_SLOTS)
+class PointerScroll:
+    # Scroll amounts. Positive values scroll down and right. Unless smooth is
+    # True, these are whole numbers of mouse wheel clicks.
+    dx: Union[int, float] = 0
+    dy: Union[int, float] = 0
 
-    const waitPromise = (ms) => {
-        return new Promise((resolve, reject) => {
-            GLib.timeout_add(GLib.PRIORITY_DEFAULT, ms, () => resolve(null));
-        });
-    };
+    # If True, send a continuous scroll (e.g. from a touchpad) by dx and dy.
+    smooth: bool = False
 
-    for (let i = 0; i < events.length; i++) {
-        const e = events[i];
-        if (e.button) {
-            // For some reason, some click events don't work if they are
-            // directly after a mouse movement, so clicks can have a delay
-            // before them.
-            await waitPromise(e.button.delay_ms);
-
-            dev.notify_button(
-                0,
-                e.button.button,
-                e.button.pressed ? Clutter.ButtonState.PRESSED : Clutter.ButtonState.RELEASED,
-            );
-        } else if (e.move) {
-            dev.notify_absolute_motion(0, e.move.x, e.move.y);
-
-            // For some reason, some click events don't work if they are
-            // directly after a mouse movement, so mouse movements can have
-            // a delay before them.
-            await waitPromise(e.move.delay_ms);
-        }
-    }
+    delay_ms: int = 0  # how long to wait after the event.
+
+    def encode_pointer_event(self) -> Dict[str, Any]:
+        self._check()
+        return dict(
+            scroll=dict(
+                dx=self.dx, dy=self.dy, smooth=self.smooth, delay_ms=self.delay_ms
+            )
+        )
+
+    def pack_event(self) -> Tuple[int, int, int, int]:
+        self._check()
+        return (
+            EVENT_SMOOTH_SCROLL if self.smooth else EVENT_SCROLL,
+            to_fixed_point(self.dx),
+            to_fixed_point(self.dy),
+            int(self.delay_ms),
+        )
+
+    def _check(self):
+        if not self.smooth and (self.dx != int(self.dx) or self.dy != int(self.dy)):
+            raise ValueError(f"discrete scrolls must be whole numbers, got {self}")
+
+
+PointerEvent = Union[PointerMove, PointerButton, PointerScroll]
+
+
+def simulate_pointer_events(
+    e: Evaluator,
+    *events: PointerEvent,
+    progress: Optional[Callable[[int, int], None]] = None,
+):
+    """
+    Trigger a sequence of pointer events in one call.
+
+    The events are sent as a packed array of integers, with coordinates in
+    fixed point, so even long paths make small requests. The call's timeout
+    is extended by the exact duration of all delays, and very long
+    sequences are streamed to the shell in chunks as they run.
+
+    To mix key and pointer events, see simulate_input().
+
+    :param progress: called with (events done, total events) as the
+                     sequence runs.
+    """
+    run_timeline(e, pack_events(events), progress=progress)
+
+
+def glide_pointer(
+    e: Evaluator,
+    end: Point,
+    duration_ms: int = 250,
+    path: str = "linear",
+    start: Optional[Point] = None,
+    control_points: Sequence[Point] = (),
+    easing: str = "ease-in-out-quad",
+    seed: Optional[int] = None,
+):
     """
+    Move the pointer smoothly along a path.
+
+    The shell generates the intermediate positions itself on a Clutter
+    timeline, so there is one motion event per frame and only the path's
+    parameters are sent.
+
+    :param e: the script evaluator.
+    :param end: where the pointer ends up.
+    :param duration_ms: how long the motion takes.
+    :param path: one of PATH_KINDS. "linear" moves in a straight line,
+                 "bezier" follows a Bézier curve through control_points, and
+                 "human" follows a randomly bent curve with a minimum-jerk
+                 speed profile and a little tremor.
+    :param start: where the motion starts, or None to start at the current
+                  pointer position.
+    :param control_points: the control points of a "bezier" path.
+    :param easing: the name of a Clutter.AnimationMode to apply to "linear"
+                   and "bezier" paths, such as "linear" or "ease-out-cubic".
+    :param seed: the random seed of a "human" path.
+    """
+    e.with_timeout(e.timeout_ms + duration_ms).call_async_function(
+        _PATH_JS + """
+    const from = start || global.get_pointer().slice(0, 2);
+    await glide(makePath(kind, from, end, control_points, seed), duration_ms, mode);
+    """,
+        **_path_args(path, start, end, control_points, easing, seed),
+        duration_ms=duration_ms,
+    )
+
+
+def drag(
+    e: Evaluator,
+    start: Point,
+    end: Point,
+    duration_ms: int = 500,
+    button: int = 1,
+    path: str = "linear",
+    control_points: Sequence[Point] = (),
+    easing: str = "ease-in-out-quad",
+    seed: Optional[int] = None,
+    press_delay_ms: int = 100,
+    release_delay_ms: int = 50,
+):
+    """
+    Drag from one point to another with a button held down.
+
+    The pointer moves to start, presses the button after press_delay_ms,
+    glides to end like glide_pointer(), and releases the button after
+    release_delay_ms. The button is released even if the motion fails.
+    """
+    e.with_timeout(
+        e.timeout_ms + press_delay_ms + duration_ms + release_delay_ms
+    ).call_async_function(
+        _PATH_JS + """
+    const ButtonState = Clutter.ButtonState;
+    pointer().notify_absolute_motion(0, start[0], start[1]);
+    await waitUntil(GLib.get_monotonic_time(), press_delay_ms);
+    pointer().notify_button(0, button, ButtonState.PRESSED);
+    try {
+        await glide(makePath(kind, start, end, control_points, seed), duration_ms, mode);
+        await waitUntil(GLib.get_monotonic_time(), release_delay_ms);
+    } finally {
+        pointer().notify_button(0, button, ButtonState.RELEASED);
+    }
+    """,
+        **_path_args(path, start, end, control_points, easing, seed),
+        duration_ms=duration_ms,
+        button=button,
+        press_delay_ms=press_delay_ms,
+        release_delay_ms=release_delay_ms,
     )
-    total_delay = sum(x.delay_ms if isinstance(x, PointerMove) else 0 for x in events)
-    delay = total_delay
-    e.with_timeout(e.timeout_ms + delay).call_async(
-        code,
-        events=[x.encode_pointer_event() for x in events],
+
+
+def _path_args(
+    path: str,
+    start: Optional[Point],
+    end: Point,
+    control_points: Sequence[Point],
+    easing: str,
+    seed: Optional[int],
+) -> Dict[str, Any]:
+    if path not in PATH_KINDS:
+        raise ValueError(f"unknown path kind {path!r}, expected one of {PATH_KINDS}")
+    if seed is None:
+        seed = random.getrandbits(32)
+    return dict(
+        kind=path,
+        start=None if start is None else list(start),
+        end=list(end),
+        control_points=[list(x) for x in control_points],
+        mode="LINEAR" if path == "human" else easing.upper().replace("-", "_"),
+        seed=seed,
     )
+
+
+_PATH_JS = TIMELINE_JS + """
+if (typeof Clutter.AnimationMode[mode] === 'undefined') {
+    throw new Error('unknown easing mode: ' + mode);
+}
+
+// A small seeded PRNG (mulberry32), so paths can be reproduced.
+const seededRandom = (a) => () => {
+    a = (a + 0x6D2B79F5) | 0;
+    let t = Math.imul(a ^ (a >>> 15), 1 | a);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+};
+
+// Evaluate a Bézier curve at t with de Casteljau's algorithm.
+const bezierPoint = (points, t) => {
+    let pts = points;
+    while (pts.length > 1) {
+        const next = [];
+        for (let i = 0; i + 1 < pts.length; i++) {
+            next.push([
+                pts[i][0] + (pts[i + 1][0] - pts[i][0]) * t,
+                pts[i][1] + (pts[i + 1][1] - pts[i][1]) * t,
+            ]);
+        }
+        pts = next;
+    }
+    return pts[0];
+};
+
+// Create a function mapping progress in [0, 1] to a point on a path.
+const makePath = (kind, from, to, controls, seed) => {
+    if (kind === 'linear') {
+        return (t) => bezierPoint([from, to], t);
+    }
+    if (kind === 'bezier') {
+        const points = [from].concat(controls, [to]);
+        return (t) => bezierPoint(points, t);
+    }
+    const random = seededRandom(seed);
+    const dx = to[0] - from[0];
+    const dy = to[1] - from[1];
+    const dist = Math.hypot(dx, dy);
+    const normal = dist ? [-dy / dist, dx / dist] : [0, 0];
+    const control = (f) => {
+        const bend = (random() - 0.5) * 0.3 * dist;
+        return [from[0] + dx * f + normal[0] * bend, from[1] + dy * f + normal[1] * bend];
+    };
+    const points = [from, control(1 / 3), control(2 / 3), to];
+    const tremor = Math.min(1, dist / 200);
+    return (t) => {
+        // A minimum-jerk speed profile: slow start, fast middle, slow end.
+        const s = t * t * t * (10 - 15 * t + 6 * t * t);
+        const p = bezierPoint(points, s);
+        const amplitude = tremor * Math.sin(Math.PI * t);
+        return [p[0] + (random() - 0.5) * amplitude, p[1] + (random() - 0.5) * amplitude];
+    };
+};
+
+// Move the pointer along a path, once per frame of the stage.
+const glide = (path, durationMs, mode) => {
+    const move = (t) => {
+        const p = path(t);
+        pointer().notify_absolute_motion(0, p[0], p[1]);
+    };
+    if (durationMs <= 0) {
+        move(1);
+        return Promise.resolve();
+    }
+    const timeline = Clutter.Timeline.new_for_actor
+        ? Clutter.Timeline.new_for_actor(global.stage, durationMs)
+        : new Clutter.Timeline({duration: durationMs});
+    timeline.set_progress_mode(Clutter.AnimationMode[mode]);
+    return new Promise((resolve) => {
+        timeline.connect('new-frame', () => move(timeline.get_progress()));
+        timeline.connect('completed', () => {
+            move(1);
+            resolve();
+        });
+        timeline.start();
+    });
+};
+"""
@@ -1,10 +1,91 @@
 import base64
+import mmap
 import os
 import time
 import uuid
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
-from .evaluator import Evaluator, EvaluatorJavaScriptError
+from ._utils import private_shm_dir
+from .evaluator import Evaluator, EvaluatorJavaScriptError, map_result
+
+# Defines capturePixbuf(opts), which takes a screenshot as a GdkPixbuf.
+# Older shells can only write PNG files, so opts.staging_path is used as a
+# temporary file on those. Shell.Screenshot only produces PNG data, which is
+# decoded in a GdkPixbuf worker thread so the compositor's main loop is not
+# blocked. Also defines writeBytes(path, bytes), which writes a GLib.Bytes
+# to a file in a GIO worker thread.
+_CAPTURE_PIXBUF_JS = """
+const Shell = imports.gi.Shell;
+const GLib = imports.gi.GLib;
+const Gio = imports.gi.Gio;
+const GdkPixbuf = imports.gi.GdkPixbuf;
+const decodePixbuf = (input) => new Promise((resolve, reject) => {
+    GdkPixbuf.Pixbuf.new_from_stream_async(input, null, (_, asyncResult) => {
+        try {
+            resolve(GdkPixbuf.Pixbuf.new_from_stream_finish(asyncResult));
+        } catch (e) {
+            reject(e);
+        }
+    });
+});
+const writeBytes = (path, bytes) => new Promise((resolve, reject) => {
+    Gio.File.new_for_path(path).replace_contents_bytes_async(
+        bytes,
+        null,
+        false,
+        Gio.FileCreateFlags.NONE,
+        null,
+        (file, asyncResult) => {
+            try {
+                file.replace_contents_finish(asyncResult);
+                resolve();
+            } catch (e) {
+                reject(e);
+            }
+        },
+    );
+});
+const capturePixbuf = (opts) => new Promise((resolve, reject) => {
+    const ss = new Shell.Screenshot();
+    const useStream = !!ss.screenshot_finish;
+    const output = useStream ? Gio.MemoryOutputStream.new_resizable() : opts.staging_path;
+    const done = (load) => {
+        try {
+            load().then(resolve, reject);
+        } catch (e) {
+            reject(e);
+        }
+    };
+    let cb;
+    if (useStream) {
+        cb = (_, asyncResult) => done(() => {
+            ss.screenshot_finish(asyncResult);
+            output.close(null);
+            return decodePixbuf(Gio.MemoryInputStream.new_from_bytes(output.steal_as_bytes()));
+        });
+    } else {
+        cb = (_, success, _area, filename) => done(() => {
+            if (!success) {
+                throw new Error('screenshot failed');
+            }
+            const file = Gio.File.new_for_path(filename);
+            const input = file.read(null);
+            return decodePixbuf(input).finally(() => {
+                input.close(null);
+                file.delete(null);
+            });
+        });
+    }
+    if (opts.area) {
+        const a = opts.area;
+        ss.screenshot_area(a[0], a[1], a[2], a[3], output, cb);
+    } else if (opts.window) {
+        ss.screenshot_window(opts.include_frame, opts.include_cursor, output, cb);
+    } else {
+        ss.screenshot(opts.include_cursor, output, cb);
+    }
+});
+"""
 
 
 def capture_screenshot(
@@ -13,19 +94,47 @@ def capture_screenshot(
     area: Optional[Tuple[int, int, int, int]] = None,
     window: bool = False,
     include_frame: bool = True,
+    format: str = "png",
+    quality: Optional[int] = None,
+    scale: float = 1.0,
     **kwargs,
 ) -> bytes:
     """
-    Capture a screenshot as PNG data.
+    Capture a screenshot as encoded image data.
 
     :param e: the script evaluator.
     :param include_cursor: if True, render the cursor in the screenshot.
     :param area: if specified, the (x, y, width, height) to capture.
     :param window: if True, screenshot a specific window.
     :param include_frame: if True, capture the frame of a window screenshot.
-    :param kwargs: arguments to e.call_promise().
-    :return: PNG image data of the screenshot.
+    :param format: a GdkPixbuf image format, such as "png", "jpeg" or "webp".
+                   Formats besides "png" and "jpeg" require the matching
+                   GdkPixbuf loader to be installed for the shell.
+    :param quality: for JPEG and WebP, the quality from 0 to 100.
+    :param scale: a factor to resize the screenshot by before encoding.
+    :param kwargs: arguments to e.call_async_function().
+    :return: image data of the screenshot.
     """
+    if format != "png" or scale != 1:
+        return map_result(
+            e.call_async_function(
+                _ENCODE_SCRIPT,
+                opts=dict(
+                    include_cursor=include_cursor,
+                    area=area,
+                    window=window,
+                    include_frame=include_frame,
+                    staging_path=os.path.join(
+                        private_shm_dir(), f"screenshot-{uuid.uuid4()}.png"
+                    ),
+                ),
+                format=format,
+                quality=quality,
+                scale=scale,
+                **kwargs,
+            ),
+            base64.b64decode,
+        )
 
     code = """
     const Screenshot = imports.gi.Shell.Screenshot;
@@ -33,71 +142,44 @@ def capture_screenshot(
     const Gio = imports.gi.Gio;
     return await new Promise((resolve, reject) => {
         const ss = new Screenshot();
-        let output = '';
-        if (use_file) {
-            output = use_file;
-        } else {
-            output = Gio.MemoryOutputStream.new_resizable();
+        if (!ss.screenshot_finish) {
+            // This is an older branch of gnome-shell that doesn't use GIO's async pattern.
+            // This old branch only had filename support.
+            reject('must use filename');
+            return;
         }
-
-        if (ss.screenshot_finish) {
-            const cb = (_, async_result) => {
-                try {
-                    const result = ss.screenshot_finish(async_result);
-                    if (use_file) {
-                        resolve(result[2]);
-                    } else {
-                        output.close(Gio.Cancellable.get_current());
-                        const data = output.steal_as_bytes();
-                        const encoded = GLib.base64_encode(data.get_data());
-                        resolve(encoded);
-                    }
-                } catch (e) {
-                    reject(e);
-                }
-            };
-            if (area) {
-                ss.screenshot_area(area[0], area[1], area[2], area[3], output, cb);
-            } else if (grab_window) {
-                ss.screenshot_window(include_frame, include_cursor, output, cb);
-            } else {
-                ss.screenshot(include_cursor, output, cb);
+        const output = Gio.MemoryOutputStream.new_resizable();
+        const cb = (_, async_result) => {
+            try {
+                ss.screenshot_finish(async_result);
+                output.close(Gio.Cancellable.get_current());
+                const data = output.steal_as_bytes();
+                const encoded = GLib.base64_encode(data.get_data());
+                resolve(encoded);
+            } catch (e) {
+                reject(e);
             }
+        };
+        if (area) {
+            ss.screenshot_area(area[0], area[1], area[2], area[3], output, cb);
+        } else if (grab_window) {
+            ss.screenshot_window(include_frame, include_cursor, output, cb);
         } else {
-            if (!use_file) {
-                // This is an older branch of gnome-shell that doesn't use GIO's async pattern.
-                // This old branch only had filename support.
-                reject('must use filename');
-                return;
-            }
-            const cb = (_, success, _area, filename) => {
-                if (!success) {
-                    reject('screeshot failed');
-                } else {
-                    resolve(filename);
-                }
-            };
-            if (area) {
-                ss.screenshot_area(area[0], area[1], area[2], area[3], output, cb);
-            } else if (grab_window) {
-                ss.screenshot_window(include_frame, include_cursor, output, cb);
-            } else {
-                ss.screenshot(include_cursor, output, cb);
-            }
+            ss.screenshot(include_cursor, output, cb);
         }
     });
     """
     try:
-        return base64.b64decode(
-            e.call_async(
+        return map_result(
+            e.call_async_function(
                 code,
                 include_cursor=include_cursor,
                 area=area,
                 grab_window=window,
                 include_frame=include_frame,
-                use_file=None,
                 **kwargs,
-            )
+            ),
+            base64.b64decode,
         )
     except EvaluatorJavaScriptError as exc:
         if (
@@ -105,9 +187,254 @@ def capture_screenshot(
             and "Argument 'filename'" not in exc.message
         ):
             raise
-        use_file = str(uuid.uuid4())
-        path = e.call_async(code, include_cursor=include_cursor, use_file=use_file)
+        with capture_screenshot_file(
+            e,
+            include_cursor=include_cursor,
+            area=area,
+            window=window,
+            include_frame=include_frame,
+            **kwargs,
+        ) as staged:
+            return staged.read()
+
+
+class StagedScreenshot:
+    """
+    A PNG screenshot stored in a private tmpfs file.
+
+    The file is deleted by close(). Memory maps created by mmap() stay valid
+    after that.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __enter__(self) -> "StagedScreenshot":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def read(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def mmap(self) -> mmap.mmap:
+        """
+        Map the PNG data into memory without copying it.
+        """
+        with open(self.path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        if self.path is not None:
+            _remove_staged(self.path)
+            self.path = None
+
+
+def capture_screenshot_file(
+    e: Evaluator,
+    include_cursor: bool = True,
+    area: Optional[Tuple[int, int, int, int]] = None,
+    window: bool = False,
+    include_frame: bool = True,
+    **kwargs,
+) -> StagedScreenshot:
+    """
+    Capture a PNG screenshot into a file.
+
+    This works on every shell version, including older ones which cannot
+    capture screenshots in memory. Files are staged in a private tmpfs
+    directory under unique names.
+
+    Arguments are the same as for capture_screenshot().
+
+    :return: the staged file, which should be closed when no longer needed.
+    """
+    code = """
+    const Screenshot = imports.gi.Shell.Screenshot;
+    const Gio = imports.gi.Gio;
+    return await new Promise((resolve, reject) => {
+        const ss = new Screenshot();
+        let output, cb;
+        if (ss.screenshot_finish) {
+            output = Gio.File.new_for_path(path).replace(
+                null,
+                false,
+                Gio.FileCreateFlags.PRIVATE,
+                null,
+            );
+            cb = (_, async_result) => {
+                try {
+                    ss.screenshot_finish(async_result);
+                    output.close(null);
+                    resolve(path);
+                } catch (e) {
+                    reject(e);
+                }
+            };
+        } else {
+            // Older shells take a filename, and report the one they used.
+            output = path;
+            cb = (_, success, _area, filename) => {
+                if (!success) {
+                    reject('screenshot failed');
+                } else {
+                    resolve(filename);
+                }
+            };
+        }
+        if (area) {
+            ss.screenshot_area(area[0], area[1], area[2], area[3], output, cb);
+        } else if (grab_window) {
+            ss.screenshot_window(include_frame, include_cursor, output, cb);
+        } else {
+            ss.screenshot(include_cursor, output, cb);
+        }
+    });
+    """
+    path = os.path.join(private_shm_dir(), f"screenshot-{uuid.uuid4()}.png")
+    try:
+        written_path = e.call_async_function(
+            code,
+            include_cursor=include_cursor,
+            area=area,
+            grab_window=window,
+            include_frame=include_frame,
+            path=path,
+            **kwargs,
+        )
+    except Exception:
+        _remove_staged(path)
+        raise
+    if written_path != path:
+        # The shell avoided overwriting an existing file.
+        _remove_staged(path)
+        path = written_path
+    return StagedScreenshot(path)
+
+
+def _remove_staged(path: str):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+_ENCODE_SCRIPT = _CAPTURE_PIXBUF_JS + """
+let pixbuf = await capturePixbuf(opts);
+if (scale != 1) {
+    pixbuf = pixbuf.scale_simple(
+        Math.max(1, Math.round(pixbuf.get_width() * scale)),
+        Math.max(1, Math.round(pixbuf.get_height() * scale)),
+        GdkPixbuf.InterpType.BILINEAR,
+    );
+}
+const keys = [];
+const values = [];
+if (quality !== null && format != 'png') {
+    keys.push('quality');
+    values.push('' + quality);
+}
+// Encode in a GdkPixbuf worker thread, so only the scaling above runs on the
+// compositor's main loop.
+const output = Gio.MemoryOutputStream.new_resizable();
+await new Promise((resolve, reject) => {
+    pixbuf.save_to_streamv_async(output, format, keys, values, null, (_, asyncResult) => {
+        try {
+            if (!GdkPixbuf.Pixbuf.save_to_stream_finish(asyncResult)) {
+                throw new Error('failed to encode screenshot as ' + format);
+            }
+            resolve();
+        } catch (e) {
+            reject(e);
+        }
+    });
+});
+output.close(null);
+return GLib.base64_encode(output.steal_as_bytes().get_data());
+"""
+
+
+def capture_frame(
+    e: Evaluator,
+    include_cursor: bool = True,
+    area: Optional[Tuple[int, int, int, int]] = None,
+    window: bool = False,
+    include_frame: bool = True,
+    **kwargs,
+) -> Any:
+    """
+    Capture a screenshot as uncompressed RGBA pixels.
+
+    The shell writes the pixels to a file in a private tmpfs directory, which
+    is memory mapped here rather than being sent over D-Bus. Compared to
+    capture_screenshot(), this skips the base64 encoding and the PNG decode
+    in Python. The shell still receives a PNG from Shell.Screenshot, which
+    it decodes in a worker thread.
+
+    Arguments are the same as for capture_screenshot().
+
+    :return: a read-only uint8 NumPy array of shape [height x width x 4]. If
+             NumPy is not installed, a memoryview of the same shape.
+    """
+    code = _CAPTURE_PIXBUF_JS + """
+    let pixbuf = await capturePixbuf(opts);
+    if (!pixbuf.get_has_alpha()) {
+        pixbuf = pixbuf.add_alpha(false, 0, 0, 0);
+    }
+    await writeBytes(path, pixbuf.read_pixel_bytes());
+    return {
+        width: pixbuf.get_width(),
+        height: pixbuf.get_height(),
+        rowstride: pixbuf.get_rowstride(),
+    };
+    """
+    path = os.path.join(private_shm_dir(), f"frame-{uuid.uuid4()}.rgba")
+    opts = dict(
+        include_cursor=include_cursor,
+        area=area,
+        window=window,
+        include_frame=include_frame,
+        staging_path=path + ".png",
+    )
+    return map_result(
+        e.call_async_function(code, opts=opts, path=path, **kwargs),
+        lambda info: _map_pixels(path, **info),
+    )
+
+
+def _map_pixels(path: str, width: int, height: int, rowstride: int) -> Any:
+    return _pixel_view(_map_pixels_file(path), width, height, rowstride)
+
+
+def _map_pixels_file(path: str) -> mmap.mmap:
+    """
+    Memory map a file written by the shell and delete it.
+    """
+    try:
         with open(path, "rb") as f:
-            data = f.read()
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    finally:
         os.unlink(path)
-        return data
+
+
+def _pixel_view(
+    buf: Any, width: int, height: int, rowstride: int, offset: int = 0
+) -> Any:
+    """
+    Create a [height x width x 4] view of RGBA pixels in a buffer, without
+    copying them.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        # Four-channel rows are never padded, so this is a valid shape.
+        end = offset + height * width * 4
+        return memoryview(buf)[offset:end].cast("B", (height, width, 4))
+    return np.lib.stride_tricks.as_strided(
+        np.frombuffer(buf, dtype=np.uint8, offset=offset),
+        shape=(height, width, 4),
+        strides=(rowstride, 4, 1),
+        writeable=False,
+    )
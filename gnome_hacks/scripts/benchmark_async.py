@@ -0,0 +1,64 @@
+"""
+Measure Eval throughput of Evaluator and AsyncEvaluator against a fake shell
+proxy with a fixed round-trip latency.
+"""
+
+import asyncio
+import time
+
+from gi.repository import GLib
+from gnome_hacks.evaluator import AsyncEvaluator, Evaluator
+
+LATENCY_MS = 5
+CALLS = 256
+
+
+class FakeProxy:
+    """
+    Answers every Eval with "null" after LATENCY_MS milliseconds.
+    """
+
+    def call_sync(self, method, parameters, flags, timeout_ms):
+        time.sleep(LATENCY_MS / 1000)
+        return GLib.Variant("(bs)", (True, "null"))
+
+    def call(self, method, parameters, flags, timeout_ms, cancellable, cb, data):
+        def done(*_):
+            cb(self, None, data)
+            return False
+
+        source = GLib.timeout_source_new(LATENCY_MS)
+        source.set_callback(done)
+        source.attach(GLib.MainContext.ref_thread_default())
+
+    def call_finish(self, _result):
+        return GLib.Variant("(bs)", (True, "null"))
+
+
+async def run_async(concurrency: int) -> float:
+    e = AsyncEvaluator(proxy=FakeProxy())
+    await e("null")  # start the GLib thread outside the timed region
+
+    async def worker(n: int):
+        for _ in range(n):
+            await e("null")
+
+    t1 = time.perf_counter()
+    await asyncio.gather(*[worker(CALLS // concurrency) for _ in range(concurrency)])
+    return CALLS / (time.perf_counter() - t1)
+
+
+def run_sync() -> float:
+    e = Evaluator(proxy=FakeProxy())
+    t1 = time.perf_counter()
+    for _ in range(CALLS):
+        e("null")
+    return CALLS / (time.perf_counter() - t1)
+
+
+if __name__ == "__main__":
+    print(f"latency: {LATENCY_MS} ms, calls: {CALLS}")
+    print(f"Evaluator (sequential): {run_sync():.1f} evals/sec")
+    for concurrency in [1, 8, 64]:
+        rate = asyncio.run(run_async(concurrency))
+        print(f"AsyncEvaluator ({concurrency} callers): {rate:.1f} evals/sec")
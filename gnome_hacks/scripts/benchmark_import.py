@@ -0,0 +1,43 @@
+"""
+Measure how long it takes to import the keysym table and to use it, each in
+a fresh interpreter.
+"""
+
+import subprocess
+import sys
+import time
+
+RUNS = 20
+
+CASES = [
+    ("baseline", "pass"),
+    ("import keysyms", "import gnome_hacks.keysyms"),
+    (
+        "keyval_from_name",
+        "from gnome_hacks.keysyms import keyval_from_name; "
+        "keyval_from_name('KEY_Return')",
+    ),
+    ("KeyVal enum", "from gnome_hacks.keysyms import KeyVal; KeyVal.KEY_Return"),
+]
+
+
+def measure(code: str) -> float:
+    best = float("inf")
+    for _ in range(RUNS):
+        t1 = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        best = min(best, time.perf_counter() - t1)
+    return best
+
+
+def main():
+    baseline = None
+    for name, code in CASES:
+        elapsed = measure(code)
+        if baseline is None:
+            baseline = elapsed
+        print(f"{name}: {(elapsed - baseline) * 1000:.2f} ms over baseline")
+
+
+if __name__ == "__main__":
+    main()
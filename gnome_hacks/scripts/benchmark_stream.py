@@ -0,0 +1,77 @@
+"""
+Measure the frame rate stream_frames() sustains, and how much it stalls the
+shell's main loop.
+
+A timer in the shell records how late each of its ticks runs, first without
+a stream and then while frames are streamed. Long stalls in the main loop
+delay the compositor's frames by the same amount.
+
+Usage: python benchmark_stream.py [fps] [seconds]
+"""
+
+import sys
+import time
+from typing import List
+
+from gnome_hacks.evaluator import Evaluator
+from gnome_hacks.stream import stream_frames
+
+PROBE_INTERVAL_MS = 5
+
+_START_PROBE_SCRIPT = """
+const GLib = imports.gi.GLib;
+const probe = {lateness: [], last: GLib.get_monotonic_time()};
+probe.source = GLib.timeout_add(GLib.PRIORITY_DEFAULT, interval_ms, () => {
+    const now = GLib.get_monotonic_time();
+    probe.lateness.push(now - probe.last - interval_ms * 1000);
+    probe.last = now;
+    return GLib.SOURCE_CONTINUE;
+});
+global._gnomeHacksStallProbe = probe;
+"""
+
+_STOP_PROBE_SCRIPT = """
+const probe = global._gnomeHacksStallProbe;
+delete global._gnomeHacksStallProbe;
+imports.gi.GLib.source_remove(probe.source);
+return probe.lateness;
+"""
+
+
+def report(name: str, lateness_us: List[int]):
+    values = sorted(lateness_us)
+    p50 = values[len(values) // 2] / 1000
+    p99 = values[int(len(values) * 0.99)] / 1000
+    print(
+        f"{name}: main loop lateness p50 {p50:.2f} ms, p99 {p99:.2f} ms, "
+        f"max {values[-1] / 1000:.2f} ms"
+    )
+
+
+def main():
+    fps = float(sys.argv[1]) if len(sys.argv) > 1 else 30
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 10
+    e = Evaluator()
+
+    e.call_function(_START_PROBE_SCRIPT, interval_ms=PROBE_INTERVAL_MS)
+    time.sleep(seconds)
+    report("idle", e.call_function(_STOP_PROBE_SCRIPT))
+
+    e.call_function(_START_PROBE_SCRIPT, interval_ms=PROBE_INTERVAL_MS)
+    frames = 0
+    last = None
+    t1 = time.monotonic()
+    for frame in stream_frames(e, fps=fps):
+        frames += 1
+        last = frame
+        if time.monotonic() - t1 >= seconds:
+            break
+    elapsed = time.monotonic() - t1
+    report(f"streaming at {fps:g} fps", e.call_function(_STOP_PROBE_SCRIPT))
+    print(f"received {frames / elapsed:.1f} frames/sec")
+    if last is not None:
+        print(f"dropped {last.dropped} capture ticks, missed {last.missed} frames")
+
+
+if __name__ == "__main__":
+    main()
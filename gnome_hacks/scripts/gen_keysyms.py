@@ -0,0 +1,93 @@
+"""
+Regenerate gnome_hacks/_keysym_data.py from mutter's clutter-keysyms.h, and
+the characters of the keysyms from the U+ annotations in X11's keysymdef.h.
+
+Usage: python gen_keysyms.py path/to/clutter-keysyms.h path/to/keysymdef.h
+"""
+
+import os
+import re
+import sys
+from typing import Dict, List, Tuple
+
+OUTPUT = os.path.join(os.path.dirname(__file__), "..", "_keysym_data.py")
+LINE_WIDTH = 88
+
+# Offset of the keysyms which directly encode a Unicode code point.
+UNICODE_OFFSET = 0x01000000
+
+
+def parse_header(path: str) -> List[Tuple[str, int]]:
+    pattern = re.compile(r"^#define CLUTTER_(KEY_\w+)\s+(0x[0-9a-fA-F]+)")
+    result = []
+    with open(path) as f:
+        for line in f:
+            match = pattern.match(line)
+            if match:
+                result.append((match.group(1), int(match.group(2), 16)))
+    return result
+
+
+def parse_unicode(path: str) -> Dict[str, int]:
+    """
+    Get the code points of keysyms by name. Only exact mappings are used,
+    which keysymdef.h writes as /* U+xxxx ... */, as opposed to approximate
+    ones in parentheses or angle brackets.
+    """
+    pattern = re.compile(r"^#define XK_(\w+)\s+0x[0-9a-fA-F]+\s*/\*\s*U\+([0-9A-F]+)\s")
+    result = {}
+    with open(path) as f:
+        for line in f:
+            match = pattern.match(line)
+            if match:
+                result["KEY_" + match.group(1)] = int(match.group(2), 16)
+    return result
+
+
+def code_point(name: str, value: int, unicode: Dict[str, int]) -> int:
+    if UNICODE_OFFSET + 0x100 <= value <= UNICODE_OFFSET + 0x10FFFF:
+        return value - UNICODE_OFFSET
+    return unicode.get(name, 0)
+
+
+def write_table(keysyms: List[Tuple[str, int]], unicode: Dict[str, int], path: str):
+    lines = [
+        '"""',
+        "Generated by scripts/gen_keysyms.py. Do not edit.",
+        "",
+        "NAMES, VALUES and CODE_POINTS are parallel, in the order of",
+        "clutter-keysyms.h, so the first name of a value is its canonical name.",
+        "CODE_POINTS holds the Unicode character a keysym types, or 0 if none.",
+        '"""',
+        "",
+        "# fmt: off",
+    ]
+    lines += _wrap("NAMES = (", [f'"{name}"' for name, _ in keysyms])
+    lines += _wrap("VALUES = (", [f"0x{value:X}" for _, value in keysyms])
+    lines += _wrap(
+        "CODE_POINTS = (",
+        [
+            f"0x{cp:X}" if cp else "0"
+            for cp in (code_point(name, value, unicode) for name, value in keysyms)
+        ],
+    )
+    lines.append("# fmt: on")
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def _wrap(opening: str, items: List[str]) -> List[str]:
+    lines = [opening]
+    line = "   "
+    for item in items:
+        if len(line) + len(item) + 2 > LINE_WIDTH:
+            lines.append(line)
+            line = "   "
+        line += " " + item + ","
+    lines.append(line)
+    lines.append(")")
+    return lines
+
+
+if __name__ == "__main__":
+    write_table(parse_header(sys.argv[1]), parse_unicode(sys.argv[2]), OUTPUT)
@@ -3,5 +3,8 @@ from gnome_hacks.windows import get_window_frame, list_windows
 
 if __name__ == "__main__":
     e = Evaluator()
-    for w in list_windows(e):
-        print(w, get_window_frame(e, w.id))
+    windows = list_windows(e)
+    with e.batch() as b:
+        frames = [get_window_frame(b, w.id) for w in windows]
+    for w, frame in zip(windows, frames):
+        print(w, frame.result())
@@ -2,17 +2,16 @@
 Work-in-progress remote desktop web application.
 """
 
-import io
 import json
 from threading import Lock
 
 from flask import Flask, Response, request
 from gnome_hacks.evaluator import Evaluator
-from gnome_hacks.keyboard import KeyEvent, simulate_key_events
-from gnome_hacks.keysyms import KeyVal
-from gnome_hacks.pointer import PointerButton, PointerMove, simulate_pointer_events
+from gnome_hacks.input import simulate_input as simulate_input_events
+from gnome_hacks.keyboard import KeyEvent
+from gnome_hacks.keysyms import keyval_from_name
+from gnome_hacks.pointer import PointerButton, PointerMove
 from gnome_hacks.screenshot import capture_screenshot
-from PIL import Image
 
 app = Flask(__name__)
 lock = Lock()
@@ -175,28 +174,14 @@ def screenshot():
     quality = int(request.args.get("q", "50"))
 
     with lock:
-        png_data = capture_screenshot(evaluator)
-    img = Image.open(io.BytesIO(png_data))
-    out = io.BytesIO()
-    img.convert("RGB").save(out, format="jpeg", quality=quality)
-    return Response(out.getvalue(), mimetype="image/jpeg")
+        data = capture_screenshot(evaluator, format="jpeg", quality=quality)
+    return Response(data, mimetype="image/jpeg")
 
 
 @app.route("/input")
 def simulate_input():
     event_data = json.loads(request.args.get("events"))
     events = []
-
-    def flush_events():
-        if not len(events):
-            return
-        with lock:
-            if isinstance(events[0], KeyEvent):
-                simulate_key_events(evaluator, *events)
-            else:
-                simulate_pointer_events(evaluator, *events)
-        events.clear()
-
     for obj in event_data:
         if "mousemove" in obj:
             evt = PointerMove(obj["mousemove"]["x"], obj["mousemove"]["y"])
@@ -207,11 +192,9 @@ def simulate_input():
                 obj["keypress"]["pressed"],
                 keycode_to_keyval(obj["keypress"]["keycode"]),
             )
-        if len(events) and isinstance(evt, KeyEvent) != isinstance(events[0], KeyEvent):
-            # Cannot intertwine mouse and keyboard events.
-            flush_events()
         events.append(evt)
-    flush_events()
+    with lock:
+        simulate_input_events(evaluator, *events)
     return "ok"
 
 
@@ -222,22 +205,22 @@ def keycode_to_keyval(x):
     if x in range(b"0"[0], b"9"[0] + 1):
         return x
     tbl = {
-        16: KeyVal.KEY_Shift_L,
-        17: KeyVal.KEY_Control_L,
-        18: KeyVal.KEY_Alt_L,
-        32: KeyVal.KEY_space,
-        46: KeyVal.KEY_Delete,
-        186: KeyVal.KEY_semicolon,
-        187: KeyVal.KEY_equal,
-        188: KeyVal.KEY_comma,
-        189: KeyVal.KEY_minus,
-        190: KeyVal.KEY_period,
-        191: KeyVal.KEY_slash,
-        192: KeyVal.KEY_grave,
-        219: KeyVal.KEY_bracketleft,
-        220: KeyVal.KEY_backslash,
-        221: KeyVal.KEY_bracketright,
-        222: KeyVal.KEY_apostrophe,
+        16: keyval_from_name("KEY_Shift_L"),
+        17: keyval_from_name("KEY_Control_L"),
+        18: keyval_from_name("KEY_Alt_L"),
+        32: keyval_from_name("KEY_space"),
+        46: keyval_from_name("KEY_Delete"),
+        186: keyval_from_name("KEY_semicolon"),
+        187: keyval_from_name("KEY_equal"),
+        188: keyval_from_name("KEY_comma"),
+        189: keyval_from_name("KEY_minus"),
+        190: keyval_from_name("KEY_period"),
+        191: keyval_from_name("KEY_slash"),
+        192: keyval_from_name("KEY_grave"),
+        219: keyval_from_name("KEY_bracketleft"),
+        220: keyval_from_name("KEY_backslash"),
+        221: keyval_from_name("KEY_bracketright"),
+        222: keyval_from_name("KEY_apostrophe"),
     }
     return tbl.get(x, 0xFF00 + x)
 
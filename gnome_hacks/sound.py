@@ -7,7 +7,7 @@ def bell_notify(e: Evaluator):
     const seat = Clutter.get_default_backend().get_default_seat();
     seat.bell_notify();
     """
-    return e(code)
+    return e.call_function(code)
 
 
 def play_bell_sound(e: Evaluator):
@@ -19,7 +19,7 @@ def play_bell_sound(e: Evaluator):
         null,
     );
     """
-    return e(code)
+    return e.call_function(code)
 
 
 def play_sound(e: Evaluator, path: str, description: str = ""):
@@ -33,4 +33,4 @@ def play_sound(e: Evaluator, path: str, description: str = ""):
         null,
     );
     """
-    return e(code, path=path, description=description)
+    return e.call_function(code, path=path, description=description)
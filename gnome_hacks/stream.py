@@ -0,0 +1,353 @@
+import mmap
+import os
+import struct
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional, Tuple
+
+from ._utils import private_shm_dir
+from .evaluator import Evaluator, EvaluatorJavaScriptError
+from .screenshot import _CAPTURE_PIXBUF_JS, _pixel_view
+
+# Layout of the shared ring buffer file. All integers are little-endian.
+#
+# The header holds the number of the last fully written frame, the number
+# of capture ticks the shell skipped, a heartbeat counter bumped by the
+# reader, and a flag set when the shell ends the session. It is followed by
+# one descriptor per slot, and then by the slots themselves.
+_HEADER = struct.Struct("<QQII4x")  # write_seq, dropped, heartbeat, stopped
+_SLOT = struct.Struct("<QQIIII")  # seq, timestamp_us, width, height, stride, len
+_DROPPED_OFFSET = 8
+_HEARTBEAT_OFFSET = 16
+_STOPPED_OFFSET = 20
+
+# Values of the stopped flag.
+_STOPPED = 1
+_STOPPED_SIZE_CHANGED = 2
+
+
+@dataclass
+class StreamFrame:
+    seq: int  # 1-based index of the frame within the session.
+    timestamp: float  # capture time, in seconds since the epoch.
+    pixels: Any  # RGBA pixels, in the same format as capture_frame().
+
+    # Capture ticks skipped by the shell because a capture was still busy.
+    dropped: int
+
+    # Frames overwritten in the ring buffer before they could be read.
+    missed: int
+
+
+def stream_frames(
+    e: Evaluator,
+    fps: float = 15,
+    slots: int = 4,
+    include_cursor: bool = True,
+    area: Optional[Tuple[int, int, int, int]] = None,
+    idle_timeout_ms: int = 5000,
+) -> Iterator[StreamFrame]:
+    """
+    Continuously capture the screen at a target frame rate.
+
+    The shell captures frames on a low-priority GLib timeout and writes them
+    into a ring buffer of slots in a shared memory file, skipping ticks while
+    a capture is still in progress. The PNG decode and the pixel writes run
+    in worker threads, so the shell's main loop only starts each capture and
+    updates the small header. No D-Bus calls are made while frames are being
+    read.
+
+    The rate the shell sustains depends on the screen size and the machine,
+    see scripts/benchmark_stream.py to measure it along with the stalls it
+    causes in the shell's main loop.
+
+    The session ends when the generator is closed, or by itself if the
+    generator is not advanced for idle_timeout_ms.
+
+    :param e: the script evaluator.
+    :param fps: the target frame rate.
+    :param slots: the number of frames in the ring buffer (at least 3).
+    :param include_cursor: if True, render the cursor in the frames.
+    :param area: if specified, the (x, y, width, height) to capture.
+    :param idle_timeout_ms: how long the shell waits for the reader.
+    :return: a generator of frames. Each frame's pixels are copied out of the
+             ring buffer, so they remain valid after later frames arrive.
+    :raises RuntimeError: if the size of the captured frames changes during
+                          the session, e.g. because a monitor was added.
+    """
+    if slots < 3:
+        raise ValueError("at least 3 slots are required")
+    path = os.path.join(private_shm_dir(), f"stream-{uuid.uuid4()}.ring")
+    opts = dict(
+        include_cursor=include_cursor,
+        area=area,
+        window=False,
+        include_frame=False,
+        staging_path=path + ".png",
+    )
+    # Slots are sized from a real capture, since screenshots are in physical
+    # pixels, which differ from the logical screen size on scaled outputs.
+    slot_size = e.call_async_function(_PROBE_SCRIPT, opts=opts)
+    data_offset = _HEADER.size + _SLOT.size * slots
+    with open(path, "w+b") as f:
+        f.truncate(data_offset + slot_size * slots)
+        buf = mmap.mmap(f.fileno(), 0)
+    session_id = f"s{uuid.uuid4().hex}"
+    try:
+        e.call_function(
+            _START_SCRIPT,
+            session_id=session_id,
+            path=path,
+            interval_ms=max(1, int(1000 / fps)),
+            slot_count=slots,
+            slot_size=slot_size,
+            idle_timeout_ms=idle_timeout_ms,
+            opts=opts,
+        )
+    finally:
+        # The shell keeps its own handle open.
+        os.unlink(path)
+
+    try:
+        last_seq = 0
+        missed = 0
+        heartbeat = 0
+        while True:
+            heartbeat = (heartbeat + 1) & 0xFFFFFFFF
+            struct.pack_into("<I", buf, _HEARTBEAT_OFFSET, heartbeat)
+            write_seq, dropped, _, stopped = _HEADER.unpack_from(buf, 0)
+            if write_seq == last_seq:
+                if stopped == _STOPPED_SIZE_CHANGED:
+                    raise RuntimeError("the size of the captured frames changed")
+                if stopped:
+                    return
+                time.sleep(1 / (fps * 4))
+                continue
+
+            # A slot may be rewritten once the frame before its next use has
+            # been written, so skip ahead to the oldest frame that is safe.
+            seq = max(last_seq + 1, write_seq - slots + 2)
+            missed += seq - (last_seq + 1)
+            last_seq = seq
+            slot = (seq - 1) % slots
+            slot_seq, timestamp, w, h, stride, _ = _SLOT.unpack_from(
+                buf, _HEADER.size + _SLOT.size * slot
+            )
+            if slot_seq != seq:
+                missed += 1
+                continue
+            pixels = _copy_pixels(
+                _pixel_view(buf, w, h, stride, offset=data_offset + slot * slot_size)
+            )
+            if _HEADER.unpack_from(buf, 0)[0] > seq + slots - 2:
+                # The slot was being rewritten while we copied it.
+                missed += 1
+                continue
+            yield StreamFrame(
+                seq=seq,
+                timestamp=timestamp / 1e6,
+                pixels=pixels,
+                dropped=dropped,
+                missed=missed,
+            )
+    finally:
+        try:
+            e.call_function(_STOP_SCRIPT, session_id=session_id)
+        except EvaluatorJavaScriptError:
+            pass
+        buf.close()
+
+
+def _copy_pixels(view: Any) -> Any:
+    if isinstance(view, memoryview):
+        return memoryview(view.tobytes()).cast("B", view.shape)
+    return view.copy()
+
+
+_PROBE_SCRIPT = _CAPTURE_PIXBUF_JS + """
+let pixbuf = await capturePixbuf(opts);
+if (!pixbuf.get_has_alpha()) {
+    pixbuf = pixbuf.add_alpha(false, 0, 0, 0);
+}
+return pixbuf.get_byte_length();
+"""
+
+_START_SCRIPT = (
+    _CAPTURE_PIXBUF_JS
+    + """
+if (!global._gnomeHacksStreams) {
+    global._gnomeHacksStreams = {};
+}
+// The header is read and written synchronously, since it is small. Pixels
+// are written asynchronously in a GIO worker thread, through a second stream
+// so the header stays usable while a write is pending.
+const io = Gio.File.new_for_path(path).open_readwrite(null);
+const dataIo = Gio.File.new_for_path(path).open_readwrite(null);
+const dataOffset = """
+    + str(_HEADER.size)
+    + " + "
+    + str(_SLOT.size)
+    + """ * slot_count;
+
+// Encode a list of [value, byteCount] pairs as little-endian integers.
+const encode = (fields) => {
+    const bytes = new Uint8Array(fields.reduce((n, f) => n + f[1], 0));
+    const view = new DataView(bytes.buffer);
+    let offset = 0;
+    fields.forEach(([value, size]) => {
+        view.setUint32(offset, value % 4294967296, true);
+        if (size == 8) {
+            view.setUint32(offset + 4, Math.floor(value / 4294967296), true);
+        }
+        offset += size;
+    });
+    return bytes;
+};
+const writeAt = (offset, bytes) => {
+    io.seek(offset, GLib.SeekType.SET, null);
+    io.get_output_stream().write_all(bytes, null);
+};
+const writePixels = (offset, bytes) => new Promise((resolve, reject) => {
+    dataIo.seek(offset, GLib.SeekType.SET, null);
+    const out = dataIo.get_output_stream();
+    const writeRest = (rest) => out.write_bytes_async(
+        rest,
+        GLib.PRIORITY_LOW,
+        null,
+        (_, asyncResult) => {
+            try {
+                const written = out.write_bytes_finish(asyncResult);
+                const size = rest.get_size();
+                if (written < size) {
+                    writeRest(GLib.Bytes.new_from_bytes(rest, written, size - written));
+                } else {
+                    resolve();
+                }
+            } catch (e) {
+                reject(e);
+            }
+        },
+    );
+    writeRest(bytes);
+});
+const readHeartbeat = () => {
+    io.seek("""
+    + str(_HEARTBEAT_OFFSET)
+    + """, GLib.SeekType.SET, null);
+    const bytes = io.get_input_stream().read_bytes(4, null).toArray();
+    return new DataView(bytes.buffer, bytes.byteOffset, 4).getUint32(0, true);
+};
+
+const session = {
+    seq: 0,
+    dropped: 0,
+    busy: false,
+    heartbeat: null,
+    lastBeat: GLib.get_monotonic_time(),
+    source: 0,
+};
+const isLive = () => global._gnomeHacksStreams[session_id] === session;
+const drop = () => {
+    session.dropped++;
+    writeAt("""
+    + str(_DROPPED_OFFSET)
+    + """, encode([[session.dropped, 8]]));
+};
+session.stop = (reason = """
+    + str(_STOPPED)
+    + """) => {
+    if (!isLive()) {
+        return;
+    }
+    delete global._gnomeHacksStreams[session_id];
+    if (session.source) {
+        GLib.source_remove(session.source);
+        session.source = 0;
+    }
+    writeAt("""
+    + str(_STOPPED_OFFSET)
+    + """, encode([[reason, 4]]));
+    io.close(null);
+    if (!session.busy) {
+        // Otherwise it is closed once the pending write completes.
+        dataIo.close(null);
+    }
+};
+const writeFrame = async (pixbuf) => {
+    if (!pixbuf.get_has_alpha()) {
+        pixbuf = pixbuf.add_alpha(false, 0, 0, 0);
+    }
+    // This wraps the pixbuf's own memory, unlike get_pixels().
+    const pixels = pixbuf.read_pixel_bytes();
+    if (pixels.get_size() > slot_size) {
+        session.stop("""
+    + str(_STOPPED_SIZE_CHANGED)
+    + """);
+        return;
+    }
+    const seq = session.seq + 1;
+    const slot = (seq - 1) % slot_count;
+    await writePixels(dataOffset + slot * slot_size, pixels);
+    if (!isLive()) {
+        return;
+    }
+    writeAt("""
+    + str(_HEADER.size)
+    + " + "
+    + str(_SLOT.size)
+    + """ * slot, encode([
+        [seq, 8],
+        [GLib.get_real_time(), 8],
+        [pixbuf.get_width(), 4],
+        [pixbuf.get_height(), 4],
+        [pixbuf.get_rowstride(), 4],
+        [pixels.get_size(), 4],
+    ]));
+    writeAt(0, encode([[seq, 8]]));
+    session.seq = seq;
+};
+const tick = () => {
+    const now = GLib.get_monotonic_time();
+    const beat = readHeartbeat();
+    if (beat !== session.heartbeat) {
+        session.heartbeat = beat;
+        session.lastBeat = now;
+    } else if (now - session.lastBeat > idle_timeout_ms * 1000) {
+        // Returning SOURCE_REMOVE removes the source, so stop() must not.
+        session.source = 0;
+        session.stop();
+        return GLib.SOURCE_REMOVE;
+    }
+    if (session.busy) {
+        drop();
+        return GLib.SOURCE_CONTINUE;
+    }
+    session.busy = true;
+    capturePixbuf(opts).then((pixbuf) => {
+        if (isLive()) {
+            return writeFrame(pixbuf);
+        }
+    }).catch(() => {
+        if (isLive()) {
+            drop();
+        }
+    }).finally(() => {
+        session.busy = false;
+        if (!isLive()) {
+            dataIo.close(null);
+        }
+    });
+    return GLib.SOURCE_CONTINUE;
+};
+session.source = GLib.timeout_add(GLib.PRIORITY_LOW, interval_ms, tick);
+global._gnomeHacksStreams[session_id] = session;
+"""
+)
+
+_STOP_SCRIPT = """
+const session = (global._gnomeHacksStreams || {})[session_id];
+if (session) {
+    session.stop();
+}
+"""
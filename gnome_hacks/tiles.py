@@ -0,0 +1,246 @@
+import os
+import uuid
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+from ._utils import private_shm_dir
+from .evaluator import Evaluator, EvaluatorJavaScriptError
+from .screenshot import _CAPTURE_PIXBUF_JS, _map_pixels_file, _pixel_view
+
+
+@dataclass
+class Tile:
+    x: int
+    y: int
+    width: int
+    height: int
+    pixels: Any  # RGBA pixels of shape [height x width x 4].
+
+
+@dataclass
+class FrameUpdate:
+    width: int
+    height: int
+
+    # If True, the tiles cover the whole frame, e.g. because this is the
+    # first capture, the screen size changed, or the previous update was
+    # never received.
+    full: bool
+
+    tiles: List[Tile]
+
+
+class DirtyRegionCapture:
+    """
+    A capture session that only transfers the tiles of the screen which
+    changed since the previous capture.
+
+    The shell splits each frame into tiles, hashes them with GLib's native
+    checksum functions, and compares the hashes against those of the
+    previous frame, which it keeps for the session. Only changed tiles are
+    written to shared memory.
+
+    Each call tells the shell which frame it last received, so if a result
+    is lost, e.g. because the call timed out, the next capture is full.
+    """
+
+    def __init__(
+        self,
+        e: Evaluator,
+        tile_size: int = 128,
+        include_cursor: bool = True,
+        area: Optional[Tuple[int, int, int, int]] = None,
+        idle_timeout_ms: int = 60000,
+    ):
+        self.e = e
+        self.tile_size = tile_size
+        self.include_cursor = include_cursor
+        self.area = area
+        self.idle_timeout_ms = idle_timeout_ms
+        self.session_id = f"t{uuid.uuid4().hex}"
+        self._seq = 0  # the number of the last frame received from the shell.
+
+    def __enter__(self) -> "DirtyRegionCapture":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def capture(self, **kwargs) -> FrameUpdate:
+        """
+        Capture the tiles that changed since the last call.
+
+        :param kwargs: arguments to e.call_async_function().
+        """
+        path = os.path.join(private_shm_dir(), f"tiles-{uuid.uuid4()}.rgba")
+        info = self.e.call_async_function(
+            _CAPTURE_SCRIPT,
+            session_id=self.session_id,
+            received_seq=self._seq,
+            tile_size=self.tile_size,
+            idle_timeout_ms=self.idle_timeout_ms,
+            path=path,
+            opts=dict(
+                include_cursor=self.include_cursor,
+                area=self.area,
+                window=False,
+                include_frame=False,
+                staging_path=path + ".png",
+            ),
+            **kwargs,
+        )
+        buf = _map_pixels_file(path) if info["tiles"] else b""
+        tiles = []
+        for x, y, width, height, offset in info["tiles"]:
+            tiles.append(
+                Tile(
+                    x=x,
+                    y=y,
+                    width=width,
+                    height=height,
+                    pixels=_pixel_view(buf, width, height, width * 4, offset),
+                )
+            )
+        self._seq = info["seq"]
+        return FrameUpdate(
+            width=info["width"], height=info["height"], full=info["full"], tiles=tiles
+        )
+
+    def close(self):
+        """
+        Release the previous frame's checksums held by the shell.
+        """
+        try:
+            self.e.call_function(_CLOSE_SCRIPT, session_id=self.session_id)
+        except EvaluatorJavaScriptError:
+            pass
+
+
+def apply_update(frame: Any, update: FrameUpdate) -> Any:
+    """
+    Patch a local frame buffer with the tiles from an update.
+
+    :param frame: the previous frame, as returned by the last call, or None.
+                  This is a [height x width x 4] NumPy array if NumPy is
+                  installed, or a bytearray of packed RGBA rows otherwise.
+    :param update: the update to apply.
+    :return: the patched frame. This is frame itself if it could be updated
+             in place, or a new buffer if the frame size changed.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    shape = (update.height, update.width, 4)
+    if np is not None:
+        if frame is None or frame.shape != shape:
+            frame = np.zeros(shape, dtype=np.uint8)
+        for t in update.tiles:
+            frame[t.y : t.y + t.height, t.x : t.x + t.width] = t.pixels
+        return frame
+
+    row_size = update.width * 4
+    if frame is None or len(frame) != update.height * row_size:
+        frame = bytearray(update.height * row_size)
+    for t in update.tiles:
+        data = memoryview(t.pixels).cast("B")
+        tile_row = t.width * 4
+        for i in range(t.height):
+            start = (t.y + i) * row_size + t.x * 4
+            frame[start : start + tile_row] = data[i * tile_row : (i + 1) * tile_row]
+    return frame
+
+
+_CAPTURE_SCRIPT = _CAPTURE_PIXBUF_JS + """
+if (!global._gnomeHacksTileSessions) {
+    global._gnomeHacksTileSessions = {};
+}
+const sessions = global._gnomeHacksTileSessions;
+let session = sessions[session_id];
+if (!session) {
+    session = sessions[session_id] = {
+        seq: 0,
+        width: 0,
+        height: 0,
+        checksums: [],
+        timeout: 0,
+    };
+}
+
+// Forget the session if the client goes away without closing it.
+if (session.timeout) {
+    GLib.source_remove(session.timeout);
+}
+session.timeout = GLib.timeout_add(GLib.PRIORITY_DEFAULT, idle_timeout_ms, () => {
+    session.timeout = 0;
+    delete sessions[session_id];
+    return GLib.SOURCE_REMOVE;
+});
+
+let pixbuf = await capturePixbuf(opts);
+if (!pixbuf.get_has_alpha()) {
+    pixbuf = pixbuf.add_alpha(false, 0, 0, 0);
+}
+const width = pixbuf.get_width();
+const height = pixbuf.get_height();
+const stride = pixbuf.get_rowstride();
+const pixels = pixbuf.get_pixels();
+// The checksums describe the last frame sent, so they are only valid if the
+// client received that frame.
+const full = (
+    received_seq !== session.seq ||
+    width != session.width ||
+    height != session.height
+);
+
+const changed = [];
+const checksums = [];
+let totalSize = 0;
+// Each tile's rows are gathered into one buffer so that it is hashed with a
+// single call into GLib, rather than one per row.
+const tile = new Uint8Array(tile_size * tile_size * 4);
+for (let y = 0; y < height; y += tile_size) {
+    for (let x = 0; x < width; x += tile_size) {
+        const w = Math.min(tile_size, width - x);
+        const h = Math.min(tile_size, height - y);
+        for (let i = 0; i < h; i++) {
+            const start = (y + i) * stride + x * 4;
+            tile.set(pixels.subarray(start, start + w * 4), i * w * 4);
+        }
+        const checksum = GLib.Checksum.new(GLib.ChecksumType.MD5);
+        checksum.update(tile.subarray(0, w * h * 4));
+        const digest = checksum.get_string();
+        if (full || digest !== session.checksums[checksums.length]) {
+            changed.push([x, y, w, h, totalSize]);
+            totalSize += w * h * 4;
+        }
+        checksums.push(digest);
+    }
+}
+if (changed.length) {
+    const packed = new Uint8Array(totalSize);
+    changed.forEach(([x, y, w, h, offset]) => {
+        for (let i = 0; i < h; i++) {
+            const start = (y + i) * stride + x * 4;
+            packed.set(pixels.subarray(start, start + w * 4), offset + i * w * 4);
+        }
+    });
+    await writeBytes(path, new GLib.Bytes(packed));
+}
+session.seq++;
+session.width = width;
+session.height = height;
+session.checksums = checksums;
+return {seq: session.seq, width: width, height: height, full: full, tiles: changed};
+"""
+
+_CLOSE_SCRIPT = """
+const sessions = global._gnomeHacksTileSessions || {};
+const session = sessions[session_id];
+if (session) {
+    if (session.timeout) {
+        imports.gi.GLib.source_remove(session.timeout);
+    }
+    delete sessions[session_id];
+}
+"""
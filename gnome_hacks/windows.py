@@ -1,7 +1,10 @@
+import time
+import uuid
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
-from .evaluator import Evaluator
+from ._utils import notify_expr, window_index_expr
+from .evaluator import Evaluator, EvaluatorJavaScriptError, map_result
 
 
 @dataclass
@@ -31,68 +34,758 @@ def list_windows(e: Evaluator) -> List[WindowInfo]:
             id: window.get_id(),
         });
     }
-    result;
+    return result;
     """
-    return [WindowInfo(**x) for x in e(code)]
+    return map_result(e.call_function(code), lambda x: [WindowInfo(**y) for y in x])
 
 
-def get_window_frame(e: Evaluator, id: int) -> Optional[Rect]:
-    code = """
-    const actors = global.get_window_actors();
-    let result = null;
-    for (let i = 0; i < actors.length; i++) {
-        const window = actors[i].get_meta_window();
-        if (window.get_id() == window_id) {
-            const f = window.get_frame_rect();
-            result = {
-                x: f.x,
-                y: f.y,
-                width: f.width,
-                height: f.height,
-            };
+SNAPSHOT_FIELDS = (
+    "id",
+    "title",
+    "pid",
+    "wm_class",
+    "x",
+    "y",
+    "width",
+    "height",
+    "monitor",
+    "workspace",
+    "minimized",
+    "maximized",
+    "focused",
+)
+
+
+@dataclass
+class WindowSnapshot:
+    """
+    Properties of all windows in columnar form: each requested field maps
+    to a list with one value per window.
+    """
+
+    columns: Dict[str, List[Any]]
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+
+    def rows(self) -> List[Dict[str, Any]]:
+        return [
+            dict(zip(self.columns, values)) for values in zip(*self.columns.values())
+        ]
+
+    def window_infos(self) -> List[WindowInfo]:
+        """
+        Build WindowInfo objects. Requires the title, pid and id fields.
+        """
+        c = self.columns
+        return [WindowInfo(*x) for x in zip(c["title"], c["pid"], c["id"])]
+
+    def frames(self) -> Dict[int, Rect]:
+        """
+        Build frames keyed by window ID. Requires id, x, y, width and height.
+        """
+        c = self.columns
+        return {
+            id: Rect(*rect)
+            for id, *rect in zip(c["id"], c["x"], c["y"], c["width"], c["height"])
         }
+
+    def to_dataframe(self) -> Any:
+        """
+        Convert the snapshot to a pandas DataFrame with one row per window.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.columns)
+
+
+def snapshot_windows(
+    e: Evaluator, fields: Sequence[str] = ("id", "title", "pid")
+) -> WindowSnapshot:
+    """
+    Get properties of all windows in a single call.
+
+    Only the requested fields are computed and sent back.
+
+    :param e: the script evaluator.
+    :param fields: names from SNAPSHOT_FIELDS. The workspace field is the
+                   index of the window's workspace, or -1 if it is on all of
+                   them. The monitor field is the index of its monitor.
+    """
+    for field in fields:
+        if field not in SNAPSHOT_FIELDS:
+            raise ValueError(f"unknown window field: {field}")
+    code = """
+    const frame = (ctx) => ctx.frame || (ctx.frame = ctx.window.get_frame_rect());
+    const getters = {
+        id: (ctx) => ctx.window.get_id(),
+        title: (ctx) => ctx.window.get_title(),
+        pid: (ctx) => ctx.window.get_pid(),
+        wm_class: (ctx) => ctx.window.get_wm_class(),
+        x: (ctx) => frame(ctx).x,
+        y: (ctx) => frame(ctx).y,
+        width: (ctx) => frame(ctx).width,
+        height: (ctx) => frame(ctx).height,
+        monitor: (ctx) => ctx.window.get_monitor(),
+        workspace: (ctx) => {
+            const ws = ctx.window.get_workspace();
+            return ctx.window.is_on_all_workspaces() || !ws ? -1 : ws.index();
+        },
+        minimized: (ctx) => ctx.window.minimized,
+        maximized: (ctx) => ctx.window.get_maximized() != 0,
+        focused: (ctx) => ctx.window.has_focus(),
+    };
+    const columns = {};
+    const selected = fields.map((f) => {
+        columns[f] = [];
+        return [columns[f], getters[f]];
+    });
+    global.get_window_actors().forEach((actor) => {
+        const ctx = {window: actor.get_meta_window(), frame: null};
+        selected.forEach(([column, getter]) => column.push(getter(ctx)));
+    });
+    return columns;
+    """
+    return map_result(e.call_function(code, fields=list(fields)), WindowSnapshot)
+
+
+def get_window_frame(e: Evaluator, id: int) -> Optional[Rect]:
+    code = (
+        """
+    const entry = """
+        + window_index_expr()
+        + """.windows[window_id];
+    if (!entry) {
+        return null;
     }
-    result;
+    const f = entry.window.get_frame_rect();
+    return {
+        x: f.x,
+        y: f.y,
+        width: f.width,
+        height: f.height,
+    };
     """
-    result = e(code, window_id=id)
-    return None if result is None else Rect(**result)
+    )
+    return map_result(e.call_function(code, window_id=id), _rect_or_none)
 
 
 def get_window_monitor_frame(e: Evaluator, id: int) -> Optional[Rect]:
-    code = """
-    const actors = global.get_window_actors();
-    let result = null;
-    for (let i = 0; i < actors.length; i++) {
-        const window = actors[i].get_meta_window();
-        if (window.get_id() == window_id) {
-            const display = window.get_display();
-            const monitor = window.get_monitor();
-            const f = display.get_monitor_geometry(monitor);
-            result = {
-                x: f.x,
-                y: f.y,
-                width: f.width,
-                height: f.height,
-            };
-        }
+    code = (
+        """
+    const entry = """
+        + window_index_expr()
+        + """.windows[window_id];
+    if (!entry) {
+        return null;
     }
-    result;
+    const window = entry.window;
+    const display = window.get_display();
+    const monitor = window.get_monitor();
+    const f = display.get_monitor_geometry(monitor);
+    return {
+        x: f.x,
+        y: f.y,
+        width: f.width,
+        height: f.height,
+    };
     """
-    result = e(code, window_id=id)
-    return None if result is None else Rect(**result)
+    )
+    return map_result(e.call_function(code, window_id=id), _rect_or_none)
 
 
 def move_window(e: Evaluator, id: int, x: int, y: int, user_op: bool = False) -> bool:
-    code = """
-    const actors = global.get_window_actors();
-    let result = false;
-    for (let i = 0; i < actors.length; i++) {
-        const window = actors[i].get_meta_window();
-        if (window.get_id() == window_id) {
-            window.move_frame(user_op, x, y);
-            result = true;
+    code = (
+        """
+    const entry = """
+        + window_index_expr()
+        + """.windows[window_id];
+    if (!entry) {
+        return false;
+    }
+    entry.window.move_frame(user_op, x, y);
+    return true;
+    """
+    )
+    return e.call_function(code, window_id=id, x=x, y=y, user_op=user_op)
+
+
+@dataclass
+class LayoutResult:
+    ok: bool
+    frame: Optional[Rect] = None  # the window's frame after the move.
+    error: Optional[str] = None
+
+
+def apply_layout(
+    e: Evaluator, layout: Dict[int, Rect], user_op: bool = False
+) -> Dict[int, LayoutResult]:
+    """
+    Move and resize many windows at once.
+
+    All windows are updated in a single pass within one Eval, so the shell
+    does not paint a frame in the middle of the layout change. Maximized
+    windows are unmaximized first, since they would ignore the new frame.
+
+    :param e: the script evaluator.
+    :param layout: the new frame for each window ID.
+    :param user_op: if True, treat the changes as user operations, which
+                    respects window constraints like minimum sizes.
+    :return: a result for every window in the layout.
+    """
+    code = (
+        """
+    const Meta = imports.gi.Meta;
+    const windows = """
+        + window_index_expr()
+        + """.windows;
+    return frames.map(([id, x, y, width, height]) => {
+        const entry = windows[id];
+        if (!entry) {
+            return {ok: false, error: 'no window with id ' + id};
         }
+        try {
+            const window = entry.window;
+            if (window.get_maximized()) {
+                window.unmaximize(Meta.MaximizeFlags.BOTH);
+            }
+            window.move_resize_frame(user_op, x, y, width, height);
+            const f = window.get_frame_rect();
+            return {ok: true, frame: {x: f.x, y: f.y, width: f.width, height: f.height}};
+        } catch (e) {
+            return {ok: false, error: '' + e};
+        }
+    });
+    """
+    )
+    ids = list(layout)
+    frames = [[id, r.x, r.y, r.width, r.height] for id, r in layout.items()]
+
+    def parse(results: List[dict]) -> Dict[int, LayoutResult]:
+        return {
+            id: LayoutResult(
+                ok=res["ok"],
+                frame=_rect_or_none(res.get("frame")),
+                error=res.get("error"),
+            )
+            for id, res in zip(ids, results)
+        }
+
+    return map_result(e.call_function(code, frames=frames, user_op=user_op), parse)
+
+
+def animate_window(
+    e: Evaluator,
+    id: int,
+    target: Rect,
+    duration_ms: int = 250,
+    easing: str = "ease-out-quad",
+) -> Optional[Rect]:
+    """
+    Smoothly move and resize a window to a target frame.
+
+    The interpolation runs in the shell on a Clutter timeline, which follows
+    the stage's frame clock, so the window is updated once per frame.
+
+    :param e: the script evaluator.
+    :param id: the window ID.
+    :param target: the final frame of the window.
+    :param duration_ms: the length of the animation.
+    :param easing: the name of a Clutter.AnimationMode, such as "linear",
+                   "ease-in-out-cubic" or "ease-out-bounce".
+    :return: the final frame, or None if the window does not exist or went
+             away during the animation, or if another animation of the same
+             window replaced this one.
+    """
+    code = (
+        """
+    const Clutter = imports.gi.Clutter;
+    const Meta = imports.gi.Meta;
+    const mode = Clutter.AnimationMode[easing];
+    if (typeof mode === 'undefined') {
+        throw new Error('unknown easing mode: ' + easing);
+    }
+    const entry = """
+        + window_index_expr()
+        + """.windows[window_id];
+    if (!entry) {
+        return null;
     }
-    result;
+    const window = entry.window;
+    if (window.get_maximized()) {
+        window.unmaximize(Meta.MaximizeFlags.BOTH);
+    }
+    if (!global._gnomeHacksAnimations) {
+        global._gnomeHacksAnimations = {};
+    }
+    const animations = global._gnomeHacksAnimations;
+    if (animations[window_id]) {
+        animations[window_id].cancel();
+    }
+
+    const f = window.get_frame_rect();
+    const start = [f.x, f.y, f.width, f.height];
+    const end = [target.x, target.y, target.width, target.height];
+    const step = (t) => {
+        const r = start.map((a, i) => Math.round(a + (end[i] - a) * t));
+        window.move_resize_frame(false, r[0], r[1], r[2], r[3]);
+    };
+    const timeline = Clutter.Timeline.new_for_actor
+        ? Clutter.Timeline.new_for_actor(global.stage, duration_ms)
+        : new Clutter.Timeline({duration: duration_ms});
+    timeline.set_progress_mode(mode);
+
+    return await new Promise((resolve) => {
+        const signals = [];
+        const finish = (result) => {
+            signals.forEach(([obj, id]) => obj.disconnect(id));
+            timeline.stop();
+            delete animations[window_id];
+            resolve(result);
+        };
+        const animation = {cancel: () => finish(null)};
+        animations[window_id] = animation;
+        signals.push([timeline, timeline.connect('new-frame', () => {
+            step(timeline.get_progress());
+        })]);
+        signals.push([timeline, timeline.connect('completed', () => {
+            step(1);
+            const f = window.get_frame_rect();
+            finish({x: f.x, y: f.y, width: f.width, height: f.height});
+        })]);
+        signals.push([window, window.connect('unmanaged', () => finish(null))]);
+        timeline.start();
+    });
+    """
+    )
+    return map_result(
+        e.with_timeout(e.timeout_ms + duration_ms).call_async_function(
+            code,
+            window_id=id,
+            target=dict(
+                x=target.x, y=target.y, width=target.width, height=target.height
+            ),
+            duration_ms=duration_ms,
+            easing=easing.upper().replace("-", "_"),
+        ),
+        _rect_or_none,
+    )
+
+
+class WindowCache:
     """
-    return e(code, window_id=id, x=x, y=y, user_op=user_op)
+    A local cache of window frames.
+
+    The cache mirrors an index of windows in the shell which is updated by
+    window signals. Each sync asks the shell to send this process a D-Bus
+    signal the next time a window is created, destroyed, moved or resized,
+    so lookups are answered locally until then. Syncing only transfers the
+    frames of windows that changed. The cache is also invalidated if the
+    shell restarts. On shells that cannot emit signals, the cache is synced
+    when it is older than fallback_max_age_ms.
+    """
+
+    def __init__(self, e: Evaluator, fallback_max_age_ms: int = 100):
+        self.e = e
+        self.fallback_max_age_ms = fallback_max_age_ms
+        self.key = f"c{uuid.uuid4().hex}"
+        self.synced_at: Optional[float] = None
+        self._token: Optional[Tuple[str, int]] = None
+        self._frames: Dict[int, Rect] = {}
+        self._waiter = e.listen(self.key)
+        self._owner_changes = 0
+        self._changed = True
+
+    def __enter__(self) -> "WindowCache":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        """
+        Stop listening for changes in the shell.
+        """
+        self._waiter.close()
+        try:
+            self.e.call_function(_UNWATCH_CACHE_SCRIPT, key=self.key)
+        except EvaluatorJavaScriptError:
+            pass
+
+    @property
+    def token(self) -> Optional[Tuple[str, int]]:
+        """
+        An (epoch, version) pair identifying the state of the shell's index
+        as of the last sync. The epoch changes if the shell restarted.
+        """
+        return self._token
+
+    @property
+    def age_ms(self) -> Optional[float]:
+        """
+        The time since the last sync, or None if the cache was never synced.
+        """
+        if self.synced_at is None:
+            return None
+        return (time.monotonic() - self.synced_at) * 1000
+
+    def is_fresh(self) -> bool:
+        """
+        Check if no window changed since the last sync, without blocking.
+
+        On shells that cannot emit signals, this only checks the age of the
+        cache, so frames may have changed even if this returns True.
+        """
+        if self.synced_at is None:
+            return False
+        if self._waiter.destination is None:
+            return self.age_ms <= self.fallback_max_age_ms
+        while self._waiter.poll() is not None:
+            self._changed = True
+        # The shell restarted, so its watch for this cache is gone.
+        if self._waiter.owner_changes != self._owner_changes:
+            self._changed = True
+        return not self._changed
+
+    def sync(self) -> bool:
+        """
+        Fetch changes from the shell.
+
+        :return: True if anything changed since the last sync.
+        """
+        code = (
+            """
+        const idx = """
+            + window_index_expr()
+            + """;
+        if (notify_dest) {
+            const notify = """
+            + notify_expr()
+            + """;
+            // Fires once, on the first change to a window's frame.
+            const listener = (evt) => {
+                if (evt.type === 'title' || evt.type === 'focus') {
+                    return;
+                }
+                if (idx.listeners[key] === listener) {
+                    delete idx.listeners[key];
+                }
+                notify(notify_dest, key, '');
+            };
+            idx.listeners[key] = listener;
+        }
+        if (idx.epoch === epoch && idx.version === version) {
+            return {epoch: epoch, version: version};
+        }
+        const full = idx.epoch !== epoch;
+        const ids = [];
+        const frames = {};
+        Object.values(idx.windows).forEach((entry) => {
+            const id = entry.window.get_id();
+            ids.push(id);
+            if (full || entry.version > version) {
+                const f = entry.window.get_frame_rect();
+                frames[id] = {x: f.x, y: f.y, width: f.width, height: f.height};
+            }
+        });
+        return {epoch: idx.epoch, version: idx.version, ids: ids, frames: frames};
+        """
+        )
+        epoch, version = self._token or (None, -1)
+        # Notifications received so far are for changes this sync fetches.
+        while self._waiter.poll() is not None:
+            pass
+        owner_changes = self._waiter.owner_changes
+        out = self.e.call_function(
+            code,
+            key=self.key,
+            notify_dest=self._waiter.destination,
+            epoch=epoch,
+            version=version,
+        )
+        self.synced_at = time.monotonic()
+        self._owner_changes = owner_changes
+        self._changed = False
+        if "ids" not in out:
+            return False
+        if out["epoch"] != epoch:
+            self._frames = {}
+        self._token = (out["epoch"], out["version"])
+        ids = set(out["ids"])
+        self._frames = {k: v for k, v in self._frames.items() if k in ids}
+        for id, frame in out["frames"].items():
+            self._frames[int(id)] = Rect(**frame)
+        return True
+
+    def get_frame(self, id: int) -> Optional[Rect]:
+        """
+        Get the frame of a window, syncing first if the cache is stale.
+        """
+        if not self.is_fresh():
+            self.sync()
+        return self._frames.get(id)
+
+    def frames(self) -> Dict[int, Rect]:
+        """
+        Get the frames of all windows, syncing first if the cache is stale.
+        """
+        if not self.is_fresh():
+            self.sync()
+        return dict(self._frames)
+
+
+_UNWATCH_CACHE_SCRIPT = """
+const idx = global._gnomeHacksWindowIndex;
+if (idx) {
+    delete idx.listeners[key];
+}
+"""
+
+
+@dataclass
+class WindowDelta:
+    # Pass this to the next windows_since() call.
+    token: Tuple[str, int]
+
+    # If True, the token was missing, too old, or from before a shell
+    # restart. In that case, added holds every window, and any state kept
+    # from earlier deltas should be discarded.
+    reset: bool
+
+    added: List[WindowInfo]
+    changed: List[WindowInfo]  # windows that were moved, resized or retitled.
+    removed: List[int]
+
+    # The current frames of the added and changed windows.
+    frames: Dict[int, Rect]
+
+
+def windows_since(e: Evaluator, token: Optional[Tuple[str, int]] = None) -> WindowDelta:
+    """
+    Get the windows that were added, changed or removed since a token.
+
+    The changes are read from a log kept by the shell's window index, so if
+    nothing changed, the response is nearly empty.
+
+    :param e: the script evaluator.
+    :param token: the token of a previous delta, or None to get all windows.
+    """
+    code = (
+        """
+    const idx = """
+        + window_index_expr()
+        + """;
+    const full = !token || token[0] !== idx.epoch
+        || token[1] < idx.logStart || token[1] > idx.version;
+    const result = {
+        token: [idx.epoch, idx.version],
+        reset: full,
+        added: [],
+        changed: [],
+        removed: [],
+    };
+    const describe = (window) => {
+        const f = window.get_frame_rect();
+        return {
+            title: window.get_title(),
+            pid: window.get_pid(),
+            id: window.get_id(),
+            frame: {x: f.x, y: f.y, width: f.width, height: f.height},
+        };
+    };
+    if (full) {
+        Object.values(idx.windows).forEach((entry) => {
+            result.added.push(describe(entry.window));
+        });
+        return result;
+    }
+    const firstKind = {};
+    for (let i = idx.log.length - 1; i >= 0 && idx.log[i].seq > token[1]; i--) {
+        firstKind[idx.log[i].id] = idx.log[i].kind;
+    }
+    Object.keys(firstKind).forEach((id) => {
+        const entry = idx.windows[id];
+        if (entry) {
+            const list = firstKind[id] === 'added' ? result.added : result.changed;
+            list.push(describe(entry.window));
+        } else if (firstKind[id] !== 'added') {
+            result.removed.push(Number(id));
+        }
+    });
+    return result;
+    """
+    )
+
+    def parse(out: dict) -> WindowDelta:
+        frames = {}
+        infos = {"added": [], "changed": []}
+        for key, items in infos.items():
+            for item in out[key]:
+                frames[item["id"]] = Rect(**item.pop("frame"))
+                items.append(WindowInfo(**item))
+        return WindowDelta(
+            token=tuple(out["token"]),
+            reset=out["reset"],
+            added=infos["added"],
+            changed=infos["changed"],
+            removed=out["removed"],
+            frames=frames,
+        )
+
+    return map_result(
+        e.call_function(code, token=None if token is None else list(token)), parse
+    )
+
+
+@dataclass
+class WindowEvent:
+    # One of "created", "destroyed", "moved", "resized", "title" or "focus",
+    # or "reset" if the subscription was lost (e.g. the shell restarted) and
+    # events may have been missed.
+    type: str
+
+    # The window's ID. For "focus" events, this is None if no window has
+    # focus, and for "reset" events it is always None.
+    id: Optional[int]
+
+    time: float  # when the event happened, in seconds since the epoch.
+
+    # The number of events discarded just before this one because the
+    # shell's buffer was full.
+    dropped: int = 0
+
+
+def watch_windows(
+    e: Evaluator,
+    max_buffer: int = 1024,
+    max_batch: int = 256,
+    poll_interval: int = 50,
+    idle_timeout_ms: int = 10000,
+) -> Iterator[WindowEvent]:
+    """
+    Subscribe to window events.
+
+    The shell connects to window and display signals once and buffers the
+    resulting events. When the buffer is empty, the shell notifies this
+    process with a D-Bus signal as soon as a new event arrives, so no work
+    is done while nothing changes. On shells that cannot emit signals, the
+    buffer is polled every poll_interval milliseconds instead.
+
+    :param e: the script evaluator.
+    :param max_buffer: the most events to buffer in the shell. Beyond this,
+                       the oldest events are dropped, and consecutive moves
+                       and resizes of a window are always merged.
+    :param max_batch: the most events to fetch per call.
+    :param poll_interval: the polling interval when signals are unavailable.
+    :param idle_timeout_ms: how long the shell keeps buffering events while
+                            the generator is not being advanced.
+    :return: a generator of events, which unsubscribes when closed.
+    """
+    sub_id = f"w{uuid.uuid4().hex}"
+    with e.listen(sub_id) as waiter:
+        resume = False
+        try:
+            while True:
+                out = e.call_function(
+                    _DRAIN_EVENTS_SCRIPT,
+                    sub_id=sub_id,
+                    resume=resume,
+                    max_buffer=max_buffer,
+                    max_batch=max_batch,
+                    idle_timeout_ms=idle_timeout_ms,
+                    notify_dest=waiter.destination,
+                )
+                resume = True
+                if out["reset"]:
+                    yield WindowEvent(type="reset", id=None, time=time.time())
+                for evt in out["events"]:
+                    yield WindowEvent(
+                        type=evt["type"],
+                        id=evt["id"],
+                        time=evt["time"] / 1e6,
+                        dropped=evt.get("dropped", 0),
+                    )
+                if out["events"]:
+                    continue
+                if waiter.destination is None:
+                    time.sleep(poll_interval / 1000)
+                else:
+                    # Wake up periodically so the shell knows we're alive.
+                    waiter.wait(idle_timeout_ms // 2)
+        finally:
+            try:
+                e.call_function(_UNWATCH_SCRIPT, sub_id=sub_id)
+            except EvaluatorJavaScriptError:
+                pass
+
+
+_DRAIN_EVENTS_SCRIPT = (
+    """
+const GLib = imports.gi.GLib;
+const idx = """
+    + window_index_expr()
+    + """;
+const notify = """
+    + notify_expr()
+    + """;
+if (!global._gnomeHacksWindowWatches) {
+    global._gnomeHacksWindowWatches = {};
+}
+const watches = global._gnomeHacksWindowWatches;
+let watch = watches[sub_id];
+let reset = false;
+if (!watch || idx.listeners[sub_id] !== watch.listener) {
+    reset = !!watch || resume;
+    watch = watches[sub_id] = {events: [], dest: null};
+    watch.listener = (evt) => {
+        if (GLib.get_monotonic_time() - watch.lastDrain > idle_timeout_ms * 1000) {
+            delete idx.listeners[sub_id];
+            delete watches[sub_id];
+            return;
+        }
+        const last = watch.events[watch.events.length - 1];
+        const merge = (evt.type == 'moved' || evt.type == 'resized') &&
+            last && last.type == evt.type && last.id == evt.id;
+        if (merge) {
+            last.time = evt.time;
+        } else {
+            // Events are shared by all listeners, so buffer a copy.
+            evt = Object.assign({}, evt);
+            if (watch.events.length >= max_buffer) {
+                // Count the dropped event against the event which follows it,
+                // which is now the oldest one in the buffer.
+                const removed = watch.events.shift();
+                const head = watch.events.length ? watch.events[0] : evt;
+                head.dropped = (head.dropped || 0) + 1 + (removed.dropped || 0);
+            }
+            watch.events.push(evt);
+        }
+        if (watch.dest) {
+            const dest = watch.dest;
+            watch.dest = null;
+            notify(dest, sub_id, '');
+        }
+    };
+    idx.listeners[sub_id] = watch.listener;
+}
+watch.lastDrain = GLib.get_monotonic_time();
+const events = watch.events.splice(0, max_batch);
+if (!events.length) {
+    watch.dest = notify_dest;
+}
+return {events: events, reset: reset};
+"""
+)
+
+_UNWATCH_SCRIPT = """
+const watches = global._gnomeHacksWindowWatches || {};
+const idx = global._gnomeHacksWindowIndex;
+if (idx && watches[sub_id] && idx.listeners[sub_id] === watches[sub_id].listener) {
+    delete idx.listeners[sub_id];
+}
+delete watches[sub_id];
+"""
+
+
+def _rect_or_none(result: Optional[dict]) -> Optional[Rect]:
+    return None if result is None else Rect(**result)